@@ -0,0 +1,53 @@
+"""Add account_balances projection of the ledger
+
+Revision ID: add_account_balances
+Revises: add_booking_updated_at
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_account_balances'
+down_revision: Union[str, None] = 'add_booking_updated_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'account_balances',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('balance', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('total_charges', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('total_payments', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('entry_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_payment_date', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_account_balances_balance', 'account_balances', ['balance'], unique=False)
+
+    # Backfill from the existing ledger
+    op.execute("""
+        INSERT INTO account_balances
+            (user_id, balance, total_charges, total_payments, entry_count, last_payment_date, updated_at)
+        SELECT
+            user_id,
+            COALESCE(SUM(amount), 0),
+            COALESCE(SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN amount < 0 THEN -amount ELSE 0 END), 0),
+            COUNT(id),
+            MAX(CASE WHEN transaction_type = 'payment' THEN transaction_date END),
+            CURRENT_TIMESTAMP
+        FROM ledger_entries
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_account_balances_balance', table_name='account_balances')
+    op.drop_table('account_balances')
@@ -0,0 +1,30 @@
+"""Add composite index for arena booking conflict checks
+
+Revision ID: add_booking_conflict_index
+Revises: add_hourly_rate_history
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_booking_conflict_index'
+down_revision: Union[str, None] = 'add_hourly_rate_history'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_bookings_arena_status_time',
+        'bookings',
+        ['arena_id', 'booking_status', 'start_time', 'end_time'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_arena_status_time', table_name='bookings')
@@ -0,0 +1,27 @@
+"""Add updated_at to bookings for calendar ETags
+
+Revision ID: add_booking_updated_at
+Revises: add_booking_conflict_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_booking_updated_at'
+down_revision: Union[str, None] = 'add_booking_conflict_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bookings', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE bookings SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column('bookings', 'updated_at')
@@ -0,0 +1,50 @@
+"""Add document_sequences for receipt and invoice numbering
+
+Revision ID: add_document_sequences
+Revises: add_hot_path_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_document_sequences'
+down_revision: Union[str, None] = 'add_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'document_sequences',
+        sa.Column('prefix', sa.String(10), primary_key=True),
+        sa.Column('year', sa.Integer(), primary_key=True),
+        sa.Column('last_number', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    # Continue from the numbers already issued
+    op.execute("""
+        INSERT INTO document_sequences (prefix, year, last_number, updated_at)
+        SELECT 'REC', split_part(receipt_number, '-', 2)::integer,
+               MAX(split_part(receipt_number, '-', 3)::integer), CURRENT_TIMESTAMP
+        FROM ledger_entries
+        WHERE receipt_number ~ '^REC-[0-9]{4}-[0-9]+$'
+        GROUP BY 2
+    """)
+    op.execute("""
+        INSERT INTO document_sequences (prefix, year, last_number, updated_at)
+        SELECT 'INV', split_part(invoice_number, '-', 2)::integer,
+               MAX(split_part(invoice_number, '-', 3)::integer), CURRENT_TIMESTAMP
+        FROM invoices
+        WHERE invoice_number ~ '^INV-[0-9]{4}-[0-9]+$'
+        GROUP BY 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('document_sequences')
@@ -0,0 +1,64 @@
+"""Add composite indexes for date-filtered hot paths
+
+Revision ID: add_hot_path_indexes
+Revises: add_income_rollups
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_hot_path_indexes'
+down_revision: Union[str, None] = 'add_income_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index_name, table_name, columns) - declared on the models' __table_args__ too
+HOT_PATH_INDEXES = [
+    # ledger_entries: statements, aged debt, income summary
+    ('ix_ledger_entries_user_date', 'ledger_entries', ['user_id', 'transaction_date']),
+    ('ix_ledger_entries_voided_date', 'ledger_entries', ['voided', 'transaction_date']),
+
+    # yard_tasks: task board, rollover, health task generation
+    ('ix_yard_tasks_status_scheduled', 'yard_tasks', ['status', 'scheduled_date']),
+    ('ix_yard_tasks_status_completed', 'yard_tasks', ['status', 'completed_date']),
+    ('ix_yard_tasks_scheduled_health_type', 'yard_tasks', ['scheduled_date', 'health_task_type']),
+
+    # staff_management: timesheet lists, payroll summary, leave overlap
+    ('ix_timesheets_staff_date', 'timesheets', ['staff_id', 'date']),
+    ('ix_timesheets_status_date', 'timesheets', ['status', 'date']),
+    ('ix_holiday_requests_staff_dates', 'holiday_requests', ['staff_id', 'start_date', 'end_date']),
+    ('ix_holiday_requests_status_dates', 'holiday_requests', ['status', 'start_date', 'end_date']),
+
+    # turnout_groups: field usage and daily turnout
+    ('ix_turnout_groups_field_date', 'turnout_groups', ['field_id', 'turnout_date']),
+    ('ix_turnout_groups_date', 'turnout_groups', ['turnout_date']),
+
+    # worming_records: horse history and worm count reports
+    ('ix_worming_records_horse_treatment', 'worming_records', ['horse_id', 'treatment_date']),
+    ('ix_worming_records_horse_count', 'worming_records', ['horse_id', 'worm_count_date']),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for index_name, table, columns in HOT_PATH_INDEXES:
+        # Check if index already exists
+        result = conn.execute(
+            sa.text(
+                "SELECT 1 FROM pg_indexes WHERE indexname = :index_name"
+            ),
+            {"index_name": index_name}
+        ).fetchone()
+        if not result:
+            op.create_index(index_name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for index_name, table, columns in reversed(HOT_PATH_INDEXES):
+        op.drop_index(index_name, table_name=table)
@@ -0,0 +1,61 @@
+"""Add income_rollups monthly ledger totals
+
+Revision ID: add_income_rollups
+Revises: add_account_balances
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_income_rollups'
+down_revision: Union[str, None] = 'add_account_balances'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+transactiontype = postgresql.ENUM(
+    'package_charge', 'service_charge', 'payment', 'credit', 'adjustment',
+    name='transactiontype', create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'income_rollups',
+        sa.Column('year', sa.Integer(), primary_key=True),
+        sa.Column('month', sa.Integer(), primary_key=True),
+        sa.Column('transaction_type', transactiontype, primary_key=True),
+        sa.Column('amount', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('total_charges', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('total_payments', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('entry_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    # Backfill from the existing ledger
+    op.execute("""
+        INSERT INTO income_rollups
+            (year, month, transaction_type, amount, total_charges, total_payments, entry_count, updated_at)
+        SELECT
+            EXTRACT(YEAR FROM transaction_date)::integer,
+            EXTRACT(MONTH FROM transaction_date)::integer,
+            transaction_type,
+            COALESCE(SUM(amount), 0),
+            COALESCE(SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN amount < 0 THEN -amount ELSE 0 END), 0),
+            COUNT(id),
+            CURRENT_TIMESTAMP
+        FROM ledger_entries
+        WHERE voided = false
+        GROUP BY 1, 2, transaction_type
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('income_rollups')
@@ -8,6 +8,7 @@ from starlette.responses import Response
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.routers import auth, users, arenas, bookings, horses, health_records, feed, services, notices, professionals, tasks, staff_management, staff_profiles, clinics, lessons, payments, settings, uploads, weather, stables, livery_packages, compliance, turnout, account, backup, rehab, fields, invoices, billing, holiday_livery, contracts, grants, land_features, flood_warnings, feature_flags, risk_assessments, sheep_flocks, feed_notifications
+from app.services.pdf_rendering import shutdown_render_pool
 from app.services.scheduler import start_scheduler, stop_scheduler
 from app.database import SessionLocal
 from app.models.settings import SiteSettings
@@ -62,6 +63,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     stop_scheduler()
+    shutdown_render_pool()
 
 
 app = FastAPI(
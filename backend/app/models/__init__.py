@@ -80,6 +80,8 @@ from app.models.turnout import (
 from app.models.account import (
     LedgerEntry,
     TransactionType,
+    UserAccountBalance,
+    MonthlyIncomeRollup,
 )
 from app.models.backup import (
     Backup,
@@ -127,6 +129,7 @@ from app.models.invoice import (
     InvoiceLineItem,
     InvoiceStatus,
 )
+from app.models.document_sequence import DocumentSequence
 from app.models.contract import (
     ContractTemplate,
     ContractVersion,
@@ -232,6 +235,8 @@ __all__ = [
     "TurnoutType",
     "LedgerEntry",
     "TransactionType",
+    "UserAccountBalance",
+    "MonthlyIncomeRollup",
     "Backup",
     "BackupSchedule",
     "CoachProfile",
@@ -266,6 +271,7 @@ __all__ = [
     "Invoice",
     "InvoiceLineItem",
     "InvoiceStatus",
+    "DocumentSequence",
     "ContractTemplate",
     "ContractVersion",
     "ContractSignature",
@@ -1,8 +1,14 @@
 import enum
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Boolean
-from sqlalchemy.orm import relationship
+from typing import Dict, Iterable, Optional, Set, Tuple
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Boolean, Index,
+    case, delete, event, extract, func, inspect, select, update
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, relationship
 
 from app.database import Base, EnumColumn
 
@@ -74,3 +80,426 @@ class LedgerEntry(Base):
     original_entry = relationship("LedgerEntry", remote_side="LedgerEntry.id", foreign_keys=[original_entry_id])
     service_request = relationship("ServiceRequest", backref="ledger_entries")
     livery_package = relationship("LiveryPackage", backref="ledger_entries")
+
+    # Statements and per-user history filter by user and date; the income
+    # summary and aged debt report filter by void status and date
+    __table_args__ = (
+        Index("ix_ledger_entries_user_date", "user_id", "transaction_date"),
+        Index("ix_ledger_entries_voided_date", "voided", "transaction_date"),
+    )
+
+
+class UserAccountBalance(Base):
+    """
+    Per-user projection of ledger_entries: running balance and totals.
+
+    Maintained in the same transaction as every ORM flush that creates,
+    changes or deletes a LedgerEntry (see _maintain_account_balances).
+    Writes that bypass the ORM must call apply_balance_deltas or
+    recompute_account_balances themselves.
+    scripts/reconcile_account_balances.py rebuilds it and reports drift.
+    """
+    __tablename__ = "account_balances"
+    __table_args__ = (
+        Index("ix_account_balances_balance", "balance"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    balance = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    total_charges = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    total_payments = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    entry_count = Column(Integer, nullable=False, default=0)
+    last_payment_date = Column(DateTime, nullable=True)  # Latest PAYMENT transaction_date
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = relationship("User", foreign_keys=[user_id])
+
+
+class MonthlyIncomeRollup(Base):
+    """
+    Non-voided ledger totals per calendar month and transaction type.
+
+    Maintained alongside account_balances on every ORM flush that touches a
+    LedgerEntry (see _maintain_income_rollups); voiding an entry removes it.
+    scripts/backfill_income_rollups.py rebuilds it from the ledger.
+    """
+    __tablename__ = "income_rollups"
+
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    transaction_type = EnumColumn(TransactionType, primary_key=True)
+    amount = Column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))
+    total_charges = Column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))  # Positive amounts
+    total_payments = Column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))  # Negative amounts, as positive
+    entry_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+BALANCE_TOTALS = ("balance", "total_charges", "total_payments", "entry_count")
+
+
+def zero_balance_delta() -> dict:
+    return {
+        "balance": Decimal("0.00"),
+        "total_charges": Decimal("0.00"),
+        "total_payments": Decimal("0.00"),
+        "entry_count": 0,
+        "last_payment_date": None,
+    }
+
+
+def add_entry_delta(
+    delta: dict,
+    amount,
+    transaction_type: TransactionType,
+    transaction_date: Optional[datetime],
+    sign: int = 1
+) -> None:
+    """Add (sign=1) or remove (sign=-1) one ledger entry's contribution to a delta."""
+    amount = Decimal(str(amount))
+    delta["balance"] += sign * amount
+    if amount > 0:
+        delta["total_charges"] += sign * amount
+    elif amount < 0:
+        delta["total_payments"] += sign * -amount
+    delta["entry_count"] += sign
+    if sign > 0 and transaction_type == TransactionType.PAYMENT and transaction_date is not None:
+        if delta["last_payment_date"] is None or transaction_date > delta["last_payment_date"]:
+            delta["last_payment_date"] = transaction_date
+
+
+def apply_balance_deltas(connection: Connection, deltas: Dict[int, dict]) -> None:
+    """
+    Upsert per-user deltas into account_balances in one statement.
+
+    Removing a payment cannot move last_payment_date backwards; pass those
+    users to recompute_last_payment_dates as well.
+    """
+    if not deltas:
+        return
+    table = UserAccountBalance.__table__
+    now = datetime.utcnow()
+    rows = [{"user_id": user_id, **delta, "updated_at": now} for user_id, delta in deltas.items()]
+
+    if connection.dialect.name in ("postgresql", "sqlite"):
+        if connection.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                **{name: table.c[name] + excluded[name] for name in BALANCE_TOTALS},
+                "last_payment_date": case(
+                    (excluded.last_payment_date.is_(None), table.c.last_payment_date),
+                    (table.c.last_payment_date.is_(None), excluded.last_payment_date),
+                    (excluded.last_payment_date > table.c.last_payment_date, excluded.last_payment_date),
+                    else_=table.c.last_payment_date
+                ),
+                "updated_at": excluded.updated_at,
+            }
+        )
+        connection.execute(stmt, rows)
+        return
+
+    for row in rows:
+        values = {name: table.c[name] + row[name] for name in BALANCE_TOTALS}
+        if row["last_payment_date"] is not None:
+            values["last_payment_date"] = func.coalesce(
+                case(
+                    (table.c.last_payment_date > row["last_payment_date"], table.c.last_payment_date),
+                    else_=row["last_payment_date"]
+                ),
+                row["last_payment_date"]
+            )
+        result = connection.execute(
+            update(table).where(table.c.user_id == row["user_id"]).values(**values, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(**row))
+
+
+def ledger_totals_query(user_ids: Optional[Iterable[int]] = None):
+    """SELECT of the projection columns aggregated straight from ledger_entries."""
+    query = select(
+        LedgerEntry.user_id,
+        func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00")).label("balance"),
+        func.coalesce(
+            func.sum(case((LedgerEntry.amount > 0, LedgerEntry.amount), else_=Decimal("0.00"))),
+            Decimal("0.00")
+        ).label("total_charges"),
+        func.coalesce(
+            func.sum(case((LedgerEntry.amount < 0, -LedgerEntry.amount), else_=Decimal("0.00"))),
+            Decimal("0.00")
+        ).label("total_payments"),
+        func.count(LedgerEntry.id).label("entry_count"),
+        func.max(
+            case((LedgerEntry.transaction_type == TransactionType.PAYMENT, LedgerEntry.transaction_date))
+        ).label("last_payment_date"),
+    ).group_by(LedgerEntry.user_id)
+    if user_ids is not None:
+        query = query.where(LedgerEntry.user_id.in_(list(user_ids)))
+    return query
+
+
+def recompute_account_balances(connection: Connection, user_ids: Optional[Iterable[int]] = None) -> None:
+    """Rebuild projection rows from the ledger, for the given users or everyone."""
+    table = UserAccountBalance.__table__
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+    clear = delete(table)
+    if user_ids is not None:
+        clear = clear.where(table.c.user_id.in_(user_ids))
+    connection.execute(clear)
+
+    now = datetime.utcnow()
+    rows = [{**row._asdict(), "updated_at": now} for row in connection.execute(ledger_totals_query(user_ids))]
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+def recompute_last_payment_dates(connection: Connection, user_ids: Iterable[int]) -> None:
+    """Reset last_payment_date from the ledger, e.g. after a payment is removed."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    table = UserAccountBalance.__table__
+    latest_payment = select(func.max(LedgerEntry.transaction_date)).where(
+        LedgerEntry.user_id == table.c.user_id,
+        LedgerEntry.transaction_type == TransactionType.PAYMENT
+    ).scalar_subquery()
+    connection.execute(
+        update(table).where(table.c.user_id.in_(user_ids)).values(last_payment_date=latest_payment)
+    )
+
+
+INCOME_TOTALS = ("amount", "total_charges", "total_payments", "entry_count")
+
+RollupKey = Tuple[int, int, TransactionType]  # (year, month, transaction_type)
+
+
+def zero_income_delta() -> dict:
+    return {
+        "amount": Decimal("0.00"),
+        "total_charges": Decimal("0.00"),
+        "total_payments": Decimal("0.00"),
+        "entry_count": 0,
+    }
+
+
+def add_income_delta(
+    deltas: Dict[RollupKey, dict],
+    amount,
+    transaction_type: TransactionType,
+    transaction_date: datetime,
+    sign: int = 1
+) -> None:
+    """Add (sign=1) or remove (sign=-1) one non-voided entry's contribution to its month."""
+    delta = deltas[(transaction_date.year, transaction_date.month, transaction_type)]
+    amount = Decimal(str(amount))
+    delta["amount"] += sign * amount
+    if amount > 0:
+        delta["total_charges"] += sign * amount
+    elif amount < 0:
+        delta["total_payments"] += sign * -amount
+    delta["entry_count"] += sign
+
+
+def apply_income_deltas(connection: Connection, deltas: Dict[RollupKey, dict]) -> None:
+    """Upsert per-month deltas into income_rollups in one statement."""
+    deltas = {key: delta for key, delta in deltas.items() if any(delta.values())}
+    if not deltas:
+        return
+    table = MonthlyIncomeRollup.__table__
+    now = datetime.utcnow()
+    rows = [
+        {"year": year, "month": month, "transaction_type": transaction_type, **delta, "updated_at": now}
+        for (year, month, transaction_type), delta in deltas.items()
+    ]
+
+    if connection.dialect.name in ("postgresql", "sqlite"):
+        if connection.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.year, table.c.month, table.c.transaction_type],
+            set_={
+                **{name: table.c[name] + excluded[name] for name in INCOME_TOTALS},
+                "updated_at": excluded.updated_at,
+            }
+        )
+        connection.execute(stmt, rows)
+        return
+
+    for row in rows:
+        result = connection.execute(
+            update(table).where(
+                table.c.year == row["year"],
+                table.c.month == row["month"],
+                table.c.transaction_type == row["transaction_type"]
+            ).values(**{name: table.c[name] + row[name] for name in INCOME_TOTALS}, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(**row))
+
+
+def income_totals_query(start: Optional[datetime] = None, end: Optional[datetime] = None):
+    """
+    SELECT of the rollup columns aggregated straight from ledger_entries,
+    optionally limited to start <= transaction_date < end.
+    """
+    year = extract("year", LedgerEntry.transaction_date)
+    month = extract("month", LedgerEntry.transaction_date)
+    query = select(
+        year.label("year"),
+        month.label("month"),
+        LedgerEntry.transaction_type,
+        func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00")).label("amount"),
+        func.coalesce(
+            func.sum(case((LedgerEntry.amount > 0, LedgerEntry.amount), else_=Decimal("0.00"))),
+            Decimal("0.00")
+        ).label("total_charges"),
+        func.coalesce(
+            func.sum(case((LedgerEntry.amount < 0, -LedgerEntry.amount), else_=Decimal("0.00"))),
+            Decimal("0.00")
+        ).label("total_payments"),
+        func.count(LedgerEntry.id).label("entry_count"),
+    ).where(
+        LedgerEntry.voided == False
+    ).group_by(year, month, LedgerEntry.transaction_type)
+    if start is not None:
+        query = query.where(LedgerEntry.transaction_date >= start)
+    if end is not None:
+        query = query.where(LedgerEntry.transaction_date < end)
+    return query
+
+
+def recompute_income_rollups(connection: Connection) -> None:
+    """Rebuild every income_rollups row from the ledger."""
+    table = MonthlyIncomeRollup.__table__
+    connection.execute(delete(table))
+    now = datetime.utcnow()
+    rows = [
+        {**row._asdict(), "year": int(row.year), "month": int(row.month), "updated_at": now}
+        for row in connection.execute(income_totals_query())
+    ]
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+_TRACKED_ATTRS = ("user_id", "amount", "transaction_type", "transaction_date")
+_INCOME_ATTRS = ("amount", "transaction_type", "transaction_date", "voided")
+
+
+def _previous_values(entry: LedgerEntry, attrs: Tuple[str, ...] = _TRACKED_ATTRS):
+    """Pre-flush values of the tracked columns, or None if any were never loaded."""
+    state = inspect(entry)
+    values = {}
+    for name in attrs:
+        history = state.attrs[name].history
+        if history.deleted:
+            values[name] = history.deleted[0]
+        elif history.unchanged:
+            values[name] = history.unchanged[0]
+        else:
+            return None
+    return values
+
+
+@event.listens_for(Session, "before_flush")
+def _load_deleted_ledger_entries(session: Session, flush_context, instances) -> None:
+    """Make sure deleted entries still have their values for the after_flush hook."""
+    with session.no_autoflush:
+        for obj in session.deleted:
+            if isinstance(obj, LedgerEntry):
+                for name in _TRACKED_ATTRS + _INCOME_ATTRS:
+                    getattr(obj, name)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_account_balances(session: Session, flush_context) -> None:
+    """Apply the flush's LedgerEntry inserts, changes and deletes to account_balances."""
+    deltas: Dict[int, dict] = defaultdict(zero_balance_delta)
+    recompute: Set[int] = set()
+    last_payment_changed: Set[int] = set()
+
+    for obj in session.new:
+        if isinstance(obj, LedgerEntry):
+            add_entry_delta(deltas[obj.user_id], obj.amount, obj.transaction_type, obj.transaction_date)
+
+    for obj in session.deleted:
+        if not isinstance(obj, LedgerEntry):
+            continue
+        old = _previous_values(obj)
+        add_entry_delta(deltas[old["user_id"]], old["amount"], old["transaction_type"], None, sign=-1)
+        if old["transaction_type"] == TransactionType.PAYMENT:
+            last_payment_changed.add(old["user_id"])
+
+    for obj in session.dirty:
+        if not isinstance(obj, LedgerEntry) or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[name].history.has_changes() for name in _TRACKED_ATTRS):
+            continue
+        old = _previous_values(obj)
+        if old is None:
+            recompute.add(obj.user_id)
+            continue
+        add_entry_delta(deltas[old["user_id"]], old["amount"], old["transaction_type"], None, sign=-1)
+        add_entry_delta(deltas[obj.user_id], obj.amount, obj.transaction_type, obj.transaction_date)
+        if TransactionType.PAYMENT in (old["transaction_type"], obj.transaction_type):
+            last_payment_changed.update((old["user_id"], obj.user_id))
+
+    if not (deltas or recompute):
+        return
+
+    connection = session.connection()
+    apply_balance_deltas(connection, {k: v for k, v in deltas.items() if k not in recompute})
+    recompute_last_payment_dates(connection, last_payment_changed - recompute)
+    recompute_account_balances(connection, recompute)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_income_rollups(session: Session, flush_context) -> None:
+    """Apply the flush's non-voided LedgerEntry changes to income_rollups."""
+    deltas: Dict[RollupKey, dict] = defaultdict(zero_income_delta)
+    rebuild = False
+
+    for obj in session.new:
+        if isinstance(obj, LedgerEntry) and not obj.voided:
+            add_income_delta(deltas, obj.amount, obj.transaction_type, obj.transaction_date)
+
+    for obj in session.deleted:
+        if not isinstance(obj, LedgerEntry):
+            continue
+        old = _previous_values(obj, _INCOME_ATTRS)
+        if not old["voided"]:
+            add_income_delta(deltas, old["amount"], old["transaction_type"], old["transaction_date"], sign=-1)
+
+    for obj in session.dirty:
+        if not isinstance(obj, LedgerEntry) or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[name].history.has_changes() for name in _INCOME_ATTRS):
+            continue
+        old = _previous_values(obj, _INCOME_ATTRS)
+        if old is None:
+            # The old month is unknown, so no delta can be worked out
+            rebuild = True
+            break
+        if not old["voided"]:
+            add_income_delta(deltas, old["amount"], old["transaction_type"], old["transaction_date"], sign=-1)
+        if not obj.voided:
+            add_income_delta(deltas, obj.amount, obj.transaction_type, obj.transaction_date)
+
+    if rebuild:
+        recompute_income_rollups(session.connection())
+    elif deltas:
+        apply_income_deltas(session.connection(), deltas)
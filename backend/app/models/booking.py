@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.database import Base, EnumColumn
 
@@ -43,6 +43,7 @@ class Booking(Base):
     payment_ref = Column(String(100), nullable=True)
     payment_status = EnumColumn(PaymentStatus, default=PaymentStatus.PENDING, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     # Guest booking fields (for anonymous users)
     guest_name = Column(String(100), nullable=True)
     guest_email = Column(String(255), nullable=True)
@@ -51,3 +52,8 @@ class Booking(Base):
     arena = relationship("Arena", back_populates="bookings")
     user = relationship("User", back_populates="bookings")
     horse = relationship("Horse")
+
+    # Serves the arena slot overlap check in app.services.booking_conflicts
+    __table_args__ = (
+        Index('ix_bookings_arena_status_time', 'arena_id', 'booking_status', 'start_time', 'end_time'),
+    )
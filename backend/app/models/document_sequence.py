@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from app.database import Base
+
+
+class DocumentSequence(Base):
+    """
+    Last number issued per document prefix and year (e.g. REC 2025 -> 17
+    means REC-2025-0017 was the latest receipt).
+
+    Numbers are handed out by app.services.document_numbers, which bumps
+    the row inside the caller's transaction: concurrent requests queue on
+    the row lock and a rolled-back request releases its number, so
+    numbering stays gap-free and collision-free.
+    """
+    __tablename__ = "document_sequences"
+
+    prefix = Column(String(10), primary_key=True)  # "REC", "INV"
+    year = Column(Integer, primary_key=True)
+    last_number = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Date, Text, Numeric, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Date, Text, Numeric, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.database import Base, EnumColumn
 
@@ -129,6 +129,12 @@ class TurnoutGroup(Base):
     assigned_by = relationship("User")
     horses = relationship("TurnoutGroupHorse", back_populates="group", cascade="all, delete-orphan")
 
+    # Field usage and today's turnout look up groups by field and date
+    __table_args__ = (
+        Index("ix_turnout_groups_field_date", "field_id", "turnout_date"),
+        Index("ix_turnout_groups_date", "turnout_date"),
+    )
+
 
 class TurnoutGroupHorse(Base):
     """Horses assigned to a turnout group for a day."""
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Numeric
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Numeric, Index
 from sqlalchemy.orm import relationship
 from app.database import Base, EnumColumn
 
@@ -81,6 +81,12 @@ class WormingRecord(Base):
 
     horse = relationship("Horse", back_populates="worming_records")
 
+    # Horse history is read newest first; worm count reports go by count date
+    __table_args__ = (
+        Index("ix_worming_records_horse_treatment", "horse_id", "treatment_date"),
+        Index("ix_worming_records_horse_count", "horse_id", "worm_count_date"),
+    )
+
 
 class WeightRecord(Base):
     __tablename__ = "weight_records"
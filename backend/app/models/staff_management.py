@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, Time, ForeignKey, Enum, Numeric
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, Time, ForeignKey, Enum, Numeric, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base, EnumColumn
@@ -134,6 +134,12 @@ class Timesheet(Base):
     logged_by = relationship("User", foreign_keys=[logged_by_id])
     approved_by = relationship("User", foreign_keys=[approved_by_id])
 
+    # Per-staff timesheet lists and the payroll summary filter by date
+    __table_args__ = (
+        Index("ix_timesheets_staff_date", "staff_id", "date"),
+        Index("ix_timesheets_status_date", "status", "date"),
+    )
+
 
 class HolidayRequest(Base):
     """Holiday/leave requests from staff."""
@@ -163,6 +169,12 @@ class HolidayRequest(Base):
     staff = relationship("User", foreign_keys=[staff_id])
     approved_by = relationship("User", foreign_keys=[approved_by_id])
 
+    # Leave overlapping a period, per staff member or by approval status
+    __table_args__ = (
+        Index("ix_holiday_requests_staff_dates", "staff_id", "start_date", "end_date"),
+        Index("ix_holiday_requests_status_dates", "status", "start_date", "end_date"),
+    )
+
 
 class UnplannedAbsence(Base):
     """Unplanned absence records for staff (sickness, no-show, emergency, etc.)."""
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base, EnumColumn
@@ -124,6 +124,14 @@ class YardTask(Base):
     rehab_task = relationship("RehabTask", foreign_keys=[rehab_task_id])
     rehab_program = relationship("RehabProgram", foreign_keys=[rehab_program_id])
 
+    # Task board, rollover and health task generation filter by status or
+    # health task type within a date range
+    __table_args__ = (
+        Index("ix_yard_tasks_status_scheduled", "status", "scheduled_date"),
+        Index("ix_yard_tasks_status_completed", "status", "completed_date"),
+        Index("ix_yard_tasks_scheduled_health_type", "scheduled_date", "health_task_type"),
+    )
+
 
 class TaskComment(Base):
     """Comments/updates on a task."""
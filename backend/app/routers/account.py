@@ -1,19 +1,24 @@
+import tempfile
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 from decimal import Decimal
-from io import BytesIO
-import csv
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case, extract
 
 from app.database import get_db
-from app.models.account import LedgerEntry, TransactionType, PaymentMethod
+from app.models.account import LedgerEntry, TransactionType, PaymentMethod, UserAccountBalance
 from app.models.service import ServiceRequest, RequestStatus
 from app.models.user import User, UserRole
 from app.models.invoice import Invoice, InvoiceStatus
 from app.utils.auth import get_current_user, has_staff_access
+from app.utils.streaming_csv import YIELD_PER, csv_response, stream_session
+from app.services.aged_debt import add_to_totals, build_aged_debt_report, empty_totals, iter_aged_debt
+from app.services.document_numbers import next_receipt_number
+from app.services.income_summary import build_income_summary
+from app.services.pdf_rendering import render_pdf_blocking
+from app.services.statements import load_statements, render_statement, write_statements_zip
 from app.schemas.account import (
     LedgerEntryCreate,
     LedgerEntryUpdate,
@@ -25,10 +30,7 @@ from app.schemas.account import (
     TransactionEnums,
     RecordPayment,
     PaymentResponse,
-    AgedDebtItem,
     AgedDebtReport,
-    IncomeByType,
-    MonthlyIncome,
     IncomeSummaryReport,
 )
 
@@ -65,63 +67,21 @@ def enrich_ledger_entry(entry: LedgerEntry) -> LedgerEntryResponse:
     return response
 
 
-def generate_receipt_number(db: Session) -> str:
-    """Generate a unique receipt number in format REC-YYYY-NNNN."""
-    year = datetime.utcnow().year
-    prefix = f"REC-{year}-"
-
-    # Find highest existing receipt number for this year
-    last_receipt = db.query(LedgerEntry).filter(
-        LedgerEntry.receipt_number.like(f"{prefix}%")
-    ).order_by(LedgerEntry.receipt_number.desc()).first()
-
-    if last_receipt and last_receipt.receipt_number:
-        try:
-            last_num = int(last_receipt.receipt_number.split("-")[-1])
-            next_num = last_num + 1
-        except (ValueError, IndexError):
-            next_num = 1
-    else:
-        next_num = 1
-
-    return f"{prefix}{next_num:04d}"
-
-
 def calculate_balance(user_id: int, db: Session) -> AccountBalance:
     """Calculate account balance for a user."""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    # Sum all transactions
-    result = db.query(
-        func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00")).label("balance"),
-        func.coalesce(
-            func.sum(
-                case(
-                    (LedgerEntry.amount > 0, LedgerEntry.amount),
-                    else_=Decimal("0.00")
-                )
-            ),
-            Decimal("0.00")
-        ).label("total_charges"),
-        func.coalesce(
-            func.sum(
-                case(
-                    (LedgerEntry.amount < 0, func.abs(LedgerEntry.amount)),
-                    else_=Decimal("0.00")
-                )
-            ),
-            Decimal("0.00")
-        ).label("total_payments"),
-    ).filter(LedgerEntry.user_id == user_id).first()
+    # Maintained on every ledger write, so this is a primary key lookup
+    projection = db.query(UserAccountBalance).filter(UserAccountBalance.user_id == user_id).first()
 
     return AccountBalance(
         user_id=user_id,
         user_name=user.name,
-        balance=result.balance if result else Decimal("0.00"),
-        total_charges=result.total_charges if result else Decimal("0.00"),
-        total_payments=result.total_payments if result else Decimal("0.00"),
+        balance=projection.balance if projection else Decimal("0.00"),
+        total_charges=projection.total_charges if projection else Decimal("0.00"),
+        total_payments=projection.total_payments if projection else Decimal("0.00"),
     )
 
 
@@ -260,29 +220,29 @@ def list_user_accounts(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    # Get all livery users
-    livery_users = db.query(User).filter(
+    # Get all livery users with their maintained balances, highest owed first
+    balance = func.coalesce(UserAccountBalance.balance, Decimal("0.00"))
+    rows = db.query(
+        User.id,
+        User.name,
+        balance.label("balance"),
+        func.coalesce(UserAccountBalance.entry_count, 0).label("count"),
+    ).outerjoin(
+        UserAccountBalance, UserAccountBalance.user_id == User.id
+    ).filter(
         User.role == UserRole.LIVERY,
         User.is_active == True
-    ).all()
-
-    summaries = []
-    for user in livery_users:
-        result = db.query(
-            func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00")).label("balance"),
-            func.count(LedgerEntry.id).label("count"),
-        ).filter(LedgerEntry.user_id == user.id).first()
-
-        summaries.append(UserAccountSummary(
-            user_id=user.id,
-            user_name=user.name,
-            balance=result.balance if result else Decimal("0.00"),
-            transaction_count=result.count if result else 0,
-        ))
-
-    # Sort by balance descending (highest owed first)
-    summaries.sort(key=lambda x: x.balance, reverse=True)
-    return summaries
+    ).order_by(balance.desc(), User.id).all()
+
+    return [
+        UserAccountSummary(
+            user_id=row.id,
+            user_name=row.name,
+            balance=row.balance,
+            transaction_count=row.count,
+        )
+        for row in rows
+    ]
 
 
 @router.get("/users/{user_id}", response_model=AccountSummary)
@@ -481,8 +441,8 @@ def record_payment(
     if not target_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    # Generate receipt number
-    receipt_number = generate_receipt_number(db)
+    # Reserve the next receipt number (row-locked until commit)
+    receipt_number = next_receipt_number(db)
 
     # Create payment entry (amount stored as negative)
     entry = LedgerEntry(
@@ -565,45 +525,11 @@ def download_my_statement(
     db: Session = Depends(get_db)
 ):
     """Download account statement PDF for current user."""
-    from app.utils.pdf_generator import generate_account_statement_pdf
-    from app.models.settings import SiteSettings
-
-    # Get transactions for the period
-    transactions = db.query(LedgerEntry).filter(
-        LedgerEntry.user_id == current_user.id,
-        LedgerEntry.transaction_date >= datetime.combine(from_date, datetime.min.time()),
-        LedgerEntry.transaction_date <= datetime.combine(to_date, datetime.max.time()),
-        LedgerEntry.voided == False
-    ).order_by(LedgerEntry.transaction_date.asc()).all()
-
-    # Calculate opening balance (sum of all transactions before from_date)
-    opening_result = db.query(
-        func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00"))
-    ).filter(
-        LedgerEntry.user_id == current_user.id,
-        LedgerEntry.transaction_date < datetime.combine(from_date, datetime.min.time()),
-        LedgerEntry.voided == False
-    ).scalar()
-    opening_balance = opening_result or Decimal("0.00")
-
-    # Get site settings for venue details
-    settings = db.query(SiteSettings).first()
-
-    # Generate PDF
-    pdf_buffer = generate_account_statement_pdf(
-        user=current_user,
-        transactions=transactions,
-        from_date=from_date,
-        to_date=to_date,
-        opening_balance=opening_balance,
-        settings=settings
-    )
-
-    filename = f"statement_{current_user.name.replace(' ', '_')}_{from_date}_{to_date}.pdf"
-    return StreamingResponse(
-        pdf_buffer,
+    statement = load_statements(db, from_date, to_date, [current_user.id])[0]
+    return Response(
+        content=render_pdf_blocking(render_statement, statement),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers={"Content-Disposition": f"attachment; filename={statement.filename}"}
     )
 
 
@@ -619,46 +545,52 @@ def download_user_statement(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    from app.utils.pdf_generator import generate_account_statement_pdf
-    from app.models.settings import SiteSettings
-
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    statements = load_statements(db, from_date, to_date, [user_id])
+    if not statements:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    # Get transactions for the period
-    transactions = db.query(LedgerEntry).filter(
-        LedgerEntry.user_id == user_id,
-        LedgerEntry.transaction_date >= datetime.combine(from_date, datetime.min.time()),
-        LedgerEntry.transaction_date <= datetime.combine(to_date, datetime.max.time()),
-        LedgerEntry.voided == False
-    ).order_by(LedgerEntry.transaction_date.asc()).all()
-
-    # Calculate opening balance
-    opening_result = db.query(
-        func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00"))
-    ).filter(
-        LedgerEntry.user_id == user_id,
-        LedgerEntry.transaction_date < datetime.combine(from_date, datetime.min.time()),
-        LedgerEntry.voided == False
-    ).scalar()
-    opening_balance = opening_result or Decimal("0.00")
-
-    settings = db.query(SiteSettings).first()
-
-    pdf_buffer = generate_account_statement_pdf(
-        user=user,
-        transactions=transactions,
-        from_date=from_date,
-        to_date=to_date,
-        opening_balance=opening_balance,
-        settings=settings
+    statement = statements[0]
+    return Response(
+        content=render_pdf_blocking(render_statement, statement),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={statement.filename}"}
     )
 
-    filename = f"statement_{user.name.replace(' ', '_')}_{from_date}_{to_date}.pdf"
+
+@router.get("/statements/zip")
+def download_all_statements(
+    from_date: date = Query(...),
+    to_date: date = Query(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Download statements for every active livery client as a zip (admin only).
+    PDFs are rendered in a process pool rather than on the request thread.
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+
+    statements = load_statements(db, from_date, to_date)
+    if not statements:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No livery clients found")
+
+    # Spools to disk past 32MB so a large run doesn't sit in memory
+    archive = tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+    write_statements_zip(statements, archive)
+    archive.seek(0)
+
+    def chunks():
+        try:
+            while chunk := archive.read(64 * 1024):
+                yield chunk
+        finally:
+            archive.close()
+
+    filename = f"statements_{from_date}_{to_date}.zip"
     return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
+        chunks(),
+        media_type="application/zip",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
@@ -666,6 +598,7 @@ def download_user_statement(
 @router.get("/users/{user_id}/transactions/csv")
 def download_user_transactions_csv(
     user_id: int,
+    request: Request,
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
     current_user: User = Depends(get_current_user),
@@ -679,46 +612,38 @@ def download_user_transactions_csv(
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    query = db.query(LedgerEntry).filter(LedgerEntry.user_id == user_id)
+    filters = [LedgerEntry.user_id == user_id]
     if from_date:
-        query = query.filter(LedgerEntry.transaction_date >= datetime.combine(from_date, datetime.min.time()))
+        filters.append(LedgerEntry.transaction_date >= datetime.combine(from_date, datetime.min.time()))
     if to_date:
-        query = query.filter(LedgerEntry.transaction_date <= datetime.combine(to_date, datetime.max.time()))
-
-    transactions = query.order_by(LedgerEntry.transaction_date.asc()).all()
-
-    # Generate CSV
-    output = BytesIO()
-    writer = csv.writer(output.__class__(output, 'w', newline='', encoding='utf-8'))
-
-    # Write header
-    writer.writerow(['Date', 'Type', 'Description', 'Amount', 'Payment Method', 'Reference', 'Voided'])
-
-    # Write data
-    for t in transactions:
-        writer.writerow([
-            t.transaction_date.strftime('%Y-%m-%d'),
-            t.transaction_type.value,
-            t.description,
-            str(t.amount),
-            t.payment_method.value if t.payment_method else '',
-            t.payment_reference or '',
-            'Yes' if t.voided else 'No'
-        ])
-
-    output.seek(0)
+        filters.append(LedgerEntry.transaction_date <= datetime.combine(to_date, datetime.max.time()))
+
+    def rows():
+        yield ['Date', 'Type', 'Description', 'Amount', 'Payment Method', 'Reference', 'Voided']
+        with stream_session(db) as session:
+            transactions = session.query(LedgerEntry).filter(*filters).order_by(
+                LedgerEntry.transaction_date.asc(), LedgerEntry.id.asc()
+            ).yield_per(YIELD_PER)
+            for t in transactions:
+                yield [
+                    t.transaction_date.strftime('%Y-%m-%d'),
+                    t.transaction_type.value,
+                    t.description,
+                    str(t.amount),
+                    t.payment_method.value if t.payment_method else '',
+                    t.payment_reference or '',
+                    'Yes' if t.voided else 'No'
+                ]
+
     filename = f"transactions_{user.name.replace(' ', '_')}.csv"
-    return StreamingResponse(
-        output,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return csv_response(rows(), filename, request)
 
 
 # ============== Reports ==============
 
 @router.get("/reports/aged-debt", response_model=AgedDebtReport)
 def get_aged_debt_report(
+    as_of_date: Optional[date] = Query(None, description="Age balances as at the end of this date (default today)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -726,105 +651,13 @@ def get_aged_debt_report(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    today = date.today()
-    one_month_ago = today - timedelta(days=30)
-    two_months_ago = today - timedelta(days=60)
-    three_months_ago = today - timedelta(days=90)
-
-    # Get all livery users with balances
-    livery_users = db.query(User).filter(
-        User.role == UserRole.LIVERY,
-        User.is_active == True
-    ).all()
-
-    accounts = []
-    totals = AgedDebtItem(user_id=0, user_name="TOTALS")
-
-    for user in livery_users:
-        # Get transactions grouped by age
-        entries = db.query(LedgerEntry).filter(
-            LedgerEntry.user_id == user.id,
-            LedgerEntry.voided == False
-        ).all()
-
-        current = Decimal("0.00")
-        month_1 = Decimal("0.00")
-        month_2 = Decimal("0.00")
-        month_3_plus = Decimal("0.00")
-        last_payment = None
-
-        for entry in entries:
-            entry_date = entry.transaction_date.date() if isinstance(entry.transaction_date, datetime) else entry.transaction_date
-
-            # Track last payment
-            if entry.transaction_type == TransactionType.PAYMENT and entry.amount < 0:
-                if last_payment is None or entry_date > last_payment:
-                    last_payment = entry_date
-
-            # Only count positive amounts (debts) for aging
-            if entry.amount > 0:
-                if entry_date >= one_month_ago:
-                    current += entry.amount
-                elif entry_date >= two_months_ago:
-                    month_1 += entry.amount
-                elif entry_date >= three_months_ago:
-                    month_2 += entry.amount
-                else:
-                    month_3_plus += entry.amount
-            else:
-                # Payments reduce from oldest first
-                payment = abs(entry.amount)
-                if month_3_plus > 0:
-                    reduction = min(payment, month_3_plus)
-                    month_3_plus -= reduction
-                    payment -= reduction
-                if payment > 0 and month_2 > 0:
-                    reduction = min(payment, month_2)
-                    month_2 -= reduction
-                    payment -= reduction
-                if payment > 0 and month_1 > 0:
-                    reduction = min(payment, month_1)
-                    month_1 -= reduction
-                    payment -= reduction
-                if payment > 0:
-                    current -= payment
-
-        total = current + month_1 + month_2 + month_3_plus
-
-        # Only include users with non-zero balance
-        if total != 0:
-            item = AgedDebtItem(
-                user_id=user.id,
-                user_name=user.name,
-                user_email=user.email,
-                current=current,
-                month_1=month_1,
-                month_2=month_2,
-                month_3_plus=month_3_plus,
-                total=total,
-                last_payment_date=last_payment
-            )
-            accounts.append(item)
-
-            # Add to totals
-            totals.current += current
-            totals.month_1 += month_1
-            totals.month_2 += month_2
-            totals.month_3_plus += month_3_plus
-            totals.total += total
-
-    # Sort by total descending
-    accounts.sort(key=lambda x: x.total, reverse=True)
-
-    return AgedDebtReport(
-        as_of_date=today,
-        accounts=accounts,
-        totals=totals
-    )
+    return build_aged_debt_report(db, as_of_date)
 
 
 @router.get("/reports/aged-debt/csv")
 def download_aged_debt_csv(
+    request: Request,
+    as_of_date: Optional[date] = Query(None, description="Age balances as at the end of this date (default today)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -832,49 +665,35 @@ def download_aged_debt_csv(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    report = get_aged_debt_report(current_user, db)
-
-    output = BytesIO()
-    import io
-    text_output = io.StringIO()
-    writer = csv.writer(text_output)
-
-    # Write header
-    writer.writerow(['User', 'Email', 'Current', '1 Month', '2 Months', '3+ Months', 'Total', 'Last Payment'])
-
-    # Write data
-    for item in report.accounts:
-        writer.writerow([
-            item.user_name,
-            item.user_email or '',
-            str(item.current),
-            str(item.month_1),
-            str(item.month_2),
-            str(item.month_3_plus),
-            str(item.total),
-            item.last_payment_date.isoformat() if item.last_payment_date else ''
-        ])
-
-    # Write totals
-    writer.writerow([
-        'TOTALS', '',
-        str(report.totals.current),
-        str(report.totals.month_1),
-        str(report.totals.month_2),
-        str(report.totals.month_3_plus),
-        str(report.totals.total),
-        ''
-    ])
-
-    csv_content = text_output.getvalue().encode('utf-8')
-    output = BytesIO(csv_content)
-
-    filename = f"aged_debt_{date.today().isoformat()}.csv"
-    return StreamingResponse(
-        output,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    as_of_date = as_of_date or date.today()
+
+    def rows():
+        yield ['User', 'Email', 'Current', '1 Month', '2 Months', '3+ Months', 'Total', 'Last Payment']
+        totals = empty_totals()
+        with stream_session(db) as session:
+            for item in iter_aged_debt(session, as_of_date):
+                add_to_totals(totals, item)
+                yield [
+                    item.user_name,
+                    item.user_email or '',
+                    str(item.current),
+                    str(item.month_1),
+                    str(item.month_2),
+                    str(item.month_3_plus),
+                    str(item.total),
+                    item.last_payment_date.isoformat() if item.last_payment_date else ''
+                ]
+        yield [
+            'TOTALS', '',
+            str(totals.current),
+            str(totals.month_1),
+            str(totals.month_2),
+            str(totals.month_3_plus),
+            str(totals.total),
+            ''
+        ]
+
+    return csv_response(rows(), f"aged_debt_{as_of_date.isoformat()}.csv", request)
 
 
 @router.get("/reports/income-summary", response_model=IncomeSummaryReport)
@@ -888,93 +707,12 @@ def get_income_summary(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    type_labels = {
-        TransactionType.PACKAGE_CHARGE: "Livery Package",
-        TransactionType.SERVICE_CHARGE: "Service Charge",
-        TransactionType.PAYMENT: "Payment",
-        TransactionType.CREDIT: "Credit/Refund",
-        TransactionType.ADJUSTMENT: "Adjustment",
-    }
-
-    # Get all transactions in period
-    entries = db.query(LedgerEntry).filter(
-        LedgerEntry.transaction_date >= datetime.combine(from_date, datetime.min.time()),
-        LedgerEntry.transaction_date <= datetime.combine(to_date, datetime.max.time()),
-        LedgerEntry.voided == False
-    ).all()
-
-    # Calculate by type
-    by_type_dict = {}
-    for entry in entries:
-        t_type = entry.transaction_type.value
-        if t_type not in by_type_dict:
-            by_type_dict[t_type] = {"amount": Decimal("0.00"), "count": 0}
-        by_type_dict[t_type]["amount"] += entry.amount
-        by_type_dict[t_type]["count"] += 1
-
-    by_type = [
-        IncomeByType(
-            transaction_type=t_type,
-            type_label=type_labels.get(TransactionType(t_type), t_type.replace("_", " ").title()),
-            amount=data["amount"],
-            count=data["count"]
-        )
-        for t_type, data in by_type_dict.items()
-    ]
-
-    # Calculate by month
-    by_month_dict = {}
-    for entry in entries:
-        year = entry.transaction_date.year
-        month = entry.transaction_date.month
-        key = (year, month)
-        if key not in by_month_dict:
-            by_month_dict[key] = {"total": Decimal("0.00"), "by_type": {}}
-        by_month_dict[key]["total"] += entry.amount
-        t_type = entry.transaction_type.value
-        if t_type not in by_month_dict[key]["by_type"]:
-            by_month_dict[key]["by_type"][t_type] = {"amount": Decimal("0.00"), "count": 0}
-        by_month_dict[key]["by_type"][t_type]["amount"] += entry.amount
-        by_month_dict[key]["by_type"][t_type]["count"] += 1
-
-    by_month = []
-    for (year, month), data in sorted(by_month_dict.items()):
-        month_label = date(year, month, 1).strftime("%B %Y")
-        month_by_type = [
-            IncomeByType(
-                transaction_type=t_type,
-                type_label=type_labels.get(TransactionType(t_type), t_type.replace("_", " ").title()),
-                amount=type_data["amount"],
-                count=type_data["count"]
-            )
-            for t_type, type_data in data["by_type"].items()
-        ]
-        by_month.append(MonthlyIncome(
-            year=year,
-            month=month,
-            month_label=month_label,
-            total=data["total"],
-            by_type=month_by_type
-        ))
-
-    # Calculate totals
-    total_charges = sum(e.amount for e in entries if e.amount > 0)
-    total_payments = sum(abs(e.amount) for e in entries if e.amount < 0)
-    total_income = total_charges - total_payments
-
-    return IncomeSummaryReport(
-        from_date=from_date,
-        to_date=to_date,
-        total_income=total_income,
-        total_charges=total_charges,
-        total_payments=total_payments,
-        by_type=by_type,
-        by_month=by_month
-    )
+    return build_income_summary(db, from_date, to_date)
 
 
 @router.get("/reports/income-summary/csv")
 def download_income_summary_csv(
+    request: Request,
     from_date: date = Query(...),
     to_date: date = Query(...),
     current_user: User = Depends(get_current_user),
@@ -984,42 +722,32 @@ def download_income_summary_csv(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    report = get_income_summary(from_date, to_date, current_user, db)
-
-    import io
-    text_output = io.StringIO()
-    writer = csv.writer(text_output)
-
-    # Summary section
-    writer.writerow(['Income Summary Report'])
-    writer.writerow(['Period', f"{from_date} to {to_date}"])
-    writer.writerow(['Total Charges', str(report.total_charges)])
-    writer.writerow(['Total Payments', str(report.total_payments)])
-    writer.writerow(['Net Income', str(report.total_income)])
-    writer.writerow([])
-
-    # By type section
-    writer.writerow(['By Transaction Type'])
-    writer.writerow(['Type', 'Amount', 'Count'])
-    for item in report.by_type:
-        writer.writerow([item.type_label, str(item.amount), item.count])
-    writer.writerow([])
-
-    # By month section
-    writer.writerow(['By Month'])
-    writer.writerow(['Month', 'Total'])
-    for month in report.by_month:
-        writer.writerow([month.month_label, str(month.total)])
-
-    csv_content = text_output.getvalue().encode('utf-8')
-    output = BytesIO(csv_content)
-
-    filename = f"income_summary_{from_date}_{to_date}.csv"
-    return StreamingResponse(
-        output,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    # The report is a handful of rollup rows; only the encoding is streamed
+    report = build_income_summary(db, from_date, to_date)
+
+    def rows():
+        # Summary section
+        yield ['Income Summary Report']
+        yield ['Period', f"{from_date} to {to_date}"]
+        yield ['Total Charges', str(report.total_charges)]
+        yield ['Total Payments', str(report.total_payments)]
+        yield ['Net Income', str(report.total_income)]
+        yield []
+
+        # By type section
+        yield ['By Transaction Type']
+        yield ['Type', 'Amount', 'Count']
+        for item in report.by_type:
+            yield [item.type_label, str(item.amount), item.count]
+        yield []
+
+        # By month section
+        yield ['By Month']
+        yield ['Month', 'Total']
+        for month in report.by_month:
+            yield [month.month_label, str(month.total)]
+
+    return csv_response(rows(), f"income_summary_{from_date}_{to_date}.csv", request)
 
 
 # ============================================
@@ -1,13 +1,17 @@
 """Backup and restore API endpoints.
 
 Two types of backups:
-1. Database Backup (pg_dump) - Full PostgreSQL dump for disaster recovery
-2. Data Export (JSON) - Human-readable export for portability/seeding
+1. Database Backup (pg_dump) - Full PostgreSQL dump for disaster recovery,
+   in pg_dump's compressed custom format
+2. Data Export - Compressed archive of per-table JSON records with a
+   checksummed manifest (see app.utils.backup_archive). Plain JSON files
+   can still be validated and imported for portability/seeding.
 """
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
+from io import BytesIO
 import os
 import json
 import subprocess
@@ -24,11 +28,17 @@ from app.schemas.backup import (
     BackupValidationResult,
     DatabaseBackupResponse, DatabaseBackupListResponse,
 )
+from app.services.arena_usage import clear_usage_cache
 from app.utils.auth import get_current_user
 from app.utils.backup import (
-    export_database, save_backup_file, load_backup_file,
-    validate_backup, delete_backup_file, generate_backup_filename,
-    get_backup_file_size, BACKUP_DIR, ensure_backup_dir, import_database,
+    write_backup_archive, load_backup_file,
+    validate_backup, validate_backup_manifest, delete_backup_file, generate_backup_filename,
+    get_backup_file_size, BACKUP_DIR, ensure_backup_dir, import_database, current_schema_revision,
+    backup_base_filename,
+)
+from app.utils.backup_archive import (
+    FULL_BACKUP, BackupArchiveError, backup_kind, is_backup_archive, load_archive,
+    manifest_entity_counts, read_manifest, replay_archives,
 )
 
 # Directory for pg_dump backups
@@ -51,19 +61,13 @@ def create_backup(
     db: Session = Depends(get_db),
 ):
     """Create a new database backup."""
-    # Export the database
-    backup_data, entity_counts = export_database(db)
-
-    # Add metadata
-    backup_data["_metadata"] = {
+    # Stream the export to disk
+    filename = generate_backup_filename()
+    _, entity_counts = write_backup_archive(db, filename, metadata={
         "version": "1.0",
         "exported_at": datetime.utcnow().isoformat(),
         "exported_by": current_user.name,
-    }
-
-    # Generate filename and save
-    filename = generate_backup_filename()
-    save_backup_file(backup_data, filename)
+    })
     file_size = get_backup_file_size(filename)
 
     # Create database record
@@ -138,10 +142,25 @@ def download_backup(
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail="Backup file not found on disk")
 
+    if not is_backup_archive(filepath):
+        return FileResponse(
+            filepath,
+            media_type="application/json",
+            filename=backup.filename,
+        )
+
+    try:
+        manifest = read_manifest(filepath)
+    except BackupArchiveError as e:
+        raise HTTPException(status_code=500, detail=str(e))
     return FileResponse(
         filepath,
-        media_type="application/json",
+        media_type="application/zip",
         filename=backup.filename,
+        headers={
+            "X-Backup-Format-Version": str(manifest["version"]),
+            "X-Backup-Schema-Revision": manifest.get("schema_revision") or "",
+        },
     )
 
 
@@ -149,10 +168,27 @@ def download_backup(
 async def validate_backup_file(
     file: UploadFile = File(...),
     current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
 ):
-    """Validate an uploaded backup file without importing."""
+    """
+    Validate an uploaded backup file without importing. Archives are
+    checked from their manifest alone.
+    """
+    content = await file.read()
+    if is_backup_archive(BytesIO(content)):
+        try:
+            manifest = read_manifest(BytesIO(content))
+        except BackupArchiveError as e:
+            return BackupValidationResult(is_valid=False, errors=[str(e)])
+        is_valid, errors, warnings = validate_backup_manifest(manifest, current_schema_revision(db))
+        return BackupValidationResult(
+            is_valid=is_valid,
+            entity_counts=manifest_entity_counts(manifest) if is_valid else None,
+            errors=errors,
+            warnings=warnings,
+        )
+
     try:
-        content = await file.read()
         data = json.loads(content.decode('utf-8'))
     except json.JSONDecodeError as e:
         return BackupValidationResult(
@@ -191,11 +227,26 @@ def delete_backup(
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Delete a backup record and its file."""
+    """
+    Delete a backup record and its file.
+
+    A full backup is kept while any differential still depends on it,
+    since the differential cannot be restored without it.
+    """
     backup = db.query(Backup).filter(Backup.id == backup_id).first()
     if not backup:
         raise HTTPException(status_code=404, detail="Backup not found")
 
+    dependents = [
+        filename for filename, in db.query(Backup.filename).filter(Backup.id != backup.id)
+        if backup_base_filename(filename) == backup.filename
+    ]
+    if dependents:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Differential backups depend on this backup; delete them first: {', '.join(sorted(dependents))}"
+        )
+
     # Delete the file
     delete_backup_file(backup.filename)
 
@@ -206,6 +257,18 @@ def delete_backup(
     return {"message": "Backup deleted successfully"}
 
 
+def _load_uploaded_archive(content: bytes) -> dict:
+    """Load an uploaded archive, replaying a differential on top of its full backup."""
+    manifest = read_manifest(BytesIO(content))
+    if backup_kind(manifest) == FULL_BACKUP:
+        return load_archive(BytesIO(content))
+    base = manifest.get("base", {}).get("filename") or ""
+    base_path = os.path.join(BACKUP_DIR, os.path.basename(base))
+    if not base or not os.path.exists(base_path):
+        raise BackupArchiveError(f"Differential backup needs its full backup ({base}) in the backup directory")
+    return replay_archives([base_path, BytesIO(content)])
+
+
 @router.post("/import")
 async def import_backup(
     file: UploadFile = File(...),
@@ -217,13 +280,19 @@ async def import_backup(
     Import/restore data from a backup file.
 
     Supports both backup format (IDs, absolute dates) and seed format
-    (name references, relative dates like days_from_now).
+    (name references, relative dates like days_from_now). A differential
+    archive is replayed on top of its full backup from the backup directory.
 
     WARNING: If clear_first=True, all existing data will be deleted first!
     """
+    content = await file.read()
     try:
-        content = await file.read()
-        data = json.loads(content.decode('utf-8'))
+        if is_backup_archive(BytesIO(content)):
+            data = _load_uploaded_archive(content)
+        else:
+            data = json.loads(content.decode('utf-8'))
+    except BackupArchiveError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid backup archive: {str(e)}")
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
     except Exception as e:
@@ -253,6 +322,7 @@ async def import_backup(
         logger.error(f"Import failed: {str(e)}")
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+    clear_usage_cache()
 
     return {
         "message": "Import completed successfully",
@@ -337,12 +407,13 @@ def create_database_backup(
     Create a full database backup using pg_dump.
 
     This creates a complete PostgreSQL dump that can be used for disaster recovery.
-    The backup includes all data, schema, sequences, and constraints.
+    The backup includes all data, schema, sequences, and constraints. It is
+    written in pg_dump's compressed custom format; restore with pg_restore.
     """
     ensure_db_backup_dir()
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"db_backup_{timestamp}.sql"
+    filename = f"db_backup_{timestamp}.dump"
     filepath = os.path.join(DB_BACKUP_DIR, filename)
 
     db_info = get_db_connection_info()
@@ -361,6 +432,7 @@ def create_database_backup(
                 "-U", db_info["user"],
                 "-d", db_info["database"],
                 "-f", filepath,
+                "--format=custom",  # Compressed, restorable with pg_restore
                 "--no-owner",  # Don't output ownership commands
                 "--no-acl",    # Don't output access privilege commands
             ],
@@ -403,7 +475,7 @@ def list_database_backups(
 
     backups = []
     for filename in os.listdir(DB_BACKUP_DIR):
-        if filename.endswith('.sql'):
+        if filename.endswith(('.sql', '.dump')):
             filepath = os.path.join(DB_BACKUP_DIR, filename)
             stat = os.stat(filepath)
             backups.append(DatabaseBackupResponse(
@@ -435,7 +507,7 @@ def download_database_backup(
 
     return FileResponse(
         filepath,
-        media_type="application/sql",
+        media_type="application/sql" if filename.endswith(".sql") else "application/octet-stream",
         filename=filename,
     )
 
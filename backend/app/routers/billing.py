@@ -155,7 +155,8 @@ def preview_billing(
         total_horses=result.total_horses,
         total_owners=result.total_owners,
         ledger_entries_created=result.ledger_entries_created,
-        is_preview=result.is_preview
+        is_preview=result.is_preview,
+        timings=result.timings
     )
 
 
@@ -223,5 +224,6 @@ def run_billing(
         total_horses=result.total_horses,
         total_owners=result.total_owners,
         ledger_entries_created=result.ledger_entries_created,
-        is_preview=result.is_preview
+        is_preview=result.is_preview,
+        timings=result.timings
     )
@@ -1,8 +1,11 @@
-from typing import List, Optional, Union
+import base64
+import binascii
+import hashlib
+from typing import List, Optional, Tuple, Union
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, func
 
 from app.database import get_db
@@ -16,6 +19,7 @@ from app.schemas.booking import (
     BookingUpdate,
     BookingResponse,
     BookingPublicResponse,
+    BookingCalendarPage,
     GuestBookingCreate,
     BlockSlotCreate,
     ArenaUsageReport,
@@ -23,6 +27,8 @@ from app.schemas.booking import (
     ArenaUsageSummary,
     BookingTypeUsage,
 )
+from app.services.arena_usage import aggregate_usage, invalidate_usage_cache
+from app.services.booking_conflicts import has_conflict, allocate_pending_bookings
 from app.utils.auth import get_current_user, require_staff_or_admin, has_staff_access
 
 router = APIRouter()
@@ -39,18 +45,7 @@ def check_booking_conflict(
     Check if a time slot conflicts with existing CONFIRMED bookings.
     Pending and cancelled bookings do not block slots.
     """
-    query = db.query(Booking).filter(
-        Booking.arena_id == arena_id,
-        Booking.booking_status == BookingStatus.CONFIRMED,  # Only confirmed bookings block
-        or_(
-            and_(Booking.start_time <= start_time, Booking.end_time > start_time),
-            and_(Booking.start_time < end_time, Booking.end_time >= end_time),
-            and_(Booking.start_time >= start_time, Booking.end_time <= end_time)
-        )
-    )
-    if exclude_booking_id:
-        query = query.filter(Booking.id != exclude_booking_id)
-    return query.first() is not None
+    return has_conflict(db, arena_id, start_time, end_time, exclude_booking_id)
 
 
 def get_booking_response(
@@ -370,6 +365,7 @@ def create_guest_booking(
     )
     db.add(booking)
     db.commit()
+    invalidate_usage_cache(booking.start_time)
     db.refresh(booking)
     return get_booking_response(
         booking,
@@ -418,10 +414,43 @@ def block_arena_slot(
     )
     db.add(booking)
     db.commit()
+    invalidate_usage_cache(booking.start_time)
     db.refresh(booking)
     return get_booking_response(booking)
 
 
+def get_booking_view(booking: Booking, current_user: User) -> Union[BookingResponse, BookingPublicResponse]:
+    """Full booking details if the user may see them, otherwise the compact calendar slot."""
+    if (
+        has_staff_access(current_user)
+        or booking.booking_type == BookingType.EVENT
+        or (current_user.role == UserRole.LIVERY and booking.booking_type == BookingType.LIVERY)
+        or booking.user_id == current_user.id
+    ):
+        return get_booking_response(booking)
+
+    title = "Pending" if booking.booking_status == BookingStatus.PENDING else "Booked"
+    return BookingPublicResponse(
+        id=booking.id,
+        arena_id=booking.arena_id,
+        start_time=booking.start_time,
+        end_time=booking.end_time,
+        booking_type=booking.booking_type,
+        booking_status=booking.booking_status,
+        open_to_share=booking.open_to_share,
+        title=title
+    )
+
+
+def with_booking_relations(query):
+    """Eager load the relationships get_booking_response reads."""
+    return query.options(
+        joinedload(Booking.user),
+        joinedload(Booking.arena),
+        joinedload(Booking.horse)
+    )
+
+
 @router.get("/", response_model=List[Union[BookingResponse, BookingPublicResponse]])
 def list_bookings(
     arena_id: Optional[int] = Query(None),
@@ -431,7 +460,7 @@ def list_bookings(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Booking)
+    query = with_booking_relations(db.query(Booking))
 
     # By default, exclude cancelled bookings (unless admin wants to see them)
     if not include_cancelled or not has_staff_access(current_user):
@@ -445,35 +474,110 @@ def list_bookings(
         query = query.filter(Booking.start_time <= end_date)
 
     bookings = query.all()
+    return [get_booking_view(b, current_user) for b in bookings]
 
-    # Yard staff can see all booking details
-    if has_staff_access(current_user):
-        return [get_booking_response(b) for b in bookings]
 
-    result = []
-    for booking in bookings:
-        if booking.booking_type == BookingType.EVENT:
-            result.append(get_booking_response(booking))
-        elif current_user.role == UserRole.LIVERY and booking.booking_type == BookingType.LIVERY:
-            result.append(get_booking_response(booking))
-        elif booking.user_id == current_user.id:
-            result.append(get_booking_response(booking))
-        else:
-            title = "Pending" if booking.booking_status == BookingStatus.PENDING else "Booked"
-            if booking.booking_type == BookingType.EVENT:
-                title = booking.title
-            result.append(BookingPublicResponse(
-                id=booking.id,
-                arena_id=booking.arena_id,
-                start_time=booking.start_time,
-                end_time=booking.end_time,
-                booking_type=booking.booking_type,
-                booking_status=booking.booking_status,
-                open_to_share=booking.open_to_share,
-                title=title
-            ))
+# ============== Booking Calendar (paginated) ==============
+
+CALENDAR_DEFAULT_PAGE_SIZE = 200
+CALENDAR_MAX_PAGE_SIZE = 500
+
+
+def encode_calendar_cursor(booking: Booking) -> str:
+    raw = f"{booking.start_time.isoformat()}|{booking.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
-    return result
+
+def decode_calendar_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        start_raw, id_raw = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(start_raw), int(id_raw)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid calendar cursor"
+        )
+
+
+def calendar_etag(db: Session, conditions: list, current_user: User, cursor: Optional[str], limit: int) -> str:
+    """
+    Weak ETag for a calendar range. Changes whenever a booking in the range is
+    added, edited or removed, and differs per viewer because visibility does.
+    """
+    count, last_change, max_id = db.query(
+        func.count(Booking.id),
+        func.max(func.coalesce(Booking.updated_at, Booking.created_at)),
+        func.max(Booking.id)
+    ).filter(*conditions).one()
+    raw = ":".join(str(part) for part in (
+        current_user.id, current_user.role.value, has_staff_access(current_user),
+        cursor, limit, count, last_change, max_id
+    ))
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # Weak comparison - ignore W/ prefixes on either side
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+@router.get("/calendar", response_model=BookingCalendarPage)
+def get_booking_calendar(
+    request: Request,
+    response: Response,
+    start_date: datetime = Query(...),
+    end_date: datetime = Query(...),
+    arena_id: Optional[int] = Query(None),
+    include_cancelled: bool = Query(False),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(CALENDAR_DEFAULT_PAGE_SIZE, ge=1, le=CALENDAR_MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Keyset-paginated calendar of bookings overlapping [start_date, end_date].
+
+    Pages are ordered by (start_time, id); pass next_cursor back to get the
+    following page. Responses carry a weak ETag so an unchanged calendar poll
+    with If-None-Match returns 304.
+    """
+    if start_date >= end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="End date must be after start date"
+        )
+
+    conditions = [Booking.end_time >= start_date, Booking.start_time <= end_date]
+    if not include_cancelled or not has_staff_access(current_user):
+        conditions.append(Booking.booking_status != BookingStatus.CANCELLED)
+    if arena_id:
+        conditions.append(Booking.arena_id == arena_id)
+
+    etag = calendar_etag(db, conditions, current_user, cursor, limit)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    query = with_booking_relations(db.query(Booking).filter(*conditions))
+    if cursor:
+        after_start, after_id = decode_calendar_cursor(cursor)
+        query = query.filter(or_(
+            Booking.start_time > after_start,
+            and_(Booking.start_time == after_start, Booking.id > after_id)
+        ))
+
+    rows = query.order_by(Booking.start_time, Booking.id).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    response.headers["ETag"] = etag
+    return BookingCalendarPage(
+        items=[get_booking_view(b, current_user) for b in rows],
+        next_cursor=encode_calendar_cursor(rows[-1]) if has_more else None
+    )
 
 
 @router.get("/{booking_id}", response_model=BookingResponse)
@@ -579,6 +683,7 @@ def create_booking(
     )
     db.add(booking)
     db.commit()
+    invalidate_usage_cache(booking.start_time)
     db.refresh(booking)
     return get_booking_response(booking)
 
@@ -605,6 +710,7 @@ def update_booking(
                 detail="Not authorized to update this booking"
             )
 
+    old_start = booking.start_time
     new_start = booking_data.start_time or booking.start_time
     new_end = booking_data.end_time or booking.end_time
 
@@ -634,6 +740,8 @@ def update_booking(
         setattr(booking, field, value)
 
     db.commit()
+    invalidate_usage_cache(old_start)
+    invalidate_usage_cache(new_start)
     db.refresh(booking)
     return get_booking_response(booking)
 
@@ -661,6 +769,7 @@ def delete_booking(
 
     db.delete(booking)
     db.commit()
+    invalidate_usage_cache(booking.start_time)
 
 
 # ============== Arena Usage Report ==============
@@ -682,50 +791,23 @@ def calculate_usage_for_period(
 ) -> PeriodUsageReport:
     """Calculate arena usage statistics for a given period."""
     arenas = db.query(Arena).filter(Arena.is_active == True).all()
+    usage = aggregate_usage(db, start_date, end_date)
 
     arena_summaries = []
     total_hours = 0.0
 
     for arena in arenas:
-        # Get all bookings for this arena in the period
-        bookings = db.query(Booking).filter(
-            Booking.arena_id == arena.id,
-            Booking.start_time >= start_date,
-            Booking.end_time <= end_date
-        ).all()
-
-        # Calculate hours by booking type
-        usage_by_type = {}
-        arena_total = 0.0
-
-        for booking in bookings:
-            duration_hours = (booking.end_time - booking.start_time).total_seconds() / 3600
-            booking_type = booking.booking_type.value
-
-            if booking_type not in usage_by_type:
-                usage_by_type[booking_type] = {"hours": 0.0, "count": 0}
-
-            usage_by_type[booking_type]["hours"] += duration_hours
-            usage_by_type[booking_type]["count"] += 1
-            arena_total += duration_hours
-
-        # Convert to list of BookingTypeUsage
         usage_list = []
+        arena_total = 0.0
         for bt in BookingType:
-            if bt.value in usage_by_type:
-                usage_list.append(BookingTypeUsage(
-                    booking_type=bt.value,
-                    label=BOOKING_TYPE_LABELS.get(bt, bt.value.title()),
-                    total_hours=round(usage_by_type[bt.value]["hours"], 2),
-                    booking_count=usage_by_type[bt.value]["count"]
-                ))
-            else:
-                usage_list.append(BookingTypeUsage(
-                    booking_type=bt.value,
-                    label=BOOKING_TYPE_LABELS.get(bt, bt.value.title()),
-                    total_hours=0.0,
-                    booking_count=0
-                ))
+            hours, count = usage.get((arena.id, bt), (0.0, 0))
+            usage_list.append(BookingTypeUsage(
+                booking_type=bt.value,
+                label=BOOKING_TYPE_LABELS.get(bt, bt.value.title()),
+                total_hours=round(hours, 2),
+                booking_count=count
+            ))
+            arena_total += hours
 
         arena_summaries.append(ArenaUsageSummary(
             arena_id=arena.id,
@@ -832,37 +914,24 @@ def process_pending_bookings(
     tomorrow = date.today() + relativedelta(days=1)
     tomorrow_end = datetime.combine(tomorrow, datetime.max.time())
 
-    # Find all pending bookings for tomorrow or earlier
-    pending_bookings = db.query(Booking).filter(
-        Booking.booking_status == BookingStatus.PENDING,
-        Booking.start_time <= tomorrow_end
-    ).order_by(Booking.created_at.asc()).all()  # First-come, first-served
-
-    confirmed_count = 0
-    for booking in pending_bookings:
-        # Check if there's a confirmed booking that conflicts
-        conflict = db.query(Booking).filter(
-            Booking.arena_id == booking.arena_id,
-            Booking.booking_status == BookingStatus.CONFIRMED,
-            Booking.id != booking.id,
-            or_(
-                and_(Booking.start_time <= booking.start_time, Booking.end_time > booking.start_time),
-                and_(Booking.start_time < booking.end_time, Booking.end_time >= booking.end_time),
-                and_(Booking.start_time >= booking.start_time, Booking.end_time <= booking.end_time)
-            )
-        ).first()
-
-        if not conflict:
-            # No conflict - auto-confirm
-            booking.booking_status = BookingStatus.CONFIRMED
-            confirmed_count += 1
-
+    # First-come, first-served sweep over all pending bookings for tomorrow or earlier
+    result = allocate_pending_bookings(db, tomorrow_end)
     db.commit()
 
     return {
-        "processed": len(pending_bookings),
-        "confirmed": confirmed_count,
-        "message": f"Processed {len(pending_bookings)} pending booking(s), confirmed {confirmed_count}"
+        "processed": result.processed,
+        "confirmed": result.confirmed,
+        "arenas": [
+            {
+                "arena_id": report.arena_id,
+                "processed": report.processed,
+                "confirmed": len(report.confirmed_ids),
+                "confirmed_booking_ids": report.confirmed_ids,
+                "skipped_booking_ids": report.skipped_ids,
+            }
+            for report in result.arenas.values()
+        ],
+        "message": f"Processed {result.processed} pending booking(s), confirmed {result.confirmed}"
     }
 
 
@@ -890,6 +959,7 @@ def cancel_booking(
 
     booking.booking_status = BookingStatus.CANCELLED
     db.commit()
+    invalidate_usage_cache(booking.start_time)
     db.refresh(booking)
 
     return get_booking_response(booking)
@@ -3,7 +3,7 @@ import os
 from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import Response
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, and_
 
@@ -46,7 +46,9 @@ from app.schemas.contract import (
     DocuSignTestResponse,
 )
 from app.services.docusign_service import get_docusign_service
+from app.services.pdf_rendering import render_cached_pdf
 from app.utils.contract_pdf import generate_contract_pdf, generate_inline_diff_html
+from app.utils.pdf_cache import pdf_cache
 from app.utils.auth import get_current_user, require_roles
 
 router = APIRouter(prefix="/contracts", tags=["contracts"])
@@ -678,15 +680,10 @@ async def download_signed_pdf(
     if not os.path.exists(pdf_path):
         raise HTTPException(status_code=404, detail="Signed PDF file not found")
 
-    with open(pdf_path, "rb") as f:
-        pdf_bytes = f.read()
-
-    return Response(
-        content=pdf_bytes,
+    return FileResponse(
+        pdf_path,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{signature.signed_pdf_filename}"'
-        }
+        filename=signature.signed_pdf_filename
     )
 
 
@@ -789,16 +786,18 @@ async def initiate_signing(
 
     # Generate PDF from contract HTML
     try:
-        pdf_bytes = generate_contract_pdf(
-            html_content=version.html_content,
-            contract_name=template.name,
-            version_number=version.version_number,
-            venue_name=settings.venue_name or "Equestrian Venue",
-            signer_name=current_user.name,
-            include_signature_placeholder=True,
-        )
+        pdf_path = await render_cached_pdf("contract", signature.id, generate_contract_pdf, {
+            "html_content": version.html_content,
+            "contract_name": template.name,
+            "version_number": version.version_number,
+            "venue_name": settings.venue_name or "Equestrian Venue",
+            "signer_name": current_user.name,
+            "include_signature_placeholder": True,
+        })
     except ImportError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    with open(pdf_path, "rb") as f:
+        pdf_bytes = f.read()
 
     # Build return URL for after signing
     frontend_url = settings.frontend_url or "http://localhost:3000"
@@ -875,6 +874,9 @@ async def complete_signing(
             signature.signed_pdf_filename = filename
 
     db.commit()
+    if new_status == SignatureStatusModel.SIGNED:
+        # The unsigned copy sent for signing is no longer needed
+        pdf_cache.invalidate("contract", signature.id)
 
     status_messages = {
         SignatureStatusModel.SIGNED: "Contract signed successfully",
@@ -951,15 +953,10 @@ async def download_my_signed_pdf(
     if not os.path.exists(pdf_path):
         raise HTTPException(status_code=404, detail="Signed PDF file not found")
 
-    with open(pdf_path, "rb") as f:
-        pdf_bytes = f.read()
-
-    return Response(
-        content=pdf_bytes,
+    return FileResponse(
+        pdf_path,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{signature.signed_pdf_filename}"'
-        }
+        filename=signature.signed_pdf_filename
     )
 
 
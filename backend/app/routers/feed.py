@@ -30,6 +30,7 @@ from app.schemas.feed import (
     RehabFeedMedication,
 )
 from app.models.medication_log import RehabProgram, RehabPhase, RehabTask, RehabStatus
+from app.models.task import HealthTaskType
 from app.utils.auth import get_current_user
 from app.services.health_task_generator import HealthTaskGenerator
 
@@ -359,6 +360,8 @@ def update_feed_addition(
     if addition.requested_by_id != current_user.id and current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
+    was_approved = addition.status == AdditionStatus.APPROVED
+
     # Capture old values for notification
     old_values = {
         'name': addition.name,
@@ -399,13 +402,13 @@ def update_feed_addition(
     db.commit()
     db.refresh(addition)
 
-    # Auto-generate medication tasks if just approved and active today
-    if is_approving:
-        today = date.today()
-        if addition.start_date <= today and (addition.end_date is None or addition.end_date >= today):
-            generator = HealthTaskGenerator(db, current_user.id)
-            generator.generate_medication_tasks(today)
-            db.commit()
+    # Reconcile today's medication tasks with the approved additions, so
+    # approvals add tasks and edits update or remove the open ones in place
+    if was_approved or addition.status == AdditionStatus.APPROVED:
+        generator = HealthTaskGenerator(db, current_user.id)
+        diff = generator.diff_for_range(date.today(), health_task_types=[HealthTaskType.MEDICATION])
+        generator.apply_diff(diff)
+        db.commit()
 
     return addition
 
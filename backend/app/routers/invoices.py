@@ -3,7 +3,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -16,6 +16,9 @@ from app.schemas.invoice import (
     InvoiceResponse, InvoiceSummary, MyInvoiceSummary,
     InvoiceLineItemCreate, InvoiceLineItemResponse
 )
+from app.services.document_numbers import next_invoice_number
+from app.services.pdf_rendering import render_cached_pdf
+from app.utils.pdf_cache import pdf_cache
 from app.utils.pdf_generator import generate_invoice_pdf
 from app.utils.auth import get_current_user, require_roles
 
@@ -25,26 +28,6 @@ router = APIRouter(prefix="/invoices", tags=["invoices"])
 PDF_STORAGE_DIR = os.environ.get("PDF_STORAGE_DIR", "/tmp/invoices")
 
 
-def get_next_invoice_number(db: Session) -> str:
-    """Generate next invoice number in format INV-YYYY-NNNN."""
-    year = date.today().year
-    prefix = f"INV-{year}-"
-
-    # Get the highest invoice number for this year
-    last_invoice = db.query(Invoice).filter(
-        Invoice.invoice_number.like(f"{prefix}%")
-    ).order_by(Invoice.invoice_number.desc()).first()
-
-    if last_invoice:
-        # Extract the number part and increment
-        last_num = int(last_invoice.invoice_number.split('-')[-1])
-        next_num = last_num + 1
-    else:
-        next_num = 1
-
-    return f"{prefix}{next_num:04d}"
-
-
 def _invoice_to_response(invoice: Invoice) -> InvoiceResponse:
     """Convert Invoice model to response schema."""
     return InvoiceResponse(
@@ -86,6 +69,37 @@ def _invoice_to_response(invoice: Invoice) -> InvoiceResponse:
     )
 
 
+async def _invoice_pdf_response(invoice: Invoice) -> FileResponse:
+    """Serve the invoice PDF from the PDF cache, rendering it in the render pool on a miss."""
+    pdf_path = await render_cached_pdf("invoice", invoice.id, generate_invoice_pdf, {
+        "invoice_number": invoice.invoice_number,
+        "issue_date": invoice.issue_date or date.today(),
+        "due_date": invoice.due_date or date.today(),
+        "period_start": invoice.period_start,
+        "period_end": invoice.period_end,
+        "customer_name": invoice.user.name,
+        "customer_email": invoice.user.email,
+        "line_items": [
+            {
+                'description': item.description,
+                'quantity': item.quantity,
+                'unit_price': item.unit_price,
+                'amount': item.amount
+            }
+            for item in invoice.line_items
+        ],
+        "subtotal": invoice.subtotal,
+        "payments_received": invoice.payments_received,
+        "balance_due": invoice.balance_due,
+        "notes": invoice.notes,
+    })
+    return FileResponse(
+        pdf_path,
+        media_type="application/pdf",
+        filename=f"{invoice.invoice_number}.pdf"
+    )
+
+
 # ============== Livery User Endpoints ==============
 
 @router.get("/my", response_model=List[MyInvoiceSummary])
@@ -151,37 +165,7 @@ async def download_my_invoice_pdf(
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
 
-    # Generate PDF on the fly
-    pdf_bytes = generate_invoice_pdf(
-        invoice_number=invoice.invoice_number,
-        issue_date=invoice.issue_date or date.today(),
-        due_date=invoice.due_date or date.today(),
-        period_start=invoice.period_start,
-        period_end=invoice.period_end,
-        customer_name=invoice.user.name,
-        customer_email=invoice.user.email,
-        line_items=[
-            {
-                'description': item.description,
-                'quantity': item.quantity,
-                'unit_price': item.unit_price,
-                'amount': item.amount
-            }
-            for item in invoice.line_items
-        ],
-        subtotal=invoice.subtotal,
-        payments_received=invoice.payments_received,
-        balance_due=invoice.balance_due,
-        notes=invoice.notes
-    )
-
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{invoice.invoice_number}.pdf"'
-        }
-    )
+    return await _invoice_pdf_response(invoice)
 
 
 # ============== Admin Endpoints ==============
@@ -250,7 +234,7 @@ async def generate_invoice(
     # Create invoice
     invoice = Invoice(
         user_id=request.user_id,
-        invoice_number=get_next_invoice_number(db),
+        invoice_number=next_invoice_number(db),
         period_start=request.period_start,
         period_end=request.period_end,
         due_date=request.due_date,
@@ -359,6 +343,7 @@ async def issue_invoice(
     invoice.issue_date = date.today()
 
     db.commit()
+    pdf_cache.invalidate("invoice", invoice_id)
     db.refresh(invoice)
 
     return _invoice_to_response(invoice)
@@ -381,6 +366,7 @@ async def mark_invoice_paid(
     invoice.balance_due = Decimal("0")
 
     db.commit()
+    pdf_cache.invalidate("invoice", invoice_id)
     db.refresh(invoice)
 
     return _invoice_to_response(invoice)
@@ -403,6 +389,7 @@ async def cancel_invoice(
     invoice.status = InvoiceStatus.CANCELLED
 
     db.commit()
+    pdf_cache.invalidate("invoice", invoice_id)
     db.refresh(invoice)
 
     return _invoice_to_response(invoice)
@@ -424,6 +411,7 @@ async def delete_invoice(
 
     db.delete(invoice)
     db.commit()
+    pdf_cache.invalidate("invoice", invoice_id)
 
     return {"message": "Invoice deleted"}
 
@@ -439,34 +427,4 @@ async def download_invoice_pdf(
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
 
-    # Generate PDF on the fly
-    pdf_bytes = generate_invoice_pdf(
-        invoice_number=invoice.invoice_number,
-        issue_date=invoice.issue_date or date.today(),
-        due_date=invoice.due_date or date.today(),
-        period_start=invoice.period_start,
-        period_end=invoice.period_end,
-        customer_name=invoice.user.name,
-        customer_email=invoice.user.email,
-        line_items=[
-            {
-                'description': item.description,
-                'quantity': item.quantity,
-                'unit_price': item.unit_price,
-                'amount': item.amount
-            }
-            for item in invoice.line_items
-        ],
-        subtotal=invoice.subtotal,
-        payments_received=invoice.payments_received,
-        balance_due=invoice.balance_due,
-        notes=invoice.notes
-    )
-
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{invoice.invoice_number}.pdf"'
-        }
-    )
+    return await _invoice_pdf_response(invoice)
@@ -29,6 +29,7 @@ from app.schemas.coach import (
     CoachAcceptLesson, CoachDeclineLesson, CoachCancelLesson, CoachBookLesson,
     CoachAvailabilityResponse
 )
+from app.services.arena_usage import invalidate_usage_cache
 from app.utils.auth import get_current_user, get_current_user_optional
 
 router = APIRouter()
@@ -439,6 +440,8 @@ def book_lesson(
         lesson.booking_id = booking.id
 
     db.commit()
+    if data.arena_id:
+        invalidate_usage_cache(booking.start_time)
     db.refresh(lesson)
 
     return build_lesson_response(lesson)
@@ -895,6 +898,8 @@ def accept_lesson_request(
         lesson.booking_id = booking.id
 
     db.commit()
+    if data.arena_id:
+        invalidate_usage_cache(booking.start_time)
     db.refresh(lesson)
 
     return build_lesson_response(lesson)
@@ -1144,6 +1149,8 @@ def coach_book_lesson(
         lesson.booking_id = booking.id
 
     db.commit()
+    if data.arena_id:
+        invalidate_usage_cache(booking.start_time)
     db.refresh(lesson)
 
     return build_lesson_response(lesson)
@@ -1317,6 +1324,8 @@ def admin_accept_lesson(
         lesson.booking_id = booking.id
 
     db.commit()
+    if data.arena_id:
+        invalidate_usage_cache(booking.start_time)
     db.refresh(lesson)
 
     return build_lesson_response(lesson)
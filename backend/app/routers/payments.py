@@ -11,6 +11,7 @@ from app.database import get_db
 from app.config import get_settings
 from app.models.booking import Booking, PaymentStatus
 from app.models.settings import SiteSettings
+from app.services.arena_usage import invalidate_usage_cache
 
 router = APIRouter()
 settings = get_settings()
@@ -338,5 +339,6 @@ def cancel_unpaid_booking(
 
     db.delete(booking)
     db.commit()
+    invalidate_usage_cache(booking.start_time)
 
     return {"message": "Booking cancelled"}
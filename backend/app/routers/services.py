@@ -39,6 +39,7 @@ from app.models.service import PreferredTime
 from app.models.settings import SiteSettings
 from app.models.account import LedgerEntry, TransactionType
 from app.models.livery_package import LiveryPackage
+from app.services.pdf_rendering import render_pdf_blocking
 from app.utils.auth import get_current_user, has_staff_access
 from app.utils.crud import CRUDFactory, require_admin, get_or_404
 from app.utils.pdf_generator import generate_insurance_statement_pdf
@@ -1151,7 +1152,8 @@ def download_insurance_statement_pdf(
     statement_number = f"INS-{start_date.strftime('%Y%m')}-{current_user.id}"
 
     # Generate PDF
-    pdf_bytes = generate_insurance_statement_pdf(
+    pdf_bytes = render_pdf_blocking(
+        generate_insurance_statement_pdf,
         statement_number=statement_number,
         statement_date=date.today(),
         period_start=start_date,
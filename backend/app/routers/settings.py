@@ -6,7 +6,7 @@ from sqlalchemy import text, func
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.settings import SiteSettings
-from app.models.task import YardTask, HealthTaskType, TaskStatus, AssignmentType
+from app.models.task import YardTask, HealthTaskType
 from app.models.staff_management import Shift, ShiftRole
 from app.schemas.settings import (
     SiteSettingsResponse, SiteSettingsUpdate,
@@ -527,7 +527,9 @@ def preview_health_tasks(
 ):
     """Preview what health tasks would be generated for a given date (admin only).
 
-    This is a dry run that doesn't create any tasks.
+    This is a dry run that doesn't create any tasks. It returns the diff a
+    regeneration would apply: tasks to create, open tasks to update in
+    place and open tasks to delete. Completed tasks are never changed.
     """
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
@@ -538,9 +540,7 @@ def preview_health_tasks(
     # Get system user ID for the generator
     system_user_id = scheduler_service.get_system_user_id(db)
     generator = HealthTaskGenerator(db, system_user_id)
-
-    # Generate tasks in preview mode (we'll query without committing)
-    # We need to check what WOULD be generated without creating them
+    diff = generator.diff_for_range(target_date)
 
     # Check for existing tasks on that date
     existing_tasks = db.query(
@@ -570,11 +570,36 @@ def preview_health_tasks(
             existing_counts["rehab_exercise"] = count
         existing_counts["total"] += count
 
+    summary = diff.summary()
+    has_changes = bool(diff.to_insert or diff.to_update or diff.to_delete)
+
     return {
         "target_date": target_date.isoformat(),
         "existing_tasks": existing_counts,
         "already_generated": existing_counts["total"] > 0,
-        "message": f"Health tasks for {target_date} {'already exist' if existing_counts['total'] > 0 else 'have not been generated yet'}."
+        "up_to_date": not has_changes,
+        "changes": summary,
+        "to_create": [
+            {
+                "health_task_type": row["health_task_type"].value,
+                "title": row["title"],
+                "feed_time": row["feed_time"]
+            }
+            for row in diff.to_insert
+        ],
+        "to_update": [
+            {"task_id": task.id, "title": task.title, "fields": sorted(changes)}
+            for task, changes in diff.to_update
+        ],
+        "to_delete": [
+            {"task_id": task.id, "title": task.title}
+            for task in diff.to_delete
+        ],
+        "message": (
+            f"Regenerating health tasks for {target_date} would create {summary['insert']['total']}, "
+            f"update {summary['update']['total']} and delete {summary['delete']['total']} tasks."
+            if has_changes else f"Health tasks for {target_date} are up to date."
+        )
     }
 
 
@@ -601,7 +626,10 @@ def generate_health_tasks(
             "success": True,
             "target_date": target_date.isoformat(),
             "tasks_generated": result,
-            "message": f"Generated {result['total']} health tasks for {target_date}"
+            "message": (
+                f"Generated {result['total']} health tasks for {target_date} "
+                f"({result['updated']} updated, {result['deleted']} removed)"
+            )
         }
     except Exception as e:
         db.rollback()
@@ -624,24 +652,12 @@ def run_task_rollover(
         )
 
     try:
-        today = date.today()
-
-        # Find incomplete tasks scheduled for past dates
-        past_tasks = db.query(YardTask).filter(
-            YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-            YardTask.scheduled_date < today,
-            YardTask.scheduled_date.isnot(None)
-        ).all()
-
-        count = 0
-        for task in past_tasks:
-            task.scheduled_date = None
-            task.assignment_type = AssignmentType.BACKLOG
-            task.assigned_to_id = None
-            task.is_maintenance_day_task = False
-            count += 1
-
+        moved_ids = scheduler_service.rollover_tasks(
+            db, date.today(), chunk_size=scheduler_service.ROLLOVER_CHUNK_SIZE
+        )
         db.commit()
+        scheduler_service.tasks_rolled_over_total.inc(len(moved_ids))
+        count = len(moved_ids)
 
         return {
             "success": True,
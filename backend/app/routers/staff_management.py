@@ -14,7 +14,7 @@ from app.models.staff_management import (
     Shift, Timesheet, HolidayRequest, UnplannedAbsence, PayrollAdjustment, StaffThanks, StaffDayStatus,
     ShiftType, ShiftRole, WorkType, TimesheetStatus, LeaveType, LeaveStatus, PayrollAdjustmentType, DayStatusType
 )
-from app.models.staff_profile import StaffProfile, HourlyRateHistory
+from app.models.staff_profile import StaffProfile
 from app.models.user import User, UserRole, StaffType
 from app.models.settings import SiteSettings
 from app.utils.auth import has_staff_access
@@ -27,11 +27,12 @@ from app.schemas.staff_management import (
     StaffSummary, ManagerDashboard, StaffManagementEnums, EnumInfo,
     StaffLeaveSummary, AllStaffLeaveSummary,
     PayrollAdjustmentCreate, PayrollAdjustmentResponse, PayrollAdjustmentListResponse,
-    PayrollAdjustmentSummary, StaffPayrollPeriod, PayrollSummaryResponse,
+    PayrollSummaryResponse,
     StaffThanksCreate, StaffThanksResponse, StaffThanksListResponse, StaffThanksUnreadCount,
     DayStatusCreate, DayStatusResponse, DayStatusListResponse
 )
 from app.utils.auth import get_current_user
+from app.services.payroll_engine import calculate_hours, build_payroll_summary
 
 router = APIRouter()
 
@@ -111,43 +112,6 @@ def require_manager(current_user: User):
         )
 
 
-def calculate_hours(clock_in, clock_out, break_minutes: int = 0) -> float:
-    """Calculate total hours worked."""
-    if not clock_out:
-        return 0.0
-    # Convert times to datetime for calculation, truncating seconds
-    base_date = date.today()
-    dt_in = datetime.combine(base_date, clock_in.replace(second=0, microsecond=0))
-    dt_out = datetime.combine(base_date, clock_out.replace(second=0, microsecond=0))
-    # Handle overnight shifts
-    if dt_out < dt_in:
-        dt_out += timedelta(days=1)
-    total_minutes = (dt_out - dt_in).total_seconds() / 60 - break_minutes
-    return round(total_minutes / 60, 2)
-
-
-def get_rate_for_date(db: Session, staff_id: int, work_date: date) -> float:
-    """Get the hourly rate that was effective on a given date.
-
-    Looks up the rate history to find the most recent rate that was
-    effective on or before the work date.
-    """
-    rate_entry = db.query(HourlyRateHistory).filter(
-        HourlyRateHistory.staff_id == staff_id,
-        HourlyRateHistory.effective_date <= work_date
-    ).order_by(HourlyRateHistory.effective_date.desc()).first()
-
-    if rate_entry:
-        return float(rate_entry.hourly_rate)
-
-    # Fallback to current profile rate if no history exists
-    profile = db.query(StaffProfile).filter(StaffProfile.user_id == staff_id).first()
-    if profile and profile.hourly_rate:
-        return float(profile.hourly_rate)
-
-    return 0.0
-
-
 def enrich_shift(shift: Shift) -> dict:
     """Add computed fields to shift response."""
     return {
@@ -1300,134 +1264,7 @@ def get_payroll_summary(
     if end_date < start_date:
         raise HTTPException(status_code=400, detail="end_date must be on or after start_date")
 
-    period_start = start_date
-    period_end = end_date
-    period_label = f"{period_start.strftime('%-d %b %Y')} - {period_end.strftime('%-d %b %Y')}"
-
-    # Get all staff users
-    staff_users = db.query(User).filter(
-        (User.role == UserRole.STAFF) | (User.is_yard_staff == True),
-        User.is_active == True
-    ).all()
-
-    staff_summaries = []
-    total_hours = 0.0
-    total_base_pay = 0.0
-    total_holiday_hours = 0.0
-    total_holiday_pay = 0.0
-    total_adjustments_amount = 0.0
-    total_pay_amount = 0.0
-
-    for user in staff_users:
-        # Get staff profile for current hourly rate (for display)
-        profile = db.query(StaffProfile).filter(StaffProfile.user_id == user.id).first()
-        current_hourly_rate = float(profile.hourly_rate) if profile and profile.hourly_rate else 0.0
-        staff_type = user.staff_type.value if user.staff_type else None
-
-        # Calculate approved hours and base pay (using rate effective on each timesheet date)
-        timesheets = db.query(Timesheet).filter(
-            Timesheet.staff_id == user.id,
-            Timesheet.status == TimesheetStatus.APPROVED,
-            Timesheet.date >= period_start,
-            Timesheet.date <= period_end
-        ).all()
-
-        approved_hours = 0.0
-        base_pay = 0.0
-        for ts in timesheets:
-            if ts.clock_out:
-                hours = calculate_hours(ts.clock_in, ts.clock_out, ts.break_minutes)
-                # Use the rate effective on the timesheet date
-                rate_for_date = get_rate_for_date(db, user.id, ts.date)
-                approved_hours += hours
-                base_pay += hours * rate_for_date
-
-        timesheet_count = len(timesheets)
-
-        # Get adjustments for this period
-        adjustments = db.query(PayrollAdjustment).filter(
-            PayrollAdjustment.staff_id == user.id,
-            PayrollAdjustment.payment_date >= period_start,
-            PayrollAdjustment.payment_date <= period_end
-        ).all()
-
-        oneoff_total = sum(float(a.amount) for a in adjustments if a.adjustment_type == PayrollAdjustmentType.ONEOFF)
-        tips_total = sum(float(a.amount) for a in adjustments if a.adjustment_type == PayrollAdjustmentType.TIP)
-        taxable_adj = sum(float(a.amount) for a in adjustments if a.taxable)
-        non_taxable_adj = sum(float(a.amount) for a in adjustments if not a.taxable)
-
-        adjustment_summary = PayrollAdjustmentSummary(
-            oneoff_total=oneoff_total,
-            tips_total=tips_total,
-            taxable_adjustments=taxable_adj,
-            non_taxable_adjustments=non_taxable_adj
-        )
-
-        # Calculate approved annual leave (holiday) pay for this period
-        holidays = db.query(HolidayRequest).filter(
-            HolidayRequest.staff_id == user.id,
-            HolidayRequest.leave_type == LeaveType.ANNUAL,
-            HolidayRequest.status == LeaveStatus.APPROVED,
-            HolidayRequest.start_date <= period_end,
-            HolidayRequest.end_date >= period_start
-        ).all()
-
-        holiday_days = 0.0
-        for h in holidays:
-            if h.start_date >= period_start and h.end_date <= period_end:
-                # Fully within period
-                holiday_days += float(h.days_requested)
-            else:
-                # Partially overlapping - pro-rate
-                total_calendar_days = (h.end_date - h.start_date).days + 1
-                overlap_start = max(h.start_date, period_start)
-                overlap_end = min(h.end_date, period_end)
-                overlap_days = (overlap_end - overlap_start).days + 1
-                holiday_days += float(h.days_requested) * (overlap_days / total_calendar_days)
-
-        holiday_hours = round(holiday_days * 8, 2)
-        holiday_pay = round(holiday_hours * current_hourly_rate, 2)
-
-        staff_total_pay = base_pay + oneoff_total + tips_total + holiday_pay
-        taxable_pay = base_pay + taxable_adj + holiday_pay
-        non_taxable_pay = non_taxable_adj
-
-        staff_summaries.append(StaffPayrollPeriod(
-            staff_id=user.id,
-            staff_name=user.name,
-            staff_type=staff_type,
-            hourly_rate=current_hourly_rate,
-            approved_hours=approved_hours,
-            timesheet_count=timesheet_count,
-            base_pay=base_pay,
-            holiday_days=holiday_days,
-            holiday_hours=holiday_hours,
-            holiday_pay=holiday_pay,
-            adjustments=adjustment_summary,
-            total_pay=staff_total_pay,
-            taxable_pay=taxable_pay,
-            non_taxable_pay=non_taxable_pay
-        ))
-
-        total_hours += approved_hours
-        total_base_pay += base_pay
-        total_holiday_hours += holiday_hours
-        total_holiday_pay += holiday_pay
-        total_adjustments_amount += oneoff_total + tips_total
-        total_pay_amount += staff_total_pay
-
-    return PayrollSummaryResponse(
-        period_start=period_start,
-        period_end=period_end,
-        period_label=period_label,
-        staff_summaries=staff_summaries,
-        total_approved_hours=total_hours,
-        total_base_pay=total_base_pay,
-        total_holiday_hours=total_holiday_hours,
-        total_holiday_pay=total_holiday_pay,
-        total_adjustments=total_adjustments_amount,
-        total_pay=total_pay_amount
-    )
+    return build_payroll_summary(db, start_date, end_date)
 
 
 @router.post("/payroll-adjustments", response_model=PayrollAdjustmentResponse, status_code=status.HTTP_201_CREATED)
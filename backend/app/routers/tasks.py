@@ -1,5 +1,5 @@
 from typing import List, Optional
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
@@ -10,7 +10,6 @@ from app.models.task import (
     TaskCategory, TaskPriority, TaskStatus, RecurrenceType, AssignmentType, HealthTaskType
 )
 from app.models.user import User, UserRole
-from app.models.service import ServiceRequest
 from app.models.medication_log import (
     MedicationAdminLog, WoundCareLog, HealthObservation, RehabTaskLog,
     HealingStatus, AppetiteStatus, DemeanorStatus
@@ -24,6 +23,7 @@ from app.schemas.task import (
 )
 from app.utils.auth import get_current_user, has_staff_access
 from app.services.health_task_generator import HealthTaskGenerator
+from app.services.task_board import build_task_board
 
 router = APIRouter()
 
@@ -177,6 +177,18 @@ def get_enums():
     )
 
 
+# Dashboard summaries are polled constantly by staff tablets, so each user's
+# counts are cached briefly. Task writes in this router clear the cache;
+# writes made elsewhere (scheduler, service requests) show up within the TTL.
+SUMMARY_CACHE_SECONDS = 5
+_summary_cache: dict = {}
+
+
+def invalidate_summary_cache():
+    """Call this after committing any change that creates, changes or removes tasks."""
+    _summary_cache.clear()
+
+
 @router.get("/summary", response_model=TasksSummary)
 def get_summary(
     current_user: User = Depends(get_current_user),
@@ -184,37 +196,25 @@ def get_summary(
 ):
     """Get task summary counts."""
     today = date.today()
-
-    total_open = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS])
-    ).count()
-
-    urgent_count = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.priority == TaskPriority.URGENT
-    ).count()
-
-    high_priority_count = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.priority == TaskPriority.HIGH
-    ).count()
-
-    overdue_count = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.scheduled_date < today
-    ).count()
-
-    my_assigned_count = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.assigned_to_id == current_user.id
-    ).count()
-
-    today_count = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.scheduled_date == today
-    ).count()
-
-    return TasksSummary(
+    now = datetime.utcnow()
+
+    cache_key = (current_user.id, today)
+    cached = _summary_cache.get(cache_key)
+    if cached and cached["expires_at"] > now:
+        return cached["data"]
+
+    is_active = YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS])
+    counts = db.query(
+        func.count().filter(is_active),
+        func.count().filter(is_active, YardTask.priority == TaskPriority.URGENT),
+        func.count().filter(is_active, YardTask.priority == TaskPriority.HIGH),
+        func.count().filter(is_active, YardTask.scheduled_date < today),
+        func.count().filter(is_active, YardTask.assigned_to_id == current_user.id),
+        func.count().filter(is_active, YardTask.scheduled_date == today),
+    ).select_from(YardTask).one()
+
+    total_open, urgent_count, high_priority_count, overdue_count, my_assigned_count, today_count = counts
+    summary = TasksSummary(
         total_open=total_open,
         urgent_count=urgent_count,
         high_priority_count=high_priority_count,
@@ -222,6 +222,11 @@ def get_summary(
         my_assigned_count=my_assigned_count,
         today_count=today_count,
     )
+    _summary_cache[cache_key] = {
+        "data": summary,
+        "expires_at": now + timedelta(seconds=SUMMARY_CACHE_SECONDS),
+    }
+    return summary
 
 
 @router.get("/", response_model=TasksListResponse)
@@ -241,116 +246,23 @@ def list_tasks(
     - status_filter: Filter by task status
     - assigned_to_id: Filter by assigned user ID (use -1 for unassigned/pool tasks)
     """
-    today = date.today()
-
-    # Rollover overdue tasks: move uncompleted tasks back to backlog (To Schedule)
-    overdue_tasks = db.query(YardTask).filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.scheduled_date < today,
-        YardTask.assignment_type.in_([AssignmentType.SPECIFIC, AssignmentType.POOL])
-    ).all()
-
-    for task in overdue_tasks:
-        task.scheduled_date = None  # Clear schedule
-        task.assignment_type = AssignmentType.BACKLOG  # Return to backlog for rescheduling
-        task.assigned_to_id = None  # Clear assignment
-        task.is_maintenance_day_task = False  # No longer part of a maintenance day
-
-    if overdue_tasks:
-        db.commit()
-
-    # Base query with eager loading for relationships
-    base_query = db.query(YardTask).options(
-        joinedload(YardTask.reported_by),
-        joinedload(YardTask.assigned_to),
-        joinedload(YardTask.completed_by),
-        joinedload(YardTask.comments),
-        # Health task relationships
-        joinedload(YardTask.horse),
-        joinedload(YardTask.feed_addition),
-        joinedload(YardTask.wound_care_log),
-        joinedload(YardTask.rehab_task),
-        joinedload(YardTask.rehab_program),
-        # Service request relationship (for billable amount)
-        joinedload(YardTask.service_request).joinedload(ServiceRequest.service)
-    )
-
-    if category:
-        base_query = base_query.filter(YardTask.category == category)
-    if priority:
-        base_query = base_query.filter(YardTask.priority == priority)
-    if assigned_to_id is not None:
-        if assigned_to_id == -1:
-            # Special value: show unassigned tasks (pool or no assignment)
-            base_query = base_query.filter(YardTask.assigned_to_id.is_(None))
-        else:
-            base_query = base_query.filter(YardTask.assigned_to_id == assigned_to_id)
-
-    # Open tasks (not completed/cancelled)
-    open_query = base_query.filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS])
+    board = build_task_board(
+        db,
+        current_user.id,
+        category=category,
+        priority=priority,
+        status_filter=status_filter,
+        assigned_to_id=assigned_to_id
     )
-    if status_filter:
-        open_query = open_query.filter(YardTask.status == status_filter)
-
-    open_tasks = open_query.order_by(
-        YardTask.priority.desc(),
-        YardTask.scheduled_date.asc().nullslast(),
-        YardTask.reported_date.desc()
-    ).all()
-
-    # My tasks (specifically assigned to me - not pool tasks)
-    my_tasks = base_query.filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.assigned_to_id == current_user.id,
-        YardTask.assignment_type == AssignmentType.SPECIFIC
-    ).order_by(
-        YardTask.priority.desc(),
-        YardTask.scheduled_date.asc().nullslast()
-    ).all()
-
-    # Today's tasks (specific assignments for today)
-    today_tasks = base_query.filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.scheduled_date == today,
-        YardTask.assignment_type == AssignmentType.SPECIFIC
-    ).order_by(YardTask.priority.desc()).all()
-
-    # Pool tasks - available for any staff working today
-    pool_tasks = base_query.filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.assignment_type == AssignmentType.POOL,
-        YardTask.scheduled_date == today
-    ).order_by(YardTask.priority.desc()).all()
-
-    # Backlog tasks - not time-sensitive
-    backlog_tasks = base_query.filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.assignment_type == AssignmentType.BACKLOG
-    ).order_by(YardTask.priority.desc(), YardTask.reported_date.asc()).all()
-
-    # Completed today - for daily review
-    completed_tasks = base_query.filter(
-        YardTask.status == TaskStatus.COMPLETED,
-        func.date(YardTask.completed_date) == today
-    ).order_by(YardTask.completed_date.desc()).all()
-
-    # Scheduled tasks - future scheduled dates only (today is shown in Today tabs)
-    # Include both SPECIFIC (assigned) and POOL (unassigned) tasks
-    scheduled_tasks = base_query.filter(
-        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-        YardTask.assignment_type.in_([AssignmentType.SPECIFIC, AssignmentType.POOL]),
-        YardTask.scheduled_date > today
-    ).order_by(YardTask.scheduled_date.asc(), YardTask.priority.desc()).all()
 
     return TasksListResponse(
-        open_tasks=[enrich_task(t) for t in open_tasks],
-        my_tasks=[enrich_task(t) for t in my_tasks],
-        today_tasks=[enrich_task(t) for t in today_tasks],
-        pool_tasks=[enrich_task(t) for t in pool_tasks],
-        backlog_tasks=[enrich_task(t) for t in backlog_tasks],
-        completed_tasks=[enrich_task(t) for t in completed_tasks],
-        scheduled_tasks=[enrich_task(t) for t in scheduled_tasks],
+        open_tasks=[enrich_task(t) for t in board.open_tasks],
+        my_tasks=[enrich_task(t) for t in board.my_tasks],
+        today_tasks=[enrich_task(t) for t in board.today_tasks],
+        pool_tasks=[enrich_task(t) for t in board.pool_tasks],
+        backlog_tasks=[enrich_task(t) for t in board.backlog_tasks],
+        completed_tasks=[enrich_task(t) for t in board.completed_tasks],
+        scheduled_tasks=[enrich_task(t) for t in board.scheduled_tasks],
     )
 
 
@@ -395,6 +307,7 @@ def create_task(
     )
     db.add(task)
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -450,6 +363,7 @@ def update_task(
         setattr(task, field, value)
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -498,6 +412,7 @@ def assign_task(
         task.assigned_to_id = None
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -551,6 +466,7 @@ def complete_task(
                 service_request.notes = notes
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -578,6 +494,7 @@ def cancel_task(
 
     task.status = TaskStatus.CANCELLED
     db.commit()
+    invalidate_summary_cache()
 
 
 @router.put("/{task_id}/reopen", response_model=YardTaskResponse)
@@ -621,6 +538,7 @@ def reopen_task(
     task.completion_notes = None
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -652,6 +570,7 @@ def unschedule_task(
     task.is_maintenance_day_task = False
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -694,6 +613,7 @@ def reassign_task(
         task.assignment_type = AssignmentType.POOL
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -765,6 +685,7 @@ def assign_maintenance_day(
         db.add(shift)
 
     db.commit()
+    invalidate_summary_cache()
 
     # Refresh and return
     for task in tasks:
@@ -857,6 +778,7 @@ def generate_health_tasks(
 
     generator = HealthTaskGenerator(db, current_user.id)
     result = generator.generate_all_for_date(target_date)
+    invalidate_summary_cache()
 
     return HealthTaskGenerationResult(
         date=target_date,
@@ -864,7 +786,9 @@ def generate_health_tasks(
         wound_care=result["wound_care"],
         health_check=result["health_check"],
         rehab_exercise=result["rehab_exercise"],
-        total=result["total"]
+        total=result["total"],
+        updated=result["updated"],
+        deleted=result["deleted"]
     )
 
 
@@ -1043,6 +967,7 @@ def complete_health_task(
     task.health_record_type = health_record_type
 
     db.commit()
+    invalidate_summary_cache()
     db.refresh(task)
 
     return enrich_task(task)
@@ -2,7 +2,7 @@
 
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 
@@ -43,6 +43,7 @@ class BillingRunResponse(BaseModel):
     total_owners: int
     ledger_entries_created: int
     is_preview: bool
+    timings: Dict[str, float] = {}  # seconds spent loading, calculating and writing
 
 
 class BillingRunRequest(BaseModel):
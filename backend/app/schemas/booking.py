@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from pydantic import BaseModel, ConfigDict, EmailStr
 from app.models.booking import BookingType, BookingStatus, PaymentStatus
 
@@ -63,6 +63,12 @@ class BookingPublicResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BookingCalendarPage(BaseModel):
+    """One keyset page of the booking calendar."""
+    items: list[Union[BookingResponse, BookingPublicResponse]]
+    next_cursor: Optional[str] = None
+
+
 class GuestBookingCreate(BaseModel):
     arena_id: int
     title: str
@@ -219,3 +219,5 @@ class HealthTaskGenerationResult(BaseModel):
     health_check: int
     rehab_exercise: int
     total: int
+    updated: int = 0
+    deleted: int = 0
@@ -0,0 +1,88 @@
+"""
+Account Balance Reconciliation
+
+account_balances is a projection of ledger_entries kept up to date on
+every flush (see app.models.account). This service compares it with a
+fresh aggregate of the ledger, reports any drift and optionally rebuilds
+the table from scratch.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.account import (
+    UserAccountBalance, BALANCE_TOTALS, ledger_totals_query, recompute_account_balances
+)
+
+
+PROJECTION_FIELDS = BALANCE_TOTALS + ("last_payment_date",)
+
+
+@dataclass
+class BalanceDrift:
+    """A user whose stored balance row disagrees with the ledger."""
+    user_id: int
+    stored: Optional[dict]  # None when the row is missing
+    expected: Optional[dict]  # None when the user has no ledger entries
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the projection columns that differ."""
+        stored = self.stored or {}
+        expected = self.expected or {}
+        return [name for name in PROJECTION_FIELDS if stored.get(name) != expected.get(name)]
+
+
+def _normalise(values: dict) -> dict:
+    result = {}
+    for name in PROJECTION_FIELDS:
+        value = values.get(name)
+        if name in ("balance", "total_charges", "total_payments"):
+            value = Decimal(str(value or 0)).quantize(Decimal("0.01"))
+        elif name == "entry_count":
+            value = int(value or 0)
+        elif isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        result[name] = value
+    return result
+
+
+def find_balance_drift(db: Session) -> List[BalanceDrift]:
+    """Compare every stored balance row with the ledger aggregate."""
+    expected: Dict[int, dict] = {
+        row.user_id: _normalise(row._asdict())
+        for row in db.execute(ledger_totals_query())
+    }
+    stored: Dict[int, dict] = {
+        row.user_id: _normalise({name: getattr(row, name) for name in PROJECTION_FIELDS})
+        for row in db.query(UserAccountBalance).all()
+    }
+
+    drift = []
+    for user_id in sorted(expected.keys() | stored.keys()):
+        expected_row = expected.get(user_id)
+        stored_row = stored.get(user_id)
+        if expected_row is None and stored_row is not None and stored_row["entry_count"] == 0 \
+                and not any(stored_row[name] for name in ("balance", "total_charges", "total_payments")):
+            # A zeroed row for a user whose entries were all deleted is equivalent to no row
+            continue
+        if expected_row != stored_row:
+            drift.append(BalanceDrift(user_id=user_id, stored=stored_row, expected=expected_row))
+    return drift
+
+
+def reconcile_account_balances(db: Session, rebuild: bool = True) -> List[BalanceDrift]:
+    """
+    Report drift between account_balances and the ledger, then (unless
+    rebuild is False) rebuild the whole table from the ledger. The caller
+    commits.
+    """
+    drift = find_balance_drift(db)
+    if rebuild:
+        recompute_account_balances(db.connection())
+        db.expire_all()
+    return drift
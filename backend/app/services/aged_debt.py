@@ -0,0 +1,176 @@
+"""
+Aged Debt Engine
+
+Ages every livery account in a single SQL statement:
+
+1. entries   - ledger entries as they stood at the end of as_of_date
+               (entries voided by then, and their reversals, drop out)
+2. per_user  - total charges, total credits and last payment per user
+3. charges   - each charge with a running total of the user's earlier
+               charges (window function, oldest first)
+4. buckets   - credits are allocated to charges FIFO: a charge is paid
+               off once the user's credits exceed the charges before it.
+               What is left of each charge is summed into its age
+               bracket with FILTER aggregates.
+
+Credit beyond the total charged shows as a negative current balance.
+Because entries are cut off at as_of_date, year-end snapshots can be
+produced for any past date.
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Iterator, Optional
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.account import LedgerEntry, TransactionType
+from app.models.user import User, UserRole
+from app.schemas.account import AgedDebtItem, AgedDebtReport
+
+
+ZERO = Decimal("0.00")
+
+# Age brackets in days: current is under 30, then 30-59, 60-89 and 90+
+BRACKET_DAYS = (30, 60, 90)
+
+
+def aged_debt_query(as_of_date: date):
+    """SELECT of one aged row per livery user with a non-zero balance."""
+    cutoff = datetime.combine(as_of_date + timedelta(days=1), time.min)
+    one_month, two_months, three_months = (
+        datetime.combine(as_of_date - timedelta(days=days), time.min) for days in BRACKET_DAYS
+    )
+
+    entries = select(
+        LedgerEntry.id,
+        LedgerEntry.user_id,
+        LedgerEntry.amount,
+        LedgerEntry.transaction_type,
+        LedgerEntry.transaction_date,
+    ).where(
+        LedgerEntry.transaction_date < cutoff,
+        LedgerEntry.original_entry_id.is_(None),
+        or_(
+            LedgerEntry.voided == False,
+            and_(LedgerEntry.voided_at.isnot(None), LedgerEntry.voided_at >= cutoff)
+        )
+    ).cte("entries")
+
+    per_user = select(
+        entries.c.user_id,
+        func.coalesce(func.sum(case((entries.c.amount > 0, entries.c.amount), else_=ZERO)), ZERO).label("charged"),
+        func.coalesce(func.sum(case((entries.c.amount < 0, -entries.c.amount), else_=ZERO)), ZERO).label("credited"),
+        func.max(case((
+            and_(entries.c.transaction_type == TransactionType.PAYMENT, entries.c.amount < 0),
+            entries.c.transaction_date
+        ))).label("last_payment"),
+    ).group_by(entries.c.user_id).cte("per_user")
+
+    charges = select(
+        entries.c.user_id,
+        entries.c.amount,
+        entries.c.transaction_date,
+        (func.sum(entries.c.amount).over(
+            partition_by=entries.c.user_id,
+            order_by=(entries.c.transaction_date, entries.c.id),
+            rows=(None, 0)
+        ) - entries.c.amount).label("charged_before"),
+    ).where(entries.c.amount > 0).cte("charges")
+
+    # Portion of each charge not yet covered by the user's credits
+    credited = per_user.c.credited
+    before = charges.c.charged_before
+    outstanding = case(
+        (credited <= before, charges.c.amount),
+        (credited >= before + charges.c.amount, ZERO),
+        else_=before + charges.c.amount - credited
+    )
+    tx_date = charges.c.transaction_date
+
+    buckets = select(
+        charges.c.user_id,
+        func.sum(outstanding).filter(tx_date >= one_month).label("current"),
+        func.sum(outstanding).filter(and_(tx_date < one_month, tx_date >= two_months)).label("month_1"),
+        func.sum(outstanding).filter(and_(tx_date < two_months, tx_date >= three_months)).label("month_2"),
+        func.sum(outstanding).filter(tx_date < three_months).label("month_3_plus"),
+    ).select_from(
+        charges.join(per_user, per_user.c.user_id == charges.c.user_id)
+    ).group_by(charges.c.user_id).cte("buckets")
+
+    excess_credit = case((credited > per_user.c.charged, credited - per_user.c.charged), else_=ZERO)
+    total = per_user.c.charged - credited
+
+    return select(
+        User.id.label("user_id"),
+        User.name.label("user_name"),
+        User.email.label("user_email"),
+        (func.coalesce(buckets.c.current, ZERO) - excess_credit).label("current"),
+        func.coalesce(buckets.c.month_1, ZERO).label("month_1"),
+        func.coalesce(buckets.c.month_2, ZERO).label("month_2"),
+        func.coalesce(buckets.c.month_3_plus, ZERO).label("month_3_plus"),
+        total.label("total"),
+        per_user.c.last_payment,
+    ).select_from(
+        User.__table__
+        .join(per_user, per_user.c.user_id == User.id)
+        .outerjoin(buckets, buckets.c.user_id == User.id)
+    ).where(
+        User.role == UserRole.LIVERY,
+        User.is_active == True,
+        total != 0
+    ).order_by(total.desc(), User.id)
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(ZERO)
+
+
+def iter_aged_debt(db: Session, as_of_date: date, yield_per: int = 500) -> Iterator[AgedDebtItem]:
+    """Aged rows as at the end of as_of_date, fetched in batches from a server-side cursor."""
+    result = db.execute(aged_debt_query(as_of_date).execution_options(yield_per=yield_per))
+    for row in result:
+        last_payment = row.last_payment
+        if isinstance(last_payment, str):
+            last_payment = datetime.fromisoformat(last_payment)
+        yield AgedDebtItem(
+            user_id=row.user_id,
+            user_name=row.user_name,
+            user_email=row.user_email,
+            current=_money(row.current),
+            month_1=_money(row.month_1),
+            month_2=_money(row.month_2),
+            month_3_plus=_money(row.month_3_plus),
+            total=_money(row.total),
+            last_payment_date=last_payment.date() if last_payment else None
+        )
+
+
+def add_to_totals(totals: AgedDebtItem, item: AgedDebtItem) -> None:
+    totals.current += item.current
+    totals.month_1 += item.month_1
+    totals.month_2 += item.month_2
+    totals.month_3_plus += item.month_3_plus
+    totals.total += item.total
+
+
+def empty_totals() -> AgedDebtItem:
+    return AgedDebtItem(user_id=0, user_name="TOTALS")
+
+
+def build_aged_debt_report(db: Session, as_of_date: Optional[date] = None) -> AgedDebtReport:
+    """Aged debt for every livery account as at the end of as_of_date (default today)."""
+    as_of_date = as_of_date or date.today()
+
+    accounts = []
+    totals = empty_totals()
+    for item in iter_aged_debt(db, as_of_date):
+        accounts.append(item)
+        add_to_totals(totals, item)
+
+    return AgedDebtReport(
+        as_of_date=as_of_date,
+        accounts=accounts,
+        totals=totals
+    )
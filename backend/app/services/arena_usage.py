@@ -0,0 +1,71 @@
+"""
+Arena Usage Aggregation
+
+Sums booking hours and counts per arena and booking type for the usage
+report, in one grouped query per period.
+
+Usage for periods that have already ended is memoised per (start, end)
+as {(arena_id, booking_type): (hours, count)}. Writers call
+invalidate_usage_cache once a booking change is committed, and
+clear_usage_cache after bookings are restored in bulk; writes made
+anywhere else (or by another worker process) show up within the TTL.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking
+
+USAGE_CACHE_SECONDS = 300
+_usage_cache: dict = {}
+
+
+def invalidate_usage_cache(booking_start: datetime) -> None:
+    """Drop memoised usage for any period containing booking_start."""
+    for key in [k for k in _usage_cache if k[0] <= booking_start <= k[1]]:
+        del _usage_cache[key]
+
+
+def clear_usage_cache() -> None:
+    """Drop all memoised usage, e.g. after bookings are restored in bulk."""
+    _usage_cache.clear()
+
+
+def booking_duration_seconds(db: Session):
+    """SQL expression for end_time - start_time in seconds."""
+    if db.get_bind().dialect.name == "sqlite":
+        return (func.julianday(Booking.end_time) - func.julianday(Booking.start_time)) * 86400
+    return func.extract("epoch", Booking.end_time - Booking.start_time)
+
+
+def aggregate_usage(db: Session, start_date: datetime, end_date: datetime) -> dict:
+    """Sum booking hours and counts per arena and booking type in one query."""
+    now = datetime.utcnow()
+    is_closed = end_date < now
+    cache_key = (start_date, end_date)
+    cached = _usage_cache.get(cache_key)
+    if is_closed and cached and cached["expires_at"] > now:
+        return cached["data"]
+
+    rows = db.query(
+        Booking.arena_id,
+        Booking.booking_type,
+        func.count(Booking.id),
+        func.sum(booking_duration_seconds(db))
+    ).filter(
+        Booking.start_time >= start_date,
+        Booking.end_time <= end_date
+    ).group_by(Booking.arena_id, Booking.booking_type).all()
+
+    usage = {
+        (arena_id, booking_type): (float(seconds or 0) / 3600, count)
+        for arena_id, booking_type, count, seconds in rows
+    }
+    if is_closed:
+        _usage_cache[cache_key] = {
+            "data": usage,
+            "expires_at": now + timedelta(seconds=USAGE_CACHE_SECONDS),
+        }
+    return usage
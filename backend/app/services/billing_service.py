@@ -6,24 +6,42 @@ Handles automated monthly billing for livery packages including:
 - Holiday livery short stays
 - Grouping charges by owner
 - Ledger entry creation
+
+A run reads the billable horses (with their packages and owners) and the
+period's existing package charges in two queries, works out every charge
+in memory, then writes all new ledger entries with one bulk INSERT inside
+a savepoint. The bulk insert bypasses the ORM flush hooks, so the
+account_balances and income_rollups deltas are applied alongside it.
 """
 
 import logging
+import re
+import time
+from collections import defaultdict
 from datetime import date, datetime
 from decimal import Decimal, ROUND_HALF_UP
 from calendar import monthrange
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from sqlalchemy import and_, insert
 
 from app.models.horse import Horse
 from app.models.user import User
 from app.models.livery_package import LiveryPackage, BillingType
-from app.models.account import LedgerEntry, TransactionType
+from app.models.account import (
+    LedgerEntry, RollupKey, TransactionType, add_entry_delta, add_income_delta,
+    apply_balance_deltas, apply_income_deltas, zero_balance_delta, zero_income_delta
+)
 
 logger = logging.getLogger(__name__)
 
+# Package charge descriptions end "(Horse ID: <id>)"
+HORSE_ID_PATTERN = re.compile(r"\(Horse ID: (\d+)\)")
+
+# (horse_id, package_id, period_start, period_end) of a package charge
+BilledKey = Tuple[int, int, date, date]
+
 
 @dataclass
 class HorseCharge:
@@ -64,6 +82,7 @@ class BillingRunResult:
     total_owners: int
     ledger_entries_created: int
     is_preview: bool
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per phase
 
 
 class BillingService:
@@ -160,7 +179,10 @@ class BillingService:
         month_start = date(billing_year, billing_month, 1)
         month_end = date(billing_year, billing_month, days_in_month)
 
-        horses = self.db.query(Horse).join(LiveryPackage).filter(
+        horses = self.db.query(Horse).join(LiveryPackage).options(
+            contains_eager(Horse.livery_package),
+            joinedload(Horse.owner)
+        ).filter(
             Horse.livery_package_id.isnot(None),
             # Package has either monthly_price OR weekly_price set
             or_(
@@ -176,23 +198,69 @@ class BillingService:
 
         return horses
 
-    def check_already_billed(
-        self,
-        horse_id: int,
-        package_id: int,
-        period_start: date,
-        period_end: date
-    ) -> bool:
-        """Check if a horse has already been billed for this period."""
-        existing = self.db.query(LedgerEntry).filter(
-            LedgerEntry.livery_package_id == package_id,
+    def get_billed_keys(self, month_start: date, month_end: date) -> Set[BilledKey]:
+        """Every package charge already in the ledger for periods inside the month."""
+        rows = self.db.query(
+            LedgerEntry.livery_package_id,
+            LedgerEntry.description,
+            LedgerEntry.period_start,
+            LedgerEntry.period_end
+        ).filter(
             LedgerEntry.transaction_type == TransactionType.PACKAGE_CHARGE,
-            LedgerEntry.period_start == datetime.combine(period_start, datetime.min.time()),
-            LedgerEntry.period_end == datetime.combine(period_end, datetime.min.time()),
-            LedgerEntry.description.contains(f"Horse ID: {horse_id}")
-        ).first()
+            LedgerEntry.period_start >= datetime.combine(month_start, datetime.min.time()),
+            LedgerEntry.period_end <= datetime.combine(month_end, datetime.min.time())
+        ).all()
 
-        return existing is not None
+        billed = set()
+        for package_id, description, period_start, period_end in rows:
+            match = HORSE_ID_PATTERN.search(description or "")
+            if match and package_id is not None:
+                billed.add((int(match.group(1)), package_id, period_start.date(), period_end.date()))
+        return billed
+
+    def write_charges(self, owner_charges: Dict[int, List[HorseCharge]]) -> int:
+        """
+        Insert a ledger entry per charge in one statement, inside a savepoint,
+        and apply the matching account balance and income rollup deltas.
+        """
+        now = datetime.utcnow()
+        rows = []
+        balance_deltas: Dict[int, dict] = defaultdict(zero_balance_delta)
+        income_deltas: Dict[RollupKey, dict] = defaultdict(zero_income_delta)
+
+        for owner_id, charges in owner_charges.items():
+            for charge in charges:
+                description = (
+                    f"{charge.package_name} - {charge.horse_name} "
+                    f"(Horse ID: {charge.horse_id})"
+                )
+                if charge.is_partial:
+                    description += f" [{charge.billable_days}/{charge.days_in_month} days]"
+
+                rows.append({
+                    "user_id": owner_id,
+                    "transaction_type": TransactionType.PACKAGE_CHARGE,
+                    "amount": charge.charge_amount,
+                    "description": description,
+                    "notes": charge.notes,
+                    "livery_package_id": charge.package_id,
+                    "period_start": datetime.combine(charge.period_start, datetime.min.time()),
+                    "period_end": datetime.combine(charge.period_end, datetime.min.time()),
+                    "transaction_date": now,
+                    "created_by_id": self.created_by_id,
+                })
+                add_entry_delta(balance_deltas[owner_id], charge.charge_amount, TransactionType.PACKAGE_CHARGE, now)
+                add_income_delta(income_deltas, charge.charge_amount, TransactionType.PACKAGE_CHARGE, now)
+
+        if not rows:
+            return 0
+
+        with self.db.begin_nested():
+            self.db.execute(insert(LedgerEntry), rows)
+            connection = self.db.connection()
+            apply_balance_deltas(connection, balance_deltas)
+            apply_income_deltas(connection, income_deltas)
+        return len(rows)
 
     def generate_billing(
         self,
@@ -213,11 +281,15 @@ class BillingService:
         Returns:
             BillingRunResult with all charges and summaries
         """
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
         days_in_month = monthrange(billing_year, billing_month)[1]
         month_start = date(billing_year, billing_month, 1)
         month_end = date(billing_year, billing_month, days_in_month)
 
         horses = self.get_billable_horses(billing_year, billing_month)
+        billed = self.get_billed_keys(month_start, month_end) if skip_already_billed else set()
+        timings["load"] = time.perf_counter() - started
 
         # Group charges by owner
         owner_charges: Dict[int, List[HorseCharge]] = {}
@@ -251,12 +323,7 @@ class BillingService:
                 continue
 
             # Check if already billed
-            if skip_already_billed and self.check_already_billed(
-                horse.id,
-                horse.livery_package_id,
-                period_start,
-                period_end
-            ):
+            if (horse.id, horse.livery_package_id, period_start, period_end) in billed:
                 logger.info(f"Skipping {horse.name} - already billed for this period")
                 continue
 
@@ -298,7 +365,6 @@ class BillingService:
         owner_summaries: List[OwnerBillingSummary] = []
         total_amount = Decimal('0.00')
         total_horses = 0
-        ledger_entries_created = 0
 
         for owner_id, charges in owner_charges.items():
             owner = owner_info[owner_id]
@@ -317,32 +383,15 @@ class BillingService:
             )
             owner_summaries.append(summary)
 
-            # Create ledger entries if not preview
-            if not preview_only:
-                for charge in charges:
-                    description = (
-                        f"{charge.package_name} - {charge.horse_name} "
-                        f"(Horse ID: {charge.horse_id})"
-                    )
-                    if charge.is_partial:
-                        description += f" [{charge.billable_days}/{charge.days_in_month} days]"
-
-                    entry = LedgerEntry(
-                        user_id=owner_id,
-                        transaction_type=TransactionType.PACKAGE_CHARGE,
-                        amount=charge.charge_amount,
-                        description=description,
-                        notes=charge.notes,
-                        livery_package_id=charge.package_id,
-                        period_start=datetime.combine(charge.period_start, datetime.min.time()),
-                        period_end=datetime.combine(charge.period_end, datetime.min.time()),
-                        transaction_date=datetime.utcnow(),
-                        created_by_id=self.created_by_id
-                    )
-                    self.db.add(entry)
-                    ledger_entries_created += 1
-
-                self.db.commit()
+        timings["calculate"] = time.perf_counter() - started - timings["load"]
+
+        # Create ledger entries if not preview
+        ledger_entries_created = 0
+        if not preview_only:
+            write_started = time.perf_counter()
+            ledger_entries_created = self.write_charges(owner_charges)
+            self.db.commit()
+            timings["write"] = time.perf_counter() - write_started
 
         # Sort by owner name
         owner_summaries.sort(key=lambda x: x.owner_name)
@@ -354,5 +403,6 @@ class BillingService:
             total_horses=total_horses,
             total_owners=len(owner_summaries),
             ledger_entries_created=ledger_entries_created,
-            is_preview=preview_only
+            is_preview=preview_only,
+            timings={**timings, "total": time.perf_counter() - started}
         )
@@ -0,0 +1,160 @@
+"""
+Booking Conflict Engine
+
+Single place for deciding whether an arena slot is free. Bookings are
+treated as half-open intervals [start_time, end_time), so two bookings
+overlap exactly when each one starts before the other ends. Back-to-back
+bookings (one ending at 10:00, the next starting at 10:00) never conflict.
+
+The overlap predicate is served by the composite index
+ix_bookings_arena_status_time on (arena_id, booking_status, start_time,
+end_time), which turns each check into a single index range scan.
+
+For batch work (auto-confirming the pending queue) allocate_pending_bookings
+loads everything up front and sweeps it in memory against an ArenaTimeline,
+so a run costs two queries regardless of how many bookings are pending.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking, BookingStatus
+
+
+def overlaps(start_time: datetime, end_time: datetime):
+    """SQL predicate matching bookings that overlap [start_time, end_time)."""
+    return and_(Booking.start_time < end_time, Booking.end_time > start_time)
+
+
+def find_conflict(
+    db: Session,
+    arena_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    exclude_booking_id: Optional[int] = None
+) -> Optional[Booking]:
+    """
+    Return the first CONFIRMED booking that overlaps the slot, if any.
+    Pending and cancelled bookings do not block slots.
+    """
+    query = db.query(Booking).filter(
+        Booking.arena_id == arena_id,
+        Booking.booking_status == BookingStatus.CONFIRMED,
+        overlaps(start_time, end_time)
+    )
+    if exclude_booking_id:
+        query = query.filter(Booking.id != exclude_booking_id)
+    return query.first()
+
+
+def has_conflict(
+    db: Session,
+    arena_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    exclude_booking_id: Optional[int] = None
+) -> bool:
+    """Check whether the slot overlaps any CONFIRMED booking."""
+    return find_conflict(db, arena_id, start_time, end_time, exclude_booking_id) is not None
+
+
+class ArenaTimeline:
+    """
+    Busy time for one arena, kept as a sorted list of disjoint half-open
+    intervals. Adjacent or overlapping intervals are merged on insert, so
+    an overlap check is a single bisect.
+    """
+
+    def __init__(self):
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
+
+    def overlaps(self, start_time: datetime, end_time: datetime) -> bool:
+        # Last busy interval starting before end_time is the only candidate
+        idx = bisect_left(self._starts, end_time) - 1
+        return idx >= 0 and self._ends[idx] > start_time
+
+    def add(self, start_time: datetime, end_time: datetime) -> None:
+        lo = bisect_left(self._starts, start_time)
+        # Merge with the previous interval if it reaches start_time
+        if lo > 0 and self._ends[lo - 1] >= start_time:
+            lo -= 1
+            start_time = self._starts[lo]
+        hi = lo
+        while hi < len(self._starts) and self._starts[hi] <= end_time:
+            end_time = max(end_time, self._ends[hi])
+            hi += 1
+        self._starts[lo:hi] = [start_time]
+        self._ends[lo:hi] = [end_time]
+
+
+@dataclass
+class ArenaAllocation:
+    """Outcome of the pending sweep for a single arena."""
+    arena_id: int
+    processed: int = 0
+    confirmed_ids: List[int] = field(default_factory=list)
+    skipped_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class AllocationResult:
+    """Outcome of a pending booking allocation run."""
+    processed: int
+    confirmed: int
+    arenas: Dict[int, ArenaAllocation]
+
+
+def allocate_pending_bookings(db: Session, cutoff: datetime) -> AllocationResult:
+    """
+    Auto-confirm PENDING bookings starting on or before cutoff.
+
+    Pending bookings are taken first-come, first-served by created_at and
+    each one is confirmed if it does not overlap a confirmed booking -
+    including ones confirmed earlier in the same run. Status changes are
+    applied to the session; the caller commits.
+    """
+    pending = db.query(Booking).filter(
+        Booking.booking_status == BookingStatus.PENDING,
+        Booking.start_time <= cutoff
+    ).order_by(Booking.created_at.asc(), Booking.id.asc()).all()
+
+    if not pending:
+        return AllocationResult(processed=0, confirmed=0, arenas={})
+
+    arena_ids = {b.arena_id for b in pending}
+    window_start = min(b.start_time for b in pending)
+    window_end = max(b.end_time for b in pending)
+
+    confirmed_rows: List[Tuple[int, datetime, datetime]] = db.query(
+        Booking.arena_id, Booking.start_time, Booking.end_time
+    ).filter(
+        Booking.arena_id.in_(arena_ids),
+        Booking.booking_status == BookingStatus.CONFIRMED,
+        overlaps(window_start, window_end)
+    ).order_by(Booking.start_time).all()
+
+    timelines: Dict[int, ArenaTimeline] = {arena_id: ArenaTimeline() for arena_id in arena_ids}
+    for arena_id, start_time, end_time in confirmed_rows:
+        timelines[arena_id].add(start_time, end_time)
+
+    arenas = {arena_id: ArenaAllocation(arena_id=arena_id) for arena_id in sorted(arena_ids)}
+    confirmed_count = 0
+    for booking in pending:
+        timeline = timelines[booking.arena_id]
+        report = arenas[booking.arena_id]
+        report.processed += 1
+        if timeline.overlaps(booking.start_time, booking.end_time):
+            report.skipped_ids.append(booking.id)
+            continue
+        booking.booking_status = BookingStatus.CONFIRMED
+        timeline.add(booking.start_time, booking.end_time)
+        report.confirmed_ids.append(booking.id)
+        confirmed_count += 1
+
+    return AllocationResult(processed=len(pending), confirmed=confirmed_count, arenas=arenas)
@@ -0,0 +1,104 @@
+"""
+Document Numbers
+
+Hands out receipt and invoice numbers (PREFIX-YYYY-NNNN) from the
+document_sequences table. Each call is a single UPDATE ... RETURNING on
+the (prefix, year) row, which takes a row lock until the caller's
+transaction ends, so concurrent payments cannot be given the same number
+and a rolled-back request does not burn one.
+
+The first number of a year seeds the row from the highest number already
+issued with that prefix, so sequences pick up where existing data (or a
+restored backup) left off.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.account import LedgerEntry
+from app.models.document_sequence import DocumentSequence
+from app.models.invoice import Invoice
+
+
+RECEIPT_PREFIX = "REC"
+INVOICE_PREFIX = "INV"
+
+# Column holding the issued numbers for each prefix, used to seed a new year
+NUMBERED_COLUMNS = {
+    RECEIPT_PREFIX: LedgerEntry.receipt_number,
+    INVOICE_PREFIX: Invoice.invoice_number,
+}
+
+
+def format_document_number(prefix: str, year: int, number: int) -> str:
+    return f"{prefix}-{year}-{number:04d}"
+
+
+def _highest_issued(db: Session, prefix: str, year: int) -> int:
+    """Highest number already used for prefix and year (0 if none)."""
+    column = NUMBERED_COLUMNS[prefix]
+    highest = 0
+    for (value,) in db.execute(select(column).where(column.like(f"{prefix}-{year}-%"))):
+        try:
+            highest = max(highest, int(value.split("-")[-1]))
+        except (ValueError, IndexError):
+            continue
+    return highest
+
+
+def _increment(db: Session, prefix: str, year: int) -> Optional[int]:
+    table = DocumentSequence.__table__
+    stmt = update(table).where(
+        table.c.prefix == prefix,
+        table.c.year == year
+    ).values(last_number=table.c.last_number + 1, updated_at=datetime.utcnow())
+
+    if db.bind.dialect.name in ("postgresql", "sqlite"):
+        return db.execute(stmt.returning(table.c.last_number)).scalar()
+
+    # Lock the row first where UPDATE ... RETURNING is unavailable
+    current = db.execute(
+        select(table.c.last_number).where(
+            table.c.prefix == prefix, table.c.year == year
+        ).with_for_update()
+    ).scalar()
+    if current is None:
+        return None
+    db.execute(stmt)
+    return current + 1
+
+
+def next_document_number(db: Session, prefix: str, year: Optional[int] = None) -> str:
+    """Reserve the next number for prefix in year (default this year). The caller commits."""
+    year = year or date.today().year
+
+    number = _increment(db, prefix, year)
+    if number is None:
+        # First number of the year: start after anything already issued
+        number = _highest_issued(db, prefix, year) + 1
+        savepoint = db.begin_nested()
+        try:
+            db.execute(DocumentSequence.__table__.insert().values(
+                prefix=prefix, year=year, last_number=number, updated_at=datetime.utcnow()
+            ))
+            savepoint.commit()
+        except IntegrityError:
+            # Another request created the row first
+            savepoint.rollback()
+            number = _increment(db, prefix, year)
+
+    return format_document_number(prefix, year, number)
+
+
+def next_receipt_number(db: Session) -> str:
+    """Next receipt number, REC-YYYY-NNNN."""
+    return next_document_number(db, RECEIPT_PREFIX, datetime.utcnow().year)
+
+
+def next_invoice_number(db: Session) -> str:
+    """Next invoice number, INV-YYYY-NNNN."""
+    return next_document_number(db, INVOICE_PREFIX, date.today().year)
@@ -12,13 +12,14 @@ This service is called:
 2. On-demand by admin via API endpoint
 """
 
-from datetime import date, datetime
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import insert, or_
 
 from app.models.task import (
-    YardTask, TaskCategory, TaskPriority, TaskStatus,
+    YardTask, TaskComment, TaskCategory, TaskPriority, TaskStatus,
     AssignmentType, HealthTaskType
 )
 from app.models.feed import FeedAddition, FeedTime, AdditionStatus
@@ -30,8 +31,84 @@ from app.models.horse import Horse
 from app.models.user import User
 
 
+# (health_task_type, source_id, feed_time, scheduled_date)
+HealthTaskKey = Tuple[HealthTaskType, int, Optional[str], date]
+
+# YardTask column holding the source record for each health task type
+SOURCE_COLUMNS = {
+    HealthTaskType.MEDICATION: "feed_addition_id",
+    HealthTaskType.WOUND_CARE: "wound_care_log_id",
+    HealthTaskType.HEALTH_CHECK: "horse_id",
+    HealthTaskType.REHAB_EXERCISE: "rehab_task_id",
+}
+
+# Columns derived from the source record; reconciliation refreshes these in place
+CONTENT_FIELDS = ("title", "description", "priority", "location", "horse_id", "rehab_program_id")
+
+OPEN_STATUSES = (TaskStatus.OPEN, TaskStatus.IN_PROGRESS)
+
+# Keys used in generation results and diff summaries
+RESULT_KEYS = {
+    HealthTaskType.MEDICATION: "medication",
+    HealthTaskType.WOUND_CARE: "wound_care",
+    HealthTaskType.HEALTH_CHECK: "health_check",
+    HealthTaskType.REHAB_EXERCISE: "rehab_exercise",
+}
+
+
+def _days(start_date: date, end_date: Optional[date]) -> List[date]:
+    """Every date from start_date to end_date inclusive."""
+    end_date = end_date or start_date
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+
+def _task_key(task: YardTask) -> HealthTaskKey:
+    source_id = getattr(task, SOURCE_COLUMNS[task.health_task_type])
+    return (task.health_task_type, source_id, task.feed_time, task.scheduled_date)
+
+
+def _count_by_type(task_types: Iterable[HealthTaskType]) -> dict:
+    counts = {name: 0 for name in RESULT_KEYS.values()}
+    for task_type in task_types:
+        counts[RESULT_KEYS[task_type]] += 1
+    counts["total"] = sum(counts.values())
+    return counts
+
+
+@dataclass
+class HealthTaskDiff:
+    """
+    Changes needed to bring the scheduled health tasks in line with their
+    sources. Completed and cancelled tasks are never touched.
+    """
+    to_insert: List[dict] = field(default_factory=list)
+    to_update: List[Tuple[YardTask, dict]] = field(default_factory=list)
+    to_delete: List[YardTask] = field(default_factory=list)
+    unchanged: int = 0
+
+    def summary(self) -> dict:
+        """Counts by health task type for each kind of change."""
+        return {
+            "insert": _count_by_type(row["health_task_type"] for row in self.to_insert),
+            "update": _count_by_type(task.health_task_type for task, _ in self.to_update),
+            "delete": _count_by_type(task.health_task_type for task in self.to_delete),
+            "unchanged": self.unchanged
+        }
+
+
 class HealthTaskGenerator:
-    """Service for generating health-related yard tasks."""
+    """
+    Service for generating health-related yard tasks.
+
+    Each generator works over a date range (a single day by default):
+    sources are loaded once, existing tasks are loaded once into a set of
+    HealthTaskKey, and the missing tasks are written with one bulk INSERT.
+    Generating a range gives the same tasks as generating each day in turn.
+
+    diff_for_range/apply_diff reconcile instead: open tasks whose source
+    changed are updated in place and only tasks whose source has gone are
+    deleted, so IDs, assignments and comments survive regeneration.
+    """
 
     def __init__(self, db: Session, system_user_id: int):
         """
@@ -43,6 +120,12 @@ class HealthTaskGenerator:
         """
         self.db = db
         self.system_user_id = system_user_id
+        self._planners = {
+            HealthTaskType.MEDICATION: self._plan_medication_tasks,
+            HealthTaskType.WOUND_CARE: self._plan_wound_care_tasks,
+            HealthTaskType.HEALTH_CHECK: self._plan_health_check_tasks,
+            HealthTaskType.REHAB_EXERCISE: self._plan_rehab_tasks,
+        }
 
     def generate_all_for_date(self, target_date: date) -> dict:
         """
@@ -50,52 +133,183 @@ class HealthTaskGenerator:
 
         Returns dict with counts of generated tasks by type.
         """
-        # First, delete any existing auto-generated health tasks for this date that are uncompleted
-        self._cleanup_uncompleted_health_tasks(target_date)
+        return self.generate_all_for_range(target_date, target_date)
 
-        medication_count = len(self.generate_medication_tasks(target_date))
-        wound_count = len(self.generate_wound_care_tasks(target_date))
-        health_check_count = len(self.generate_health_check_tasks(target_date))
-        rehab_count = len(self.generate_rehab_tasks(target_date))
+    def generate_all_for_range(self, start_date: date, end_date: date) -> dict:
+        """
+        Reconcile all health tasks for every date from start_date to end_date
+        inclusive, e.g. to pre-generate a week at once.
 
+        Returns dict with counts of created tasks by type, plus the number
+        of open tasks updated, deleted and left unchanged.
+        """
+        diff = self.diff_for_range(start_date, end_date)
+        self.apply_diff(diff)
         self.db.commit()
 
+        summary = diff.summary()
         return {
-            "medication": medication_count,
-            "wound_care": wound_count,
-            "health_check": health_check_count,
-            "rehab_exercise": rehab_count,
-            "total": medication_count + wound_count + health_check_count + rehab_count
+            **summary["insert"],
+            "updated": summary["update"]["total"],
+            "deleted": summary["delete"]["total"],
+            "unchanged": diff.unchanged
         }
 
-    def _cleanup_uncompleted_health_tasks(self, target_date: date):
-        """Remove uncompleted auto-generated health tasks for the target date."""
-        self.db.query(YardTask).filter(
+    def diff_for_range(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        health_task_types: Optional[Iterable[HealthTaskType]] = None
+    ) -> HealthTaskDiff:
+        """
+        Compare the desired health tasks for the date range with the ones
+        already scheduled. Read-only; use apply_diff to write the result.
+        """
+        task_types = list(health_task_types or self._planners)
+        days = _days(start_date, end_date)
+        now = datetime.utcnow()
+
+        desired: Dict[HealthTaskKey, dict] = {}
+        for task_type in task_types:
+            desired.update(self._planners[task_type](days, now))
+
+        existing = self.db.query(YardTask).filter(
+            YardTask.health_task_type.in_(task_types),
+            YardTask.scheduled_date >= days[0],
+            YardTask.scheduled_date <= days[-1]
+        ).order_by(YardTask.id).all()
+
+        diff = HealthTaskDiff()
+        # Completed and cancelled tasks claim their key first so they are never regenerated
+        for task in existing:
+            if task.status not in OPEN_STATUSES:
+                desired.pop(_task_key(task), None)
+
+        for task in existing:
+            if task.status not in OPEN_STATUSES:
+                continue
+            row = desired.pop(_task_key(task), None)
+            if row is None:
+                diff.to_delete.append(task)
+                continue
+            changes = {name: row[name] for name in CONTENT_FIELDS if getattr(task, name) != row[name]}
+            if changes:
+                diff.to_update.append((task, changes))
+            else:
+                diff.unchanged += 1
+
+        diff.to_insert = list(desired.values())
+        return diff
+
+    def apply_diff(self, diff: HealthTaskDiff) -> List[YardTask]:
+        """Write a diff to the session and return the inserted tasks. The caller commits."""
+        if diff.to_delete:
+            task_ids = [task.id for task in diff.to_delete]
+            self.db.query(TaskComment).filter(
+                TaskComment.task_id.in_(task_ids)
+            ).delete(synchronize_session=False)
+            self.db.query(YardTask).filter(
+                YardTask.id.in_(task_ids)
+            ).delete(synchronize_session="evaluate")
+
+        for task, changes in diff.to_update:
+            for name, value in changes.items():
+                setattr(task, name, value)
+
+        return self._insert_tasks(diff.to_insert)
+
+    def _load_existing_keys(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        health_task_type: Optional[HealthTaskType] = None
+    ) -> Set[HealthTaskKey]:
+        """Load the keys of every health task already scheduled in the date range."""
+        query = self.db.query(
+            YardTask.health_task_type,
+            YardTask.scheduled_date,
+            YardTask.feed_time,
+            YardTask.feed_addition_id,
+            YardTask.wound_care_log_id,
+            YardTask.horse_id,
+            YardTask.rehab_task_id
+        ).filter(
             YardTask.health_task_type.isnot(None),
-            YardTask.scheduled_date == target_date,
-            YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS])
-        ).delete(synchronize_session=False)
+            YardTask.scheduled_date >= start_date,
+            YardTask.scheduled_date <= (end_date or start_date)
+        )
+        if health_task_type:
+            query = query.filter(YardTask.health_task_type == health_task_type)
+
+        return {_task_key(row) for row in query.all()}
+
+    def _insert_tasks(self, rows: List[dict]) -> List[YardTask]:
+        """Insert the new tasks with a single bulk INSERT and return them."""
+        if not rows:
+            return []
+        return list(self.db.scalars(insert(YardTask).returning(YardTask), rows))
+
+    def _insert_missing(
+        self,
+        planned: Dict[HealthTaskKey, dict],
+        existing: Set[HealthTaskKey]
+    ) -> List[YardTask]:
+        """Insert the planned tasks whose key is not already taken."""
+        rows = []
+        for key, row in planned.items():
+            if key in existing:
+                continue
+            existing.add(key)
+            rows.append(row)
+        return self._insert_tasks(rows)
+
+    def _task_row(self, target_date: date, reported_date: datetime, **fields) -> dict:
+        """Column values shared by every auto-generated health task."""
+        return {
+            "category": TaskCategory.HEALTH,
+            "reported_by_id": self.system_user_id,
+            "reported_date": reported_date,
+            "assignment_type": AssignmentType.POOL,
+            "scheduled_date": target_date,
+            "status": TaskStatus.OPEN,
+            "location": None,
+            "feed_time": None,
+            "rehab_program_id": None,
+            **fields
+        }
 
-    def generate_medication_tasks(self, target_date: date) -> List[YardTask]:
+    def generate_medication_tasks(
+        self,
+        target_date: date,
+        end_date: Optional[date] = None,
+        existing: Optional[Set[HealthTaskKey]] = None
+    ) -> List[YardTask]:
         """
         Generate medication administration tasks from active FeedAdditions.
 
         Creates one task per FeedAddition per feed time (morning/evening).
         FeedAdditions with feed_time='both' create two tasks.
         """
-        tasks = []
-
-        # Get all active, approved feed additions that are valid for the target date
-        feed_additions = self.db.query(FeedAddition).join(Horse).filter(
+        days = _days(target_date, end_date)
+        if existing is None:
+            existing = self._load_existing_keys(days[0], days[-1], HealthTaskType.MEDICATION)
+        return self._insert_missing(self._plan_medication_tasks(days, datetime.utcnow()), existing)
+
+    def _plan_medication_tasks(self, days: List[date], now: datetime) -> Dict[HealthTaskKey, dict]:
+        # Get all active, approved feed additions that are valid at some point in the range
+        feed_additions = self.db.query(FeedAddition).join(Horse).options(
+            joinedload(FeedAddition.horse)
+        ).filter(
             FeedAddition.status == AdditionStatus.APPROVED,
             FeedAddition.is_active == True,
-            FeedAddition.start_date <= target_date,
+            FeedAddition.start_date <= days[-1],
             or_(
                 FeedAddition.end_date.is_(None),
-                FeedAddition.end_date >= target_date
+                FeedAddition.end_date >= days[0]
             )
-        ).all()
+        ).order_by(FeedAddition.id).all()
 
+        planned = {}
         for fa in feed_additions:
             # Determine which feed times to create tasks for
             feed_times = []
@@ -106,209 +320,195 @@ class HealthTaskGenerator:
             elif fa.feed_time == FeedTime.BOTH:
                 feed_times = ['morning', 'evening']
 
-            for ft in feed_times:
-                # Check if task already exists
-                existing = self.db.query(YardTask).filter(
-                    YardTask.health_task_type == HealthTaskType.MEDICATION,
-                    YardTask.feed_addition_id == fa.id,
-                    YardTask.feed_time == ft,
-                    YardTask.scheduled_date == target_date
-                ).first()
-
-                if existing:
+            for day in days:
+                if fa.start_date > day or (fa.end_date is not None and fa.end_date < day):
                     continue
 
-                task = YardTask(
-                    title=f"{fa.horse.name}: {fa.name} ({ft})",
-                    description=f"Administer {fa.dosage}\n{fa.reason or ''}".strip(),
-                    category=TaskCategory.HEALTH,
-                    priority=TaskPriority.MEDIUM,
-                    reported_by_id=self.system_user_id,
-                    reported_date=datetime.utcnow(),
-                    assignment_type=AssignmentType.POOL,
-                    scheduled_date=target_date,
-                    status=TaskStatus.OPEN,
-                    health_task_type=HealthTaskType.MEDICATION,
-                    horse_id=fa.horse_id,
-                    feed_addition_id=fa.id,
-                    feed_time=ft
-                )
-                self.db.add(task)
-                tasks.append(task)
+                for ft in feed_times:
+                    planned[(HealthTaskType.MEDICATION, fa.id, ft, day)] = self._task_row(
+                        day, now,
+                        title=f"{fa.horse.name}: {fa.name} ({ft})",
+                        description=f"Administer {fa.dosage}\n{fa.reason or ''}".strip(),
+                        priority=TaskPriority.MEDIUM,
+                        health_task_type=HealthTaskType.MEDICATION,
+                        horse_id=fa.horse_id,
+                        feed_addition_id=fa.id,
+                        feed_time=ft
+                    )
 
-        return tasks
+        return planned
 
-    def generate_wound_care_tasks(self, target_date: date) -> List[YardTask]:
+    def generate_wound_care_tasks(
+        self,
+        target_date: date,
+        end_date: Optional[date] = None,
+        existing: Optional[Set[HealthTaskKey]] = None
+    ) -> List[YardTask]:
         """
         Generate wound care tasks for wounds with next_treatment_due on target date.
         """
-        tasks = []
+        days = _days(target_date, end_date)
+        if existing is None:
+            existing = self._load_existing_keys(days[0], days[-1], HealthTaskType.WOUND_CARE)
+        return self._insert_missing(self._plan_wound_care_tasks(days, datetime.utcnow()), existing)
 
-        # Get active wounds with treatment due on or before target date
+    def _plan_wound_care_tasks(self, days: List[date], now: datetime) -> Dict[HealthTaskKey, dict]:
+        # Get active wounds with treatment due on or before the end of the range
         # We include overdue treatments to ensure they appear
-        active_wounds = self.db.query(WoundCareLog).join(Horse).filter(
+        wound_logs = self.db.query(WoundCareLog).join(Horse).options(
+            joinedload(WoundCareLog.horse)
+        ).filter(
             WoundCareLog.is_resolved == False,
-            WoundCareLog.next_treatment_due <= target_date
-        ).distinct(WoundCareLog.horse_id, WoundCareLog.wound_name).all()
-
-        for wound in active_wounds:
-            # Check if task already exists
-            existing = self.db.query(YardTask).filter(
-                YardTask.health_task_type == HealthTaskType.WOUND_CARE,
-                YardTask.wound_care_log_id == wound.id,
-                YardTask.scheduled_date == target_date
-            ).first()
-
-            if existing:
-                continue
-
-            task = YardTask(
-                title=f"{wound.horse.name}: Wound care - {wound.wound_name}",
-                description=f"Location: {wound.wound_location or 'Not specified'}\n{wound.wound_description or ''}".strip(),
-                category=TaskCategory.HEALTH,
-                priority=TaskPriority.HIGH,  # Wound care is high priority
-                reported_by_id=self.system_user_id,
-                reported_date=datetime.utcnow(),
-                assignment_type=AssignmentType.POOL,
-                scheduled_date=target_date,
-                status=TaskStatus.OPEN,
-                health_task_type=HealthTaskType.WOUND_CARE,
-                horse_id=wound.horse_id,
-                wound_care_log_id=wound.id
-            )
-            self.db.add(task)
-            tasks.append(task)
+            WoundCareLog.next_treatment_due <= days[-1]
+        ).order_by(WoundCareLog.id).all()
+
+        planned = {}
+        for day in days:
+            # One task per wound: the latest log entry due by this day
+            active_wounds: Dict[Tuple[int, str], WoundCareLog] = {}
+            for wound in wound_logs:
+                if wound.next_treatment_due <= day:
+                    active_wounds[(wound.horse_id, wound.wound_name)] = wound
+
+            for wound in active_wounds.values():
+                planned[(HealthTaskType.WOUND_CARE, wound.id, None, day)] = self._task_row(
+                    day, now,
+                    title=f"{wound.horse.name}: Wound care - {wound.wound_name}",
+                    description=f"Location: {wound.wound_location or 'Not specified'}\n{wound.wound_description or ''}".strip(),
+                    priority=TaskPriority.HIGH,  # Wound care is high priority
+                    health_task_type=HealthTaskType.WOUND_CARE,
+                    horse_id=wound.horse_id,
+                    wound_care_log_id=wound.id
+                )
 
-        return tasks
+        return planned
 
-    def generate_health_check_tasks(self, target_date: date) -> List[YardTask]:
+    def generate_health_check_tasks(
+        self,
+        target_date: date,
+        end_date: Optional[date] = None,
+        existing: Optional[Set[HealthTaskKey]] = None
+    ) -> List[YardTask]:
         """
         Generate daily health observation tasks for each livery horse.
-        Creates one task per horse.
+        Creates one task per horse per day.
         """
-        tasks = []
+        days = _days(target_date, end_date)
+        if existing is None:
+            existing = self._load_existing_keys(days[0], days[-1], HealthTaskType.HEALTH_CHECK)
+        return self._insert_missing(self._plan_health_check_tasks(days, datetime.utcnow()), existing)
 
+    def _plan_health_check_tasks(self, days: List[date], now: datetime) -> Dict[HealthTaskKey, dict]:
         # Get all livery horses (horses with livery_package_id set)
         horses = self.db.query(Horse).filter(
             Horse.livery_package_id.isnot(None)
-        ).all()
-
+        ).order_by(Horse.id).all()
+
+        # Skip horses whose observation has already been logged that day
+        observed = set(self.db.query(
+            HealthObservation.horse_id,
+            HealthObservation.observation_date
+        ).filter(
+            HealthObservation.observation_date >= days[0],
+            HealthObservation.observation_date <= days[-1]
+        ).all())
+
+        planned = {}
         for horse in horses:
-            # Check if task already exists
-            existing = self.db.query(YardTask).filter(
-                YardTask.health_task_type == HealthTaskType.HEALTH_CHECK,
-                YardTask.horse_id == horse.id,
-                YardTask.scheduled_date == target_date
-            ).first()
-
-            if existing:
-                continue
-
-            # Check if observation already logged today
-            already_observed = self.db.query(HealthObservation).filter(
-                HealthObservation.horse_id == horse.id,
-                HealthObservation.observation_date == target_date
-            ).first()
-
-            if already_observed:
-                continue
+            for day in days:
+                if (horse.id, day) in observed:
+                    continue
 
-            task = YardTask(
-                title=f"{horse.name}: Daily health check",
-                description="Check appetite, demeanor, droppings, and general condition",
-                category=TaskCategory.HEALTH,
-                priority=TaskPriority.MEDIUM,
-                reported_by_id=self.system_user_id,
-                reported_date=datetime.utcnow(),
-                assignment_type=AssignmentType.POOL,
-                scheduled_date=target_date,
-                status=TaskStatus.OPEN,
-                health_task_type=HealthTaskType.HEALTH_CHECK,
-                horse_id=horse.id
-            )
-            self.db.add(task)
-            tasks.append(task)
+                planned[(HealthTaskType.HEALTH_CHECK, horse.id, None, day)] = self._task_row(
+                    day, now,
+                    title=f"{horse.name}: Daily health check",
+                    description="Check appetite, demeanor, droppings, and general condition",
+                    priority=TaskPriority.MEDIUM,
+                    health_task_type=HealthTaskType.HEALTH_CHECK,
+                    horse_id=horse.id
+                )
 
-        return tasks
+        return planned
 
-    def generate_rehab_tasks(self, target_date: date) -> List[YardTask]:
+    def generate_rehab_tasks(
+        self,
+        target_date: date,
+        end_date: Optional[date] = None,
+        existing: Optional[Set[HealthTaskKey]] = None
+    ) -> List[YardTask]:
         """
         Generate rehab exercise tasks from active rehab programs.
 
         For each active program, check which phase is current and generate
         tasks for the exercises in that phase based on their frequency.
         """
-        tasks = []
-
-        # Get active rehab programs
-        programs = self.db.query(RehabProgram).filter(
+        days = _days(target_date, end_date)
+        if existing is None:
+            existing = self._load_existing_keys(days[0], days[-1], HealthTaskType.REHAB_EXERCISE)
+        return self._insert_missing(self._plan_rehab_tasks(days, datetime.utcnow()), existing)
+
+    def _plan_rehab_tasks(self, days: List[date], now: datetime) -> Dict[HealthTaskKey, dict]:
+        # Get rehab programs active at some point in the range
+        programs = self.db.query(RehabProgram).options(
+            joinedload(RehabProgram.horse),
+            selectinload(RehabProgram.phases).selectinload(RehabPhase.tasks)
+        ).filter(
             RehabProgram.status == RehabStatus.ACTIVE,
-            RehabProgram.start_date <= target_date,
+            RehabProgram.start_date <= days[-1],
             or_(
                 RehabProgram.expected_end_date.is_(None),
-                RehabProgram.expected_end_date >= target_date
+                RehabProgram.expected_end_date >= days[0]
             )
-        ).all()
+        ).order_by(RehabProgram.id).all()
 
+        planned = {}
         for program in programs:
-            # Calculate which day of the program we're on
-            days_since_start = (target_date - program.start_date).days + 1
-
-            # Find the current phase
-            current_phase = None
-            for phase in program.phases:
-                phase_end_day = phase.start_day + phase.duration_days - 1
-                if phase.start_day <= days_since_start <= phase_end_day:
-                    current_phase = phase
-                    break
-
-            if not current_phase:
-                continue
-
-            # Generate tasks for each exercise in the phase
-            for rehab_task in current_phase.tasks:
-                # Check frequency to see if task should run today
-                if not self._should_run_today(rehab_task.frequency, target_date, program.start_date):
+            for day in days:
+                if program.start_date > day or (
+                    program.expected_end_date is not None and program.expected_end_date < day
+                ):
                     continue
 
-                # Determine feed times based on frequency
-                feed_times = self._get_feed_times_for_frequency(rehab_task.frequency)
+                # Calculate which day of the program we're on
+                days_since_start = (day - program.start_date).days + 1
 
-                for ft in feed_times:
-                    # Check if task already exists
-                    existing = self.db.query(YardTask).filter(
-                        YardTask.health_task_type == HealthTaskType.REHAB_EXERCISE,
-                        YardTask.rehab_task_id == rehab_task.id,
-                        YardTask.feed_time == ft,
-                        YardTask.scheduled_date == target_date
-                    ).first()
-
-                    if existing:
-                        continue
+                # Find the current phase
+                current_phase = None
+                for phase in program.phases:
+                    phase_end_day = phase.start_day + phase.duration_days - 1
+                    if phase.start_day <= days_since_start <= phase_end_day:
+                        current_phase = phase
+                        break
 
-                    duration_str = f" ({rehab_task.duration_minutes}min)" if rehab_task.duration_minutes else ""
-
-                    task = YardTask(
-                        title=f"{program.horse.name}: {rehab_task.description}{duration_str}",
-                        description=f"Program: {program.name}\nPhase: {current_phase.name}\n{rehab_task.instructions or ''}".strip(),
-                        category=TaskCategory.HEALTH,
-                        priority=TaskPriority.HIGH,  # Rehab exercises are high priority
-                        location=rehab_task.equipment_needed,
-                        reported_by_id=self.system_user_id,
-                        reported_date=datetime.utcnow(),
-                        assignment_type=AssignmentType.POOL,
-                        scheduled_date=target_date,
-                        status=TaskStatus.OPEN,
-                        health_task_type=HealthTaskType.REHAB_EXERCISE,
-                        horse_id=program.horse_id,
-                        rehab_task_id=rehab_task.id,
-                        rehab_program_id=program.id,
-                        feed_time=ft
-                    )
-                    self.db.add(task)
-                    tasks.append(task)
+                if not current_phase:
+                    continue
+
+                # Generate tasks for each exercise in the phase
+                for rehab_task in current_phase.tasks:
+                    # Check frequency to see if task should run that day
+                    if not self._should_run_today(rehab_task.frequency, day, program.start_date):
+                        continue
 
-        return tasks
+                    # Determine feed times based on frequency
+                    feed_times = self._get_feed_times_for_frequency(rehab_task.frequency)
+
+                    for ft in feed_times:
+                        duration_str = f" ({rehab_task.duration_minutes}min)" if rehab_task.duration_minutes else ""
+
+                        planned[(HealthTaskType.REHAB_EXERCISE, rehab_task.id, ft, day)] = self._task_row(
+                            day, now,
+                            title=f"{program.horse.name}: {rehab_task.description}{duration_str}",
+                            description=f"Program: {program.name}\nPhase: {current_phase.name}\n{rehab_task.instructions or ''}".strip(),
+                            priority=TaskPriority.HIGH,  # Rehab exercises are high priority
+                            location=rehab_task.equipment_needed,
+                            health_task_type=HealthTaskType.REHAB_EXERCISE,
+                            horse_id=program.horse_id,
+                            rehab_task_id=rehab_task.id,
+                            rehab_program_id=program.id,
+                            feed_time=ft
+                        )
+
+        return planned
 
     def _should_run_today(self, frequency: TaskFrequency, target_date: date, program_start: date) -> bool:
         """Check if a task with given frequency should run on target date."""
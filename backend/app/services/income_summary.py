@@ -0,0 +1,145 @@
+"""
+Income Summary
+
+Builds the income summary report from income_rollups, the per-month
+ledger totals maintained on every ledger write (see app.models.account).
+
+Only whole, closed months are read from the rollup. Partial months at
+either end of the range, and the current month, are aggregated live from
+ledger_entries - normally just the month in progress.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models.account import MonthlyIncomeRollup, TransactionType, income_totals_query
+from app.schemas.account import IncomeByType, MonthlyIncome, IncomeSummaryReport
+
+
+TYPE_LABELS = {
+    TransactionType.PACKAGE_CHARGE: "Livery Package",
+    TransactionType.SERVICE_CHARGE: "Service Charge",
+    TransactionType.PAYMENT: "Payment",
+    TransactionType.CREDIT: "Credit/Refund",
+    TransactionType.ADJUSTMENT: "Adjustment",
+}
+
+TYPE_ORDER = {transaction_type: rank for rank, transaction_type in enumerate(TransactionType)}
+
+Month = Tuple[int, int]
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def closed_months(from_date: date, to_date: date, today: date) -> Optional[Tuple[date, date]]:
+    """
+    The whole months inside from_date..to_date that ended before today's
+    month, as [first month start, end month start), or None.
+    """
+    first = from_date if from_date.day == 1 else _next_month(from_date)
+    end = _next_month(to_date) if (to_date + timedelta(days=1)).day == 1 else _month_start(to_date)
+    end = min(end, _month_start(today))
+    return (first, end) if first < end else None
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+
+def build_income_summary(
+    db: Session,
+    from_date: date,
+    to_date: date,
+    today: Optional[date] = None
+) -> IncomeSummaryReport:
+    """Income by type and by month for from_date..to_date inclusive."""
+    today = today or date.today()
+    range_start = _midnight(from_date)
+    range_end = _midnight(to_date + timedelta(days=1))
+
+    rows = []
+    closed = closed_months(from_date, to_date, today)
+    if closed:
+        first, end = closed
+        last = end - timedelta(days=1)
+        rows.extend(db.query(MonthlyIncomeRollup).filter(
+            MonthlyIncomeRollup.entry_count != 0,
+            or_(
+                MonthlyIncomeRollup.year > first.year,
+                and_(MonthlyIncomeRollup.year == first.year, MonthlyIncomeRollup.month >= first.month)
+            ),
+            or_(
+                MonthlyIncomeRollup.year < last.year,
+                and_(MonthlyIncomeRollup.year == last.year, MonthlyIncomeRollup.month <= last.month)
+            )
+        ).all())
+        live_ranges = [(range_start, _midnight(first)), (_midnight(end), range_end)]
+    else:
+        live_ranges = [(range_start, range_end)]
+
+    for start, end in live_ranges:
+        if start < end:
+            rows.extend(db.execute(income_totals_query(start, end)).all())
+
+    by_type_totals: Dict[TransactionType, dict] = defaultdict(lambda: {"amount": Decimal("0.00"), "count": 0})
+    by_month_totals: Dict[Month, Dict[TransactionType, dict]] = defaultdict(
+        lambda: defaultdict(lambda: {"amount": Decimal("0.00"), "count": 0})
+    )
+    total_charges = Decimal("0.00")
+    total_payments = Decimal("0.00")
+    for row in rows:
+        transaction_type = TransactionType(row.transaction_type)
+        amount = _money(row.amount)
+        month_totals = by_month_totals[(int(row.year), int(row.month))]
+        for bucket in (by_type_totals[transaction_type], month_totals[transaction_type]):
+            bucket["amount"] += amount
+            bucket["count"] += row.entry_count
+        total_charges += _money(row.total_charges)
+        total_payments += _money(row.total_payments)
+
+    def _items(totals: Dict[TransactionType, dict]) -> List[IncomeByType]:
+        return [
+            IncomeByType(
+                transaction_type=transaction_type.value,
+                type_label=TYPE_LABELS.get(transaction_type, transaction_type.value.replace("_", " ").title()),
+                amount=data["amount"],
+                count=data["count"]
+            )
+            for transaction_type, data in sorted(totals.items(), key=lambda item: TYPE_ORDER[item[0]])
+        ]
+
+    by_month = [
+        MonthlyIncome(
+            year=year,
+            month=month,
+            month_label=date(year, month, 1).strftime("%B %Y"),
+            total=sum((data["amount"] for data in month_totals.values()), Decimal("0.00")),
+            by_type=_items(month_totals)
+        )
+        for (year, month), month_totals in sorted(by_month_totals.items())
+    ]
+
+    return IncomeSummaryReport(
+        from_date=from_date,
+        to_date=to_date,
+        total_income=total_charges - total_payments,
+        total_charges=total_charges,
+        total_payments=total_payments,
+        by_type=_items(by_type_totals),
+        by_month=by_month
+    )
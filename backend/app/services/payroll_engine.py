@@ -0,0 +1,254 @@
+"""
+Payroll Engine
+
+Builds the payroll summary for a period in a fixed number of queries,
+however many staff there are:
+- Active staff with their profiles
+- Approved timesheets in the period
+- Hourly rate history up to the end of the period
+- Payroll adjustments paid in the period
+- Approved annual leave overlapping the period
+
+Rate history is held per staff member as sorted arrays, so the rate
+effective on each timesheet date is a bisect rather than a query.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.staff_management import (
+    Timesheet, HolidayRequest, PayrollAdjustment,
+    TimesheetStatus, LeaveType, LeaveStatus, PayrollAdjustmentType
+)
+from app.models.staff_profile import HourlyRateHistory
+from app.models.user import User, UserRole
+from app.schemas.staff_management import (
+    PayrollAdjustmentSummary, StaffPayrollPeriod, PayrollSummaryResponse
+)
+
+
+HOLIDAY_HOURS_PER_DAY = 8
+
+
+def calculate_hours(clock_in, clock_out, break_minutes: int = 0) -> float:
+    """Calculate total hours worked."""
+    if not clock_out:
+        return 0.0
+    # Convert times to datetime for calculation, truncating seconds
+    base_date = date.today()
+    dt_in = datetime.combine(base_date, clock_in.replace(second=0, microsecond=0))
+    dt_out = datetime.combine(base_date, clock_out.replace(second=0, microsecond=0))
+    # Handle overnight shifts
+    if dt_out < dt_in:
+        dt_out += timedelta(days=1)
+    total_minutes = (dt_out - dt_in).total_seconds() / 60 - break_minutes
+    return round(total_minutes / 60, 2)
+
+
+@dataclass
+class RateSchedule:
+    """
+    Hourly rate history for one staff member, sorted by effective date.
+    Dates before the first entry (or staff with no history) fall back to
+    the current profile rate.
+    """
+    fallback_rate: float = 0.0
+    effective_dates: List[date] = field(default_factory=list)
+    rates: List[float] = field(default_factory=list)
+
+    def rate_on(self, work_date: date) -> float:
+        """The most recent rate effective on or before work_date."""
+        idx = bisect_right(self.effective_dates, work_date) - 1
+        return self.rates[idx] if idx >= 0 else self.fallback_rate
+
+
+def load_rate_schedules(
+    db: Session,
+    staff_ids: Iterable[int],
+    until: date,
+    fallback_rates: Dict[int, float]
+) -> Dict[int, RateSchedule]:
+    """Load every rate change up to `until` for the given staff in one query."""
+    staff_ids = list(staff_ids)
+    schedules = {
+        staff_id: RateSchedule(fallback_rate=fallback_rates.get(staff_id, 0.0))
+        for staff_id in staff_ids
+    }
+    if not staff_ids:
+        return schedules
+
+    rows = db.query(
+        HourlyRateHistory.staff_id,
+        HourlyRateHistory.effective_date,
+        HourlyRateHistory.hourly_rate
+    ).filter(
+        HourlyRateHistory.staff_id.in_(staff_ids),
+        HourlyRateHistory.effective_date <= until
+    ).order_by(
+        HourlyRateHistory.staff_id,
+        HourlyRateHistory.effective_date,
+        HourlyRateHistory.id
+    ).all()
+
+    for staff_id, effective_date, hourly_rate in rows:
+        schedule = schedules[staff_id]
+        schedule.effective_dates.append(effective_date)
+        schedule.rates.append(float(hourly_rate))
+    return schedules
+
+
+def _holiday_days(holiday: HolidayRequest, period_start: date, period_end: date) -> float:
+    """Days of a holiday falling in the period, pro-rated when it straddles the boundary."""
+    if holiday.start_date >= period_start and holiday.end_date <= period_end:
+        # Fully within period
+        return float(holiday.days_requested)
+    # Partially overlapping - pro-rate
+    total_calendar_days = (holiday.end_date - holiday.start_date).days + 1
+    overlap_start = max(holiday.start_date, period_start)
+    overlap_end = min(holiday.end_date, period_end)
+    overlap_days = (overlap_end - overlap_start).days + 1
+    return float(holiday.days_requested) * (overlap_days / total_calendar_days)
+
+
+def build_payroll_summary(db: Session, period_start: date, period_end: date) -> PayrollSummaryResponse:
+    """
+    Calculate approved hours, rates, holiday pay, adjustments and totals
+    for every active staff member in the period.
+    """
+    staff_users = db.query(User).options(
+        joinedload(User.staff_profile)
+    ).filter(
+        (User.role == UserRole.STAFF) | (User.is_yard_staff == True),
+        User.is_active == True
+    ).order_by(User.id).all()
+    staff_ids = [user.id for user in staff_users]
+
+    # Current profile rate, used for display, holiday pay and as the rate fallback
+    current_rates = {
+        user.id: float(user.staff_profile.hourly_rate)
+        if user.staff_profile and user.staff_profile.hourly_rate else 0.0
+        for user in staff_users
+    }
+
+    timesheets_by_staff: Dict[int, List[Timesheet]] = defaultdict(list)
+    adjustments_by_staff: Dict[int, List[PayrollAdjustment]] = defaultdict(list)
+    holidays_by_staff: Dict[int, List[HolidayRequest]] = defaultdict(list)
+    schedules = load_rate_schedules(db, staff_ids, period_end, current_rates)
+
+    if staff_ids:
+        for ts in db.query(Timesheet).filter(
+            Timesheet.staff_id.in_(staff_ids),
+            Timesheet.status == TimesheetStatus.APPROVED,
+            Timesheet.date >= period_start,
+            Timesheet.date <= period_end
+        ).order_by(Timesheet.staff_id, Timesheet.date, Timesheet.id):
+            timesheets_by_staff[ts.staff_id].append(ts)
+
+        for adjustment in db.query(PayrollAdjustment).filter(
+            PayrollAdjustment.staff_id.in_(staff_ids),
+            PayrollAdjustment.payment_date >= period_start,
+            PayrollAdjustment.payment_date <= period_end
+        ):
+            adjustments_by_staff[adjustment.staff_id].append(adjustment)
+
+        for holiday in db.query(HolidayRequest).filter(
+            HolidayRequest.staff_id.in_(staff_ids),
+            HolidayRequest.leave_type == LeaveType.ANNUAL,
+            HolidayRequest.status == LeaveStatus.APPROVED,
+            HolidayRequest.start_date <= period_end,
+            HolidayRequest.end_date >= period_start
+        ):
+            holidays_by_staff[holiday.staff_id].append(holiday)
+
+    staff_summaries = []
+    total_hours = 0.0
+    total_base_pay = 0.0
+    total_holiday_hours = 0.0
+    total_holiday_pay = 0.0
+    total_adjustments_amount = 0.0
+    total_pay_amount = 0.0
+
+    for user in staff_users:
+        current_hourly_rate = current_rates[user.id]
+        schedule = schedules[user.id]
+        timesheets = timesheets_by_staff[user.id]
+
+        # Base pay uses the rate effective on each timesheet date
+        approved_hours = 0.0
+        base_pay = 0.0
+        for ts in timesheets:
+            if ts.clock_out:
+                hours = calculate_hours(ts.clock_in, ts.clock_out, ts.break_minutes)
+                approved_hours += hours
+                base_pay += hours * schedule.rate_on(ts.date)
+
+        oneoff_total = 0.0
+        tips_total = 0.0
+        taxable_adj = 0.0
+        non_taxable_adj = 0.0
+        for adjustment in adjustments_by_staff[user.id]:
+            amount = float(adjustment.amount)
+            if adjustment.adjustment_type == PayrollAdjustmentType.ONEOFF:
+                oneoff_total += amount
+            elif adjustment.adjustment_type == PayrollAdjustmentType.TIP:
+                tips_total += amount
+            if adjustment.taxable:
+                taxable_adj += amount
+            else:
+                non_taxable_adj += amount
+
+        holiday_days = sum(
+            _holiday_days(h, period_start, period_end) for h in holidays_by_staff[user.id]
+        )
+        holiday_hours = round(holiday_days * HOLIDAY_HOURS_PER_DAY, 2)
+        holiday_pay = round(holiday_hours * current_hourly_rate, 2)
+
+        staff_total_pay = base_pay + oneoff_total + tips_total + holiday_pay
+        taxable_pay = base_pay + taxable_adj + holiday_pay
+
+        staff_summaries.append(StaffPayrollPeriod(
+            staff_id=user.id,
+            staff_name=user.name,
+            staff_type=user.staff_type.value if user.staff_type else None,
+            hourly_rate=current_hourly_rate,
+            approved_hours=approved_hours,
+            timesheet_count=len(timesheets),
+            base_pay=base_pay,
+            holiday_days=holiday_days,
+            holiday_hours=holiday_hours,
+            holiday_pay=holiday_pay,
+            adjustments=PayrollAdjustmentSummary(
+                oneoff_total=oneoff_total,
+                tips_total=tips_total,
+                taxable_adjustments=taxable_adj,
+                non_taxable_adjustments=non_taxable_adj
+            ),
+            total_pay=staff_total_pay,
+            taxable_pay=taxable_pay,
+            non_taxable_pay=non_taxable_adj
+        ))
+
+        total_hours += approved_hours
+        total_base_pay += base_pay
+        total_holiday_hours += holiday_hours
+        total_holiday_pay += holiday_pay
+        total_adjustments_amount += oneoff_total + tips_total
+        total_pay_amount += staff_total_pay
+
+    return PayrollSummaryResponse(
+        period_start=period_start,
+        period_end=period_end,
+        period_label=f"{period_start.strftime('%-d %b %Y')} - {period_end.strftime('%-d %b %Y')}",
+        staff_summaries=staff_summaries,
+        total_approved_hours=total_hours,
+        total_base_pay=total_base_pay,
+        total_holiday_hours=total_holiday_hours,
+        total_holiday_pay=total_holiday_pay,
+        total_adjustments=total_adjustments_amount,
+        total_pay=total_pay_amount
+    )
@@ -0,0 +1,148 @@
+"""
+PDF Rendering
+
+Runs the ReportLab and WeasyPrint generators in a bounded process pool,
+so a PDF download never renders on the event loop or holds the GIL in
+the request threadpool.
+
+- At most PDF_RENDER_MAX_PENDING renders may be queued or running; beyond
+  that requests get a 503 rather than piling up behind each other
+- A render that takes longer than PDF_RENDER_TIMEOUT seconds gets a 504
+- evm_pdf_render_queue_depth reports renders queued or running, and
+  evm_pdf_render_seconds the time from submission to completion
+
+Generators and their arguments must be picklable: module-level functions
+called with plain data.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.utils.pdf_cache import cache_key, pdf_cache
+
+
+PDF_RENDER_WORKERS = int(os.environ.get("PDF_RENDER_WORKERS", min(2, os.cpu_count() or 1)))
+PDF_RENDER_MAX_PENDING = int(os.environ.get("PDF_RENDER_MAX_PENDING", PDF_RENDER_WORKERS * 8))
+PDF_RENDER_TIMEOUT = float(os.environ.get("PDF_RENDER_TIMEOUT", 60))
+
+pdf_render_queue_depth = Gauge(
+    "evm_pdf_render_queue_depth",
+    "PDF renders queued or running in the render pool"
+)
+pdf_render_seconds = Histogram(
+    "evm_pdf_render_seconds",
+    "Time from submitting a PDF render to its completion",
+    ["renderer"]
+)
+pdf_render_rejected_total = Counter(
+    "evm_pdf_render_rejected_total",
+    "PDF renders refused because the pool was full or that timed out",
+    ["reason"]
+)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(PDF_RENDER_MAX_PENDING)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn rather than fork: the API process is multi-threaded
+            _pool = ProcessPoolExecutor(max_workers=PDF_RENDER_WORKERS, mp_context=get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next render starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_render_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def submit_render(render: Callable[..., bytes], *args: Any, **kwargs: Any) -> Future:
+    """Queue render(*args, **kwargs) on the pool, or raise 503 if the queue is full."""
+    if not _slots.acquire(blocking=False):
+        pdf_render_rejected_total.labels("queue_full").inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF rendering is busy, please try again shortly"
+        )
+    pdf_render_queue_depth.inc()
+    started = time.monotonic()
+
+    def _finished(future: Future) -> None:
+        pdf_render_queue_depth.dec()
+        _slots.release()
+        if not future.cancelled():
+            pdf_render_seconds.labels(render.__name__).observe(time.monotonic() - started)
+            if isinstance(future.exception(), BrokenProcessPool):
+                _discard_pool(pool)
+
+    try:
+        pool = _get_pool()
+        future = pool.submit(render, *args, **kwargs)
+    except BaseException:
+        pdf_render_queue_depth.dec()
+        _slots.release()
+        raise
+    future.add_done_callback(_finished)
+    return future
+
+
+def _timed_out(future: Future) -> HTTPException:
+    # Only a render still waiting in the queue can be cancelled; a running
+    # one finishes in its worker and frees its slot then
+    future.cancel()
+    pdf_render_rejected_total.labels("timeout").inc()
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail="PDF rendering timed out"
+    )
+
+
+async def render_pdf(render: Callable[..., bytes], *args: Any, **kwargs: Any) -> bytes:
+    """Render in the pool without blocking the event loop."""
+    future = submit_render(render, *args, **kwargs)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), PDF_RENDER_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise _timed_out(future)
+
+
+def render_pdf_blocking(render: Callable[..., bytes], *args: Any, **kwargs: Any) -> bytes:
+    """Render in the pool from a sync endpoint, waiting in the request's worker thread."""
+    future = submit_render(render, *args, **kwargs)
+    try:
+        return future.result(timeout=PDF_RENDER_TIMEOUT)
+    except FutureTimeoutError:
+        raise _timed_out(future)
+
+
+async def render_cached_pdf(kind: str, owner_id: int, render: Callable[..., bytes], inputs: Dict[str, Any]) -> str:
+    """Path of the cached PDF for render(**inputs), rendering it in the pool on a miss."""
+    key = cache_key(render, inputs)
+    path = pdf_cache.get(kind, owner_id, key)
+    if path is None:
+        path = pdf_cache.put(kind, owner_id, key, await render_pdf(render, **inputs))
+    return path
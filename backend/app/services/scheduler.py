@@ -11,9 +11,12 @@ Manages scheduled jobs including:
 
 import logging
 from datetime import date, datetime, timedelta
+from typing import List, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from prometheus_client import Counter
+from sqlalchemy import and_, select, update
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
@@ -54,6 +57,52 @@ def get_system_user_id(db: Session) -> int:
     return user.id if user else 1
 
 
+# Rollover updates at most this many tasks per statement/commit, so row
+# locks are held briefly even when a large backlog has built up.
+ROLLOVER_CHUNK_SIZE = 1000
+
+tasks_rolled_over_total = Counter(
+    "evm_tasks_rolled_over_total",
+    "Incomplete yard tasks moved to the backlog by the daily rollover job"
+)
+
+
+def rollover_tasks(db: Session, today: date, chunk_size: Optional[int] = None) -> List[int]:
+    """
+    Move incomplete tasks scheduled before today back to the backlog.
+
+    Runs as a set-based UPDATE ... RETURNING. With chunk_size, the update is
+    applied in batches of that many tasks, committing after each one.
+    Without it, everything is moved in a single statement and the caller
+    commits. Returns the IDs of the tasks moved.
+    """
+    is_overdue = and_(
+        YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
+        YardTask.scheduled_date < today,
+        YardTask.scheduled_date.isnot(None)
+    )
+    backlog_values = {
+        "scheduled_date": None,
+        "assignment_type": AssignmentType.BACKLOG,
+        "assigned_to_id": None,
+        "is_maintenance_day_task": False,
+    }
+
+    if not chunk_size:
+        stmt = update(YardTask).where(is_overdue).values(**backlog_values).returning(YardTask.id)
+        return list(db.execute(stmt, execution_options={"synchronize_session": False}).scalars())
+
+    moved: List[int] = []
+    while True:
+        batch = select(YardTask.id).where(is_overdue).limit(chunk_size).scalar_subquery()
+        stmt = update(YardTask).where(YardTask.id.in_(batch)).values(**backlog_values).returning(YardTask.id)
+        ids = list(db.execute(stmt, execution_options={"synchronize_session": False}).scalars())
+        db.commit()
+        moved.extend(ids)
+        if len(ids) < chunk_size:
+            return moved
+
+
 def rollover_incomplete_tasks():
     """
     Job function: Move past incomplete tasks to backlog.
@@ -67,25 +116,10 @@ def rollover_incomplete_tasks():
 
     db = SessionLocal()
     try:
-        today = date.today()
-
-        # Find incomplete tasks scheduled for past dates
-        past_tasks = db.query(YardTask).filter(
-            YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
-            YardTask.scheduled_date < today,
-            YardTask.scheduled_date.isnot(None)
-        ).all()
-
-        count = 0
-        for task in past_tasks:
-            task.scheduled_date = None
-            task.assignment_type = AssignmentType.BACKLOG
-            task.assigned_to_id = None
-            task.is_maintenance_day_task = False
-            count += 1
-
+        moved_ids = rollover_tasks(db, date.today(), chunk_size=ROLLOVER_CHUNK_SIZE)
         db.commit()
-        logger.info(f"Task rollover complete: {count} tasks moved to backlog")
+        tasks_rolled_over_total.inc(len(moved_ids))
+        logger.info(f"Task rollover complete: {len(moved_ids)} tasks moved to backlog")
 
     except Exception as e:
         logger.error(f"Error during task rollover: {e}")
@@ -120,7 +154,8 @@ def generate_daily_health_tasks():
             f"{result['wound_care']} wound care, "
             f"{result['health_check']} health check, "
             f"{result['rehab_exercise']} rehab exercise tasks created. "
-            f"Total: {result['total']}"
+            f"Total: {result['total']}, "
+            f"{result['updated']} updated, {result['deleted']} removed"
         )
 
     except Exception as e:
@@ -375,7 +410,8 @@ def generate_monthly_billing():
             f"{result.total_owners} owners, "
             f"{result.total_horses} horses, "
             f"Total: £{result.total_amount}, "
-            f"{result.ledger_entries_created} ledger entries created"
+            f"{result.ledger_entries_created} ledger entries created "
+            f"in {result.timings['total']:.2f}s"
         )
 
     except Exception as e:
@@ -472,15 +508,20 @@ def run_automated_backup():
             return
 
         # Import backup utilities
-        from app.utils.backup import export_database, save_backup_file, generate_backup_filename
+        from app.utils.backup import write_backup_archive, generate_backup_filename, differential_base
 
-        # Create the backup
-        logger.info("Creating automated backup...")
+        # Differential against the latest full backup while it is recent
+        # enough, otherwise a new full backup
+        base = differential_base(db)
+        logger.info(f"Creating automated {'differential' if base else 'full'} backup...")
         system_user_id = get_system_user_id(db)
 
-        data, entity_counts = export_database(db)
         filename = generate_backup_filename()
-        filepath = save_backup_file(data, filename)
+        filepath, entity_counts = write_backup_archive(db, filename, metadata={
+            "version": "1.0",
+            "exported_at": now.isoformat(),
+            "exported_by": "Automated backup",
+        }, base=base)
 
         # Get file size
         import os
@@ -493,7 +534,7 @@ def run_automated_backup():
             file_size=file_size,
             entity_counts=entity_counts,
             storage_location="local",
-            notes="Automated backup",
+            notes=f"Automated differential backup (base: {base})" if base else "Automated backup",
             created_by_id=system_user_id
         )
         db.add(backup)
@@ -547,10 +588,16 @@ def cleanup_old_backups():
             return
 
         # Import delete function
-        from app.utils.backup import delete_backup_file
+        from app.utils.backup import delete_backup_file, backup_base_filename
+
+        # Keep full backups that retained differentials still depend on
+        retained = db.query(Backup.filename).filter(Backup.backup_date >= cutoff_date).all()
+        needed_bases = {backup_base_filename(filename) for filename, in retained}
 
         deleted_count = 0
         for backup in old_backups:
+            if backup.filename in needed_bases:
+                continue
             try:
                 # Delete the file
                 delete_backup_file(backup.filename)
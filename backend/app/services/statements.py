@@ -0,0 +1,189 @@
+"""
+Account Statements
+
+Loads statement data for one or many clients in a fixed number of
+queries and renders the PDFs:
+- Opening balances (non-voided entries before the period) for every
+  user in one GROUP BY
+- Period ledger rows for every user in one query, ordered by user
+
+StatementData is plain picklable data, so a month-end run can render
+every client's statement in a process pool (ReportLab is CPU bound and
+holds the GIL) and write them into a zip.
+"""
+
+import os
+import re
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from multiprocessing import get_context
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.account import LedgerEntry
+from app.models.settings import SiteSettings
+from app.models.user import User, UserRole
+from app.utils.pdf_generator import generate_account_statement_pdf
+
+
+# Worker processes for bulk runs; 1 renders inline
+STATEMENT_WORKERS = int(os.environ.get("STATEMENT_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+@dataclass
+class StatementData:
+    """Everything needed to render one client's statement."""
+    user_id: int
+    user_name: str
+    user_email: Optional[str]
+    from_date: date
+    to_date: date
+    opening_balance: Decimal = Decimal("0.00")
+    transactions: List[dict] = field(default_factory=list)
+    venue: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def filename(self) -> str:
+        safe_name = re.sub(r"[^A-Za-z0-9_-]+", "_", self.user_name).strip("_") or f"user_{self.user_id}"
+        return f"statement_{safe_name}_{self.from_date}_{self.to_date}.pdf"
+
+
+def venue_details(settings: Optional[SiteSettings]) -> Dict[str, str]:
+    """Statement header fields from site settings; missing values keep the generator defaults."""
+    if not settings:
+        return {}
+    details = {}
+    if settings.venue_name:
+        details["venue_name"] = settings.venue_name
+    address = [
+        part for part in (
+            settings.address_street, settings.address_town,
+            settings.address_county, settings.address_postcode
+        ) if part
+    ]
+    if address:
+        details["venue_address"] = "\n".join(address)
+    if settings.contact_phone:
+        details["venue_phone"] = settings.contact_phone
+    if settings.contact_email:
+        details["venue_email"] = settings.contact_email
+    return details
+
+
+def load_statements(
+    db: Session,
+    from_date: date,
+    to_date: date,
+    user_ids: Optional[Iterable[int]] = None
+) -> List[StatementData]:
+    """
+    Statement data for the given users, or every active livery client,
+    ordered by name.
+    """
+    period_start = datetime.combine(from_date, datetime.min.time())
+    period_end = datetime.combine(to_date, datetime.max.time())
+
+    users_query = db.query(User)
+    if user_ids is not None:
+        users_query = users_query.filter(User.id.in_(list(user_ids)))
+    else:
+        users_query = users_query.filter(User.role == UserRole.LIVERY, User.is_active == True)
+    users = users_query.order_by(User.name, User.id).all()
+    if not users:
+        return []
+    ids = [user.id for user in users]
+
+    opening_balances = dict(db.query(
+        LedgerEntry.user_id,
+        func.coalesce(func.sum(LedgerEntry.amount), Decimal("0.00"))
+    ).filter(
+        LedgerEntry.user_id.in_(ids),
+        LedgerEntry.transaction_date < period_start,
+        LedgerEntry.voided == False
+    ).group_by(LedgerEntry.user_id).all())
+
+    transactions: Dict[int, List[dict]] = defaultdict(list)
+    for row in db.query(
+        LedgerEntry.user_id,
+        LedgerEntry.transaction_date,
+        LedgerEntry.description,
+        LedgerEntry.transaction_type,
+        LedgerEntry.amount
+    ).filter(
+        LedgerEntry.user_id.in_(ids),
+        LedgerEntry.transaction_date >= period_start,
+        LedgerEntry.transaction_date <= period_end,
+        LedgerEntry.voided == False
+    ).order_by(LedgerEntry.user_id, LedgerEntry.transaction_date, LedgerEntry.id):
+        transactions[row.user_id].append({
+            "transaction_date": row.transaction_date,
+            "description": row.description,
+            "transaction_type": row.transaction_type.value,
+            "amount": row.amount,
+        })
+
+    venue = venue_details(db.query(SiteSettings).first())
+    return [
+        StatementData(
+            user_id=user.id,
+            user_name=user.name,
+            user_email=user.email,
+            from_date=from_date,
+            to_date=to_date,
+            opening_balance=Decimal(str(opening_balances.get(user.id) or "0.00")),
+            transactions=transactions[user.id],
+            venue=venue,
+        )
+        for user in users
+    ]
+
+
+def render_statement(statement: StatementData) -> bytes:
+    """Render one statement PDF. Module level so worker processes can run it."""
+    return generate_account_statement_pdf(
+        user_name=statement.user_name,
+        user_email=statement.user_email or "",
+        transactions=statement.transactions,
+        from_date=statement.from_date,
+        to_date=statement.to_date,
+        opening_balance=statement.opening_balance,
+        **statement.venue
+    )
+
+
+def render_statements(
+    statements: List[StatementData],
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[StatementData, bytes]]:
+    """Render statements in order, in a process pool when there is more than one."""
+    max_workers = min(max_workers or STATEMENT_WORKERS, len(statements))
+    if max_workers <= 1:
+        for statement in statements:
+            yield statement, render_statement(statement)
+        return
+
+    # spawn rather than fork: the API process is multi-threaded
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as pool:
+        chunksize = max(1, len(statements) // (max_workers * 4))
+        yield from zip(statements, pool.map(render_statement, statements, chunksize=chunksize))
+
+
+def write_statements_zip(
+    statements: List[StatementData],
+    target: BinaryIO,
+    max_workers: Optional[int] = None
+) -> int:
+    """Render statements into a zip archive written to target. Returns the number written."""
+    count = 0
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for statement, pdf_bytes in render_statements(statements, max_workers):
+            # Prefixed with the user id so clients sharing a name don't collide
+            archive.writestr(f"{statement.user_id}_{statement.filename}", pdf_bytes)
+            count += 1
+    return count
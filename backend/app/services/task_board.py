@@ -0,0 +1,156 @@
+"""
+Task Board Service
+
+Builds the yard task board (open, my, today, pool, backlog, completed and
+scheduled buckets) from a single fetch. Every open task plus the tasks
+completed today are loaded once, with many-to-one relationships joined and
+the comments collection loaded separately via selectinload, then
+partitioned and ordered in Python.
+
+Rolling overdue tasks back to the backlog is the scheduler's job
+(rollover_incomplete_tasks); the board is read-only.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.models.service import ServiceRequest
+from app.models.task import YardTask, TaskCategory, TaskPriority, TaskStatus, AssignmentType
+
+
+ACTIVE_STATUSES = (TaskStatus.OPEN, TaskStatus.IN_PROGRESS)
+
+# Matches the PostgreSQL enum order (low < medium < high < urgent)
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(TaskPriority)}
+
+
+@dataclass
+class TaskBoard:
+    """Tasks partitioned into the board's tabs."""
+    open_tasks: List[YardTask] = field(default_factory=list)
+    my_tasks: List[YardTask] = field(default_factory=list)
+    today_tasks: List[YardTask] = field(default_factory=list)
+    pool_tasks: List[YardTask] = field(default_factory=list)
+    backlog_tasks: List[YardTask] = field(default_factory=list)
+    completed_tasks: List[YardTask] = field(default_factory=list)
+    scheduled_tasks: List[YardTask] = field(default_factory=list)
+
+
+def _ordered(tasks: List[YardTask], *keys: Tuple[Callable, bool]) -> List[YardTask]:
+    """Stable multi-key sort. keys are (key_func, descending), most significant first."""
+    result = list(tasks)
+    for key, descending in reversed(keys):
+        result.sort(key=key, reverse=descending)
+    return result
+
+
+def _priority(task: YardTask) -> int:
+    return PRIORITY_RANK.get(task.priority, -1)
+
+
+def _scheduled_nulls_last(task: YardTask):
+    return (task.scheduled_date is None, task.scheduled_date or date.min)
+
+
+def _reported(task: YardTask) -> datetime:
+    return task.reported_date or datetime.min
+
+
+def _completed(task: YardTask) -> datetime:
+    return task.completed_date or datetime.min
+
+
+def build_task_board(
+    db: Session,
+    current_user_id: int,
+    category: Optional[TaskCategory] = None,
+    priority: Optional[TaskPriority] = None,
+    status_filter: Optional[TaskStatus] = None,
+    assigned_to_id: Optional[int] = None,
+    today: Optional[date] = None
+) -> TaskBoard:
+    """
+    Load and partition the task board.
+
+    assigned_to_id of -1 selects unassigned (pool or no assignment) tasks.
+    status_filter only narrows the open_tasks tab.
+    """
+    today = today or date.today()
+    day_start = datetime.combine(today, datetime.min.time())
+    day_end = day_start + timedelta(days=1)
+
+    query = db.query(YardTask).options(
+        joinedload(YardTask.reported_by),
+        joinedload(YardTask.assigned_to),
+        joinedload(YardTask.completed_by),
+        selectinload(YardTask.comments),
+        # Health task relationships
+        joinedload(YardTask.horse),
+        joinedload(YardTask.feed_addition),
+        joinedload(YardTask.wound_care_log),
+        joinedload(YardTask.rehab_task),
+        joinedload(YardTask.rehab_program),
+        # Service request relationship (for billable amount)
+        joinedload(YardTask.service_request).joinedload(ServiceRequest.service)
+    ).filter(or_(
+        YardTask.status.in_(ACTIVE_STATUSES),
+        and_(
+            YardTask.status == TaskStatus.COMPLETED,
+            YardTask.completed_date >= day_start,
+            YardTask.completed_date < day_end
+        )
+    ))
+
+    if category:
+        query = query.filter(YardTask.category == category)
+    if priority:
+        query = query.filter(YardTask.priority == priority)
+    if assigned_to_id is not None:
+        if assigned_to_id == -1:
+            query = query.filter(YardTask.assigned_to_id.is_(None))
+        else:
+            query = query.filter(YardTask.assigned_to_id == assigned_to_id)
+
+    tasks = query.order_by(YardTask.id).all()
+
+    board = TaskBoard()
+    for task in tasks:
+        if task.status == TaskStatus.COMPLETED:
+            board.completed_tasks.append(task)
+            continue
+
+        assignment_type = task.assignment_type
+        if status_filter is None or task.status == status_filter:
+            board.open_tasks.append(task)
+        if assignment_type == AssignmentType.SPECIFIC and task.assigned_to_id == current_user_id:
+            board.my_tasks.append(task)
+        if task.scheduled_date == today:
+            if assignment_type == AssignmentType.SPECIFIC:
+                board.today_tasks.append(task)
+            elif assignment_type == AssignmentType.POOL:
+                board.pool_tasks.append(task)
+        if assignment_type == AssignmentType.BACKLOG:
+            board.backlog_tasks.append(task)
+        if (
+            assignment_type in (AssignmentType.SPECIFIC, AssignmentType.POOL)
+            and task.scheduled_date is not None
+            and task.scheduled_date > today
+        ):
+            board.scheduled_tasks.append(task)
+
+    board.open_tasks = _ordered(
+        board.open_tasks, (_priority, True), (_scheduled_nulls_last, False), (_reported, True)
+    )
+    board.my_tasks = _ordered(board.my_tasks, (_priority, True), (_scheduled_nulls_last, False))
+    board.today_tasks = _ordered(board.today_tasks, (_priority, True))
+    board.pool_tasks = _ordered(board.pool_tasks, (_priority, True))
+    board.backlog_tasks = _ordered(board.backlog_tasks, (_priority, True), (_reported, False))
+    board.completed_tasks = _ordered(board.completed_tasks, (_completed, True))
+    board.scheduled_tasks = _ordered(
+        board.scheduled_tasks, (_scheduled_nulls_last, False), (_priority, True)
+    )
+    return board
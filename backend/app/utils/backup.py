@@ -1,9 +1,11 @@
 """Backup and restore utilities for database export/import."""
 import json
 import os
+from collections import defaultdict
 from datetime import datetime, date, timedelta, time as time_obj
 from decimal import Decimal
-from typing import Dict, Any, List, Tuple, Optional, Callable
+from functools import lru_cache, partial
+from typing import Dict, Any, Iterator, List, Tuple, Optional, Callable
 from sqlalchemy.orm import Session
 from sqlalchemy import text, inspect as sa_inspect, func
 from enum import Enum
@@ -57,6 +59,12 @@ from app.models.staff_profile import StaffProfile, HourlyRateHistory
 from app.models.risk_assessment import RiskAssessment, RiskAssessmentCategory, RiskAssessmentReview, RiskAssessmentAcknowledgement, ReviewTrigger
 
 from app.utils.auth import get_password_hash
+from app.utils.backup_archive import (
+    ARCHIVE_EXTENSION, FULL_BACKUP, SINGLE_RECORD_TABLES, BackupArchiveError, backup_kind, id_ranges,
+    is_backup_archive, load_archive, manifest_entity_counts, read_manifest, replay_archives, write_archive,
+)
+from app.utils.bulk_import import BulkImport
+from app.utils.snapshot_export import TableReader, read_tables
 from app.utils.seed_validator import validate_seed_data, SeedValidationError
 
 
@@ -76,6 +84,112 @@ def serialize_datetime(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+# Rows fetched per round trip when streaming a table out
+EXPORT_YIELD_PER = 1000
+
+# Connections a PostgreSQL export reads tables over in parallel, all
+# sharing one snapshot (see app.utils.snapshot_export). 1 reads every
+# table in turn on the caller's session.
+EXPORT_WORKERS = int(os.environ.get("BACKUP_EXPORT_WORKERS", 4))
+
+# (backup key, model, excluded columns) in export order. site_settings is
+# exported separately as a single record. Password hashes are never
+# exported - they will need to be reset on restore.
+EXPORT_MODELS: List[Tuple[str, Any, Tuple[str, ...]]] = [
+    ("users", User, ("password_hash",)),
+    ("staff_profiles", StaffProfile, ()),
+    ("hourly_rate_history", HourlyRateHistory, ()),
+    ("livery_packages", LiveryPackage, ()),
+    ("stable_blocks", StableBlock, ()),
+    ("stables", Stable, ()),
+    ("arenas", Arena, ()),
+    ("horses", Horse, ()),
+    ("services", Service, ()),
+    ("professionals", Professional, ()),
+    ("compliance_items", ComplianceItem, ()),
+    ("notices", Notice, ()),
+    ("bookings", Booking, ()),
+    ("emergency_contacts", EmergencyContact, ()),
+    ("fields", Field, ()),
+    ("feed_requirements", FeedRequirement, ()),
+    ("feed_additions", FeedAddition, ()),
+    ("feed_supply_alerts", FeedSupplyAlert, ()),
+    ("service_requests", ServiceRequest, ()),
+    ("yard_tasks", YardTask, ()),
+    ("clinic_requests", ClinicRequest, ()),
+    ("clinic_participants", ClinicParticipant, ()),
+    ("turnout_requests", TurnoutRequest, ()),
+    ("ledger_entries", LedgerEntry, ()),
+    ("coach_profiles", CoachProfile, ()),
+    ("lesson_requests", LessonRequest, ()),
+    ("holiday_livery_requests", HolidayLiveryRequest, ()),
+    ("shifts", Shift, ()),
+    ("timesheets", Timesheet, ()),
+    ("holiday_requests", HolidayRequest, ()),
+    ("unplanned_absences", UnplannedAbsence, ()),
+    ("invoices", Invoice, ()),
+    ("invoice_line_items", InvoiceLineItem, ()),
+    ("contract_templates", ContractTemplate, ()),
+    ("contract_versions", ContractVersion, ()),
+    ("contract_signatures", ContractSignature, ()),
+    # Health Records
+    ("farrier_records", FarrierRecord, ()),
+    ("dentist_records", DentistRecord, ()),
+    ("vaccination_records", VaccinationRecord, ()),
+    ("worming_records", WormingRecord, ()),
+    ("weight_records", WeightRecord, ()),
+    ("body_condition_records", BodyConditionRecord, ()),
+    ("saddle_fit_records", SaddleFitRecord, ()),
+    # Rehab Programs and Tasks
+    ("rehab_programs", RehabProgram, ()),
+    ("rehab_tasks", RehabTask, ()),
+    ("rehab_task_logs", RehabTaskLog, ()),
+    ("health_observations", HealthObservation, ()),
+    # Medication Logs
+    ("medication_admin_logs", MedicationAdminLog, ()),
+    ("wound_care_logs", WoundCareLog, ()),
+    ("turnout_groups", TurnoutGroup, ()),
+    ("turnout_group_horses", TurnoutGroupHorse, ()),
+    ("compliance_history", ComplianceHistory, ()),
+    ("flood_monitoring_stations", FloodMonitoringStation, ()),
+    # Land Features (water troughs, hedgerows, trees, etc.)
+    ("land_features", LandFeature, ()),
+    # Grants and Environmental Schemes
+    ("grants", Grant, ()),
+    # Horse Field Assignments (permanent livery field assignments)
+    ("horse_field_assignments", HorseFieldAssignment, ()),
+    # Sheep Flocks (for worm control grazing)
+    ("sheep_flocks", SheepFlock, ()),
+    ("sheep_flock_field_assignments", SheepFlockFieldAssignment, ()),
+]
+
+
+@lru_cache(maxsize=None)
+def _export_columns(model_class, exclude: Tuple[str, ...] = ()) -> Tuple[Tuple[str, Any], ...]:
+    """(key, mapped attribute) for every exported column, looked up once per model."""
+    mapper = sa_inspect(model_class)
+    return tuple(
+        (column.key, getattr(model_class, column.key))
+        for column in mapper.columns
+        if column.key not in exclude
+    )
+
+
+def _json_value(value):
+    """Convert a column value to its JSON form."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date, time_obj)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    return value
+
+
 def model_to_dict(obj, exclude: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Convert any SQLAlchemy model to a dictionary using introspection.
@@ -94,38 +208,34 @@ def model_to_dict(obj, exclude: Optional[List[str]] = None) -> Dict[str, Any]:
     Returns:
         Dictionary with all column values, suitable for JSON serialization
     """
-    if exclude is None:
-        exclude = []
+    return {
+        key: _json_value(getattr(obj, key))
+        for key, _ in _export_columns(obj.__class__, tuple(exclude or ()))
+    }
 
-    result = {}
-    mapper = sa_inspect(obj.__class__)
 
-    for column in mapper.columns:
-        key = column.key
-        if key in exclude:
-            continue
-
-        value = getattr(obj, key)
-
-        # Handle various types
-        if value is None:
-            result[key] = None
-        elif isinstance(value, Enum):
-            result[key] = value.value
-        elif isinstance(value, datetime):
-            result[key] = value.isoformat()
-        elif isinstance(value, date):
-            result[key] = value.isoformat()
-        elif isinstance(value, time_obj):
-            result[key] = value.isoformat()
-        elif isinstance(value, Decimal):
-            result[key] = float(value)
-        elif isinstance(value, bytes):
-            result[key] = value.decode('utf-8', errors='replace')
-        else:
-            result[key] = value
+def iter_model_rows(
+    db: Session,
+    model_class,
+    exclude: Tuple[str, ...] = (),
+    yield_per: int = EXPORT_YIELD_PER,
+    where=None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every row of a model (or those matching where) as a JSON-ready
+    dict, in primary key order.
 
-    return result
+    Selects plain columns rather than ORM instances and fetches yield_per
+    rows at a time, so memory use does not grow with the table.
+    """
+    columns = _export_columns(model_class, tuple(exclude))
+    keys = [key for key, _ in columns]
+    query = db.query(*[attribute for _, attribute in columns])
+    if where is not None:
+        query = query.filter(where)
+    query = query.order_by(*sa_inspect(model_class).primary_key).yield_per(yield_per)
+    for row in query:
+        yield dict(zip(keys, map(_json_value, row)))
 
 
 def export_models(db: Session, model_class, exclude: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -140,250 +250,246 @@ def export_models(db: Session, model_class, exclude: Optional[List[str]] = None)
     Returns:
         List of dictionaries representing all records
     """
-    records = db.query(model_class).all()
-    return [model_to_dict(record, exclude=exclude) for record in records]
-
-
-def export_database(db: Session) -> Tuple[Dict[str, Any], Dict[str, int]]:
-    """
-    Export all database tables to a dictionary using model introspection.
-    This automatically captures all fields from each model, so no manual
-    field listing is required. When models change, backup automatically adapts.
+    return list(iter_model_rows(db, model_class, tuple(exclude or ())))
 
-    Returns (data_dict, entity_counts).
-    """
-    entity_counts = {}
-    data = {}
 
-    # Site Settings (single record)
+def export_site_settings(db: Session) -> Optional[Dict[str, Any]]:
     settings = db.query(SiteSettings).first()
-    if settings:
-        data["site_settings"] = model_to_dict(settings)
-        entity_counts["site_settings"] = 1
-
-    # Users (excluding password hashes for security - will need to reset on restore)
-    data["users"] = export_models(db, User, exclude=["password_hash"])
-    entity_counts["users"] = len(data["users"])
-
-    # Staff Profiles
-    data["staff_profiles"] = export_models(db, StaffProfile)
-    entity_counts["staff_profiles"] = len(data["staff_profiles"])
-
-    # Hourly Rate History
-    data["hourly_rate_history"] = export_models(db, HourlyRateHistory)
-    entity_counts["hourly_rate_history"] = len(data["hourly_rate_history"])
-
-    # Livery Packages
-    data["livery_packages"] = export_models(db, LiveryPackage)
-    entity_counts["livery_packages"] = len(data["livery_packages"])
-
-    # Stable Blocks
-    data["stable_blocks"] = export_models(db, StableBlock)
-    entity_counts["stable_blocks"] = len(data["stable_blocks"])
-
-    # Stables
-    data["stables"] = export_models(db, Stable)
-    entity_counts["stables"] = len(data["stables"])
-
-    # Arenas
-    data["arenas"] = export_models(db, Arena)
-    entity_counts["arenas"] = len(data["arenas"])
-
-    # Horses
-    data["horses"] = export_models(db, Horse)
-    entity_counts["horses"] = len(data["horses"])
-
-    # Services
-    data["services"] = export_models(db, Service)
-    entity_counts["services"] = len(data["services"])
-
-    # Professionals
-    data["professionals"] = export_models(db, Professional)
-    entity_counts["professionals"] = len(data["professionals"])
-
-    # Compliance Items
-    data["compliance_items"] = export_models(db, ComplianceItem)
-    entity_counts["compliance_items"] = len(data["compliance_items"])
-
-    # Notices
-    data["notices"] = export_models(db, Notice)
-    entity_counts["notices"] = len(data["notices"])
-
-    # Bookings
-    data["bookings"] = export_models(db, Booking)
-    entity_counts["bookings"] = len(data["bookings"])
-
-    # Emergency Contacts
-    data["emergency_contacts"] = export_models(db, EmergencyContact)
-    entity_counts["emergency_contacts"] = len(data["emergency_contacts"])
-
-    # Fields
-    data["fields"] = export_models(db, Field)
-    entity_counts["fields"] = len(data["fields"])
+    return model_to_dict(settings) if settings else None
 
-    # Feed Requirements
-    data["feed_requirements"] = export_models(db, FeedRequirement)
-    entity_counts["feed_requirements"] = len(data["feed_requirements"])
 
-    # Feed Additions
-    data["feed_additions"] = export_models(db, FeedAddition)
-    entity_counts["feed_additions"] = len(data["feed_additions"])
-
-    # Feed Supply Alerts
-    data["feed_supply_alerts"] = export_models(db, FeedSupplyAlert)
-    entity_counts["feed_supply_alerts"] = len(data["feed_supply_alerts"])
-
-    # Service Requests
-    data["service_requests"] = export_models(db, ServiceRequest)
-    entity_counts["service_requests"] = len(data["service_requests"])
-
-    # Yard Tasks
-    data["yard_tasks"] = export_models(db, YardTask)
-    entity_counts["yard_tasks"] = len(data["yard_tasks"])
-
-    # Clinic Requests
-    data["clinic_requests"] = export_models(db, ClinicRequest)
-    entity_counts["clinic_requests"] = len(data["clinic_requests"])
-
-    # Clinic Participants
-    data["clinic_participants"] = export_models(db, ClinicParticipant)
-    entity_counts["clinic_participants"] = len(data["clinic_participants"])
-
-    # Turnout Requests
-    data["turnout_requests"] = export_models(db, TurnoutRequest)
-    entity_counts["turnout_requests"] = len(data["turnout_requests"])
-
-    # Ledger Entries
-    data["ledger_entries"] = export_models(db, LedgerEntry)
-    entity_counts["ledger_entries"] = len(data["ledger_entries"])
-
-    # Coach Profiles
-    data["coach_profiles"] = export_models(db, CoachProfile)
-    entity_counts["coach_profiles"] = len(data["coach_profiles"])
-
-    # Lesson Requests
-    data["lesson_requests"] = export_models(db, LessonRequest)
-    entity_counts["lesson_requests"] = len(data["lesson_requests"])
-
-    # Holiday Livery Requests
-    data["holiday_livery_requests"] = export_models(db, HolidayLiveryRequest)
-    entity_counts["holiday_livery_requests"] = len(data["holiday_livery_requests"])
-
-    # Shifts
-    data["shifts"] = export_models(db, Shift)
-    entity_counts["shifts"] = len(data["shifts"])
-
-    # Timesheets
-    data["timesheets"] = export_models(db, Timesheet)
-    entity_counts["timesheets"] = len(data["timesheets"])
-
-    # Holiday Requests
-    data["holiday_requests"] = export_models(db, HolidayRequest)
-    entity_counts["holiday_requests"] = len(data["holiday_requests"])
+def _site_settings_rows(db: Session) -> Iterator[Dict[str, Any]]:
+    settings = export_site_settings(db)
+    if settings:
+        yield settings
 
-    # Unplanned Absences
-    data["unplanned_absences"] = export_models(db, UnplannedAbsence)
-    entity_counts["unplanned_absences"] = len(data["unplanned_absences"])
 
-    # Invoices
-    data["invoices"] = export_models(db, Invoice)
-    entity_counts["invoices"] = len(data["invoices"])
+def export_readers() -> List[Tuple[str, TableReader]]:
+    """(backup key, reader) for site_settings and every table in EXPORT_MODELS."""
+    return [("site_settings", _site_settings_rows)] + [
+        (key, partial(iter_model_rows, model_class=model_class, exclude=exclude))
+        for key, model_class, exclude in EXPORT_MODELS
+    ]
 
-    # Invoice Line Items
-    data["invoice_line_items"] = export_models(db, InvoiceLineItem)
-    entity_counts["invoice_line_items"] = len(data["invoice_line_items"])
 
-    # Contract Templates
-    data["contract_templates"] = export_models(db, ContractTemplate)
-    entity_counts["contract_templates"] = len(data["contract_templates"])
+def export_database(db: Session, workers: int = EXPORT_WORKERS) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Export all database tables to a dictionary using model introspection.
+    This automatically captures all fields from each model, so no manual
+    field listing is required. When models change, backup automatically adapts.
 
-    # Contract Versions
-    data["contract_versions"] = export_models(db, ContractVersion)
-    entity_counts["contract_versions"] = len(data["contract_versions"])
+    Holds the whole export in memory; write_backup_archive streams the
+    same data straight into a backup archive. On PostgreSQL the tables are
+    read over workers connections sharing one snapshot.
 
-    # Contract Signatures
-    data["contract_signatures"] = export_models(db, ContractSignature)
-    entity_counts["contract_signatures"] = len(data["contract_signatures"])
+    Returns (data_dict, entity_counts).
+    """
+    entity_counts = {}
+    data = {}
 
-    # Health Records
-    data["farrier_records"] = export_models(db, FarrierRecord)
-    entity_counts["farrier_records"] = len(data["farrier_records"])
+    for key, records in read_tables(db, export_readers(), workers, EXPORT_YIELD_PER):
+        rows = list(records)
+        if key in SINGLE_RECORD_TABLES:
+            if rows:
+                data[key] = rows[0]
+                entity_counts[key] = 1
+            continue
+        data[key] = rows
+        entity_counts[key] = len(rows)
 
-    data["dentist_records"] = export_models(db, DentistRecord)
-    entity_counts["dentist_records"] = len(data["dentist_records"])
+    return data, entity_counts
 
-    data["vaccination_records"] = export_models(db, VaccinationRecord)
-    entity_counts["vaccination_records"] = len(data["vaccination_records"])
 
-    data["worming_records"] = export_models(db, WormingRecord)
-    entity_counts["worming_records"] = len(data["worming_records"])
+# =============================================================================
+# DIFFERENTIAL BACKUPS
+# =============================================================================
 
-    data["weight_records"] = export_models(db, WeightRecord)
-    entity_counts["weight_records"] = len(data["weight_records"])
+# Scheduled backups are differentials against the newest full backup until
+# it is this old, then a new full backup is taken. 0 takes full backups only.
+FULL_BACKUP_INTERVAL_DAYS = int(os.environ.get("BACKUP_FULL_INTERVAL_DAYS", 7))
 
-    data["body_condition_records"] = export_models(db, BodyConditionRecord)
-    entity_counts["body_condition_records"] = len(data["body_condition_records"])
+# updated_at is stamped when a row is flushed but becomes visible at commit,
+# so a differential also re-exports rows stamped just before its base's mark
+DIFFERENTIAL_OVERLAP = timedelta(minutes=5)
 
-    data["saddle_fit_records"] = export_models(db, SaddleFitRecord)
-    entity_counts["saddle_fit_records"] = len(data["saddle_fit_records"])
 
-    # Rehab Programs and Tasks
-    data["rehab_programs"] = export_models(db, RehabProgram)
-    entity_counts["rehab_programs"] = len(data["rehab_programs"])
+def _change_column(model_class) -> Optional[str]:
+    """
+    Column stamped by in-place edits. Tables without updated_at are copied
+    whole into a differential, since an id mark alone only sees new rows.
+    """
+    return "updated_at" if "updated_at" in model_class.__table__.c else None
 
-    data["rehab_tasks"] = export_models(db, RehabTask)
-    entity_counts["rehab_tasks"] = len(data["rehab_tasks"])
 
-    data["rehab_task_logs"] = export_models(db, RehabTaskLog)
-    entity_counts["rehab_task_logs"] = len(data["rehab_task_logs"])
+def table_watermark(db: Session, model_class) -> Dict[str, Any]:
+    """High-water mark of a table: its highest id and latest change timestamp."""
+    column = _change_column(model_class)
+    max_changed = func.max(getattr(model_class, column)) if column else text("NULL")
+    max_id, changed_at = db.query(func.max(model_class.id), max_changed).one()
+    return {
+        "id": max_id,
+        "column": column,
+        "changed_at": _json_value(changed_at),
+    }
 
-    # Health Observations
-    data["health_observations"] = export_models(db, HealthObservation)
-    entity_counts["health_observations"] = len(data["health_observations"])
 
-    # Medication Logs
-    data["medication_admin_logs"] = export_models(db, MedicationAdminLog)
-    entity_counts["medication_admin_logs"] = len(data["medication_admin_logs"])
+def _changed_since(model_class, watermark: Optional[Dict[str, Any]]):
+    """Filter for rows added or changed since a base watermark, or None to copy the whole table."""
+    column = _change_column(model_class)
+    if not watermark or watermark.get("id") is None or column is None or column != watermark.get("column"):
+        return None
+    added = model_class.id > watermark["id"]
+    if not watermark.get("changed_at"):
+        return added
+    since = datetime.fromisoformat(watermark["changed_at"]) - DIFFERENTIAL_OVERLAP
+    return added | (getattr(model_class, column) > since)
 
-    data["wound_care_logs"] = export_models(db, WoundCareLog)
-    entity_counts["wound_care_logs"] = len(data["wound_care_logs"])
 
-    # Turnout Groups
-    data["turnout_groups"] = export_models(db, TurnoutGroup)
-    entity_counts["turnout_groups"] = len(data["turnout_groups"])
+def _with_live_ids(db: Session, model_class, records: Iterator[Dict[str, Any]], info: Dict[str, Any]):
+    """Pass records through, then record the ids still in the table so replay can drop deleted rows."""
+    yield from records
+    ids = db.query(model_class.id).order_by(model_class.id).yield_per(EXPORT_YIELD_PER)
+    info["ids"] = id_ranges(id_ for id_, in ids)
 
-    data["turnout_group_horses"] = export_models(db, TurnoutGroupHorse)
-    entity_counts["turnout_group_horses"] = len(data["turnout_group_horses"])
 
-    # Compliance History
-    data["compliance_history"] = export_models(db, ComplianceHistory)
-    entity_counts["compliance_history"] = len(data["compliance_history"])
+def _archive_rows(
+    db: Session,
+    key: str,
+    model_class,
+    exclude: Tuple[str, ...],
+    base_tables: Optional[Dict[str, Any]],
+    info: Dict[str, Any]
+) -> Iterator[Dict[str, Any]]:
+    info["watermark"] = table_watermark(db, model_class)
+    if base_tables is None:
+        yield from iter_model_rows(db, model_class, exclude)
+        return
+    where = _changed_since(model_class, base_tables.get(key, {}).get("watermark"))
+    yield from _with_live_ids(db, model_class, iter_model_rows(db, model_class, exclude, where=where), info)
+
+
+def iter_archive_tables(
+    db: Session,
+    base_manifest: Optional[Dict[str, Any]] = None,
+    workers: int = EXPORT_WORKERS
+) -> Iterator[Tuple[str, Iterator[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    (backup key, streamed records, manifest fields) for every exported
+    table. Each table's watermark is taken before it is read, so anything
+    written during the export is picked up again by the next differential.
+    The manifest fields are complete once the records are exhausted.
 
-    # Flood Monitoring Stations
-    data["flood_monitoring_stations"] = export_models(db, FloodMonitoringStation)
-    entity_counts["flood_monitoring_stations"] = len(data["flood_monitoring_stations"])
+    Given a full backup's manifest, only rows added or changed since its
+    watermarks are exported, plus the ranges of ids still present.
+    """
+    base_tables = base_manifest["tables"] if base_manifest else None
+    readers = [("site_settings", _site_settings_rows)]
+    infos: List[Dict[str, Any]] = [{}]
+    for key, model_class, exclude in EXPORT_MODELS:
+        info: Dict[str, Any] = {}
+        readers.append((key, partial(
+            _archive_rows, key=key, model_class=model_class, exclude=exclude, base_tables=base_tables, info=info
+        )))
+        infos.append(info)
+    for (key, records), info in zip(read_tables(db, readers, workers, EXPORT_YIELD_PER), infos):
+        yield key, records, info
+
+
+def current_schema_revision(db: Session) -> Optional[str]:
+    """The alembic revision the database is at, or None if it is not under alembic."""
+    if not sa_inspect(db.connection()).has_table("alembic_version"):
+        return None
+    return db.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+
+def write_backup_archive(
+    db: Session,
+    filename: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    base: Optional[str] = None,
+    workers: int = EXPORT_WORKERS
+) -> Tuple[str, Dict[str, int]]:
+    """
+    Stream the export into a compressed backup archive (see
+    app.utils.backup_archive), recording row counts, checksums, per-table
+    watermarks and the schema revision in its manifest.
 
-    # Land Features (water troughs, hedgerows, trees, etc.)
-    data["land_features"] = export_models(db, LandFeature)
-    entity_counts["land_features"] = len(data["land_features"])
+    Given base, the filename of a full backup archive, writes a
+    differential holding only the rows changed since that backup.
 
-    # Grants and Environmental Schemes
-    data["grants"] = export_models(db, Grant)
-    entity_counts["grants"] = len(data["grants"])
+    On PostgreSQL the tables are read over workers connections sharing
+    one snapshot, so the archive is consistent across tables as well as
+    quicker to take.
 
-    # Horse Field Assignments (permanent livery field assignments)
-    data["horse_field_assignments"] = export_models(db, HorseFieldAssignment)
-    entity_counts["horse_field_assignments"] = len(data["horse_field_assignments"])
+    Returns (filepath, entity_counts).
+    """
+    base_manifest = None
+    base_info = None
+    if base:
+        base_manifest = read_manifest(os.path.join(BACKUP_DIR, base))
+        if backup_kind(base_manifest) != FULL_BACKUP:
+            raise BackupArchiveError(f"{base} is not a full backup")
+        base_info = {"filename": base, "created_at": base_manifest["created_at"]}
 
-    # Sheep Flocks (for worm control grazing)
-    data["sheep_flocks"] = export_models(db, SheepFlock)
-    entity_counts["sheep_flocks"] = len(data["sheep_flocks"])
+    ensure_backup_dir()
+    filepath = os.path.join(BACKUP_DIR, filename)
+    tmp_path = f"{filepath}.tmp"
+    try:
+        manifest = write_archive(
+            tmp_path,
+            iter_archive_tables(db, base_manifest, workers),
+            schema_revision=current_schema_revision(db),
+            metadata=metadata,
+            base=base_info
+        )
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return filepath, manifest_entity_counts(manifest)
 
-    # Sheep Flock Field Assignments
-    data["sheep_flock_field_assignments"] = export_models(db, SheepFlockFieldAssignment)
-    entity_counts["sheep_flock_field_assignments"] = len(data["sheep_flock_field_assignments"])
 
-    return data, entity_counts
+def differential_base(db: Session, max_age_days: int = FULL_BACKUP_INTERVAL_DAYS) -> Optional[str]:
+    """
+    Filename of the newest full backup archive a differential can be taken
+    against: younger than max_age_days, with watermarks, and at the
+    database's current schema revision. None means take a full backup.
+    """
+    if max_age_days <= 0 or not os.path.isdir(BACKUP_DIR):
+        return None
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+    revision = current_schema_revision(db)
+    newest = None
+    for filename in os.listdir(BACKUP_DIR):
+        if not filename.endswith(ARCHIVE_EXTENSION):
+            continue
+        try:
+            manifest = read_manifest(os.path.join(BACKUP_DIR, filename))
+        except BackupArchiveError:
+            continue
+        created_at = datetime.fromisoformat(manifest["created_at"])
+        if (
+            backup_kind(manifest) == FULL_BACKUP
+            and created_at >= cutoff
+            and manifest.get("schema_revision") == revision
+            and all("watermark" in entry for key, entry in manifest["tables"].items() if key not in SINGLE_RECORD_TABLES)
+            and (newest is None or created_at > newest[0])
+        ):
+            newest = (created_at, filename)
+    return newest[1] if newest else None
+
+
+def backup_base_filename(filename: str) -> Optional[str]:
+    """The full backup a differential archive depends on, or None for anything else."""
+    filepath = os.path.join(BACKUP_DIR, filename)
+    if not filename.endswith(ARCHIVE_EXTENSION) or not os.path.exists(filepath):
+        return None
+    try:
+        base = read_manifest(filepath).get("base", {}).get("filename")
+    except BackupArchiveError:
+        return None
+    return os.path.basename(base) if base else None
 
 
 def save_backup_file(data: Dict[str, Any], filename: str) -> str:
@@ -404,27 +510,61 @@ def get_backup_file_size(filename: str) -> int:
 
 
 def list_backup_files() -> List[Dict[str, Any]]:
-    """List all backup files in the backup directory."""
+    """
+    List all backup files in the backup directory. Archives include their
+    manifest's entity counts and schema revision, read without
+    decompressing any table data.
+    """
     ensure_backup_dir()
     files = []
     for filename in os.listdir(BACKUP_DIR):
-        if filename.endswith('.json'):
+        if filename.endswith(('.json', ARCHIVE_EXTENSION)):
             filepath = os.path.join(BACKUP_DIR, filename)
-            files.append({
+            entry = {
                 "filename": filename,
                 "size": os.path.getsize(filepath),
                 "modified": datetime.fromtimestamp(os.path.getmtime(filepath)),
-            })
+            }
+            if filename.endswith(ARCHIVE_EXTENSION):
+                try:
+                    manifest = read_manifest(filepath)
+                except BackupArchiveError as e:
+                    # Still listed, so an unreadable archive can be seen and removed
+                    entry["error"] = str(e)
+                else:
+                    entry["entity_counts"] = manifest_entity_counts(manifest)
+                    entry["schema_revision"] = manifest.get("schema_revision")
+                    entry["kind"] = backup_kind(manifest)
+                    entry["base"] = manifest.get("base", {}).get("filename")
+            files.append(entry)
     return sorted(files, key=lambda x: x["modified"], reverse=True)
 
 
 def load_backup_file(filename: str) -> Dict[str, Any]:
-    """Load backup data from a JSON file."""
+    """
+    Load backup data from a JSON file or a backup archive. Archive
+    checksums are verified (BackupArchiveError on mismatch). A
+    differential is replayed on top of its full backup, which must be in
+    the backup directory.
+    """
     filepath = os.path.join(BACKUP_DIR, filename)
+    if is_backup_archive(filepath):
+        base = backup_base_filename(filename)
+        if base:
+            return load_backup_chain([base, filename])
+        return load_archive(filepath)
     with open(filepath, 'r') as f:
         return json.load(f)
 
 
+def load_backup_chain(filenames: List[str]) -> Dict[str, Any]:
+    """
+    Load a full backup archive followed by differentials against it, in
+    order, as one backup ready for import_database.
+    """
+    return replay_archives([os.path.join(BACKUP_DIR, filename) for filename in filenames])
+
+
 def validate_backup(data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
     """
     Validate backup data structure.
@@ -453,6 +593,48 @@ def validate_backup(data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
     return is_valid, errors, warnings
 
 
+def validate_backup_manifest(
+    manifest: Dict[str, Any],
+    schema_revision: Optional[str] = None
+) -> Tuple[bool, List[str], List[str]]:
+    """
+    Validate a backup archive from its manifest alone.
+    Returns (is_valid, errors, warnings).
+    """
+    errors = []
+    warnings = []
+    tables = manifest.get("tables", {})
+
+    for key in ["users", "arenas"]:
+        if key not in tables:
+            errors.append(f"Missing required key: {key}")
+
+    if not tables.get("site_settings", {}).get("rows"):
+        warnings.append("No site_settings found - defaults will be used")
+
+    for key, entry in tables.items():
+        if key in SINGLE_RECORD_TABLES and entry.get("rows", 0) > 1:
+            errors.append(f"{key} should hold a single record")
+        if not entry.get("sha256"):
+            errors.append(f"No checksum recorded for {key}")
+
+    base = manifest.get("base", {}).get("filename")
+    if backup_kind(manifest) != FULL_BACKUP and not (
+        base and os.path.exists(os.path.join(BACKUP_DIR, os.path.basename(base)))
+    ):
+        errors.append(f"Differential backup needs its full backup ({base}) in the backup directory")
+
+    backup_revision = manifest.get("schema_revision")
+    if schema_revision and backup_revision and backup_revision != schema_revision:
+        warnings.append(
+            f"Backup was taken at schema revision {backup_revision}; "
+            f"the database is at {schema_revision}"
+        )
+
+    is_valid = len(errors) == 0
+    return is_valid, errors, warnings
+
+
 def delete_backup_file(filename: str) -> bool:
     """Delete a backup file. Returns True if successful."""
     filepath = os.path.join(BACKUP_DIR, filename)
@@ -462,10 +644,10 @@ def delete_backup_file(filename: str) -> bool:
     return False
 
 
-def generate_backup_filename() -> str:
-    """Generate a timestamped backup filename."""
+def generate_backup_filename(extension: str = ARCHIVE_EXTENSION) -> str:
+    """Generate a timestamped backup filename (an archive unless another extension is given)."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"backup_{timestamp}.json"
+    return f"backup_{timestamp}{extension}"
 
 
 # =============================================================================
@@ -486,7 +668,7 @@ def clear_database(db: Session, log: Callable[[str], None] = print, commit: bool
         "lesson_requests", "coach_availability_slots", "coach_recurring_schedules", "coach_profiles",
         "clinic_registrations", "clinic_slots", "clinics",
         "compliance_history", "compliance_items",
-        "ledger_entries", "notices",
+        "account_balances", "income_rollups", "ledger_entries", "notices",
         "feed_supply_alerts", "feed_additions", "feed_requirements",
         "farrier_records", "dentist_records", "vaccination_records", "worming_records",
         "service_requests", "turnout_requests",
@@ -502,7 +684,7 @@ def clear_database(db: Session, log: Callable[[str], None] = print, commit: bool
         "field_usage_log_horses", "field_usage_logs", "turnout_group_horses", "turnout_groups",
         "horse_companions", "fields", "emergency_contacts",
         "holiday_requests", "timesheets", "shifts",
-        "invoice_line_items", "invoices",
+        "invoice_line_items", "invoices", "document_sequences",
         "yard_tasks",
     ]
 
@@ -543,6 +725,11 @@ def import_database(
     All operations are performed in a single transaction. If any operation fails,
     the entire import is rolled back to prevent partial data.
 
+    Name references and duplicate checks are resolved against maps that are
+    each loaded with one query, and new rows are written with chunked
+    multi-row INSERTs (see app.utils.bulk_import), so the number of round
+    trips does not grow with the number of records.
+
     Args:
         db: SQLAlchemy database session
         data: The data to import (seed or backup format)
@@ -575,6 +762,8 @@ def import_database(
         if clear_first:
             clear_database(db, log, commit=False)
 
+        bulk = BulkImport(db)
+
         # Build lookup maps as we import
         user_map = {}  # username -> id
         user_id_map = {}  # old_id -> new_id (for backup format)
@@ -584,235 +773,236 @@ def import_database(
 
         # 1. Site Settings
         if "site_settings" in data:
-            counts["site_settings"] = _import_site_settings(db, data["site_settings"], log)
+            counts["site_settings"] = _import_site_settings(bulk, data["site_settings"], log)
 
         # 2. Users (needed for relationships)
         if "users" in data:
-            user_map, user_id_map, counts["users"] = _import_users(db, data["users"], log)
+            user_map, user_id_map, counts["users"] = _import_users(bulk, data["users"], log)
 
         # 2b. Staff Profiles (depends on users)
         if "staff_profiles" in data:
-            counts["staff_profiles"] = _import_staff_profiles(db, data["staff_profiles"], user_map, user_id_map, log)
+            counts["staff_profiles"] = _import_staff_profiles(bulk, data["staff_profiles"], user_map, user_id_map, log)
 
         # 2c. Hourly Rate History (depends on users/staff profiles)
         if "hourly_rate_history" in data:
-            counts["hourly_rate_history"] = _import_hourly_rate_history(db, data["hourly_rate_history"], user_map, user_id_map, log)
+            counts["hourly_rate_history"] = _import_hourly_rate_history(bulk, data["hourly_rate_history"], user_map, user_id_map, log)
 
         # 3. Livery Packages (before horses)
         if "livery_packages" in data:
-            package_map, counts["livery_packages"] = _import_livery_packages(db, data["livery_packages"], log)
+            package_map, counts["livery_packages"] = _import_livery_packages(bulk, data["livery_packages"], log)
 
         # 4. Stable Blocks and Stables (before horses)
         if "stable_blocks" in data:
-            stable_map, counts["stable_blocks"], counts["stables"] = _import_stable_blocks(db, data["stable_blocks"], log)
+            stable_map, counts["stable_blocks"], counts["stables"] = _import_stable_blocks(bulk, data["stable_blocks"], log)
 
         # 5. Arenas
         if "arenas" in data:
-            arena_map, counts["arenas"] = _import_arenas(db, data["arenas"], log)
+            arena_map, counts["arenas"] = _import_arenas(bulk, data["arenas"], log)
 
         # 6. Horses
         if "horses" in data:
-            counts["horses"] = _import_horses(db, data["horses"], user_map, stable_map, package_map, log)
+            counts["horses"] = _import_horses(bulk, data["horses"], user_map, stable_map, package_map, log)
 
         # 7. Services
         if "services" in data:
-            counts["services"] = _import_services(db, data["services"], log)
+            counts["services"] = _import_services(bulk, data["services"], log)
 
         # 8. Professionals
         if "professionals" in data:
-            counts["professionals"] = _import_professionals(db, data["professionals"], log)
+            counts["professionals"] = _import_professionals(bulk, data["professionals"], log)
 
         # 9. Compliance Items
         if "compliance_items" in data:
-            counts["compliance_items"] = _import_compliance_items(db, data["compliance_items"], user_map, log)
+            counts["compliance_items"] = _import_compliance_items(bulk, data["compliance_items"], user_map, log)
 
         # 10. Feed Schedules
         if "feed_schedules" in data:
-            counts["feed_schedules"] = _import_feed_schedules(db, data["feed_schedules"], user_map, log)
+            counts["feed_schedules"] = _import_feed_schedules(bulk, data["feed_schedules"], user_map, log)
 
         # 11. Notices
         if "notices" in data:
-            counts["notices"] = _import_notices(db, data["notices"], user_map, log)
+            counts["notices"] = _import_notices(bulk, data["notices"], user_map, log)
 
         # 12. Bookings (uses relative dates in seed format)
         if "bookings" in data:
-            counts["bookings"] = _import_bookings(db, data["bookings"], user_map, arena_map, log)
+            counts["bookings"] = _import_bookings(bulk, data["bookings"], user_map, arena_map, log)
 
         # 13. Clinics (uses relative dates in seed format)
         if "clinics" in data:
-            counts["clinics"] = _import_clinics(db, data["clinics"], user_map, log)
+            counts["clinics"] = _import_clinics(bulk, data["clinics"], user_map, log)
 
         # 14. Coach Profiles
         if "coach_profiles" in data:
-            counts["coach_profiles"] = _import_coach_profiles(db, data["coach_profiles"], user_map, log)
+            counts["coach_profiles"] = _import_coach_profiles(bulk, data["coach_profiles"], user_map, log)
 
         # 15. Lesson Requests (depends on coach_profiles, users, horses, arenas)
         if "lesson_requests" in data:
-            counts["lesson_requests"] = _import_lesson_requests(db, data["lesson_requests"], user_map, arena_map, log)
+            counts["lesson_requests"] = _import_lesson_requests(bulk, data["lesson_requests"], user_map, arena_map, log)
 
         # 16. Yard Tasks
         if "yard_tasks" in data:
-            counts["yard_tasks"] = _import_yard_tasks(db, data["yard_tasks"], user_map, log)
+            counts["yard_tasks"] = _import_yard_tasks(bulk, data["yard_tasks"], user_map, log)
 
         # 17. Turnout Requests
         if "turnout_requests" in data:
-            counts["turnout_requests"] = _import_turnout_requests(db, data["turnout_requests"], user_map, log)
+            counts["turnout_requests"] = _import_turnout_requests(bulk, data["turnout_requests"], user_map, log)
 
         # 18. Service Requests
         if "service_requests" in data:
-            counts["service_requests"] = _import_service_requests(db, data["service_requests"], user_map, log)
+            counts["service_requests"] = _import_service_requests(bulk, data["service_requests"], user_map, log)
 
         # 19. Holiday Requests
         if "holiday_requests" in data:
-            counts["holiday_requests"] = _import_holiday_requests(db, data["holiday_requests"], user_map, log)
+            counts["holiday_requests"] = _import_holiday_requests(bulk, data["holiday_requests"], user_map, log)
 
         # 20. Unplanned Absences
         if "unplanned_absences" in data:
-            counts["unplanned_absences"] = _import_unplanned_absences(db, data["unplanned_absences"], user_map, log)
+            counts["unplanned_absences"] = _import_unplanned_absences(bulk, data["unplanned_absences"], user_map, log)
 
         # 21. Timesheets
         if "timesheets" in data:
-            counts["timesheets"] = _import_timesheets(db, data["timesheets"], user_map, log)
+            counts["timesheets"] = _import_timesheets(bulk, data["timesheets"], user_map, log)
 
         # 21b. Payroll Adjustments (bonuses, tips, ad-hoc payments)
         if "payroll_adjustments" in data:
-            counts["payroll_adjustments"] = _import_payroll_adjustments(db, data["payroll_adjustments"], user_map, log)
+            counts["payroll_adjustments"] = _import_payroll_adjustments(bulk, data["payroll_adjustments"], user_map, log)
 
         # 22. Ledger Entries (account/billing data)
         if "ledger_entries" in data:
-            counts["ledger_entries"] = _import_ledger_entries(db, data["ledger_entries"], user_map, log)
+            counts["ledger_entries"] = _import_ledger_entries(bulk, data["ledger_entries"], user_map, log)
 
         # 23. Emergency Contacts
         if "emergency_contacts" in data:
-            counts["emergency_contacts"] = _import_emergency_contacts(db, data["emergency_contacts"], user_map, log)
+            counts["emergency_contacts"] = _import_emergency_contacts(bulk, data["emergency_contacts"], user_map, log)
 
         # 24. Fields
         if "fields" in data:
-            counts["fields"] = _import_fields(db, data["fields"], log)
+            counts["fields"] = _import_fields(bulk, data["fields"], log)
 
         # 25. Horse Companions
         if "horse_companions" in data:
-            counts["horse_companions"] = _import_horse_companions(db, data["horse_companions"], user_map, log)
+            counts["horse_companions"] = _import_horse_companions(bulk, data["horse_companions"], user_map, log)
 
         # 26. Health Records - Farrier
         if "farrier_records" in data:
-            counts["farrier_records"] = _import_farrier_records(db, data["farrier_records"], user_map, log)
+            counts["farrier_records"] = _import_farrier_records(bulk, data["farrier_records"], user_map, log)
 
         # 27. Health Records - Dentist
         if "dentist_records" in data:
-            counts["dentist_records"] = _import_dentist_records(db, data["dentist_records"], user_map, log)
+            counts["dentist_records"] = _import_dentist_records(bulk, data["dentist_records"], user_map, log)
 
         # 28. Health Records - Vaccinations
         if "vaccination_records" in data:
-            counts["vaccination_records"] = _import_vaccination_records(db, data["vaccination_records"], user_map, log)
+            counts["vaccination_records"] = _import_vaccination_records(bulk, data["vaccination_records"], user_map, log)
 
         # 29. Health Records - Worming
         if "worming_records" in data:
-            counts["worming_records"] = _import_worming_records(db, data["worming_records"], user_map, log)
+            counts["worming_records"] = _import_worming_records(bulk, data["worming_records"], user_map, log)
 
         # 29a. Health Records - Weight
         if "weight_records" in data:
-            counts["weight_records"] = _import_weight_records(db, data["weight_records"], user_map, log)
+            counts["weight_records"] = _import_weight_records(bulk, data["weight_records"], user_map, log)
 
         # 29b. Health Records - Body Condition
         if "body_condition_records" in data:
-            counts["body_condition_records"] = _import_body_condition_records(db, data["body_condition_records"], user_map, log)
+            counts["body_condition_records"] = _import_body_condition_records(bulk, data["body_condition_records"], user_map, log)
 
         # 29c. Health Records - Saddle Fit
         if "saddle_fit_records" in data:
-            counts["saddle_fit_records"] = _import_saddle_fit_records(db, data["saddle_fit_records"], user_map, log)
+            counts["saddle_fit_records"] = _import_saddle_fit_records(bulk, data["saddle_fit_records"], user_map, log)
 
         # 30. Feed Additions (medications/supplements)
         if "feed_additions" in data:
-            counts["feed_additions"] = _import_feed_additions(db, data["feed_additions"], user_map, log)
+            counts["feed_additions"] = _import_feed_additions(bulk, data["feed_additions"], user_map, log)
 
         # 31. Wound Care Logs
         if "wound_care_logs" in data:
-            counts["wound_care_logs"] = _import_wound_care_logs(db, data["wound_care_logs"], user_map, log)
+            counts["wound_care_logs"] = _import_wound_care_logs(bulk, data["wound_care_logs"], user_map, log)
 
         # 32. Health Observations
         if "health_observations" in data:
-            counts["health_observations"] = _import_health_observations(db, data["health_observations"], user_map, log)
+            counts["health_observations"] = _import_health_observations(bulk, data["health_observations"], user_map, log)
 
         # 33. Rehabilitation Programs (with phases and tasks)
         if "rehab_programs" in data:
-            counts["rehab_programs"] = _import_rehab_programs(db, data["rehab_programs"], user_map, log)
+            counts["rehab_programs"] = _import_rehab_programs(bulk, data["rehab_programs"], user_map, log)
 
         # 33b. Rehabilitation Task Logs
         if "rehab_task_logs" in data:
-            counts["rehab_task_logs"] = _import_rehab_task_logs(db, data["rehab_task_logs"], user_map, log)
+            counts["rehab_task_logs"] = _import_rehab_task_logs(bulk, data["rehab_task_logs"], user_map, log)
 
         # 34. Staff Shifts
         if "shifts" in data:
-            counts["shifts"] = _import_shifts(db, data["shifts"], user_map, log)
+            counts["shifts"] = _import_shifts(bulk, data["shifts"], user_map, log)
 
         # 35. Invoices (with line items)
         if "invoices" in data:
-            counts["invoices"] = _import_invoices(db, data["invoices"], user_map, log)
+            counts["invoices"] = _import_invoices(bulk, data["invoices"], user_map, log)
 
         # 36. Turnout Groups (daily field assignments)
         if "turnout_groups" in data:
-            counts["turnout_groups"] = _import_turnout_groups(db, data["turnout_groups"], user_map, log)
+            counts["turnout_groups"] = _import_turnout_groups(bulk, data["turnout_groups"], user_map, log)
 
         # 37. Field Usage Logs
         if "field_usage_logs" in data:
-            counts["field_usage_logs"] = _import_field_usage_logs(db, data["field_usage_logs"], user_map, log)
+            counts["field_usage_logs"] = _import_field_usage_logs(bulk, data["field_usage_logs"], user_map, log)
 
         # 38. Coach Availability Slots
         if "coach_availability_slots" in data:
-            counts["coach_availability_slots"] = _import_coach_availability_slots(db, data["coach_availability_slots"], user_map, log)
+            counts["coach_availability_slots"] = _import_coach_availability_slots(bulk, data["coach_availability_slots"], user_map, log)
 
         # 39. Holiday Livery Requests
         if "holiday_livery_requests" in data:
-            counts["holiday_livery_requests"] = _import_holiday_livery_requests(db, data["holiday_livery_requests"], user_map, log)
+            counts["holiday_livery_requests"] = _import_holiday_livery_requests(bulk, data["holiday_livery_requests"], user_map, log)
 
         # 40. Feed Supply Alerts
         if "feed_supply_alerts" in data:
-            counts["feed_supply_alerts"] = _import_feed_supply_alerts(db, data["feed_supply_alerts"], user_map, log)
+            counts["feed_supply_alerts"] = _import_feed_supply_alerts(bulk, data["feed_supply_alerts"], user_map, log)
 
         # 41. Contract Templates (with versions and signatures)
         if "contract_templates" in data:
             counts["contract_templates"], counts["contract_versions"], counts["contract_signatures"] = _import_contracts(
-                db, data["contract_templates"], user_map, user_id_map, package_map, log
+                bulk, data["contract_templates"], user_map, user_id_map, package_map, log
             )
 
         # 42. Flood Monitoring Stations
         if "flood_monitoring_stations" in data:
-            counts["flood_monitoring_stations"] = _import_flood_monitoring_stations(db, data["flood_monitoring_stations"], log)
+            counts["flood_monitoring_stations"] = _import_flood_monitoring_stations(bulk, data["flood_monitoring_stations"], log)
 
         # 43. Land Features (hedgerows, trees, water troughs, fences, etc.)
         if "land_features" in data:
-            counts["land_features"] = _import_land_features(db, data["land_features"], log)
+            counts["land_features"] = _import_land_features(bulk, data["land_features"], log)
 
         # 44. Grants
         if "grants" in data:
-            counts["grants"] = _import_grants(db, data["grants"], log)
+            counts["grants"] = _import_grants(bulk, data["grants"], log)
 
         # 45. Risk Assessments
         if "risk_assessments" in data:
-            counts["risk_assessments"] = _import_risk_assessments(db, data["risk_assessments"], user_map, log)
+            counts["risk_assessments"] = _import_risk_assessments(bulk, data["risk_assessments"], user_map, log)
 
         # 46. Risk Assessment Reviews (admin review history)
         if "risk_assessment_reviews" in data:
-            counts["risk_assessment_reviews"] = _import_risk_assessment_reviews(db, data["risk_assessment_reviews"], user_map, log)
+            counts["risk_assessment_reviews"] = _import_risk_assessment_reviews(bulk, data["risk_assessment_reviews"], user_map, log)
 
         # 47. Risk Assessment Acknowledgements (staff acknowledgements)
         if "risk_assessment_acknowledgements" in data:
-            counts["risk_assessment_acknowledgements"] = _import_risk_assessment_acknowledgements(db, data["risk_assessment_acknowledgements"], user_map, log)
+            counts["risk_assessment_acknowledgements"] = _import_risk_assessment_acknowledgements(bulk, data["risk_assessment_acknowledgements"], user_map, log)
 
         # 48. Sheep Flocks (for worm control grazing)
         if "sheep_flocks" in data:
-            counts["sheep_flocks"] = _import_sheep_flocks(db, data["sheep_flocks"], log)
+            counts["sheep_flocks"] = _import_sheep_flocks(bulk, data["sheep_flocks"], log)
 
         # 49. Sheep Flock Field Assignments
         if "sheep_flock_field_assignments" in data:
-            counts["sheep_flock_field_assignments"] = _import_sheep_flock_field_assignments(db, data["sheep_flock_field_assignments"], user_map, log)
+            counts["sheep_flock_field_assignments"] = _import_sheep_flock_field_assignments(bulk, data["sheep_flock_field_assignments"], user_map, log)
 
         # 50. Horse Field Assignments (permanent livery field assignments)
         if "horse_field_assignments" in data:
-            counts["horse_field_assignments"] = _import_horse_field_assignments(db, data["horse_field_assignments"], user_map, log)
+            counts["horse_field_assignments"] = _import_horse_field_assignments(bulk, data["horse_field_assignments"], user_map, log)
 
         # Single commit at the end - all or nothing
+        bulk.flush()
         db.commit()
         log("All data imported successfully.")
         return counts
@@ -823,9 +1013,10 @@ def import_database(
         raise SeedingError(f"Seeding failed, all changes rolled back: {e}") from e
 
 
-def _import_site_settings(db: Session, settings_data: Dict, log: Callable) -> int:
+def _import_site_settings(bulk: BulkImport, settings_data: Dict, log: Callable) -> int:
     """Import site settings."""
     log("Importing site settings...")
+    db = bulk.db
     existing = db.query(SiteSettings).first()
     if existing:
         for key, value in settings_data.items():
@@ -843,29 +1034,36 @@ def _import_site_settings(db: Session, settings_data: Dict, log: Callable) -> in
     return 1
 
 
-def _import_users(db: Session, users_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], Dict[int, int], int]:
+def _import_users(bulk: BulkImport, users_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], Dict[int, int], int]:
     """Import users. Returns (username->id map, old_id->new_id map, count)."""
     log("Importing users...")
     user_map = {}  # username -> new_id
     user_id_map = {}  # old_id -> new_id (for backup format)
-    count = 0
+    existing_ids = bulk.index(func.lower(User.username), User.id)
+    updates = []  # details for users that already exist
+    rows = []  # new users, inserted together below
+    queued = {}  # lower(username) -> index into rows
+    references = []  # (username, old_id, index into rows)
 
     for user_data in users_data:
         username = user_data.get("username")
         old_id = user_data.get("id")  # Original ID from backup
-        existing = db.query(User).filter(func.lower(User.username) == func.lower(username)).first()
-        if existing:
+        key = username.lower()
+        if key in existing_ids or key in queued:
             # Update existing user with seed data (name, email, phone, etc.)
-            if user_data.get("name"):
-                existing.name = user_data["name"]
-            if user_data.get("email"):
-                existing.email = user_data["email"]
-            if user_data.get("phone"):
-                existing.phone = user_data["phone"]
+            details = {
+                name: user_data[name] for name in ("name", "email", "phone") if user_data.get(name)
+            }
+            if key in queued:
+                rows[queued[key]].update(details)
+                references.append((username, old_id, queued[key]))
+            else:
+                if details:
+                    updates.append({"id": existing_ids[key], **details})
+                user_map[username] = existing_ids[key]
+                if old_id:
+                    user_id_map[old_id] = existing_ids[key]
             log(f"  User '{username}' already exists, updated details")
-            user_map[username] = existing.id
-            if old_id:
-                user_id_map[old_id] = existing.id
             continue
 
         # Handle password - seed format has 'password', backup format doesn't
@@ -885,7 +1083,9 @@ def _import_users(db: Session, users_data: List[Dict], log: Callable) -> Tuple[D
             from app.models.user import StaffType
             staff_type = StaffType(user_data["staff_type"])
 
-        user = User(
+        queued[key] = len(rows)
+        references.append((username, old_id, len(rows)))
+        rows.append(dict(
             username=username,
             email=user_data.get("email"),
             name=user_data.get("name", username),
@@ -901,22 +1101,22 @@ def _import_users(db: Session, users_data: List[Dict], log: Callable) -> Tuple[D
             annual_leave_entitlement=user_data.get("annual_leave_entitlement", 28 if is_yard_staff else None),
             is_active=user_data.get("is_active", True),
             must_change_password=user_data.get("must_change_password", "password" not in user_data),
-        )
-        db.add(user)
-        db.flush()
-        user_map[username] = user.id
-        if old_id:
-            user_id_map[old_id] = user.id
-        count += 1
+        ))
         log(f"  Created user: {username} ({role_str})")
 
-    db.flush()
-    return user_map, user_id_map, count
+    bulk.update(User, updates)
+    new_ids = bulk.insert(User, rows)
+    for username, old_id, index in references:
+        user_map[username] = new_ids[index]
+        if old_id:
+            user_id_map[old_id] = new_ids[index]
+    return user_map, user_id_map, len(rows)
 
 
-def _import_staff_profiles(db: Session, profiles_data: List[Dict], user_map: Dict, user_id_map: Dict, log: Callable) -> int:
+def _import_staff_profiles(bulk: BulkImport, profiles_data: List[Dict], user_map: Dict, user_id_map: Dict, log: Callable) -> int:
     """Import staff profiles."""
     log("Importing staff profiles...")
+    existing_profiles = bulk.index(StaffProfile.user_id, StaffProfile.id)
     count = 0
 
     for profile_data in profiles_data:
@@ -936,8 +1136,7 @@ def _import_staff_profiles(db: Session, profiles_data: List[Dict], user_map: Dic
             continue
 
         # Check if profile already exists
-        existing = db.query(StaffProfile).filter(StaffProfile.user_id == user_id).first()
-        if existing:
+        if user_id in existing_profiles:
             log(f"  Staff profile for user {user_id} already exists, skipping")
             continue
 
@@ -958,7 +1157,7 @@ def _import_staff_profiles(db: Session, profiles_data: List[Dict], user_map: Dic
         else:
             qualifications = None
 
-        profile = StaffProfile(
+        bulk.add(StaffProfile, dict(
             user_id=user_id,
             date_of_birth=profile_data.get("date_of_birth"),
             bio=profile_data.get("bio"),
@@ -982,16 +1181,15 @@ def _import_staff_profiles(db: Session, profiles_data: List[Dict], user_map: Dic
             dbs_check_date=profile_data.get("dbs_check_date"),
             dbs_certificate_number=profile_data.get("dbs_certificate_number"),
             notes=profile_data.get("notes"),
-        )
-        db.add(profile)
+        ))
         count += 1
         log(f"  Created staff profile for user {user_id}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_hourly_rate_history(db: Session, history_data: List[Dict], user_map: Dict, user_id_map: Dict, log: Callable) -> int:
+def _import_hourly_rate_history(bulk: BulkImport, history_data: List[Dict], user_map: Dict, user_id_map: Dict, log: Callable) -> int:
     """Import hourly rate history."""
     log("Importing hourly rate history...")
     count = 0
@@ -1037,34 +1235,35 @@ def _import_hourly_rate_history(db: Session, history_data: List[Dict], user_map:
         else:
             created_at = datetime.utcnow()
 
-        history_entry = HourlyRateHistory(
+        bulk.add(HourlyRateHistory, dict(
             staff_id=staff_id,
             hourly_rate=entry_data.get("hourly_rate"),
             effective_date=effective_date,
             notes=entry_data.get("notes"),
             created_by_id=created_by_id,
             created_at=created_at,
-        )
-        db.add(history_entry)
+        ))
         count += 1
         log(f"  Created rate history entry for staff {staff_id}: £{entry_data.get('hourly_rate')} effective {effective_date}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_livery_packages(db: Session, packages_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], int]:
+def _import_livery_packages(bulk: BulkImport, packages_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], int]:
     """Import livery packages. Returns (name->id map, count)."""
     log("Importing livery packages...")
     package_map = {}
-    count = 0
+    existing = bulk.index(LiveryPackage.name, LiveryPackage.id)
+    names = []
+    rows = []
 
     for pkg_data in packages_data:
         name = pkg_data.get("name")
-        existing = db.query(LiveryPackage).filter(LiveryPackage.name == name).first()
-        if existing:
+        if name in existing:
             log(f"  Package '{name}' already exists, skipping")
-            package_map[name] = existing.id
+            if existing[name] is not None:
+                package_map[name] = existing[name]
             continue
 
         # Handle features JSON
@@ -1077,7 +1276,9 @@ def _import_livery_packages(db: Session, packages_data: List[Dict], log: Callabl
         billing_type_str = pkg_data.get("billing_type", "monthly")
         billing_type = BillingType.WEEKLY if billing_type_str == "weekly" else BillingType.MONTHLY
 
-        package = LiveryPackage(
+        existing[name] = None  # queued below
+        names.append(name)
+        rows.append(dict(
             name=name,
             description=pkg_data.get("description"),
             price_display=pkg_data.get("price_display", "Contact for price"),
@@ -1089,84 +1290,88 @@ def _import_livery_packages(db: Session, packages_data: List[Dict], log: Callabl
             is_featured=pkg_data.get("is_featured", False),
             display_order=pkg_data.get("display_order", 0),
             is_active=pkg_data.get("is_active", True),
-        )
-        db.add(package)
-        db.flush()
-        package_map[name] = package.id
-        count += 1
+        ))
         log(f"  Created livery package: {name}")
 
-    db.flush()
-    return package_map, count
+    package_map.update(zip(names, bulk.insert(LiveryPackage, rows)))
+    return package_map, len(rows)
 
 
-def _import_stable_blocks(db: Session, blocks_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], int, int]:
+def _import_stable_blocks(bulk: BulkImport, blocks_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], int, int]:
     """Import stable blocks and stables. Returns (stable_name->id map, block_count, stable_count)."""
     log("Importing stable blocks...")
     stable_map = {}
-    block_count = 0
-    stable_count = 0
+    existing_blocks = bulk.index(StableBlock.name, StableBlock.id)
+    existing_stables = bulk.index((Stable.block_id, Stable.name), Stable.id)
+    block_rows = []
+    block_stables = []  # (stable_name, number, sequence) for each new block
     stable_sequence = 0
 
     for block_data in blocks_data:
         block_name = block_data.get("name")
         stables_data = block_data.get("stables", [])
 
-        existing = db.query(StableBlock).filter(StableBlock.name == block_name).first()
-        if existing:
+        if block_name in existing_blocks:
             log(f"  Block '{block_name}' already exists, skipping")
             # Still map existing stables
-            for stable in existing.stables:
-                stable_map[stable.name] = stable.id
+            block_id = existing_blocks[block_name]
+            for (stable_block_id, stable_name), stable_id in existing_stables.items():
+                if block_id is not None and stable_block_id == block_id:
+                    stable_map[stable_name] = stable_id
             continue
 
-        block = StableBlock(
+        existing_blocks[block_name] = None  # queued below
+        block_rows.append(dict(
             name=block_name,
             sequence=block_data.get("sequence", 0),
             is_active=block_data.get("is_active", True),
-        )
-        db.add(block)
-        db.flush()
-        block_count += 1
+        ))
         log(f"  Created block: {block_name}")
 
+        stables = []
         for stable_data in stables_data:
             stable_number = stable_data.get("number", 1)
             stable_name = f"{block_name} {stable_number}"
             stable_sequence += 1
-
-            stable = Stable(
+            stables.append((stable_name, stable_number, stable_sequence))
+            log(f"    Created stable: {stable_name}")
+        block_stables.append(stables)
+
+    stable_names = []
+    stable_rows = []
+    for block_id, stables in zip(bulk.insert(StableBlock, block_rows), block_stables):
+        for stable_name, stable_number, sequence in stables:
+            stable_names.append(stable_name)
+            stable_rows.append(dict(
                 name=stable_name,
-                block_id=block.id,
+                block_id=block_id,
                 number=stable_number,
-                sequence=stable_sequence,
+                sequence=sequence,
                 is_active=True,
-            )
-            db.add(stable)
-            db.flush()
-            stable_map[stable_name] = stable.id
-            stable_count += 1
-            log(f"    Created stable: {stable_name}")
+            ))
+    stable_map.update(zip(stable_names, bulk.insert(Stable, stable_rows)))
+    return stable_map, len(block_rows), len(stable_rows)
 
-    db.flush()
-    return stable_map, block_count, stable_count
 
-
-def _import_arenas(db: Session, arenas_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], int]:
+def _import_arenas(bulk: BulkImport, arenas_data: List[Dict], log: Callable) -> Tuple[Dict[str, int], int]:
     """Import arenas. Returns (name->id map, count)."""
     log("Importing arenas...")
     arena_map = {}
-    count = 0
+    existing = bulk.index(Arena.name, Arena.id)
+    names = []
+    rows = []
 
     for arena_data in arenas_data:
         name = arena_data.get("name")
-        existing = db.query(Arena).filter(Arena.name == name).first()
-        if existing:
+        if name in existing:
             log(f"  Arena '{name}' already exists, skipping")
-            arena_map[name] = existing.id
+            if existing[name] is not None:
+                arena_map[name] = existing[name]
             continue
 
-        arena = Arena(
+        existing[name] = None  # queued below
+        names.append(name)
+        rows.append(dict(
             name=name,
             description=arena_data.get("description"),
             is_active=arena_data.get("is_active", True),
@@ -1177,22 +1382,19 @@ def _import_arenas(db: Session, arenas_data: List[Dict], log: Callable) -> Tuple
             jumps_type=arena_data.get("jumps_type"),
             free_for_livery=arena_data.get("free_for_livery", False),
             image_url=arena_data.get("image_url"),
-        )
-        db.add(arena)
-        db.flush()
-        arena_map[name] = arena.id
-        count += 1
+        ))
         log(f"  Created arena: {name}")
 
-    db.flush()
-    return arena_map, count
+    arena_map.update(zip(names, bulk.insert(Arena, rows)))
+    return arena_map, len(rows)
 
 
 def _import_horses(
-    db: Session, horses_data: List[Dict], user_map: Dict, stable_map: Dict, package_map: Dict, log: Callable
+    bulk: BulkImport, horses_data: List[Dict], user_map: Dict, stable_map: Dict, package_map: Dict, log: Callable
 ) -> int:
     """Import horses."""
     log("Importing horses...")
+    existing_horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
 
     for horse_data in horses_data:
@@ -1233,12 +1435,11 @@ def _import_horses(
             livery_end_date = calculate_date({"days_from_now": horse_data["livery_end_days_from_now"]})
 
         # Check if exists
-        existing = db.query(Horse).filter(Horse.name == name, Horse.owner_id == owner_id).first()
-        if existing:
+        if (name, owner_id) in existing_horses:
             log(f"  Horse '{name}' already exists, skipping")
             continue
 
-        horse = Horse(
+        bulk.add(Horse, dict(
             name=name,
             passport_name=horse_data.get("passport_name"),
             colour=horse_data.get("colour"),
@@ -1280,34 +1481,32 @@ def _import_horses(
             sedation_notes=horse_data.get("sedation_notes"),
             headshy=horse_data.get("headshy", False),
             headshy_notes=horse_data.get("headshy_notes"),
-        )
-        db.add(horse)
+        ))
         count += 1
         log(f"  Created horse: {name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_services(db: Session, services_data: List[Dict], log: Callable) -> int:
+def _import_services(bulk: BulkImport, services_data: List[Dict], log: Callable) -> int:
     """Import services."""
     log("Importing services...")
+    service_names = bulk.index(Service.id, Service.name)
+    service_ids = bulk.index(Service.name, Service.id)
     count = 0
 
     for service_data in services_data:
         name = service_data.get("name")
         service_id = service_data.get("id")
-        existing = db.query(Service).filter(
-            (Service.id == service_id) | (Service.name == name)
-        ).first()
-        if existing:
+        if service_id in service_names or name in service_ids:
             log(f"  Service '{name}' already exists, skipping")
             continue
 
         category_str = service_data.get("category", "general")
         category = ServiceCategory(category_str) if isinstance(category_str, str) else category_str
 
-        service = Service(
+        bulk.add(Service, dict(
             id=service_data.get("id"),
             name=name,
             description=service_data.get("description"),
@@ -1319,31 +1518,30 @@ def _import_services(db: Session, services_data: List[Dict], log: Callable) -> i
             advance_notice_hours=service_data.get("advance_notice_hours", 24),
             is_active=service_data.get("is_active", True),
             notes=service_data.get("notes"),
-        )
-        db.add(service)
+        ))
         count += 1
         log(f"  Created service: {name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_professionals(db: Session, professionals_data: List[Dict], log: Callable) -> int:
+def _import_professionals(bulk: BulkImport, professionals_data: List[Dict], log: Callable) -> int:
     """Import professionals."""
     log("Importing professionals...")
+    existing_professionals = bulk.index(Professional.business_name, Professional.id)
     count = 0
 
     for prof_data in professionals_data:
         name = prof_data.get("business_name") or prof_data.get("name")
-        existing = db.query(Professional).filter(Professional.business_name == name).first()
-        if existing:
+        if name in existing_professionals:
             log(f"  Professional '{name}' already exists, skipping")
             continue
 
         category_str = prof_data.get("category", "other")
         category = ProfessionalCategory(category_str) if isinstance(category_str, str) else category_str
 
-        professional = Professional(
+        bulk.add(Professional, dict(
             business_name=name,
             contact_name=prof_data.get("contact_name"),
             category=category,
@@ -1361,25 +1559,24 @@ def _import_professionals(db: Session, professionals_data: List[Dict], log: Call
             yard_recommended=prof_data.get("yard_recommended", False),
             yard_notes=prof_data.get("yard_notes"),
             is_active=prof_data.get("is_active", True),
-        )
-        db.add(professional)
+        ))
         count += 1
         log(f"  Created professional: {name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_compliance_items(db: Session, items_data: List[Dict], user_map: Dict, log: Callable) -> int:
+def _import_compliance_items(bulk: BulkImport, items_data: List[Dict], user_map: Dict, log: Callable) -> int:
     """Import compliance items."""
     log("Importing compliance items...")
+    existing_items = bulk.index(ComplianceItem.name, ComplianceItem.id)
     count = 0
     admin_id = user_map.get("admin")
 
     for item_data in items_data:
         name = item_data.get("name")
-        existing = db.query(ComplianceItem).filter(ComplianceItem.name == name).first()
-        if existing:
+        if name in existing_items:
             log(f"  Compliance item '{name}' already exists, skipping")
             continue
 
@@ -1390,7 +1587,7 @@ def _import_compliance_items(db: Session, items_data: List[Dict], user_map: Dict
         elif "next_due_date" in item_data and item_data["next_due_date"]:
             next_due_date = datetime.fromisoformat(item_data["next_due_date"].replace('Z', '+00:00'))
 
-        item = ComplianceItem(
+        bulk.add(ComplianceItem, dict(
             name=name,
             category=item_data.get("category", "other"),
             description=item_data.get("description"),
@@ -1401,18 +1598,19 @@ def _import_compliance_items(db: Session, items_data: List[Dict], user_map: Dict
             reminder_days_before=item_data.get("reminder_days_before", 30),
             responsible_user_id=item_data.get("responsible_user_id") or admin_id,
             is_active=item_data.get("is_active", True),
-        )
-        db.add(item)
+        ))
         count += 1
         log(f"  Created compliance item: {name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_feed_schedules(db: Session, schedules_data: List[Dict], user_map: Dict, log: Callable) -> int:
+def _import_feed_schedules(bulk: BulkImport, schedules_data: List[Dict], user_map: Dict, log: Callable) -> int:
     """Import feed schedules."""
     log("Importing feed schedules...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
+    existing_requirements = bulk.index(FeedRequirement.horse_id, FeedRequirement.id)
     count = 0
 
     for schedule_data in schedules_data:
@@ -1424,13 +1622,12 @@ def _import_feed_schedules(db: Session, schedules_data: List[Dict], user_map: Di
             log(f"  Warning: Owner '{owner_username}' not found, skipping feed for '{horse_name}'")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping feed schedule")
             continue
 
-        existing = db.query(FeedRequirement).filter(FeedRequirement.horse_id == horse.id).first()
-        if existing:
+        if horse_id in existing_requirements:
             log(f"  Feed schedule for '{horse_name}' already exists, skipping")
             continue
 
@@ -1440,26 +1637,27 @@ def _import_feed_schedules(db: Session, schedules_data: List[Dict], user_map: Di
         except ValueError:
             supply_status = SupplyStatus.ADEQUATE
 
-        feed_req = FeedRequirement(
-            horse_id=horse.id,
+        bulk.add(FeedRequirement, dict(
+            horse_id=horse_id,
             morning_feed=schedule_data.get("morning_feed"),
             evening_feed=schedule_data.get("evening_feed"),
             supplements=schedule_data.get("supplements"),
             special_instructions=schedule_data.get("special_instructions"),
             supply_status=supply_status,
             supply_notes=schedule_data.get("supply_notes"),
-        )
-        db.add(feed_req)
+        ))
         count += 1
         log(f"  Created feed schedule for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_feed_supply_alerts(db: Session, alerts_data: List[Dict], user_map: Dict, log: Callable) -> int:
+def _import_feed_supply_alerts(bulk: BulkImport, alerts_data: List[Dict], user_map: Dict, log: Callable) -> int:
     """Import feed supply alerts."""
     log("Importing feed supply alerts...")
+    horses_by_name = bulk.index(Horse.name, Horse.id)
+    existing_alerts = bulk.index((FeedSupplyAlert.horse_id, FeedSupplyAlert.item, FeedSupplyAlert.is_resolved), FeedSupplyAlert.id)
     count = 0
 
     for alert_data in alerts_data:
@@ -1467,8 +1665,8 @@ def _import_feed_supply_alerts(db: Session, alerts_data: List[Dict], user_map: D
         item = alert_data.get("item")
 
         # Find horse by name
-        horse = db.query(Horse).filter(Horse.name == horse_name).first()
-        if not horse:
+        horse_id = horses_by_name.get(horse_name)
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping alert")
             continue
 
@@ -1479,39 +1677,33 @@ def _import_feed_supply_alerts(db: Session, alerts_data: List[Dict], user_map: D
             continue
 
         # Check if similar alert already exists
-        existing = db.query(FeedSupplyAlert).filter(
-            FeedSupplyAlert.horse_id == horse.id,
-            FeedSupplyAlert.item == item,
-            FeedSupplyAlert.is_resolved == False
-        ).first()
-        if existing:
+        if (horse_id, item, False) in existing_alerts:
             log(f"  Alert for '{item}' on '{horse_name}' already exists, skipping")
             continue
 
-        alert = FeedSupplyAlert(
-            horse_id=horse.id,
+        bulk.add(FeedSupplyAlert, dict(
+            horse_id=horse_id,
             item=item,
             notes=alert_data.get("notes"),
             created_by_id=created_by_id,
             is_resolved=False,
-        )
-        db.add(alert)
+        ))
         count += 1
         log(f"  Created feed supply alert: {item} for {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_notices(db: Session, notices_data: List[Dict], user_map: Dict, log: Callable) -> int:
+def _import_notices(bulk: BulkImport, notices_data: List[Dict], user_map: Dict, log: Callable) -> int:
     """Import notices."""
     log("Importing notices...")
+    existing_notices = bulk.index(Notice.title, Notice.id)
     count = 0
 
     for notice_data in notices_data:
         title = notice_data.get("title")
-        existing = db.query(Notice).filter(Notice.title == title).first()
-        if existing:
+        if title in existing_notices:
             log(f"  Notice '{title}' already exists, skipping")
             continue
 
@@ -1522,7 +1714,7 @@ def _import_notices(db: Session, notices_data: List[Dict], user_map: Dict, log:
         category_str = notice_data.get("category", "general")
         priority_str = notice_data.get("priority", "normal")
 
-        notice = Notice(
+        bulk.add(Notice, dict(
             title=title,
             content=notice_data.get("content"),
             category=NoticeCategory(category_str) if isinstance(category_str, str) else category_str,
@@ -1530,16 +1722,15 @@ def _import_notices(db: Session, notices_data: List[Dict], user_map: Dict, log:
             is_pinned=notice_data.get("is_pinned", False),
             is_active=True,
             created_by_id=author_id,
-        )
-        db.add(notice)
+        ))
         count += 1
         log(f"  Created notice: {title}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_bookings(db: Session, bookings_data: List[Dict], user_map: Dict, arena_map: Dict, log: Callable) -> int:
+def _import_bookings(bulk: BulkImport, bookings_data: List[Dict], user_map: Dict, arena_map: Dict, log: Callable) -> int:
     """Import bookings."""
     log("Importing bookings...")
     count = 0
@@ -1581,7 +1772,7 @@ def _import_bookings(db: Session, bookings_data: List[Dict], user_map: Dict, are
         booking_status_str = booking_data.get("booking_status", "confirmed")
         booking_status = BookingStatus(booking_status_str) if isinstance(booking_status_str, str) else booking_status_str
 
-        booking = Booking(
+        bulk.add(Booking, dict(
             arena_id=arena_id,
             user_id=user_id,
             title=booking_data.get("title", "Booking"),
@@ -1590,16 +1781,15 @@ def _import_bookings(db: Session, bookings_data: List[Dict], user_map: Dict, are
             start_time=start_time,
             end_time=end_time,
             payment_status=PaymentStatus.NOT_REQUIRED,
-        )
-        db.add(booking)
+        ))
         count += 1
         log(f"  Created booking: {booking_data.get('title')} on {start_time.strftime('%Y-%m-%d %H:%M')}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_clinics(db: Session, clinics_data: List[Dict], user_map: Dict, log: Callable) -> int:
+def _import_clinics(bulk: BulkImport, clinics_data: List[Dict], user_map: Dict, log: Callable) -> int:
     """Import clinics."""
     log("Importing clinic requests...")
     count = 0
@@ -1638,7 +1828,7 @@ def _import_clinics(db: Session, clinics_data: List[Dict], user_map: Dict, log:
         # Get pricing if available
         price = clinic_data.get("price_per_participant") or clinic_data.get("price_per_lesson")
 
-        clinic = ClinicRequest(
+        bulk.add(ClinicRequest, dict(
             proposed_by_id=proposer_id,
             title=clinic_data.get("title"),
             description=clinic_data.get("description"),
@@ -1652,19 +1842,21 @@ def _import_clinics(db: Session, clinics_data: List[Dict], user_map: Dict, log:
             max_participants=clinic_data.get("max_participants", 6),
             coach_fee_group=price,  # Use group fee as the main price
             status=status,
-        )
-        db.add(clinic)
+        ))
         count += 1
         log(f"  Created clinic: {clinic_data.get('title')} on {proposed_date}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_coach_profiles(db: Session, profiles_data: List[Dict], user_map: Dict, log: Callable) -> int:
+def _import_coach_profiles(bulk: BulkImport, profiles_data: List[Dict], user_map: Dict, log: Callable) -> int:
     """Import coach profiles with their availability schedules."""
     log("Importing coach profiles...")
-    count = 0
+    existing_profiles = bulk.index(CoachProfile.user_id, CoachProfile.id)
+    user_names = bulk.index(User.id, User.name)
+    rows = []
+    schedules = []
 
     for profile_data in profiles_data:
         # Resolve user
@@ -1677,10 +1869,10 @@ def _import_coach_profiles(db: Session, profiles_data: List[Dict], user_map: Dic
             continue
 
         # Check if profile already exists
-        existing = db.query(CoachProfile).filter(CoachProfile.user_id == user_id).first()
-        if existing:
+        if user_id in existing_profiles:
             log(f"  Coach profile for user already exists, skipping")
             continue
+        existing_profiles[user_id] = None  # queued below
 
         # Resolve approved_by
         approved_by_id = profile_data.get("approved_by_id")
@@ -1701,7 +1893,7 @@ def _import_coach_profiles(db: Session, profiles_data: List[Dict], user_map: Dic
         except ValueError:
             booking_mode = BookingMode.REQUEST_FIRST
 
-        profile = CoachProfile(
+        rows.append(dict(
             user_id=user_id,
             disciplines=profile_data.get("disciplines"),
             teaching_description=profile_data.get("teaching_description"),
@@ -1715,31 +1907,28 @@ def _import_coach_profiles(db: Session, profiles_data: List[Dict], user_map: Dic
             is_active=profile_data.get("is_active", False),
             approved_by_id=approved_by_id,
             approved_at=datetime.now() if profile_data.get("is_active") else None,
-        )
-        db.add(profile)
-        db.flush()
+        ))
 
         # Add recurring schedules if present
         for schedule_data in profile_data.get("recurring_schedules", []):
-            schedule = CoachRecurringSchedule(
-                coach_profile_id=profile.id,
+            schedules.append((len(rows) - 1, dict(
                 day_of_week=schedule_data.get("day_of_week", 0),
                 start_time=time_obj.fromisoformat(schedule_data.get("start_time", "09:00")),
                 end_time=time_obj.fromisoformat(schedule_data.get("end_time", "17:00")),
                 is_active=schedule_data.get("is_active", True),
-            )
-            db.add(schedule)
+            )))
 
-        count += 1
-        user = db.query(User).filter(User.id == user_id).first()
-        log(f"  Created coach profile for: {user.name if user else 'Unknown'}")
+        log(f"  Created coach profile for: {user_names.get(user_id) or 'Unknown'}")
 
-    db.flush()
-    return count
+    profile_ids = bulk.insert(CoachProfile, rows)
+    for index, schedule in schedules:
+        bulk.add(CoachRecurringSchedule, dict(schedule, coach_profile_id=profile_ids[index]))
+    bulk.flush()
+    return len(rows)
 
 
 def _import_lesson_requests(
-    db: Session,
+    bulk: BulkImport,
     lesson_requests_data: List[Dict],
     user_map: Dict[str, int],
     arena_map: Dict[str, int],
@@ -1750,18 +1939,23 @@ def _import_lesson_requests(
     from app.models.horse import Horse
 
     log("Importing lesson requests...")
+    coach_profiles = bulk.index(
+        func.lower(User.username),
+        (CoachProfile.id, CoachProfile.coach_fee, CoachProfile.venue_fee),
+        join=(User, CoachProfile.user_id == User.id),
+    )
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
     for req_data in lesson_requests_data:
         # Get coach profile by username (case-insensitive)
         coach_username = req_data.get("coach_username")
-        coach_profile = db.query(CoachProfile).join(
-            User, CoachProfile.user_id == User.id
-        ).filter(func.lower(User.username) == func.lower(coach_username)).first()
+        coach_profile = coach_profiles.get(coach_username.lower() if coach_username else None)
         if not coach_profile:
             log(f"  Warning: Coach profile not found for {coach_username}, skipping lesson request")
             continue
+        coach_profile_id, coach_fee, venue_fee = coach_profile
 
         # Get user by username (if specified)
         user_id = None
@@ -1776,9 +1970,7 @@ def _import_lesson_requests(
         horse_id = None
         horse_name = req_data.get("horse_name")
         if horse_name and user_id:
-            horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == user_id).first()
-            if horse:
-                horse_id = horse.id
+            horse_id = horses.get((horse_name, user_id))
 
         # Get arena (if specified)
         arena_id = None
@@ -1832,8 +2024,8 @@ def _import_lesson_requests(
             confirmed_date = requested_date
 
         # Create lesson request
-        lesson_request = LessonRequest(
-            coach_profile_id=coach_profile.id,
+        bulk.add(LessonRequest, dict(
+            coach_profile_id=coach_profile_id,
             user_id=user_id,
             horse_id=horse_id,
             guest_name=req_data.get("guest_name"),
@@ -1844,9 +2036,9 @@ def _import_lesson_requests(
             alternative_dates=req_data.get("alternative_dates"),
             discipline=discipline,
             notes=req_data.get("notes"),
-            coach_fee=req_data.get("coach_fee", coach_profile.coach_fee),
-            venue_fee=req_data.get("venue_fee", coach_profile.venue_fee or 0),
-            total_price=req_data.get("total_price", (req_data.get("coach_fee", coach_profile.coach_fee) + req_data.get("venue_fee", coach_profile.venue_fee or 0))),
+            coach_fee=req_data.get("coach_fee", coach_fee),
+            venue_fee=req_data.get("venue_fee", venue_fee or 0),
+            total_price=req_data.get("total_price", (req_data.get("coach_fee", coach_fee) + req_data.get("venue_fee", venue_fee or 0))),
             confirmed_date=confirmed_date,
             confirmed_start_time=confirmed_start_time,
             confirmed_end_time=confirmed_end_time,
@@ -1857,19 +2049,18 @@ def _import_lesson_requests(
             payment_status=payment_status,
             payment_ref=req_data.get("payment_ref"),
             responded_at=datetime.now() if status != LessonRequestStatus.PENDING else None,
-        )
-        db.add(lesson_request)
+        ))
         count += 1
 
         # Get requester name for logging
         requester = req_data.get("guest_name") or user_username or "Unknown"
         log(f"  Created lesson request: {requester} -> {coach_username} ({status_str})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_yard_tasks(db: Session, tasks_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_yard_tasks(bulk: BulkImport, tasks_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import yard tasks from seed data."""
     from datetime import date
     log("Importing yard tasks...")
@@ -1927,7 +2118,7 @@ def _import_yard_tasks(db: Session, tasks_data: List[Dict], user_map: Dict[str,
             # Set completed date based on scheduled_date or today
             completed_date = datetime.combine(scheduled_date or today, datetime.now().time())
 
-        task = YardTask(
+        bulk.add(YardTask, dict(
             title=task_data.get("title"),
             description=task_data.get("description"),
             category=category,
@@ -1942,19 +2133,19 @@ def _import_yard_tasks(db: Session, tasks_data: List[Dict], user_map: Dict[str,
             is_recurring=task_data.get("is_recurring", False),
             completed_by_id=completed_by_id,
             completed_date=completed_date,
-        )
-        db.add(task)
+        ))
         count += 1
         log(f"  Created task: {task_data.get('title')} ({assignment_type.value}, {status.value})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_turnout_requests(db: Session, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_turnout_requests(bulk: BulkImport, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import turnout requests from seed data."""
     from datetime import date
     log("Importing turnout requests...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -1968,8 +2159,8 @@ def _import_turnout_requests(db: Session, requests_data: List[Dict], user_map: D
             log(f"  Warning: Owner '{owner_username}' not found, skipping turnout request")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping turnout request")
             continue
 
@@ -2004,8 +2195,8 @@ def _import_turnout_requests(db: Session, requests_data: List[Dict], user_map: D
         if req_data.get("reviewed_by_username"):
             reviewed_by_id = user_map.get(req_data["reviewed_by_username"])
 
-        turnout_request = TurnoutRequest(
-            horse_id=horse.id,
+        bulk.add(TurnoutRequest, dict(
+            horse_id=horse_id,
             requested_by_id=requested_by_id,
             request_date=request_date,
             turnout_type=turnout_type,
@@ -2015,22 +2206,25 @@ def _import_turnout_requests(db: Session, requests_data: List[Dict], user_map: D
             reviewed_by_id=reviewed_by_id,
             reviewed_at=datetime.now() if status != TurnoutStatus.PENDING else None,
             response_message=req_data.get("response_message"),
-        )
-        db.add(turnout_request)
+        ))
         count += 1
         log(f"  Created turnout request: {horse_name} ({turnout_type.value}) - {status.value}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_service_requests(db: Session, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_service_requests(bulk: BulkImport, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import service requests from seed data."""
     from datetime import date
     from app.models.service import RequestStatus, PreferredTime, ChargeStatus, RecurringPattern
     from app.models.medication_log import RehabProgram
     log("Importing service requests...")
-    count = 0
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
+    rehab_programs = bulk.index((RehabProgram.horse_id, RehabProgram.status), RehabProgram.id)
+    service_names = bulk.index(Service.id, Service.name)
+    rows = []
+    tasks = []
     today = date.today()
 
     for req_data in requests_data:
@@ -2043,8 +2237,8 @@ def _import_service_requests(db: Session, requests_data: List[Dict], user_map: D
             log(f"  Warning: Owner '{owner_username}' not found, skipping service request")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping service request")
             continue
 
@@ -2090,12 +2284,7 @@ def _import_service_requests(db: Session, requests_data: List[Dict], user_map: D
         # For rehab service requests, look up active rehab program
         rehab_program_id = None
         if req_data.get("service_id") == "rehab-assistance":
-            active_program = db.query(RehabProgram).filter(
-                RehabProgram.horse_id == horse.id,
-                RehabProgram.status == "active"
-            ).first()
-            if active_program:
-                rehab_program_id = active_program.id
+            rehab_program_id = rehab_programs.get((horse_id, RehabStatus.ACTIVE))
 
         # Resolve assigned_to
         assigned_to_id = None
@@ -2120,9 +2309,9 @@ def _import_service_requests(db: Session, requests_data: List[Dict], user_map: D
                 time_obj(hour=req_data["scheduled_hour"], minute=0)
             )
 
-        service_request = ServiceRequest(
+        rows.append(dict(
             service_id=req_data.get("service_id"),
-            horse_id=horse.id,
+            horse_id=horse_id,
             requested_by_id=requested_by_id,
             requested_date=requested_date,
             preferred_time=preferred_time,
@@ -2142,21 +2331,17 @@ def _import_service_requests(db: Session, requests_data: List[Dict], user_map: D
             quote_notes=req_data.get("quote_notes"),
             quoted_at=datetime.now() if quoted_by_id else None,
             quoted_by_id=quoted_by_id,
-        )
-        db.add(service_request)
-        db.flush()  # Flush to get service_request.id
+        ))
 
         # Create linked YardTask for scheduled service requests
         if status == RequestStatus.SCHEDULED and assigned_to_id:
-            from app.models.task import YardTask, TaskCategory, TaskPriority, TaskStatus, AssignmentType
-            service = db.query(Service).filter(Service.id == req_data.get("service_id")).first()
-            service_name_str = service.name if service else "Service"
+            service_name_str = service_names.get(req_data.get("service_id")) or "Service"
             task_title = f"{service_name_str} for {horse_name}"
             task_description = f"Livery service request."
             if req_data.get("special_instructions"):
                 task_description += f"\n\nSpecial instructions: {req_data.get('special_instructions')}"
 
-            yard_task = YardTask(
+            tasks.append((len(rows) - 1, dict(
                 title=task_title,
                 description=task_description,
                 category=TaskCategory.LIVERY_SERVICE,
@@ -2166,20 +2351,20 @@ def _import_service_requests(db: Session, requests_data: List[Dict], user_map: D
                 assigned_to_id=assigned_to_id,
                 scheduled_date=requested_date,
                 status=TaskStatus.OPEN,
-                service_request_id=service_request.id,
-            )
-            db.add(yard_task)
+            )))
             log(f"    Created linked task: {task_title}")
 
-        count += 1
         service_name = req_data.get("service_id", "Unknown")
         log(f"  Created service request: {horse_name} - {service_name} ({status.value})")
 
-    db.flush()
-    return count
+    request_ids = bulk.insert(ServiceRequest, rows)
+    for index, task in tasks:
+        bulk.add(YardTask, dict(task, service_request_id=request_ids[index]))
+    bulk.flush()
+    return len(rows)
 
 
-def _import_holiday_requests(db: Session, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_holiday_requests(bulk: BulkImport, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import holiday requests from seed data."""
     from datetime import date
     log("Importing holiday requests...")
@@ -2222,7 +2407,7 @@ def _import_holiday_requests(db: Session, requests_data: List[Dict], user_map: D
             if status == LeaveStatus.APPROVED:
                 approval_date = datetime.now()
 
-        holiday_request = HolidayRequest(
+        bulk.add(HolidayRequest, dict(
             staff_id=staff_id,
             start_date=start_date,
             end_date=end_date,
@@ -2233,16 +2418,15 @@ def _import_holiday_requests(db: Session, requests_data: List[Dict], user_map: D
             approved_by_id=approved_by_id,
             approval_date=approval_date,
             approval_notes=req_data.get("approval_notes"),
-        )
-        db.add(holiday_request)
+        ))
         count += 1
         log(f"  Created holiday request: {staff_username} ({leave_type_str}) - {status_str}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_unplanned_absences(db: Session, absences_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_unplanned_absences(bulk: BulkImport, absences_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import unplanned absences from seed data."""
     from datetime import date
     log("Importing unplanned absences...")
@@ -2279,7 +2463,7 @@ def _import_unplanned_absences(db: Session, absences_data: List[Dict], user_map:
         # Since these are historical, set actual return as expected return
         actual_return = expected_return
 
-        unplanned_absence = UnplannedAbsence(
+        bulk.add(UnplannedAbsence, dict(
             staff_id=staff_id,
             date=absence_date,
             reported_time=reported_time,
@@ -2289,17 +2473,16 @@ def _import_unplanned_absences(db: Session, absences_data: List[Dict], user_map:
             actual_return=actual_return,
             notes=absence_data.get("notes"),
             has_fit_note=absence_data.get("has_fit_note", False),
-        )
-        db.add(unplanned_absence)
+        ))
         count += 1
         reason = absence_data.get("reason", "unknown")
         log(f"  Created unplanned absence: {staff_username} ({reason}) on {absence_date}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_timesheets(db: Session, timesheets_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_timesheets(bulk: BulkImport, timesheets_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import timesheets from seed data."""
     from datetime import date, time
     from app.models.staff_management import TimesheetStatus, WorkType
@@ -2350,7 +2533,7 @@ def _import_timesheets(db: Session, timesheets_data: List[Dict], user_map: Dict[
             approved_by_id = user_map.get(approved_by_username)
             approved_at = datetime.now() - timedelta(hours=ts_data.get("hours_since_approved", 12))
 
-        timesheet = Timesheet(
+        bulk.add(Timesheet, dict(
             staff_id=staff_id,
             date=ts_date,
             clock_in=clock_in,
@@ -2363,16 +2546,15 @@ def _import_timesheets(db: Session, timesheets_data: List[Dict], user_map: Dict[
             approved_by_id=approved_by_id,
             approved_at=approved_at,
             rejection_reason=ts_data.get("rejection_reason"),
-        )
-        db.add(timesheet)
+        ))
         count += 1
         log(f"  Created timesheet: {staff_username} on {ts_date} ({status_str})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_payroll_adjustments(db: Session, adjustments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_payroll_adjustments(bulk: BulkImport, adjustments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import payroll adjustments (bonuses, tips, ad-hoc payments) from seed data."""
     from app.models.staff_management import PayrollAdjustmentType
     log("Importing payroll adjustments...")
@@ -2407,7 +2589,7 @@ def _import_payroll_adjustments(db: Session, adjustments_data: List[Dict], user_
         # Determine taxable (tips are not taxable by default)
         taxable = adj_data.get("taxable", adjustment_type != PayrollAdjustmentType.TIP)
 
-        adjustment = PayrollAdjustment(
+        bulk.add(PayrollAdjustment, dict(
             staff_id=staff_id,
             adjustment_type=adjustment_type,
             amount=adj_data.get("amount", 0),
@@ -2416,20 +2598,25 @@ def _import_payroll_adjustments(db: Session, adjustments_data: List[Dict], user_
             taxable=taxable,
             notes=adj_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(adjustment)
+        ))
         count += 1
         log(f"  Created {adj_type_str}: £{adj_data.get('amount', 0):.2f} for {staff_username} on {payment_date}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_ledger_entries(db: Session, entries_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_ledger_entries(bulk: BulkImport, entries_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import ledger entries for billing/account data."""
-    from app.models.account import TransactionType
+    from app.models.account import (
+        TransactionType, add_entry_delta, add_income_delta, apply_balance_deltas,
+        apply_income_deltas, zero_balance_delta, zero_income_delta
+    )
     log("Importing ledger entries...")
     count = 0
+    # Bulk inserts skip the flush hooks that maintain these projections
+    balance_deltas = defaultdict(zero_balance_delta)
+    income_deltas = defaultdict(zero_income_delta)
     today = date.today()
 
     for entry_data in entries_data:
@@ -2460,26 +2647,32 @@ def _import_ledger_entries(db: Session, entries_data: List[Dict], user_map: Dict
         if not created_by_id and entry_data.get("created_by_username"):
             created_by_id = user_map.get(entry_data["created_by_username"])
 
-        entry = LedgerEntry(
+        amount = entry_data.get("amount", 0)
+        bulk.add(LedgerEntry, dict(
             user_id=user_id,
             transaction_type=transaction_type,
-            amount=entry_data.get("amount", 0),
+            amount=amount,
             description=entry_data.get("description"),
             transaction_date=transaction_date,
             notes=entry_data.get("notes"),
             created_by_id=created_by_id or user_id,  # Fallback to user_id if no created_by
-        )
-        db.add(entry)
+        ))
+        add_entry_delta(balance_deltas[user_id], amount, transaction_type, transaction_date)
+        add_income_delta(income_deltas, amount, transaction_type, transaction_date)
         count += 1
         log(f"  Created ledger entry: {entry_data.get('description', 'Unknown')} ({trans_type_str})")
 
-    db.flush()
+    bulk.flush()
+    connection = bulk.db.connection()
+    apply_balance_deltas(connection, balance_deltas)
+    apply_income_deltas(connection, income_deltas)
     return count
 
 
-def _import_emergency_contacts(db: Session, contacts_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_emergency_contacts(bulk: BulkImport, contacts_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import emergency contacts for horses."""
     log("Importing emergency contacts...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
 
     for contact_data in contacts_data:
@@ -2492,8 +2685,8 @@ def _import_emergency_contacts(db: Session, contacts_data: List[Dict], user_map:
             log(f"  Warning: Owner '{owner_username}' not found, skipping emergency contact")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping emergency contact")
             continue
 
@@ -2511,8 +2704,8 @@ def _import_emergency_contacts(db: Session, contacts_data: List[Dict], user_map:
         except ValueError:
             contact_type = ContactType.OTHER
 
-        contact = EmergencyContact(
-            horse_id=horse.id,
+        bulk.add(EmergencyContact, dict(
+            horse_id=horse_id,
             contact_type=contact_type,
             name=contact_data.get("name"),
             phone=contact_data.get("phone"),
@@ -2525,24 +2718,23 @@ def _import_emergency_contacts(db: Session, contacts_data: List[Dict], user_map:
             is_primary=contact_data.get("is_primary", False),
             notes=contact_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(contact)
+        ))
         count += 1
         log(f"  Created emergency contact: {contact_data.get('name')} for {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_fields(db: Session, fields_data: List[Dict], log: Callable) -> int:
+def _import_fields(bulk: BulkImport, fields_data: List[Dict], log: Callable) -> int:
     """Import fields/paddocks."""
     log("Importing fields...")
+    existing_fields = bulk.index(Field.name, Field.id)
     count = 0
 
     for field_data in fields_data:
         name = field_data.get("name")
-        existing = db.query(Field).filter(Field.name == name).first()
-        if existing:
+        if name in existing_fields:
             log(f"  Field '{name}' already exists, skipping")
             continue
 
@@ -2553,7 +2745,7 @@ def _import_fields(db: Session, fields_data: List[Dict], log: Callable) -> int:
         except ValueError:
             condition = FieldCondition.GOOD
 
-        field = Field(
+        bulk.add(Field, dict(
             name=name,
             description=field_data.get("description"),
             max_horses=field_data.get("max_horses"),
@@ -2566,18 +2758,19 @@ def _import_fields(db: Session, fields_data: List[Dict], log: Callable) -> int:
             is_electric_fenced=field_data.get("is_electric_fenced", False),
             is_active=field_data.get("is_active", True),
             display_order=field_data.get("display_order", 0),
-        )
-        db.add(field)
+        ))
         count += 1
         log(f"  Created field: {name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_horse_companions(db: Session, companions_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_horse_companions(bulk: BulkImport, companions_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import horse companion relationships."""
     log("Importing horse companions...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
+    existing_pairs = bulk.index((HorseCompanion.horse_id, HorseCompanion.companion_horse_id), HorseCompanion.id)
     count = 0
 
     for comp_data in companions_data:
@@ -2590,8 +2783,8 @@ def _import_horse_companions(db: Session, companions_data: List[Dict], user_map:
             log(f"  Warning: Owner '{owner_username}' not found, skipping companion")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping companion")
             continue
 
@@ -2600,17 +2793,13 @@ def _import_horse_companions(db: Session, companions_data: List[Dict], user_map:
         companion_owner_username = comp_data.get("companion_owner_username", owner_username)
         companion_owner_id = user_map.get(companion_owner_username)
 
-        companion = db.query(Horse).filter(Horse.name == companion_name, Horse.owner_id == companion_owner_id).first()
-        if not companion:
+        companion_id = horses.get((companion_name, companion_owner_id))
+        if not companion_id:
             log(f"  Warning: Companion horse '{companion_name}' not found, skipping")
             continue
 
         # Check if relationship already exists
-        existing = db.query(HorseCompanion).filter(
-            HorseCompanion.horse_id == horse.id,
-            HorseCompanion.companion_horse_id == companion.id
-        ).first()
-        if existing:
+        if (horse_id, companion_id) in existing_pairs:
             log(f"  Companion relationship already exists, skipping")
             continue
 
@@ -2628,35 +2817,34 @@ def _import_horse_companions(db: Session, companions_data: List[Dict], user_map:
         except ValueError:
             rel_type = CompanionRelationship.COMPATIBLE
 
-        companion_rel = HorseCompanion(
-            horse_id=horse.id,
-            companion_horse_id=companion.id,
+        bulk.add(HorseCompanion, dict(
+            horse_id=horse_id,
+            companion_horse_id=companion_id,
             relationship_type=rel_type,
             notes=comp_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(companion_rel)
+        ))
 
         # Add reciprocal relationship
-        reciprocal = HorseCompanion(
-            horse_id=companion.id,
-            companion_horse_id=horse.id,
+        bulk.add(HorseCompanion, dict(
+            horse_id=companion_id,
+            companion_horse_id=horse_id,
             relationship_type=rel_type,
             notes=comp_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(reciprocal)
+        ))
 
         count += 1
         log(f"  Created companion relationship: {horse_name} <-> {companion_name} ({rel_type_str})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_farrier_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_farrier_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import farrier records from seed data."""
     log("Importing farrier records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2670,8 +2858,8 @@ def _import_farrier_records(db: Session, records_data: List[Dict], user_map: Dic
             log(f"  Warning: Owner '{owner_username}' not found, skipping farrier record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping farrier record")
             continue
 
@@ -2688,26 +2876,26 @@ def _import_farrier_records(db: Session, records_data: List[Dict], user_map: Dic
         elif record_data.get("next_due"):
             next_due = datetime.fromisoformat(record_data["next_due"]).date()
 
-        record = FarrierRecord(
-            horse_id=horse.id,
+        bulk.add(FarrierRecord, dict(
+            horse_id=horse_id,
             visit_date=visit_date,
             farrier_name=record_data.get("farrier_name"),
             work_done=record_data.get("work_done", "General trim"),
             cost=record_data.get("cost"),
             next_due=next_due,
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created farrier record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_dentist_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_dentist_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import dentist records from seed data."""
     log("Importing dentist records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2721,8 +2909,8 @@ def _import_dentist_records(db: Session, records_data: List[Dict], user_map: Dic
             log(f"  Warning: Owner '{owner_username}' not found, skipping dentist record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping dentist record")
             continue
 
@@ -2739,26 +2927,26 @@ def _import_dentist_records(db: Session, records_data: List[Dict], user_map: Dic
         elif record_data.get("next_due"):
             next_due = datetime.fromisoformat(record_data["next_due"]).date()
 
-        record = DentistRecord(
-            horse_id=horse.id,
+        bulk.add(DentistRecord, dict(
+            horse_id=horse_id,
             visit_date=visit_date,
             dentist_name=record_data.get("dentist_name"),
             treatment=record_data.get("treatment", "Routine check"),
             cost=record_data.get("cost"),
             next_due=next_due,
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created dentist record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_vaccination_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_vaccination_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import vaccination records from seed data."""
     log("Importing vaccination records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2772,8 +2960,8 @@ def _import_vaccination_records(db: Session, records_data: List[Dict], user_map:
             log(f"  Warning: Owner '{owner_username}' not found, skipping vaccination record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping vaccination record")
             continue
 
@@ -2797,8 +2985,8 @@ def _import_vaccination_records(db: Session, records_data: List[Dict], user_map:
         except ValueError:
             vaccine_type = VaccineType.OTHER
 
-        record = VaccinationRecord(
-            horse_id=horse.id,
+        bulk.add(VaccinationRecord, dict(
+            horse_id=horse_id,
             vaccination_date=vaccination_date,
             vaccine_type=vaccine_type,
             vaccine_name=record_data.get("vaccine_name"),
@@ -2806,18 +2994,18 @@ def _import_vaccination_records(db: Session, records_data: List[Dict], user_map:
             administered_by=record_data.get("administered_by"),
             next_due=next_due,
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created vaccination record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_worming_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_worming_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import worming records from seed data."""
     log("Importing worming records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2831,8 +3019,8 @@ def _import_worming_records(db: Session, records_data: List[Dict], user_map: Dic
             log(f"  Warning: Owner '{owner_username}' not found, skipping worming record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping worming record")
             continue
 
@@ -2854,26 +3042,26 @@ def _import_worming_records(db: Session, records_data: List[Dict], user_map: Dic
         if record_data.get("worm_count_days_ago"):
             worm_count_date = today - timedelta(days=record_data["worm_count_days_ago"])
 
-        record = WormingRecord(
-            horse_id=horse.id,
+        bulk.add(WormingRecord, dict(
+            horse_id=horse_id,
             treatment_date=treatment_date,
             product=record_data.get("product", "Equest Pramox"),
             worm_count_date=worm_count_date,
             worm_count_result=record_data.get("worm_count_result"),
             next_due=next_due,
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created worming record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_weight_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_weight_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import weight records from seed data."""
     log("Importing weight records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2887,8 +3075,8 @@ def _import_weight_records(db: Session, records_data: List[Dict], user_map: Dict
             log(f"  Warning: Owner '{owner_username}' not found, skipping weight record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping weight record")
             continue
 
@@ -2899,25 +3087,25 @@ def _import_weight_records(db: Session, records_data: List[Dict], user_map: Dict
         elif record_data.get("record_date"):
             record_date = datetime.fromisoformat(record_data["record_date"]).date()
 
-        record = WeightRecord(
-            horse_id=horse.id,
+        bulk.add(WeightRecord, dict(
+            horse_id=horse_id,
             record_date=record_date,
             weight_kg=record_data.get("weight_kg"),
             unit_entered=record_data.get("unit_entered", "kg"),
             method=record_data.get("method"),
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created weight record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_body_condition_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_body_condition_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import body condition records from seed data."""
     log("Importing body condition records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2931,8 +3119,8 @@ def _import_body_condition_records(db: Session, records_data: List[Dict], user_m
             log(f"  Warning: Owner '{owner_username}' not found, skipping body condition record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping body condition record")
             continue
 
@@ -2943,24 +3131,24 @@ def _import_body_condition_records(db: Session, records_data: List[Dict], user_m
         elif record_data.get("record_date"):
             record_date = datetime.fromisoformat(record_data["record_date"]).date()
 
-        record = BodyConditionRecord(
-            horse_id=horse.id,
+        bulk.add(BodyConditionRecord, dict(
+            horse_id=horse_id,
             record_date=record_date,
             score=record_data.get("score"),
             assessed_by=record_data.get("assessed_by"),
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created body condition record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_saddle_fit_records(db: Session, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_saddle_fit_records(bulk: BulkImport, records_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import saddle fit records from seed data."""
     log("Importing saddle fit records...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -2974,8 +3162,8 @@ def _import_saddle_fit_records(db: Session, records_data: List[Dict], user_map:
             log(f"  Warning: Owner '{owner_username}' not found, skipping saddle fit record")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping saddle fit record")
             continue
 
@@ -2993,8 +3181,8 @@ def _import_saddle_fit_records(db: Session, records_data: List[Dict], user_map:
         elif record_data.get("next_check_due"):
             next_check_due = datetime.fromisoformat(record_data["next_check_due"]).date()
 
-        record = SaddleFitRecord(
-            horse_id=horse.id,
+        bulk.add(SaddleFitRecord, dict(
+            horse_id=horse_id,
             check_date=check_date,
             fitter_name=record_data.get("fitter_name"),
             saddle_type=record_data.get("saddle_type"),
@@ -3003,18 +3191,18 @@ def _import_saddle_fit_records(db: Session, records_data: List[Dict], user_map:
             next_check_due=next_check_due,
             cost=record_data.get("cost"),
             notes=record_data.get("notes"),
-        )
-        db.add(record)
+        ))
         count += 1
         log(f"  Created saddle fit record for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_feed_additions(db: Session, additions_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_feed_additions(bulk: BulkImport, additions_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import feed additions (medications/supplements) from seed data."""
     log("Importing feed additions...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -3028,8 +3216,8 @@ def _import_feed_additions(db: Session, additions_data: List[Dict], user_map: Di
             log(f"  Warning: Owner '{owner_username}' not found, skipping feed addition")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping feed addition")
             continue
 
@@ -3069,8 +3257,8 @@ def _import_feed_additions(db: Session, additions_data: List[Dict], user_map: Di
         except ValueError:
             addition_status = AdditionStatus.APPROVED
 
-        addition = FeedAddition(
-            horse_id=horse.id,
+        bulk.add(FeedAddition, dict(
+            horse_id=horse_id,
             name=addition_data.get("name"),
             dosage=addition_data.get("dosage", "1 scoop"),
             feed_time=feed_time,
@@ -3081,18 +3269,18 @@ def _import_feed_additions(db: Session, additions_data: List[Dict], user_map: Di
             is_active=addition_data.get("is_active", True),
             requested_by_id=requested_by_id,
             approved_by_id=approved_by_id,
-        )
-        db.add(addition)
+        ))
         count += 1
         log(f"  Created feed addition: {addition_data.get('name')} for {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_wound_care_logs(db: Session, logs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_wound_care_logs(bulk: BulkImport, logs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import wound care logs from seed data."""
     log("Importing wound care logs...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -3106,8 +3294,8 @@ def _import_wound_care_logs(db: Session, logs_data: List[Dict], user_map: Dict[s
             log(f"  Warning: Owner '{owner_username}' not found, skipping wound care log")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping wound care log")
             continue
 
@@ -3134,8 +3322,8 @@ def _import_wound_care_logs(db: Session, logs_data: List[Dict], user_map: Dict[s
             except ValueError:
                 pass
 
-        wound_log = WoundCareLog(
-            horse_id=horse.id,
+        bulk.add(WoundCareLog, dict(
+            horse_id=horse_id,
             wound_name=log_data.get("wound_name", "Wound"),
             wound_location=log_data.get("wound_location"),
             wound_description=log_data.get("wound_description"),
@@ -3147,18 +3335,18 @@ def _import_wound_care_logs(db: Session, logs_data: List[Dict], user_map: Dict[s
             next_treatment_due=next_treatment_due,
             treated_by_id=treated_by_id,
             is_resolved=log_data.get("is_resolved", False),
-        )
-        db.add(wound_log)
+        ))
         count += 1
         log(f"  Created wound care log for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_health_observations(db: Session, observations_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_health_observations(bulk: BulkImport, observations_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import health observations from seed data."""
     log("Importing health observations...")
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
     count = 0
     today = date.today()
 
@@ -3172,8 +3360,8 @@ def _import_health_observations(db: Session, observations_data: List[Dict], user
             log(f"  Warning: Owner '{owner_username}' not found, skipping health observation")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping health observation")
             continue
 
@@ -3203,8 +3391,8 @@ def _import_health_observations(db: Session, observations_data: List[Dict], user
             except ValueError:
                 pass
 
-        observation = HealthObservation(
-            horse_id=horse.id,
+        bulk.add(HealthObservation, dict(
+            horse_id=horse_id,
             observation_date=observation_date,
             temperature=obs_data.get("temperature"),
             appetite=appetite,
@@ -3214,19 +3402,20 @@ def _import_health_observations(db: Session, observations_data: List[Dict], user
             action_taken=obs_data.get("action_taken"),
             vet_notified=obs_data.get("vet_notified", False),
             observed_by_id=observed_by_id,
-        )
-        db.add(observation)
+        ))
         count += 1
         log(f"  Created health observation for: {horse_name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_rehab_programs(db: Session, programs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_rehab_programs(bulk: BulkImport, programs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import rehabilitation programs with phases and tasks from seed data."""
     log("Importing rehabilitation programs...")
-    count = 0
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
+    rows = []
+    program_phases = []
     today = date.today()
 
     for program_data in programs_data:
@@ -3239,8 +3428,8 @@ def _import_rehab_programs(db: Session, programs_data: List[Dict], user_map: Dic
             log(f"  Warning: Owner '{owner_username}' not found, skipping rehab program")
             continue
 
-        horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-        if not horse:
+        horse_id = horses.get((horse_name, owner_id))
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping rehab program")
             continue
 
@@ -3266,8 +3455,8 @@ def _import_rehab_programs(db: Session, programs_data: List[Dict], user_map: Dic
         except ValueError:
             rehab_status = RehabStatus.ACTIVE
 
-        program = RehabProgram(
-            horse_id=horse.id,
+        rows.append(dict(
+            horse_id=horse_id,
             name=program_data.get("name", "Recovery Program"),
             description=program_data.get("description"),
             reason=program_data.get("reason"),
@@ -3279,85 +3468,80 @@ def _import_rehab_programs(db: Session, programs_data: List[Dict], user_map: Dic
             current_phase=program_data.get("current_phase", 1),
             notes=program_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(program)
-        db.flush()  # Get ID for phases
+        ))
+        program_phases.append(program_data.get("phases", []))
+        log(f"  Created rehab program: {program_data.get('name')} for {horse_name}")
 
-        # Add phases
-        for phase_data in program_data.get("phases", []):
-            phase = RehabPhase(
-                program_id=program.id,
+    # Programs, then phases, then tasks, each level keyed by the ids of the last
+    phase_rows = []
+    phase_tasks = []
+    for program_id, phases in zip(bulk.insert(RehabProgram, rows), program_phases):
+        for phase_data in phases:
+            phase_rows.append(dict(
+                program_id=program_id,
                 phase_number=phase_data.get("phase_number", 1),
                 name=phase_data.get("name", "Phase"),
                 description=phase_data.get("description"),
                 duration_days=phase_data.get("duration_days", 7),
                 start_day=phase_data.get("start_day", 1),
                 is_completed=phase_data.get("is_completed", False),
-            )
-            db.add(phase)
-            db.flush()  # Get ID for tasks
-
-            # Add tasks
-            for task_data in phase_data.get("tasks", []):
-                # Parse frequency
-                freq_str = task_data.get("frequency", "daily")
-                try:
-                    frequency = TaskFrequency(freq_str)
-                except ValueError:
-                    frequency = TaskFrequency.DAILY
-
-                task = RehabTask(
-                    phase_id=phase.id,
-                    task_type=task_data.get("task_type", "exercise"),
-                    description=task_data.get("description", "Complete task"),
-                    duration_minutes=task_data.get("duration_minutes"),
-                    frequency=frequency,
-                    instructions=task_data.get("instructions"),
-                    equipment_needed=task_data.get("equipment_needed"),
-                    is_feed_based=task_data.get("is_feed_based", False),
-                    feed_time=task_data.get("feed_time"),
-                    sequence=task_data.get("sequence", 0),
-                )
-                db.add(task)
-
-        count += 1
-        log(f"  Created rehab program: {program_data.get('name')} for {horse_name}")
-
-    db.flush()
-    return count
+            ))
+            phase_tasks.append(phase_data.get("tasks", []))
 
-
-def _import_rehab_task_logs(db: Session, logs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+    for phase_id, tasks in zip(bulk.insert(RehabPhase, phase_rows), phase_tasks):
+        for task_data in tasks:
+            # Parse frequency
+            freq_str = task_data.get("frequency", "daily")
+            try:
+                frequency = TaskFrequency(freq_str)
+            except ValueError:
+                frequency = TaskFrequency.DAILY
+
+            bulk.add(RehabTask, dict(
+                phase_id=phase_id,
+                task_type=task_data.get("task_type", "exercise"),
+                description=task_data.get("description", "Complete task"),
+                duration_minutes=task_data.get("duration_minutes"),
+                frequency=frequency,
+                instructions=task_data.get("instructions"),
+                equipment_needed=task_data.get("equipment_needed"),
+                is_feed_based=task_data.get("is_feed_based", False),
+                feed_time=task_data.get("feed_time"),
+                sequence=task_data.get("sequence", 0),
+            ))
+
+    bulk.flush()
+    return len(rows)
+
+
+def _import_rehab_task_logs(bulk: BulkImport, logs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import rehabilitation task logs from seed data."""
     log("Importing rehab task logs...")
+    horses_by_name = bulk.index(Horse.name, Horse.id)
+    programs = bulk.index((RehabProgram.horse_id, RehabProgram.name), RehabProgram.id)
+    tasks = bulk.index((RehabPhase.program_id, RehabTask.task_type), RehabTask.id, join=(RehabPhase,))
     count = 0
     today = date.today()
 
     for log_data in logs_data:
         # Get horse by name
         horse_name = log_data.get("horse_name")
-        horse = db.query(Horse).filter(Horse.name == horse_name).first()
-        if not horse:
+        horse_id = horses_by_name.get(horse_name)
+        if not horse_id:
             log(f"  Warning: Horse '{horse_name}' not found, skipping task log")
             continue
 
         # Get program by name and horse
         program_name = log_data.get("program_name")
-        program = db.query(RehabProgram).filter(
-            RehabProgram.horse_id == horse.id,
-            RehabProgram.name == program_name
-        ).first()
-        if not program:
+        program_id = programs.get((horse_id, program_name))
+        if not program_id:
             log(f"  Warning: Program '{program_name}' not found for horse '{horse_name}', skipping task log")
             continue
 
         # Get task by type within program
         task_type = log_data.get("task_type")
-        task = db.query(RehabTask).join(RehabPhase).filter(
-            RehabPhase.program_id == program.id,
-            RehabTask.task_type == task_type
-        ).first()
-        if not task:
+        task_id = tasks.get((program_id, task_type))
+        if not task_id:
             log(f"  Warning: Task type '{task_type}' not found in program, skipping task log")
             continue
 
@@ -3375,10 +3559,10 @@ def _import_rehab_task_logs(db: Session, logs_data: List[Dict], user_map: Dict[s
         elif "days_from_now" in log_data:
             log_date = today + timedelta(days=log_data["days_from_now"])
 
-        task_log = RehabTaskLog(
-            task_id=task.id,
-            program_id=program.id,
-            horse_id=horse.id,
+        bulk.add(RehabTaskLog, dict(
+            task_id=task_id,
+            program_id=program_id,
+            horse_id=horse_id,
             log_date=log_date,
             was_completed=log_data.get("was_completed", True),
             skip_reason=log_data.get("skip_reason"),
@@ -3390,16 +3574,15 @@ def _import_rehab_task_logs(db: Session, logs_data: List[Dict], user_map: Dict[s
             physical_observations=log_data.get("physical_observations"),
             completed_by_id=completed_by_id,
             completed_at=datetime.combine(log_date, datetime.min.time()) + timedelta(hours=10)
-        )
-        db.add(task_log)
+        ))
         count += 1
 
-    db.flush()
+    bulk.flush()
     log(f"  Created {count} rehab task logs")
     return count
 
 
-def _import_shifts(db: Session, shifts_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_shifts(bulk: BulkImport, shifts_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import staff shifts from seed data."""
     log("Importing shifts...")
     count = 0
@@ -3437,26 +3620,26 @@ def _import_shifts(db: Session, shifts_data: List[Dict], user_map: Dict[str, int
         except ValueError:
             role = ShiftRole.YARD_DUTIES
 
-        shift = Shift(
+        bulk.add(Shift, dict(
             staff_id=staff_id,
             date=shift_date,
             shift_type=shift_type,
             role=role,
             notes=shift_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(shift)
+        ))
         count += 1
         log(f"  Created shift: {staff_username} on {shift_date}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_invoices(db: Session, invoices_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_invoices(bulk: BulkImport, invoices_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import invoices with line items from seed data."""
     log("Importing invoices...")
-    count = 0
+    rows = []
+    invoice_items = []
     today = date.today()
     invoice_counter = 1
 
@@ -3497,7 +3680,7 @@ def _import_invoices(db: Session, invoices_data: List[Dict], user_map: Dict[str,
         invoice_number = invoice_data.get("invoice_number", f"INV-{today.year}-{invoice_counter:04d}")
         invoice_counter += 1
 
-        invoice = Invoice(
+        rows.append(dict(
             user_id=user_id,
             invoice_number=invoice_number,
             period_start=period_start,
@@ -3510,40 +3693,40 @@ def _import_invoices(db: Session, invoices_data: List[Dict], user_map: Dict[str,
             due_date=due_date,
             notes=invoice_data.get("notes"),
             created_by_id=created_by_id,
-        )
-        db.add(invoice)
-        db.flush()  # Get ID for line items
+        ))
+        invoice_items.append(invoice_data.get("line_items", []))
+        log(f"  Created invoice: {invoice_number} for {user_username}")
 
-        # Add line items
-        for item_data in invoice_data.get("line_items", []):
-            line_item = InvoiceLineItem(
-                invoice_id=invoice.id,
+    # Add line items
+    for invoice_id, items in zip(bulk.insert(Invoice, rows), invoice_items):
+        for item_data in items:
+            bulk.add(InvoiceLineItem, dict(
+                invoice_id=invoice_id,
                 description=item_data.get("description", "Item"),
                 quantity=item_data.get("quantity", 1),
                 unit_price=item_data.get("unit_price", 0),
                 amount=item_data.get("amount", 0),
                 category=item_data.get("category"),
-            )
-            db.add(line_item)
-
-        count += 1
-        log(f"  Created invoice: {invoice_number} for {user_username}")
+            ))
 
-    db.flush()
-    return count
+    bulk.flush()
+    return len(rows)
 
 
-def _import_turnout_groups(db: Session, groups_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_turnout_groups(bulk: BulkImport, groups_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import turnout groups with assigned horses from seed data."""
     log("Importing turnout groups...")
-    count = 0
+    fields = bulk.index(Field.name, Field.id)
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
+    rows = []
+    group_horses = []
     today = date.today()
 
     for group_data in groups_data:
         # Get field by name
         field_name = group_data.get("field_name")
-        field = db.query(Field).filter(Field.name == field_name).first()
-        if not field:
+        field_id = fields.get(field_name)
+        if not field_id:
             log(f"  Warning: Field '{field_name}' not found, skipping turnout group")
             continue
 
@@ -3558,14 +3741,13 @@ def _import_turnout_groups(db: Session, groups_data: List[Dict], user_map: Dict[
         elif "days_ago" in group_data:
             turnout_date = today - timedelta(days=group_data["days_ago"])
 
-        group = TurnoutGroup(
+        rows.append(dict(
             turnout_date=turnout_date,
-            field_id=field.id,
+            field_id=field_id,
             notes=group_data.get("notes"),
             assigned_by_id=assigned_by_id,
-        )
-        db.add(group)
-        db.flush()  # Get ID for horses
+        ))
+        group_horses.append([])
 
         # Add horses to group
         for horse_data in group_data.get("horses", []):
@@ -3577,8 +3759,8 @@ def _import_turnout_groups(db: Session, groups_data: List[Dict], user_map: Dict[
                 log(f"  Warning: Owner '{owner_username}' not found, skipping horse in turnout group")
                 continue
 
-            horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-            if not horse:
+            horse_id = horses.get((horse_name, owner_id))
+            if not horse_id:
                 log(f"  Warning: Horse '{horse_name}' not found, skipping in turnout group")
                 continue
 
@@ -3587,32 +3769,35 @@ def _import_turnout_groups(db: Session, groups_data: List[Dict], user_map: Dict[
             if horse_data.get("turned_out_by_username"):
                 turned_out_by_id = user_map.get(horse_data["turned_out_by_username"])
 
-            group_horse = TurnoutGroupHorse(
-                group_id=group.id,
-                horse_id=horse.id,
+            group_horses[-1].append(dict(
+                horse_id=horse_id,
                 turned_out_at=datetime.now() if horse_data.get("is_out") else None,
                 turned_out_by_id=turned_out_by_id,
-            )
-            db.add(group_horse)
+            ))
 
-        count += 1
         log(f"  Created turnout group for {field_name} on {turnout_date}")
 
-    db.flush()
-    return count
+    for group_id, group_rows in zip(bulk.insert(TurnoutGroup, rows), group_horses):
+        for row in group_rows:
+            bulk.add(TurnoutGroupHorse, dict(row, group_id=group_id))
+    bulk.flush()
+    return len(rows)
 
 
-def _import_field_usage_logs(db: Session, logs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_field_usage_logs(bulk: BulkImport, logs_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import field usage logs from seed data."""
     log("Importing field usage logs...")
-    count = 0
+    fields = bulk.index(Field.name, Field.id)
+    horses = bulk.index((Horse.name, Horse.owner_id), Horse.id)
+    rows = []
+    usage_horses = []
     today = date.today()
 
     for log_data in logs_data:
         # Get field by name
         field_name = log_data.get("field_name")
-        field = db.query(Field).filter(Field.name == field_name).first()
-        if not field:
+        field_id = fields.get(field_name)
+        if not field_id:
             log(f"  Warning: Field '{field_name}' not found, skipping usage log")
             continue
 
@@ -3640,18 +3825,17 @@ def _import_field_usage_logs(db: Session, logs_data: List[Dict], user_map: Dict[
             except ValueError:
                 pass
 
-        usage_log = FieldUsageLog(
-            field_id=field.id,
+        rows.append(dict(
+            field_id=field_id,
             usage_date=usage_date,
             condition_start=condition_start,
             condition_end=condition_end,
             notes=log_data.get("notes"),
             logged_by_id=logged_by_id,
-        )
-        db.add(usage_log)
-        db.flush()  # Get ID for horses
+        ))
 
         # Add horses to usage log
+        horse_ids = []
         for horse_data in log_data.get("horses", []):
             horse_name = horse_data.get("horse_name")
             owner_username = horse_data.get("owner_username")
@@ -3660,37 +3844,37 @@ def _import_field_usage_logs(db: Session, logs_data: List[Dict], user_map: Dict[
             if not owner_id:
                 continue
 
-            horse = db.query(Horse).filter(Horse.name == horse_name, Horse.owner_id == owner_id).first()
-            if not horse:
+            horse_id = horses.get((horse_name, owner_id))
+            if not horse_id:
                 continue
 
-            usage_horse = FieldUsageHorse(
-                usage_log_id=usage_log.id,
-                horse_id=horse.id,
-            )
-            db.add(usage_horse)
+            horse_ids.append(horse_id)
+        usage_horses.append(horse_ids)
 
-        count += 1
         log(f"  Created field usage log for {field_name} on {usage_date}")
 
-    db.flush()
-    return count
+    for usage_log_id, horse_ids in zip(bulk.insert(FieldUsageLog, rows), usage_horses):
+        for horse_id in horse_ids:
+            bulk.add(FieldUsageHorse, dict(usage_log_id=usage_log_id, horse_id=horse_id))
+    bulk.flush()
+    return len(rows)
 
 
-def _import_coach_availability_slots(db: Session, slots_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_coach_availability_slots(bulk: BulkImport, slots_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import coach availability slots from seed data."""
     log("Importing coach availability slots...")
+    coach_profiles = bulk.index(
+        func.lower(User.username), CoachProfile.id, join=(User, CoachProfile.user_id == User.id)
+    )
     count = 0
     today = date.today()
 
     for slot_data in slots_data:
         # Get coach profile by username (case-insensitive)
         coach_username = slot_data.get("coach_username")
-        coach_profile = db.query(CoachProfile).join(
-            User, CoachProfile.user_id == User.id
-        ).filter(func.lower(User.username) == func.lower(coach_username)).first()
+        coach_profile_id = coach_profiles.get(coach_username.lower() if coach_username else None)
 
-        if not coach_profile:
+        if not coach_profile_id:
             log(f"  Warning: Coach profile for '{coach_username}' not found, skipping availability slot")
             continue
 
@@ -3705,25 +3889,28 @@ def _import_coach_availability_slots(db: Session, slots_data: List[Dict], user_m
         start_time = time_obj.fromisoformat(slot_data.get("start_time", "09:00"))
         end_time = time_obj.fromisoformat(slot_data.get("end_time", "17:00"))
 
-        slot = CoachAvailabilitySlot(
-            coach_profile_id=coach_profile.id,
+        bulk.add(CoachAvailabilitySlot, dict(
+            coach_profile_id=coach_profile_id,
             date=slot_date,
             start_time=start_time,
             end_time=end_time,
             is_blocked=slot_data.get("is_blocked", False),
             block_reason=slot_data.get("block_reason"),
-        )
-        db.add(slot)
+        ))
         count += 1
         log(f"  Created availability slot for {coach_username} on {slot_date}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_holiday_livery_requests(db: Session, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_holiday_livery_requests(bulk: BulkImport, requests_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import holiday livery requests from seed data."""
     log("Importing holiday livery requests...")
+    existing_requests = bulk.index(
+        (HolidayLiveryRequest.guest_email, HolidayLiveryRequest.horse_name), HolidayLiveryRequest.id
+    )
+    stables = bulk.index(Stable.name, Stable.id)
     count = 0
     today = date.today()
 
@@ -3731,11 +3918,7 @@ def _import_holiday_livery_requests(db: Session, requests_data: List[Dict], user
         guest_email = req_data.get("guest_email")
 
         # Check if already exists
-        existing = db.query(HolidayLiveryRequest).filter(
-            HolidayLiveryRequest.guest_email == guest_email,
-            HolidayLiveryRequest.horse_name == req_data.get("horse_name")
-        ).first()
-        if existing:
+        if (guest_email, req_data.get("horse_name")) in existing_requests:
             log(f"  Holiday livery request for {guest_email} already exists, skipping")
             continue
 
@@ -3772,11 +3955,9 @@ def _import_holiday_livery_requests(db: Session, requests_data: List[Dict], user
         # Resolve stable assignment
         assigned_stable_id = None
         if req_data.get("assigned_stable_name"):
-            stable = db.query(Stable).filter(Stable.name == req_data["assigned_stable_name"]).first()
-            if stable:
-                assigned_stable_id = stable.id
+            assigned_stable_id = stables.get(req_data["assigned_stable_name"])
 
-        request = HolidayLiveryRequest(
+        bulk.add(HolidayLiveryRequest, dict(
             guest_name=req_data.get("guest_name"),
             guest_email=guest_email,
             guest_phone=req_data.get("guest_phone"),
@@ -3797,17 +3978,16 @@ def _import_holiday_livery_requests(db: Session, requests_data: List[Dict], user
             assigned_stable_id=assigned_stable_id,
             processed_by_id=processed_by_id,
             processed_at=processed_at,
-        )
-        db.add(request)
+        ))
         count += 1
         log(f"  Created holiday livery request: {req_data.get('guest_name')} - {req_data.get('horse_name')} ({status.value})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
 def _import_contracts(
-    db: Session,
+    bulk: BulkImport,
     templates_data: List[Dict],
     user_map: Dict[str, int],
     user_id_map: Dict[int, int],
@@ -3819,9 +3999,9 @@ def _import_contracts(
     Returns (template_count, version_count, signature_count).
     """
     log("Importing contract templates...")
-    template_count = 0
-    version_count = 0
-    signature_count = 0
+    admin_id = bulk.index(User.role, User.id).get(UserRole.ADMIN)
+    rows = []
+    template_versions = []
     today = date.today()
 
     for template_data in templates_data:
@@ -3835,9 +4015,7 @@ def _import_contracts(
 
         # If still no created_by_id, use the first admin user as fallback
         if not created_by_id:
-            admin_user = db.query(User).filter(User.role == UserRole.ADMIN).first()
-            if admin_user:
-                created_by_id = admin_user.id
+            created_by_id = admin_id
 
         # Resolve optional livery package
         livery_package_id = None
@@ -3848,98 +4026,96 @@ def _import_contracts(
         contract_type_str = template_data.get("contract_type", "livery")
         contract_type = ContractType(contract_type_str)
 
-        template = ContractTemplate(
+        rows.append(dict(
             name=template_data.get("name"),
             contract_type=contract_type,
             livery_package_id=livery_package_id,
             description=template_data.get("description"),
             is_active=template_data.get("is_active", True),
             created_by_id=created_by_id,
-        )
-        db.add(template)
-        db.flush()
-        template_count += 1
-        log(f"  Created contract template: {template.name}")
-
-        # Import versions for this template
-        for version_data in template_data.get("versions", []):
+        ))
+        template_versions.append((created_by_id, template_data.get("versions", [])))
+        log(f"  Created contract template: {template_data.get('name')}")
+
+    # Templates, then versions, then signatures, each level keyed by the ids of the last
+    version_rows = []
+    version_signatures = []
+    for template_id, (created_by_id, versions) in zip(bulk.insert(ContractTemplate, rows), template_versions):
+        for version_data in versions:
             version_created_by_id = created_by_id
             if version_data.get("created_by_username"):
                 version_created_by_id = user_map.get(version_data["created_by_username"])
 
-            version = ContractVersion(
-                template_id=template.id,
+            version_rows.append(dict(
+                template_id=template_id,
                 version_number=version_data.get("version_number", 1),
                 html_content=version_data.get("html_content", "<p>Contract content</p>"),
                 change_summary=version_data.get("change_summary"),
                 is_current=version_data.get("is_current", True),
                 created_by_id=version_created_by_id,
-            )
-            db.add(version)
-            db.flush()
-            version_count += 1
-
-            # Import signatures for this version
-            for sig_data in version_data.get("signatures", []):
-                user_id = None
-                if sig_data.get("user_username"):
-                    user_id = user_map.get(sig_data["user_username"])
-
-                requested_by_id = created_by_id
-                if sig_data.get("requested_by_username"):
-                    requested_by_id = user_map.get(sig_data["requested_by_username"])
-
-                # Handle status enum
-                status_str = sig_data.get("status", "pending")
-                status = SignatureStatus(status_str)
-
-                # Handle relative dates
-                requested_at = datetime.now()
-                if sig_data.get("requested_days_ago"):
-                    requested_at = datetime.combine(
-                        today - timedelta(days=sig_data["requested_days_ago"]),
-                        datetime.min.time()
-                    )
-
-                signed_at = None
-                if sig_data.get("signed_days_ago") is not None:
-                    signed_at = datetime.combine(
-                        today - timedelta(days=sig_data["signed_days_ago"]),
-                        datetime.min.time()
-                    )
-
-                signature = ContractSignature(
-                    contract_version_id=version.id,
-                    user_id=user_id,
-                    status=status,
-                    requested_at=requested_at,
-                    signed_at=signed_at,
-                    requested_by_id=requested_by_id,
-                    notes=sig_data.get("notes"),
+            ))
+            version_signatures.append((created_by_id, version_data.get("signatures", [])))
+
+    signature_count = 0
+    for version_id, (created_by_id, signatures) in zip(bulk.insert(ContractVersion, version_rows), version_signatures):
+        # Import signatures for this version
+        for sig_data in signatures:
+            user_id = None
+            if sig_data.get("user_username"):
+                user_id = user_map.get(sig_data["user_username"])
+
+            requested_by_id = created_by_id
+            if sig_data.get("requested_by_username"):
+                requested_by_id = user_map.get(sig_data["requested_by_username"])
+
+            # Handle status enum
+            status_str = sig_data.get("status", "pending")
+            status = SignatureStatus(status_str)
+
+            # Handle relative dates
+            requested_at = datetime.now()
+            if sig_data.get("requested_days_ago"):
+                requested_at = datetime.combine(
+                    today - timedelta(days=sig_data["requested_days_ago"]),
+                    datetime.min.time()
                 )
-                db.add(signature)
-                signature_count += 1
 
-    db.flush()
-    log(f"  Imported {template_count} templates, {version_count} versions, {signature_count} signatures")
-    return template_count, version_count, signature_count
+            signed_at = None
+            if sig_data.get("signed_days_ago") is not None:
+                signed_at = datetime.combine(
+                    today - timedelta(days=sig_data["signed_days_ago"]),
+                    datetime.min.time()
+                )
 
+            bulk.add(ContractSignature, dict(
+                contract_version_id=version_id,
+                user_id=user_id,
+                status=status,
+                requested_at=requested_at,
+                signed_at=signed_at,
+                requested_by_id=requested_by_id,
+                notes=sig_data.get("notes"),
+            ))
+            signature_count += 1
 
-def _import_flood_monitoring_stations(db: Session, stations_data: List[Dict], log: Callable) -> int:
+    bulk.flush()
+    log(f"  Imported {len(rows)} templates, {len(version_rows)} versions, {signature_count} signatures")
+    return len(rows), len(version_rows), signature_count
+
+
+def _import_flood_monitoring_stations(bulk: BulkImport, stations_data: List[Dict], log: Callable) -> int:
     """Import flood monitoring stations."""
     log("Importing flood monitoring stations...")
+    existing_stations = bulk.index(FloodMonitoringStation.station_id, FloodMonitoringStation.id)
     count = 0
 
     for station_data in stations_data:
         station_id = station_data.get("station_id")
-        existing = db.query(FloodMonitoringStation).filter(
-            FloodMonitoringStation.station_id == station_id
-        ).first()
-        if existing:
+        if station_id in existing_stations:
             log(f"  Station '{station_id}' already exists, skipping")
             continue
 
-        station = FloodMonitoringStation(
+        bulk.add(FloodMonitoringStation, dict(
             station_id=station_id,
             station_name=station_data.get("station_name"),
             river_name=station_data.get("river_name"),
@@ -3949,25 +4125,25 @@ def _import_flood_monitoring_stations(db: Session, stations_data: List[Dict], lo
             severe_threshold_meters=station_data.get("severe_threshold_meters"),
             is_active=station_data.get("is_active", True),
             notes=station_data.get("notes"),
-        )
-        db.add(station)
+        ))
         count += 1
         log(f"  Created flood monitoring station: {station_data.get('station_name')} ({station_id})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_land_features(db: Session, features_data: List[Dict], log: Callable) -> int:
+def _import_land_features(bulk: BulkImport, features_data: List[Dict], log: Callable) -> int:
     """Import land features (hedgerows, trees, water troughs, fences, etc.)."""
     log("Importing land features...")
+    existing_features = bulk.index(LandFeature.name, LandFeature.id)
+    fields = bulk.index(Field.name, Field.id)
     count = 0
     today = date.today()
 
     for feature_data in features_data:
         name = feature_data.get("name")
-        existing = db.query(LandFeature).filter(LandFeature.name == name).first()
-        if existing:
+        if name in existing_features:
             log(f"  Land feature '{name}' already exists, skipping")
             continue
 
@@ -4005,11 +4181,9 @@ def _import_land_features(db: Session, features_data: List[Dict], log: Callable)
         # Look up field by name if provided
         field_id = None
         if feature_data.get("field_name"):
-            field = db.query(Field).filter(Field.name == feature_data["field_name"]).first()
-            if field:
-                field_id = field.id
+            field_id = fields.get(feature_data["field_name"])
 
-        feature = LandFeature(
+        bulk.add(LandFeature, dict(
             name=name,
             feature_type=feature_type,
             description=feature_data.get("description"),
@@ -4033,25 +4207,24 @@ def _import_land_features(db: Session, features_data: List[Dict], log: Callable)
             electric_fence_voltage=feature_data.get("electric_fence_voltage"),
             notes=feature_data.get("notes"),
             is_active=feature_data.get("is_active", True),
-        )
-        db.add(feature)
+        ))
         count += 1
         log(f"  Created land feature: {name} ({feature_type_str})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_grants(db: Session, grants_data: List[Dict], log: Callable) -> int:
+def _import_grants(bulk: BulkImport, grants_data: List[Dict], log: Callable) -> int:
     """Import grants and environmental schemes."""
     log("Importing grants...")
+    existing_grants = bulk.index(Grant.name, Grant.id)
     count = 0
     today = date.today()
 
     for grant_data in grants_data:
         name = grant_data.get("name")
-        existing = db.query(Grant).filter(Grant.name == name).first()
-        if existing:
+        if name in existing_grants:
             log(f"  Grant '{name}' already exists, skipping")
             continue
 
@@ -4085,7 +4258,7 @@ def _import_grants(db: Session, grants_data: List[Dict], log: Callable) -> int:
         if grant_data.get("next_inspection_days_from_now") is not None:
             next_inspection = today + timedelta(days=grant_data["next_inspection_days_from_now"])
 
-        grant = Grant(
+        bulk.add(Grant, dict(
             name=name,
             scheme_type=scheme_type,
             status=status,
@@ -4099,18 +4272,18 @@ def _import_grants(db: Session, grants_data: List[Dict], log: Callable) -> int:
             inspection_notes=grant_data.get("inspection_notes"),
             compliance_requirements=grant_data.get("compliance_requirements"),
             notes=grant_data.get("notes"),
-        )
-        db.add(grant)
+        ))
         count += 1
         log(f"  Created grant: {name}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_risk_assessments(db: Session, assessments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_risk_assessments(bulk: BulkImport, assessments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import risk assessments."""
     log("Importing risk assessments...")
+    existing_assessments = bulk.index(RiskAssessment.title, RiskAssessment.id)
     count = 0
     today = date.today()
 
@@ -4119,13 +4292,11 @@ def _import_risk_assessments(db: Session, assessments_data: List[Dict], user_map
     if not admin_user_id:
         # Fall back to first admin user
         from app.models import User, UserRole
-        admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-        admin_user_id = admin.id if admin else 1
+        admin_user_id = bulk.index(User.role, User.id).get(UserRole.ADMIN) or 1
 
     for assessment_data in assessments_data:
         title = assessment_data.get("title")
-        existing = db.query(RiskAssessment).filter(RiskAssessment.title == title).first()
-        if existing:
+        if title in existing_assessments:
             log(f"  Risk assessment '{title}' already exists, skipping")
             continue
 
@@ -4151,7 +4322,7 @@ def _import_risk_assessments(db: Session, assessments_data: List[Dict], user_map
             import json
             applies_to_roles = json.dumps(applies_to_roles)
 
-        assessment = RiskAssessment(
+        bulk.add(RiskAssessment, dict(
             title=title,
             category=category,
             summary=assessment_data.get("summary"),
@@ -4165,25 +4336,25 @@ def _import_risk_assessments(db: Session, assessments_data: List[Dict], user_map
             last_reviewed_by_id=admin_user_id,
             next_review_due=next_review_due,
             created_by_id=admin_user_id,
-        )
-        db.add(assessment)
+        ))
         count += 1
         log(f"  Created risk assessment: {title} ({category_str})")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_risk_assessment_reviews(db: Session, reviews_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_risk_assessment_reviews(bulk: BulkImport, reviews_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import risk assessment review history."""
     log("Importing risk assessment reviews...")
+    assessments = bulk.index(RiskAssessment.title, RiskAssessment.id)
     count = 0
 
     for review_data in reviews_data:
         # Find the risk assessment by title
         assessment_title = review_data.get("assessment_title")
-        assessment = db.query(RiskAssessment).filter(RiskAssessment.title == assessment_title).first()
-        if not assessment:
+        assessment_id = assessments.get(assessment_title)
+        if not assessment_id:
             log(f"  Risk assessment '{assessment_title}' not found, skipping review")
             continue
 
@@ -4206,8 +4377,8 @@ def _import_risk_assessment_reviews(db: Session, reviews_data: List[Dict], user_
         if review_data.get("reviewed_days_ago") is not None:
             reviewed_at = datetime.utcnow() - timedelta(days=review_data["reviewed_days_ago"])
 
-        review = RiskAssessmentReview(
-            risk_assessment_id=assessment.id,
+        bulk.add(RiskAssessmentReview, dict(
+            risk_assessment_id=assessment_id,
             reviewed_at=reviewed_at,
             reviewed_by_id=reviewer_id,
             trigger=trigger,
@@ -4217,27 +4388,32 @@ def _import_risk_assessment_reviews(db: Session, reviews_data: List[Dict], user_
             changes_made=review_data.get("changes_made", False),
             changes_summary=review_data.get("changes_summary"),
             notes=review_data.get("notes"),
-        )
-        db.add(review)
+        ))
         count += 1
         log(f"  Created review for '{assessment_title}' by {reviewer_username}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_risk_assessment_acknowledgements(db: Session, acks_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_risk_assessment_acknowledgements(bulk: BulkImport, acks_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import risk assessment acknowledgements."""
     log("Importing risk assessment acknowledgements...")
+    assessments = bulk.index(RiskAssessment.title, (RiskAssessment.id, RiskAssessment.version))
+    existing_acks = bulk.index(
+        (RiskAssessmentAcknowledgement.risk_assessment_id, RiskAssessmentAcknowledgement.user_id),
+        RiskAssessmentAcknowledgement.id
+    )
     count = 0
 
     for ack_data in acks_data:
         # Find the risk assessment by title
         assessment_title = ack_data.get("assessment_title")
-        assessment = db.query(RiskAssessment).filter(RiskAssessment.title == assessment_title).first()
+        assessment = assessments.get(assessment_title)
         if not assessment:
             log(f"  Risk assessment '{assessment_title}' not found, skipping acknowledgement")
             continue
+        assessment_id, assessment_version = assessment
 
         # Get user
         username = ack_data.get("username")
@@ -4247,11 +4423,7 @@ def _import_risk_assessment_acknowledgements(db: Session, acks_data: List[Dict],
             continue
 
         # Check for existing acknowledgement for this user/assessment combo
-        existing = db.query(RiskAssessmentAcknowledgement).filter(
-            RiskAssessmentAcknowledgement.risk_assessment_id == assessment.id,
-            RiskAssessmentAcknowledgement.user_id == user_id
-        ).first()
-        if existing:
+        if (assessment_id, user_id) in existing_acks:
             log(f"  Acknowledgement already exists for {username} on '{assessment_title}', skipping")
             continue
 
@@ -4260,72 +4432,72 @@ def _import_risk_assessment_acknowledgements(db: Session, acks_data: List[Dict],
         if ack_data.get("acknowledged_days_ago") is not None:
             acknowledged_at = datetime.utcnow() - timedelta(days=ack_data["acknowledged_days_ago"])
 
-        ack = RiskAssessmentAcknowledgement(
-            risk_assessment_id=assessment.id,
-            assessment_version=ack_data.get("assessment_version", assessment.version),
+        bulk.add(RiskAssessmentAcknowledgement, dict(
+            risk_assessment_id=assessment_id,
+            assessment_version=ack_data.get("assessment_version", assessment_version),
             user_id=user_id,
             acknowledged_at=acknowledged_at,
             notes=ack_data.get("notes"),
-        )
-        db.add(ack)
+        ))
         count += 1
         log(f"  Created acknowledgement for {username} on '{assessment_title}'")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_sheep_flocks(db: Session, flocks_data: List[Dict], log: Callable) -> int:
+def _import_sheep_flocks(bulk: BulkImport, flocks_data: List[Dict], log: Callable) -> int:
     """Import sheep flocks for worm control grazing."""
     log("Importing sheep flocks...")
+    existing_flocks = bulk.index(SheepFlock.name, SheepFlock.id)
     count = 0
 
     for flock_data in flocks_data:
         # Check if flock with same name already exists
-        existing = db.query(SheepFlock).filter(SheepFlock.name == flock_data["name"]).first()
-        if existing:
+        if flock_data["name"] in existing_flocks:
             log(f"  Sheep flock '{flock_data['name']}' already exists, skipping")
             continue
 
-        flock = SheepFlock(
+        bulk.add(SheepFlock, dict(
             name=flock_data["name"],
             count=flock_data.get("count", 10),
             breed=flock_data.get("breed"),
             notes=flock_data.get("notes"),
             is_active=flock_data.get("is_active", True),
-        )
-        db.add(flock)
+        ))
         count += 1
         log(f"  Created sheep flock: {flock_data['name']} ({flock_data.get('count', 10)} sheep)")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_sheep_flock_field_assignments(db: Session, assignments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_sheep_flock_field_assignments(bulk: BulkImport, assignments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import sheep flock field assignments."""
     log("Importing sheep flock field assignments...")
+    flocks = bulk.index(SheepFlock.name, SheepFlock.id)
+    fields = bulk.index(Field.name, Field.id)
+    admin_id = bulk.index(User.role, User.id).get(UserRole.ADMIN)
     count = 0
 
     for assign_data in assignments_data:
         # Find flock by name
         flock_name = assign_data.get("flock_name")
-        flock = db.query(SheepFlock).filter(SheepFlock.name == flock_name).first()
-        if not flock:
+        flock_id = flocks.get(flock_name)
+        if not flock_id:
             log(f"  Sheep flock '{flock_name}' not found, skipping assignment")
             continue
 
         # Find field by name
         field_name = assign_data.get("field_name")
-        field = db.query(Field).filter(Field.name == field_name).first() if field_name else None
+        field_id = fields.get(field_name) if field_name else None
 
         # Get assigner user
         assigned_by_username = assign_data.get("assigned_by_username", "admin")
         assigned_by_id = user_map.get(assigned_by_username)
         if not assigned_by_id:
             # Fall back to first admin
-            admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-            assigned_by_id = admin.id if admin else 1
+            assigned_by_id = admin_id or 1
 
         # Handle relative dates
         start_date = date.today()
@@ -4340,47 +4512,49 @@ def _import_sheep_flock_field_assignments(db: Session, assignments_data: List[Di
         elif assign_data.get("end_date"):
             end_date = datetime.strptime(assign_data["end_date"], "%Y-%m-%d").date()
 
-        assignment = SheepFlockFieldAssignment(
-            flock_id=flock.id,
-            field_id=field.id if field else None,
+        bulk.add(SheepFlockFieldAssignment, dict(
+            flock_id=flock_id,
+            field_id=field_id,
             start_date=start_date,
             end_date=end_date,
             assigned_by_id=assigned_by_id,
             notes=assign_data.get("notes"),
-        )
-        db.add(assignment)
+        ))
         count += 1
         field_str = field_name if field_name else "no field"
         log(f"  Assigned '{flock_name}' to {field_str}")
 
-    db.flush()
+    bulk.flush()
     return count
 
 
-def _import_horse_field_assignments(db: Session, assignments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
+def _import_horse_field_assignments(bulk: BulkImport, assignments_data: List[Dict], user_map: Dict[str, int], log: Callable) -> int:
     """Import horse field assignments for permanent livery turnout."""
     log("Importing horse field assignments...")
+    horses_by_name = bulk.index(Horse.name, Horse.id)
+    fields = bulk.index(Field.name, Field.id)
+    admin_id = bulk.index(User.role, User.id).get(UserRole.ADMIN)
+    box_rest = {}
     count = 0
 
     for assign_data in assignments_data:
         # Find horse by name
         horse_name = assign_data.get("horse_name")
-        horse = db.query(Horse).filter(Horse.name == horse_name).first()
-        if not horse:
+        horse_id = horses_by_name.get(horse_name)
+        if not horse_id:
             log(f"  Horse '{horse_name}' not found, skipping assignment")
             continue
 
         # Find field by name (can be None for box rest)
         field_name = assign_data.get("field_name")
-        field = db.query(Field).filter(Field.name == field_name).first() if field_name else None
+        field_id = fields.get(field_name) if field_name else None
 
         # Get assigner user
         assigned_by_username = assign_data.get("assigned_by_username", "admin")
         assigned_by_id = user_map.get(assigned_by_username)
         if not assigned_by_id:
             # Fall back to first admin
-            admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-            assigned_by_id = admin.id if admin else 1
+            assigned_by_id = admin_id or 1
 
         # Handle relative dates
         start_date = date.today()
@@ -4396,23 +4570,20 @@ def _import_horse_field_assignments(db: Session, assignments_data: List[Dict], u
             end_date = datetime.strptime(assign_data["end_date"], "%Y-%m-%d").date()
 
         # Update horse box_rest flag
-        if field is None:
-            horse.box_rest = True
-        else:
-            horse.box_rest = False
+        box_rest[horse_id] = field_id is None
 
-        assignment = HorseFieldAssignment(
-            horse_id=horse.id,
-            field_id=field.id if field else None,
+        bulk.add(HorseFieldAssignment, dict(
+            horse_id=horse_id,
+            field_id=field_id,
             start_date=start_date,
             end_date=end_date,
             assigned_by_id=assigned_by_id,
             notes=assign_data.get("notes"),
-        )
-        db.add(assignment)
+        ))
         count += 1
         field_str = field_name if field_name else "Box Rest"
         log(f"  Assigned '{horse_name}' to {field_str}")
 
-    db.flush()
+    bulk.update(Horse, [{"id": horse_id, "box_rest": value} for horse_id, value in box_rest.items()])
+    bulk.flush()
     return count
@@ -0,0 +1,290 @@
+"""
+Backup archive format.
+
+A backup archive is a zip file holding:
+- tables/<key>.ndjson for each exported table, deflate-compressed, one
+  JSON record per line
+- manifest.json, stored uncompressed: format version, creation time,
+  schema (alembic) revision, export metadata and, per table, the member
+  name, row count, uncompressed size and SHA-256 of the member
+
+The zip central directory means the manifest can be read - to list,
+validate or describe a backup - without decompressing any table data.
+Checksums and row counts are verified when tables are read back.
+
+A backup is either full or differential. A differential holds only the
+rows changed since a full backup (its base), plus the id ranges of every
+row that still exists so deletions can be replayed; replay_archives
+merges a full backup and its differentials back into one backup.
+"""
+import hashlib
+import json
+import zipfile
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+ARCHIVE_FORMAT = "evm-backup"
+ARCHIVE_VERSION = 2  # 2: differential backups
+ARCHIVE_EXTENSION = ".zip"
+MANIFEST_NAME = "manifest.json"
+COMPRESS_LEVEL = 6
+
+# Tables exported as a single record rather than a list
+SINGLE_RECORD_TABLES = {"site_settings"}
+
+FULL_BACKUP = "full"
+DIFFERENTIAL_BACKUP = "differential"
+
+Source = Union[str, BinaryIO]
+# (key, records) or (key, records, extra manifest fields for the table).
+# The extra dict is read after the records are exhausted, so a record
+# generator may fill it in as it finishes.
+Table = Union[Tuple[str, Iterable[Dict[str, Any]]], Tuple[str, Iterable[Dict[str, Any]], Dict[str, Any]]]
+
+
+class BackupArchiveError(ValueError):
+    """Raised when a backup archive is unreadable, incomplete or fails its checksums."""
+    pass
+
+
+def is_backup_archive(source: Source) -> bool:
+    """True if source is a zip file (path or seekable file object)."""
+    try:
+        return zipfile.is_zipfile(source)
+    finally:
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+
+def id_ranges(ids: Iterable[int]) -> List[List[int]]:
+    """Collapse ascending ids into inclusive [first, last] runs."""
+    ranges: List[List[int]] = []
+    for id_ in ids:
+        if ranges and id_ == ranges[-1][1] + 1:
+            ranges[-1][1] = id_
+        else:
+            ranges.append([id_, id_])
+    return ranges
+
+
+def _in_ranges(ranges: Sequence[Sequence[int]], starts: Sequence[int], id_: int) -> bool:
+    i = bisect_right(starts, id_) - 1
+    return i >= 0 and id_ <= ranges[i][1]
+
+
+def write_archive(
+    target: Source,
+    tables: Iterable[Table],
+    schema_revision: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    base: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Write tables to a backup archive, streaming each into its compressed
+    member. Records must already be JSON-ready. Given base (the filename
+    and created_at of a full backup) the archive is a differential
+    against it. Returns the manifest.
+    """
+    manifest: Dict[str, Any] = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "kind": DIFFERENTIAL_BACKUP if base else FULL_BACKUP,
+        "created_at": datetime.utcnow().isoformat(),
+        "schema_revision": schema_revision,
+        "metadata": metadata or {},
+        "tables": {},
+    }
+    if base:
+        manifest["base"] = base
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as archive:
+        for key, records, *extra in tables:
+            member = f"tables/{key}.ndjson"
+            digest = hashlib.sha256()
+            rows = 0
+            size = 0
+            with archive.open(member, "w", force_zip64=True) as f:
+                for record in records:
+                    line = (json.dumps(record) + "\n").encode("utf-8")
+                    digest.update(line)
+                    f.write(line)
+                    rows += 1
+                    size += len(line)
+            manifest["tables"][key] = {
+                **(extra[0] if extra else {}),
+                "member": member,
+                "rows": rows,
+                "bytes": size,
+                "sha256": digest.hexdigest(),
+            }
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2), compress_type=zipfile.ZIP_STORED)
+    return manifest
+
+
+def _open(source: Source) -> zipfile.ZipFile:
+    try:
+        return zipfile.ZipFile(source)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise BackupArchiveError(f"Not a backup archive: {e}")
+
+
+def _manifest(archive: zipfile.ZipFile) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+    except KeyError:
+        raise BackupArchiveError("Backup archive has no manifest")
+    except (ValueError, zipfile.BadZipFile) as e:
+        raise BackupArchiveError(f"Backup manifest is unreadable: {e}")
+    if not isinstance(manifest, dict) or manifest.get("format") != ARCHIVE_FORMAT:
+        raise BackupArchiveError("Not a backup archive manifest")
+    if manifest.get("version", 0) > ARCHIVE_VERSION:
+        raise BackupArchiveError(f"Backup archive version {manifest['version']} is newer than supported")
+    return manifest
+
+
+def read_manifest(source: Source) -> Dict[str, Any]:
+    """Read just the manifest; no table data is decompressed."""
+    with _open(source) as archive:
+        return _manifest(archive)
+
+
+def _iter_member(archive: zipfile.ZipFile, key: str, entry: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield a table's records, checking the row count and checksum once all are read."""
+    digest = hashlib.sha256()
+    rows = 0
+    try:
+        with archive.open(entry["member"]) as f:
+            for line in f:
+                digest.update(line)
+                rows += 1
+                yield json.loads(line)
+    except KeyError:
+        raise BackupArchiveError(f"Backup archive is missing the {key} table")
+    except zipfile.BadZipFile as e:
+        raise BackupArchiveError(f"The {key} table is corrupt: {e}")
+    if digest.hexdigest() != entry["sha256"]:
+        raise BackupArchiveError(f"Checksum mismatch in the {key} table")
+    if rows != entry["rows"]:
+        raise BackupArchiveError(f"Expected {entry['rows']} {key} rows, found {rows}")
+
+
+def iter_archive_tables(source: Source) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+    """Yield (key, records) for every table in manifest order, verifying each as it is read."""
+    with _open(source) as archive:
+        manifest = _manifest(archive)
+        for key, entry in manifest["tables"].items():
+            yield key, _iter_member(archive, key, entry)
+
+
+def backup_kind(manifest: Dict[str, Any]) -> str:
+    """full or differential; archives written before differentials existed are full."""
+    return manifest.get("kind", FULL_BACKUP)
+
+
+def _backup_metadata(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    return {**manifest.get("metadata", {}), "schema_revision": manifest.get("schema_revision")}
+
+
+def _load_tables(archive: zipfile.ZipFile, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    for key, entry in manifest["tables"].items():
+        records = list(_iter_member(archive, key, entry))
+        if key in SINGLE_RECORD_TABLES:
+            if records:
+                data[key] = records[0]
+        else:
+            data[key] = records
+    return data
+
+
+def load_archive(source: Source) -> Dict[str, Any]:
+    """
+    Read a whole archive into the same dict layout as a JSON backup
+    (one list per table, site_settings as a single record, _metadata).
+    A differential on its own holds only changed rows; see replay_archives.
+    Raises BackupArchiveError if any table fails verification.
+    """
+    with _open(source) as archive:
+        manifest = _manifest(archive)
+        data = _load_tables(archive, manifest)
+    data["_metadata"] = _backup_metadata(manifest)
+    return data
+
+
+def _merge_rows(
+    rows: List[Dict[str, Any]],
+    changed: Iterable[Dict[str, Any]],
+    live: Optional[List[List[int]]]
+) -> List[Dict[str, Any]]:
+    """Drop rows no longer live, then add or replace the changed rows by id."""
+    if live is not None:
+        starts = [first for first, _ in live]
+        rows = [row for row in rows if _in_ranges(live, starts, row["id"])]
+    merged = {row["id"]: row for row in rows}
+    for row in changed:
+        merged[row["id"]] = row
+    return [merged[id_] for id_ in sorted(merged)]
+
+
+def replay_archives(sources: Sequence[Source]) -> Dict[str, Any]:
+    """
+    Merge a full backup and differentials taken against it, in order,
+    into the dict layout load_archive returns. Each differential replaces
+    changed rows by id and drops rows deleted since the full backup.
+    Raises BackupArchiveError if the chain does not start with a full
+    backup or a differential belongs to a different one.
+    """
+    if not sources:
+        raise BackupArchiveError("No backups to replay")
+    with _open(sources[0]) as archive:
+        manifest = _manifest(archive)
+        if backup_kind(manifest) != FULL_BACKUP:
+            raise BackupArchiveError("A backup chain must start with a full backup")
+        data = _load_tables(archive, manifest)
+    base_created_at = manifest["created_at"]
+
+    for source in sources[1:]:
+        with _open(source) as archive:
+            manifest = _manifest(archive)
+            if backup_kind(manifest) != DIFFERENTIAL_BACKUP:
+                raise BackupArchiveError("Only differential backups can follow the full backup")
+            if manifest.get("base", {}).get("created_at") != base_created_at:
+                raise BackupArchiveError(
+                    f"Differential backup is based on {manifest.get('base', {}).get('filename')}, "
+                    "not on this full backup"
+                )
+            for key, entry in manifest["tables"].items():
+                records = _iter_member(archive, key, entry)
+                if key in SINGLE_RECORD_TABLES:
+                    for record in records:
+                        data[key] = record
+                else:
+                    data[key] = _merge_rows(data.get(key, []), records, entry.get("ids"))
+
+    data["_metadata"] = _backup_metadata(manifest)
+    return data
+
+
+def verify_archive(source: Source) -> List[str]:
+    """Check every table against the manifest. Returns a list of errors (empty if sound)."""
+    errors = []
+    try:
+        for key, records in iter_archive_tables(source):
+            try:
+                for _ in records:
+                    pass
+            except BackupArchiveError as e:
+                errors.append(str(e))
+    except BackupArchiveError as e:
+        errors.append(str(e))
+    return errors
+
+
+def manifest_entity_counts(manifest: Dict[str, Any]) -> Dict[str, int]:
+    """Row counts per table, as recorded in the manifest."""
+    return {
+        key: entry["rows"]
+        for key, entry in manifest.get("tables", {}).items()
+        if entry["rows"] or key not in SINGLE_RECORD_TABLES
+    }
@@ -0,0 +1,138 @@
+"""
+Preloaded lookups and chunked bulk inserts for import_database.
+
+A restore used to run a query per record to resolve each name reference
+and to check for an existing duplicate, then add rows one ORM object at a
+time. BulkImport instead loads each natural-key map (horses by name and
+owner, fields by name, ...) with one query the first time it is needed,
+and queues new rows as plain dicts that are written with multi-row
+INSERT ... VALUES statements, IMPORT_CHUNK_SIZE rows at a time. Restore
+time then grows with the amount of data rather than with round trips.
+
+Rows are written through ORM bulk INSERT, so column defaults and enum
+types apply as usual but Session flush hooks do not run.
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, inspect as sa_inspect, select, update
+from sqlalchemy.orm import Session
+
+# Rows per multi-row INSERT statement
+IMPORT_CHUNK_SIZE = 1000
+
+
+def _as_tuple(columns) -> Tuple:
+    return columns if isinstance(columns, tuple) else (columns,)
+
+
+def _defaulted_keys(model) -> Set[str]:
+    """Attribute keys of the model's columns that have a default or server default."""
+    return {
+        attr.key for attr in sa_inspect(model).column_attrs
+        if any(column.default is not None or column.server_default is not None for column in attr.columns)
+    }
+
+
+class BulkImport:
+    """Natural-key lookups and queued inserts for one import transaction."""
+
+    def __init__(self, db: Session, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+        self._indexes: Dict[Tuple[str, ...], Tuple[Set[str], Dict[Any, Any]]] = {}
+        self._pending: Dict[Any, List[Dict[str, Any]]] = {}
+        self._defaulted: Dict[Any, Set[str]] = {}
+
+    def index(self, keys, value, join: Optional[Tuple] = None) -> Dict[Any, Any]:
+        """
+        Map keys -> value over every row, loaded with one query on first use.
+
+        keys and value are a column or a tuple of columns; a tuple gives
+        tuple keys or values. Where several rows share a key the one with
+        the lowest value wins, as .first() on the primary key would. join
+        is passed to Query.join, from the value column's model. The map
+        is dropped whenever rows are inserted into one of its tables.
+        Callers may add the keys of rows they queue, so duplicates within
+        one import are caught too.
+        """
+        keys = _as_tuple(keys)
+        values = _as_tuple(value)
+        cache_key = tuple(str(column) for column in keys + values)
+        if cache_key in self._indexes:
+            return self._indexes[cache_key][1]
+
+        query = self.db.query(*keys, *values)
+        tables = {table.name for table in select(*keys, *values).columns_clause_froms}
+        if join is not None:
+            query = query.select_from(values[0].class_).join(*join)
+            tables.add(join[0].__tablename__)
+
+        mapping: Dict[Any, Any] = {}
+        width = len(keys)
+        for row in query.order_by(*values):
+            key = row[0] if width == 1 else tuple(row[:width])
+            if key not in mapping:
+                mapping[key] = row[width] if len(values) == 1 else tuple(row[width:])
+        self._indexes[cache_key] = (tables, mapping)
+        return mapping
+
+    def _forget(self, model) -> None:
+        table = model.__tablename__
+        self._indexes = {
+            cache_key: entry for cache_key, entry in self._indexes.items() if table not in entry[0]
+        }
+
+    def add(self, model, row: Dict[str, Any]) -> None:
+        """Queue a row for insertion; written once chunk_size rows are waiting or on flush."""
+        pending = self._pending.setdefault(model, [])
+        pending.append(row)
+        if len(pending) >= self.chunk_size:
+            self._write(model, pending)
+            pending.clear()
+
+    def insert(self, model, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert rows now and return their new ids, in the order given."""
+        self.flush()
+        ids: List[int] = []
+        statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = self._prepare(model, rows[start:start + self.chunk_size])
+            ids.extend(self.db.execute(statement, chunk, execution_options={"render_nulls": True}).scalars())
+        if rows:
+            self._forget(model)
+        return ids
+
+    def update(self, model, rows: List[Dict[str, Any]]) -> None:
+        """Bulk UPDATE by primary key; each row holds id plus the columns to set."""
+        for start in range(0, len(rows), self.chunk_size):
+            self.db.execute(update(model), rows[start:start + self.chunk_size])
+        if rows:
+            self._forget(model)
+
+    def flush(self) -> None:
+        """Write every queued row, parents first in the order they were queued."""
+        for model, pending in self._pending.items():
+            if pending:
+                self._write(model, pending)
+                pending.clear()
+
+    def _prepare(self, model, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop None values only where a column default should fill them in.
+
+        A flush leaves such None values out so the default applies, and
+        sends NULL for the rest. ORM bulk INSERT would leave out every None
+        and could then batch only consecutive rows setting the same
+        columns; with the rest rendered as NULL the rows keep one shape.
+        """
+        if model not in self._defaulted:
+            self._defaulted[model] = _defaulted_keys(model)
+        defaulted = self._defaulted[model]
+        return [
+            {key: value for key, value in row.items() if value is not None or key not in defaulted}
+            for row in rows
+        ]
+
+    def _write(self, model, rows: List[Dict[str, Any]]) -> None:
+        self.db.execute(insert(model), self._prepare(model, rows), execution_options={"render_nulls": True})
+        self._forget(model)
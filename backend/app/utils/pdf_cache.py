@@ -0,0 +1,144 @@
+"""
+PDF Cache
+
+Rendered PDFs kept on disk, keyed by a SHA-256 of everything the
+renderer is given (line items, totals, names, venue details) plus the
+modification time of the renderer's source, so any change to the content
+or the template produces a new key rather than a stale file. Repeat
+downloads are then served straight from disk with FileResponse.
+
+Files are named {kind}-{owner_id}-{digest}.pdf so all versions of one
+document can be dropped together when it is edited. A hit bumps the
+file's mtime and, once the directory grows past PDF_CACHE_MAX_BYTES, the
+least recently used files are removed.
+"""
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+
+PDF_CACHE_DIR = os.environ.get("PDF_CACHE_DIR", "/tmp/pdf-cache")
+PDF_CACHE_MAX_BYTES = int(os.environ.get("PDF_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def _mtime(path: Optional[str]) -> Optional[float]:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def cache_key(render: Callable[..., bytes], inputs: Dict[str, Any]) -> str:
+    """Digest of the renderer, its source mtime and the keyword arguments it will be called with."""
+    payload = json.dumps(
+        {
+            "render": f"{render.__module__}.{render.__qualname__}",
+            "source": _mtime(inspect.getsourcefile(render)),
+            "inputs": inputs,
+        },
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PdfCache:
+    """Content-addressed PDF files in one directory, evicted least recently used first."""
+
+    def __init__(self, directory: str = PDF_CACHE_DIR, max_bytes: int = PDF_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path_for(self, kind: str, owner_id: int, key: str) -> str:
+        return os.path.join(self.directory, f"{kind}-{owner_id}-{key}.pdf")
+
+    def get(self, kind: str, owner_id: int, key: str) -> Optional[str]:
+        """Path of a cached PDF, marking it as recently used, or None."""
+        path = self.path_for(kind, owner_id, key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, kind: str, owner_id: int, key: str, pdf_bytes: bytes) -> str:
+        """Store a rendered PDF atomically and return its path."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(kind, owner_id, key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.evict(keep=path)
+        return path
+
+    def get_or_render(
+        self,
+        kind: str,
+        owner_id: int,
+        render: Callable[..., bytes],
+        inputs: Dict[str, Any]
+    ) -> str:
+        """Path of the PDF for render(**inputs), rendering and storing it on a miss."""
+        key = cache_key(render, inputs)
+        return self.get(kind, owner_id, key) or self.put(kind, owner_id, key, render(**inputs))
+
+    def invalidate(self, kind: str, owner_id: int) -> int:
+        """Remove every cached version of one document. Returns the number of files removed."""
+        prefix = f"{kind}-{owner_id}-"
+        removed = 0
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return 0
+        for name in names:
+            if name.startswith(prefix) and name.endswith(".pdf"):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Remove least recently used files until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".pdf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+
+pdf_cache = PdfCache()
@@ -0,0 +1,154 @@
+"""
+Parallel table reads from one consistent PostgreSQL snapshot.
+
+A single-session export reads its tables one after another. Here a lead
+connection opens a REPEATABLE READ transaction and exports its snapshot
+with pg_export_snapshot(), and a pool of worker threads each read tables
+over their own connection after SET TRANSACTION SNAPSHOT, as pg_dump
+--jobs does. Every table then sees the database as of the same instant
+while several are read at once.
+
+Tables are handed back in the order given. Each worker passes rows over
+in batches through a bounded queue, so a worker runs at most read_ahead
+batches ahead of the caller and memory stays bounded however large a
+table is. Other databases, or workers=1, read every table in turn on the
+caller's session.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Reads one table's records on the session it is given
+TableReader = Callable[[Session], Iterator[Dict[str, Any]]]
+
+# Batches a worker may read ahead of the caller, per table
+READ_AHEAD_BATCHES = 4
+
+_DONE = object()
+
+
+def supports_snapshot_export(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+@contextmanager
+def exported_snapshot(engine: Engine) -> Iterator[str]:
+    """Hold a REPEATABLE READ transaction open and yield its exported snapshot id."""
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="REPEATABLE READ")
+        with connection.begin():
+            yield connection.execute(text("SELECT pg_export_snapshot()")).scalar()
+
+
+@contextmanager
+def snapshot_session(engine: Engine, snapshot_id: str) -> Iterator[Session]:
+    """A session on its own connection that sees the database as of snapshot_id."""
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="REPEATABLE READ")
+        with connection.begin():
+            # Must be the first statement of the transaction
+            connection.execute(text("SET TRANSACTION SNAPSHOT :snapshot_id"), {"snapshot_id": snapshot_id})
+            with Session(bind=connection) as session:
+                yield session
+
+
+def _read_table(
+    read: TableReader,
+    open_session: Callable[[], ContextManager[Session]],
+    batches: queue.Queue,
+    stop: threading.Event,
+    batch_size: int
+) -> None:
+    """Run read on a session of its own, putting its rows on batches, then _DONE or the error."""
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        with open_session() as session:
+            batch = []
+            for record in read(session):
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    if not put(batch):
+                        return
+                    batch = []
+            if batch and not put(batch):
+                return
+    except Exception as e:
+        put(e)
+        return
+    put(_DONE)
+
+
+def _drain(batches: queue.Queue) -> Iterator[Dict[str, Any]]:
+    while True:
+        item = batches.get()
+        if item is _DONE:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield from item
+
+
+def parallel_tables(
+    readers: List[Tuple[str, TableReader]],
+    workers: int,
+    open_session: Callable[[], ContextManager[Session]],
+    batch_size: int,
+    read_ahead: int = READ_AHEAD_BATCHES
+) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+    """
+    (key, records) for each reader in order, the reads running on up to
+    workers threads, each table on a session from open_session.
+
+    Tables start in order, so the one the caller is on is always being
+    read; each table's records must be consumed before the next is asked
+    for. Closing the generator early stops the workers.
+    """
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot-export")
+    try:
+        tables = []
+        for key, read in readers:
+            batches: queue.Queue = queue.Queue(maxsize=read_ahead)
+            executor.submit(_read_table, read, open_session, batches, stop, batch_size)
+            tables.append((key, batches))
+        for key, batches in tables:
+            yield key, _drain(batches)
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def read_tables(
+    db: Session,
+    readers: List[Tuple[str, TableReader]],
+    workers: int,
+    batch_size: int
+) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+    """
+    (key, records) for each reader in order. On PostgreSQL with more than
+    one worker the tables are read in parallel from one exported snapshot,
+    which sees only committed data; otherwise each is read in turn on db.
+    """
+    if workers <= 1 or not supports_snapshot_export(db):
+        for key, read in readers:
+            yield key, read(db)
+        return
+
+    engine = db.get_bind().engine
+    with exported_snapshot(engine) as snapshot_id:
+        yield from parallel_tables(readers, workers, partial(snapshot_session, engine, snapshot_id), batch_size)
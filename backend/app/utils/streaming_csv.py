@@ -0,0 +1,86 @@
+"""
+Streaming CSV responses.
+
+Rows are encoded a batch at a time and handed to StreamingResponse, so an
+export starts sending straight away and holds at most one batch in memory.
+When the client sends Accept-Encoding: gzip the same chunks are compressed
+on the fly.
+
+Row sources that read the database should do so through stream_session
+and yield_per: FastAPI closes the request's session (get_db) before the
+response body is streamed.
+"""
+import csv
+import io
+import zlib
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+
+ROWS_PER_CHUNK = 500
+YIELD_PER = 1000  # ORM objects fetched per round trip from the server-side cursor
+
+
+@contextmanager
+def stream_session(db: Session) -> Iterator[Session]:
+    """A short-lived session on the request session's engine, for use inside a streamed body."""
+    session = Session(bind=db.get_bind())
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def iter_csv(rows: Iterable[Sequence[Any]], rows_per_chunk: int = ROWS_PER_CHUNK) -> Iterator[bytes]:
+    """Encode rows as UTF-8 CSV, yielding one chunk per rows_per_chunk rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member, chunk by chunk."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(request: Optional[Request]) -> bool:
+    if request is None:
+        return False
+    encodings = request.headers.get("accept-encoding", "")
+    return any(part.split(";")[0].strip().lower() == "gzip" for part in encodings.split(","))
+
+
+def csv_response(
+    rows: Iterable[Sequence[Any]],
+    filename: str,
+    request: Optional[Request] = None
+) -> StreamingResponse:
+    """Stream rows as a CSV attachment, gzip-encoded if the client accepts it."""
+    body = iter_csv(rows)
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_gzip(request):
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type="text/csv", headers=headers)
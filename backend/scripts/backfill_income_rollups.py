@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Backfill the income_rollups table from the ledger.
+
+income_rollups holds non-voided ledger totals per month and transaction
+type and is maintained on every ledger write. Run this after deploying
+the table, or whenever the rollup is suspected to be out of step with
+ledger_entries (for example after editing the ledger with raw SQL).
+It rebuilds every month from scratch.
+
+Usage:
+    python scripts/backfill_income_rollups.py
+
+Docker example:
+    docker compose exec backend python scripts/backfill_income_rollups.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.models.account import MonthlyIncomeRollup, recompute_income_rollups
+
+
+def main():
+    db = SessionLocal()
+    try:
+        recompute_income_rollups(db.connection())
+        db.commit()
+        months = db.query(MonthlyIncomeRollup.year, MonthlyIncomeRollup.month).distinct().count()
+        print(f"Rebuilt income rollups for {months} month(s)")
+
+    except Exception as e:
+        print(f"Error backfilling income rollups: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Generate account statements for every active livery client into a zip.
+
+Ledger rows and opening balances are loaded in two queries and the PDFs
+are rendered in a process pool, so a month-end run takes a single
+command instead of a download per client.
+
+Usage:
+    python scripts/generate_statements.py --from 2025-01-01 --to 2025-01-31
+    python scripts/generate_statements.py --from 2025-01-01 --to 2025-01-31 \\
+        --output /backups/statements_jan.zip --workers 8
+
+Docker example:
+    docker compose exec backend python scripts/generate_statements.py --from 2025-01-01 --to 2025-01-31
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.services.statements import load_statements, write_statements_zip
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate statements for all livery clients")
+    parser.add_argument("--from", dest="from_date", required=True, type=date.fromisoformat, help="Period start (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", required=True, type=date.fromisoformat, help="Period end (YYYY-MM-DD)")
+    parser.add_argument("--output", help="Zip file to write (default statements_<from>_<to>.zip)")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default STATEMENT_WORKERS)")
+    args = parser.parse_args()
+
+    output = Path(args.output or f"statements_{args.from_date}_{args.to_date}.zip")
+
+    db = SessionLocal()
+    try:
+        started = time.monotonic()
+        statements = load_statements(db, args.from_date, args.to_date)
+        if not statements:
+            print("No active livery clients found")
+            return
+
+        with output.open("wb") as target:
+            count = write_statements_zip(statements, target, max_workers=args.workers)
+        print(f"Wrote {count} statement(s) to {output} in {time.monotonic() - started:.1f}s")
+
+    except Exception as e:
+        print(f"Error generating statements: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
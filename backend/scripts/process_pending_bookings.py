@@ -26,10 +26,9 @@ sys.path.insert(0, str(backend_dir))
 
 from datetime import date, datetime
 from dateutil.relativedelta import relativedelta
-from sqlalchemy import and_, or_
 
 from app.database import SessionLocal
-from app.models.booking import Booking, BookingStatus
+from app.services.booking_conflicts import allocate_pending_bookings
 
 
 def process_pending_bookings():
@@ -39,38 +38,23 @@ def process_pending_bookings():
         tomorrow = date.today() + relativedelta(days=1)
         tomorrow_end = datetime.combine(tomorrow, datetime.max.time())
 
-        # Find all pending bookings for tomorrow or earlier
-        pending_bookings = db.query(Booking).filter(
-            Booking.booking_status == BookingStatus.PENDING,
-            Booking.start_time <= tomorrow_end
-        ).order_by(Booking.created_at.asc()).all()  # First-come, first-served
-
-        print(f"Found {len(pending_bookings)} pending booking(s) to process")
-
-        confirmed_count = 0
-        for booking in pending_bookings:
-            # Check if there's a confirmed booking that conflicts
-            conflict = db.query(Booking).filter(
-                Booking.arena_id == booking.arena_id,
-                Booking.booking_status == BookingStatus.CONFIRMED,
-                Booking.id != booking.id,
-                or_(
-                    and_(Booking.start_time <= booking.start_time, Booking.end_time > booking.start_time),
-                    and_(Booking.start_time < booking.end_time, Booking.end_time >= booking.end_time),
-                    and_(Booking.start_time >= booking.start_time, Booking.end_time <= booking.end_time)
-                )
-            ).first()
-
-            if not conflict:
-                # No conflict - auto-confirm
-                booking.booking_status = BookingStatus.CONFIRMED
-                confirmed_count += 1
-                print(f"  Confirmed booking #{booking.id}: {booking.title} at {booking.start_time}")
-            else:
-                print(f"  Skipped booking #{booking.id}: conflict with booking #{conflict.id}")
+        # Same first-come, first-served sweep as POST /api/bookings/process-pending
+        result = allocate_pending_bookings(db, tomorrow_end)
+
+        print(f"Found {result.processed} pending booking(s) to process")
+
+        for report in result.arenas.values():
+            print(
+                f"  Arena #{report.arena_id}: {report.processed} pending, "
+                f"confirmed {len(report.confirmed_ids)}, skipped {len(report.skipped_ids)}"
+            )
+            for booking_id in report.confirmed_ids:
+                print(f"    Confirmed booking #{booking_id}")
+            for booking_id in report.skipped_ids:
+                print(f"    Skipped booking #{booking_id}: slot already taken")
 
         db.commit()
-        print(f"\nProcessed {len(pending_bookings)} pending booking(s), confirmed {confirmed_count}")
+        print(f"\nProcessed {result.processed} pending booking(s), confirmed {result.confirmed}")
 
     except Exception as e:
         print(f"Error processing pending bookings: {e}")
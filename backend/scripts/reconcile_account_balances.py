@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Rebuild the account_balances projection from the ledger and report drift.
+
+account_balances is maintained on every ledger write; this script is the
+safety net. It compares each stored row with a fresh aggregate of
+ledger_entries, prints any differences, then rebuilds the table.
+
+Usage:
+    python scripts/reconcile_account_balances.py            # report and rebuild
+    python scripts/reconcile_account_balances.py --check    # report only, exit 1 on drift
+
+Docker example:
+    docker compose exec backend python scripts/reconcile_account_balances.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.services.account_balances import reconcile_account_balances
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile account balances with the ledger")
+    parser.add_argument("--check", action="store_true", help="Report drift without rebuilding")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        drift = reconcile_account_balances(db, rebuild=not args.check)
+
+        for item in drift:
+            print(f"  User #{item.user_id}: {', '.join(item.fields)} differ")
+            for name in item.fields:
+                stored = item.stored.get(name) if item.stored else None
+                expected = item.expected.get(name) if item.expected else None
+                print(f"    {name}: stored {stored}, ledger {expected}")
+
+        if args.check:
+            print(f"\n{len(drift)} account(s) out of step with the ledger")
+            sys.exit(1 if drift else 0)
+
+        db.commit()
+        print(f"\nRebuilt account balances; {len(drift)} account(s) had drifted")
+
+    except Exception as e:
+        print(f"Error reconciling account balances: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
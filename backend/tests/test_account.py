@@ -0,0 +1,525 @@
+"""Tests for account balances.
+
+Tests cover:
+- The account_balances projection staying in step with ledger writes
+- Admin account list ordering
+- Reconciliation against the ledger
+- Aged debt brackets and as_of_date snapshots
+- Monthly income rollups and the income summary report
+- Receipt and invoice numbering from document_sequences
+- Streaming (optionally gzipped) CSV exports
+- Single and bulk statement PDFs
+- The on-disk invoice PDF cache and the PDF render pool
+- Bulk ledger writes from monthly livery billing
+"""
+import csv
+import gzip
+import io
+import os
+import pytest
+import threading
+import time
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi import HTTPException
+
+from app.models.account import (
+    LedgerEntry, MonthlyIncomeRollup, TransactionType, UserAccountBalance,
+    income_totals_query, recompute_income_rollups
+)
+from app.models.document_sequence import DocumentSequence
+from app.models.horse import Horse
+from app.services.account_balances import reconcile_account_balances
+from app.services.document_numbers import RECEIPT_PREFIX, next_document_number
+from app.services import pdf_rendering
+from app.services.statements import load_statements, render_statement, render_statements
+from app.utils import pdf_cache as pdf_cache_module
+from app.utils.pdf_cache import PdfCache
+from app.utils.streaming_csv import gzip_chunks, iter_csv
+
+
+def _charge(client, headers, user_id, amount, description="Livery", transaction_type="service_charge",
+            transaction_date=None):
+    response = client.post("/api/account/transactions", json={
+        "user_id": user_id,
+        "transaction_type": transaction_type,
+        "amount": str(amount),
+        "description": description,
+        "transaction_date": transaction_date
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestAccountBalances:
+    def test_balance_follows_ledger_writes(self, client, db, livery_user, auth_headers_admin):
+        charge = _charge(client, auth_headers_admin, livery_user.id, "100.00")
+        _charge(client, auth_headers_admin, livery_user.id, "25.50")
+
+        response = client.post("/api/account/payments", json={
+            "user_id": livery_user.id,
+            "amount": "60.00",
+            "payment_method": "cash"
+        }, headers=auth_headers_admin)
+        assert response.status_code == 201
+
+        balance = client.get(f"/api/account/users/{livery_user.id}", headers=auth_headers_admin).json()["balance"]
+        assert Decimal(balance["balance"]) == Decimal("65.50")
+        assert Decimal(balance["total_charges"]) == Decimal("125.50")
+        assert Decimal(balance["total_payments"]) == Decimal("60.00")
+
+        # Voiding adds a reversal entry
+        response = client.post(f"/api/account/transactions/{charge['id']}/void",
+                               json={"reason": "Duplicate"}, headers=auth_headers_admin)
+        assert response.status_code == 200
+        row = db.query(UserAccountBalance).filter(UserAccountBalance.user_id == livery_user.id).one()
+        assert row.balance == Decimal("-34.50")
+        assert row.entry_count == 4
+        assert row.last_payment_date is not None
+
+        # Deleting the payment takes it back out, including the last payment date
+        payment = db.query(LedgerEntry).filter(LedgerEntry.transaction_type == TransactionType.PAYMENT).one()
+        response = client.delete(f"/api/account/transactions/{payment.id}", headers=auth_headers_admin)
+        assert response.status_code == 204
+        db.expire_all()
+        row = db.query(UserAccountBalance).filter(UserAccountBalance.user_id == livery_user.id).one()
+        assert row.balance == Decimal("25.50")
+        assert row.total_payments == Decimal("100.00")
+        assert row.entry_count == 3
+        assert row.last_payment_date is None
+
+        assert reconcile_account_balances(db, rebuild=False) == []
+
+    def test_list_accounts_sorted_by_balance(self, client, livery_user, admin_user, auth_headers_admin, db):
+        from app.models.user import User, UserRole
+        from app.utils.auth import get_password_hash
+
+        other = User(username="livery2", email="livery2@example.com", name="Second Livery",
+                     password_hash=get_password_hash("password123"), role=UserRole.LIVERY, is_active=True)
+        quiet = User(username="livery3", email="livery3@example.com", name="No Entries",
+                     password_hash=get_password_hash("password123"), role=UserRole.LIVERY, is_active=True)
+        db.add_all([other, quiet])
+        db.commit()
+        _charge(client, auth_headers_admin, livery_user.id, "10.00")
+        _charge(client, auth_headers_admin, other.id, "40.00")
+
+        response = client.get("/api/account/users", headers=auth_headers_admin)
+        assert response.status_code == 200
+        data = response.json()
+        assert [a["user_id"] for a in data] == [other.id, livery_user.id, quiet.id]
+        assert data[0]["transaction_count"] == 1
+        assert Decimal(data[2]["balance"]) == Decimal("0")
+
+    def test_reconcile_reports_and_repairs_drift(self, db, livery_user, admin_user):
+        db.add(LedgerEntry(user_id=livery_user.id, transaction_type=TransactionType.PACKAGE_CHARGE,
+                           amount=Decimal("200.00"), description="Package", created_by_id=admin_user.id))
+        db.commit()
+
+        # Simulate a write that bypassed the ORM
+        db.query(UserAccountBalance).update({"balance": Decimal("1.00")}, synchronize_session=False)
+        db.commit()
+
+        drift = reconcile_account_balances(db)
+        db.commit()
+        assert [(d.user_id, d.fields) for d in drift] == [(livery_user.id, ["balance"])]
+
+        row = db.query(UserAccountBalance).filter(UserAccountBalance.user_id == livery_user.id).one()
+        assert row.balance == Decimal("200.00")
+        assert reconcile_account_balances(db, rebuild=False) == []
+
+    def test_list_accounts_requires_admin(self, client, auth_headers_livery):
+        response = client.get("/api/account/users", headers=auth_headers_livery)
+        assert response.status_code == 403
+
+
+class TestAgedDebt:
+    def _entry(self, db, user, admin, amount, when, transaction_type=TransactionType.SERVICE_CHARGE, **kwargs):
+        entry = LedgerEntry(user_id=user.id, transaction_type=transaction_type, amount=Decimal(amount),
+                            description="Entry", transaction_date=when, created_by_id=admin.id, **kwargs)
+        db.add(entry)
+        db.commit()
+        return entry
+
+    def test_payments_allocated_oldest_first_as_of_date(self, client, db, livery_user, admin_user, auth_headers_admin):
+        self._entry(db, livery_user, admin_user, "100.00", datetime(2025, 2, 1, 10))
+        self._entry(db, livery_user, admin_user, "50.00", datetime(2025, 5, 10, 10))
+        self._entry(db, livery_user, admin_user, "30.00", datetime(2025, 6, 20, 10))
+        self._entry(db, livery_user, admin_user, "-120.00", datetime(2025, 6, 25, 10), TransactionType.PAYMENT)
+        voided = self._entry(db, livery_user, admin_user, "500.00", datetime(2025, 6, 1, 10),
+                             voided=True, voided_at=datetime(2025, 7, 5, 9))
+        self._entry(db, livery_user, admin_user, "-500.00", datetime(2025, 7, 5, 9), TransactionType.ADJUSTMENT,
+                    original_entry_id=voided.id)
+
+        # Before the void the charge is still owed
+        response = client.get("/api/account/reports/aged-debt", params={"as_of_date": "2025-06-30"},
+                              headers=auth_headers_admin)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["as_of_date"] == "2025-06-30"
+        account = data["accounts"][0]
+        assert Decimal(account["month_3_plus"]) == Decimal("0")
+        assert Decimal(account["month_1"]) == Decimal("30.00")
+        assert Decimal(account["current"]) == Decimal("530.00")
+        assert Decimal(account["total"]) == Decimal("560.00")
+        assert account["last_payment_date"] == "2025-06-25"
+
+        response = client.get("/api/account/reports/aged-debt", params={"as_of_date": "2025-07-10"},
+                              headers=auth_headers_admin)
+        account = response.json()["accounts"][0]
+        assert Decimal(account["month_2"]) == Decimal("30.00")
+        assert Decimal(account["current"]) == Decimal("30.00")
+        assert Decimal(account["total"]) == Decimal("60.00")
+
+    def test_overpayment_shows_as_credit(self, client, db, livery_user, admin_user, auth_headers_admin):
+        self._entry(db, livery_user, admin_user, "10.00", datetime(2025, 1, 10))
+        self._entry(db, livery_user, admin_user, "-25.00", datetime(2025, 1, 20), TransactionType.PAYMENT)
+
+        response = client.get("/api/account/reports/aged-debt/csv", params={"as_of_date": "2025-03-01"},
+                              headers=auth_headers_admin)
+        assert response.status_code == 200
+        assert "aged_debt_2025-03-01.csv" in response.headers["content-disposition"]
+        rows = response.text.strip().splitlines()
+        assert rows[1].split(",")[2:7] == ["-15.00", "0.00", "0.00", "0.00", "-15.00"]
+
+
+class TestIncomeSummary:
+    def _rollups(self, db):
+        db.expire_all()
+        return {
+            (row.year, row.month, row.transaction_type): (Decimal(row.amount), row.entry_count)
+            for row in db.query(MonthlyIncomeRollup).all() if row.entry_count
+        }
+
+    def _ledger_totals(self, db):
+        return {
+            (int(row.year), int(row.month), row.transaction_type): (Decimal(row.amount), row.entry_count)
+            for row in db.execute(income_totals_query())
+        }
+
+    def _ledger(self, client, headers, user_id):
+        _charge(client, headers, user_id, "100.00", transaction_date="2025-01-10T10:00:00")
+        voided = _charge(client, headers, user_id, "50.00", transaction_date="2025-01-20T10:00:00")
+        _charge(client, headers, user_id, "200.00", transaction_type="package_charge",
+                transaction_date="2025-02-05T10:00:00")
+        _charge(client, headers, user_id, "-80.00", transaction_type="payment",
+                transaction_date="2025-02-10T10:00:00")
+        removed = _charge(client, headers, user_id, "30.00", transaction_date="2025-03-20T10:00:00")
+
+        response = client.post(f"/api/account/transactions/{voided['id']}/void",
+                               json={"reason": "Duplicate"}, headers=headers)
+        assert response.status_code == 200
+        response = client.delete(f"/api/account/transactions/{removed['id']}", headers=headers)
+        assert response.status_code == 204
+
+    def test_rollup_follows_ledger_writes(self, client, db, livery_user, auth_headers_admin):
+        self._ledger(client, auth_headers_admin, livery_user.id)
+
+        rollups = self._rollups(db)
+        assert rollups == self._ledger_totals(db)
+        assert rollups[(2025, 1, TransactionType.SERVICE_CHARGE)] == (Decimal("100.00"), 1)
+        assert (2025, 3, TransactionType.SERVICE_CHARGE) not in rollups
+
+        recompute_income_rollups(db.connection())
+        assert self._rollups(db) == rollups
+
+    def test_report_combines_rollup_and_live_months(self, client, db, livery_user, auth_headers_admin):
+        self._ledger(client, auth_headers_admin, livery_user.id)
+
+        response = client.get("/api/account/reports/income-summary",
+                              params={"from_date": "2025-01-01", "to_date": "2025-03-31"},
+                              headers=auth_headers_admin)
+        assert response.status_code == 200
+        data = response.json()
+        assert Decimal(data["total_charges"]) == Decimal("300.00")
+        assert Decimal(data["total_payments"]) == Decimal("80.00")
+        assert Decimal(data["total_income"]) == Decimal("220.00")
+        by_type = {item["transaction_type"]: (Decimal(item["amount"]), item["count"]) for item in data["by_type"]}
+        assert by_type == {
+            "package_charge": (Decimal("200.00"), 1),
+            "service_charge": (Decimal("100.00"), 1),
+            "payment": (Decimal("-80.00"), 1),
+        }
+        assert [(m["month_label"], Decimal(m["total"])) for m in data["by_month"]] == [
+            ("January 2025", Decimal("100.00")), ("February 2025", Decimal("120.00"))
+        ]
+
+        # Closed months come from the rollup; the partial January is computed live
+        db.query(MonthlyIncomeRollup).filter(MonthlyIncomeRollup.month == 2).update(
+            {MonthlyIncomeRollup.amount: MonthlyIncomeRollup.amount * 2}, synchronize_session=False
+        )
+        db.commit()
+        data = client.get("/api/account/reports/income-summary",
+                          params={"from_date": "2025-01-10", "to_date": "2025-02-28"},
+                          headers=auth_headers_admin).json()
+        assert [(m["month_label"], Decimal(m["total"])) for m in data["by_month"]] == [
+            ("January 2025", Decimal("100.00")), ("February 2025", Decimal("240.00"))
+        ]
+
+        response = client.get("/api/account/reports/income-summary/csv",
+                              params={"from_date": "2025-01-10", "to_date": "2025-02-28"},
+                              headers=auth_headers_admin)
+        assert response.status_code == 200
+        assert "February 2025,240.00" in response.text
+
+
+class TestDocumentNumbers:
+    def _pay(self, client, headers, user_id, amount="10.00"):
+        response = client.post("/api/account/payments", json={
+            "user_id": user_id,
+            "amount": amount,
+            "payment_method": "cash"
+        }, headers=headers)
+        assert response.status_code == 201
+        return response.json()["receipt_number"]
+
+    def test_receipts_continue_after_existing_numbers(self, client, db, livery_user, admin_user,
+                                                      auth_headers_admin):
+        year = datetime.utcnow().year
+        db.add(LedgerEntry(user_id=livery_user.id, transaction_type=TransactionType.PAYMENT,
+                           amount=Decimal("-5.00"), description="Imported", receipt_number=f"REC-{year}-0009",
+                           created_by_id=admin_user.id))
+        db.commit()
+
+        assert self._pay(client, auth_headers_admin, livery_user.id) == f"REC-{year}-0010"
+        assert self._pay(client, auth_headers_admin, livery_user.id) == f"REC-{year}-0011"
+        sequence = db.query(DocumentSequence).filter_by(prefix=RECEIPT_PREFIX, year=year).one()
+        assert sequence.last_number == 11
+
+    def test_rolled_back_number_is_reissued(self, db):
+        assert next_document_number(db, RECEIPT_PREFIX, 2025) == "REC-2025-0001"
+        db.commit()
+        assert next_document_number(db, RECEIPT_PREFIX, 2025) == "REC-2025-0002"
+        db.rollback()
+        assert next_document_number(db, RECEIPT_PREFIX, 2025) == "REC-2025-0002"
+        assert next_document_number(db, RECEIPT_PREFIX, 2026) == "REC-2026-0001"
+
+    def test_invoice_numbers(self, client, livery_user, auth_headers_admin):
+        numbers = []
+        for _ in range(2):
+            response = client.post("/api/invoices/generate", json={
+                "user_id": livery_user.id,
+                "period_start": "2025-01-01",
+                "period_end": "2025-01-31",
+                "due_date": "2025-02-14",
+                "auto_populate": False
+            }, headers=auth_headers_admin)
+            assert response.status_code == 200
+            numbers.append(response.json()["invoice_number"])
+        year = date.today().year
+        assert numbers == [f"INV-{year}-0001", f"INV-{year}-0002"]
+
+
+class TestCsvExports:
+    def test_iter_csv_chunks_and_gzip(self):
+        rows = [["id", "name"]] + [[i, f"Row {i}"] for i in range(1200)]
+        chunks = list(iter_csv(rows, rows_per_chunk=500))
+        assert len(chunks) == 3
+        text = b"".join(chunks).decode("utf-8")
+        assert list(csv.reader(io.StringIO(text))) == [[str(v) for v in row] for row in rows]
+        assert gzip.decompress(b"".join(gzip_chunks(iter(chunks)))).decode("utf-8") == text
+
+    def test_transactions_csv_streams_and_gzips(self, client, livery_user, auth_headers_admin):
+        for i in range(3):
+            _charge(client, auth_headers_admin, livery_user.id, f"{i + 1}.00", description=f"Charge, {i}",
+                    transaction_date=f"2025-01-0{i + 1}T10:00:00")
+        url = f"/api/account/users/{livery_user.id}/transactions/csv"
+
+        plain = client.get(url, headers={**auth_headers_admin, "Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        assert "content-encoding" not in plain.headers
+        rows = list(csv.reader(io.StringIO(plain.text)))
+        assert rows[0][0] == "Date"
+        assert [row[2] for row in rows[1:]] == ["Charge, 0", "Charge, 1", "Charge, 2"]
+
+        with client.stream("GET", url, params={"from_date": "2025-01-02"},
+                           headers={**auth_headers_admin, "Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            raw = b"".join(response.iter_raw())
+        rows = list(csv.reader(io.StringIO(gzip.decompress(raw).decode("utf-8"))))
+        assert [row[3] for row in rows[1:]] == ["2.00", "3.00"]
+
+    def test_aged_debt_csv_totals(self, client, livery_user, auth_headers_admin):
+        _charge(client, auth_headers_admin, livery_user.id, "40.00", transaction_date="2025-01-10T10:00:00")
+        response = client.get("/api/account/reports/aged-debt/csv", params={"as_of_date": "2025-01-31"},
+                              headers=auth_headers_admin)
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[-1] == ["TOTALS", "", "40.00", "0.00", "0.00", "0.00", "40.00", ""]
+
+
+class TestStatements:
+    def _ledger(self, client, headers, user_id):
+        _charge(client, headers, user_id, "100.00", transaction_date="2024-12-15T10:00:00")
+        _charge(client, headers, user_id, "30.00", description="Farrier", transaction_date="2025-01-05T10:00:00")
+        _charge(client, headers, user_id, "-50.00", transaction_type="payment",
+                transaction_date="2025-01-20T10:00:00")
+
+    def test_load_statements_for_all_livery_clients(self, client, db, livery_user, admin_user,
+                                                    auth_headers_admin):
+        self._ledger(client, auth_headers_admin, livery_user.id)
+        _charge(client, auth_headers_admin, admin_user.id, "99.00", transaction_date="2025-01-05T10:00:00")
+
+        statements = load_statements(db, date(2025, 1, 1), date(2025, 1, 31))
+        assert [s.user_id for s in statements] == [livery_user.id]
+        statement = statements[0]
+        assert statement.opening_balance == Decimal("100.00")
+        assert [(t["description"], t["transaction_type"]) for t in statement.transactions] == [
+            ("Farrier", "service_charge"), ("Livery", "payment")
+        ]
+
+    def test_user_statement_pdf(self, client, livery_user, auth_headers_admin, auth_headers_livery):
+        self._ledger(client, auth_headers_admin, livery_user.id)
+        params = {"from_date": "2025-01-01", "to_date": "2025-01-31"}
+
+        response = client.get(f"/api/account/users/{livery_user.id}/statement/pdf", params=params,
+                              headers=auth_headers_admin)
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+
+        response = client.get("/api/account/my/statement/pdf", params=params, headers=auth_headers_livery)
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+
+    def test_bulk_statements_zip(self, client, livery_user, auth_headers_admin, auth_headers_livery):
+        self._ledger(client, auth_headers_admin, livery_user.id)
+        params = {"from_date": "2025-01-01", "to_date": "2025-01-31"}
+
+        assert client.get("/api/account/statements/zip", params=params,
+                          headers=auth_headers_livery).status_code == 403
+        response = client.get("/api/account/statements/zip", params=params, headers=auth_headers_admin)
+        assert response.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = archive.namelist()
+            assert names == [f"{livery_user.id}_statement_{livery_user.name.replace(' ', '_')}_2025-01-01_2025-01-31.pdf"]
+            assert archive.read(names[0]).startswith(b"%PDF")
+
+    def test_render_statements_in_process_pool(self, client, db, livery_user, auth_headers_admin):
+        self._ledger(client, auth_headers_admin, livery_user.id)
+        statement = load_statements(db, date(2025, 1, 1), date(2025, 1, 31))[0]
+
+        rendered = list(render_statements([statement, statement, statement], max_workers=2))
+        assert len(rendered) == 3
+        assert all(pdf.startswith(b"%PDF") for _, pdf in rendered)
+
+
+class TestPdfCache:
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        cache = PdfCache(str(tmp_path), max_bytes=1024 * 1024)
+        monkeypatch.setattr(pdf_cache_module.pdf_cache, "directory", cache.directory)
+        return cache
+
+    def test_renders_once_per_input(self, cache):
+        calls = []
+
+        def render(**inputs):
+            calls.append(inputs)
+            return b"%PDF " + inputs["title"].encode()
+
+        first = cache.get_or_render("invoice", 1, render, {"title": "A", "amount": Decimal("10.00")})
+        assert cache.get_or_render("invoice", 1, render, {"amount": Decimal("10.00"), "title": "A"}) == first
+        changed = cache.get_or_render("invoice", 1, render, {"title": "A", "amount": Decimal("12.00")})
+        assert changed != first
+        assert len(calls) == 2
+
+        assert cache.invalidate("invoice", 1) == 2
+        assert not os.listdir(cache.directory)
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.max_bytes = 250
+        paths = [cache.put("invoice", i, f"key{i}", b"x" * 100) for i in range(2)]
+        os.utime(paths[0], (1, 1))
+        os.utime(paths[1], (2, 2))
+        assert cache.get("invoice", 0, "key0") == paths[0]  # now the most recently used
+
+        newest = cache.put("invoice", 2, "key2", b"x" * 100)
+        assert sorted(os.listdir(cache.directory)) == sorted(
+            os.path.basename(path) for path in (paths[0], newest)
+        )
+
+    def test_invoice_pdf_served_from_cache(self, client, cache, livery_user, auth_headers_admin):
+        response = client.post("/api/invoices/generate", json={
+            "user_id": livery_user.id,
+            "period_start": "2025-01-01",
+            "period_end": "2025-01-31",
+            "due_date": "2025-02-14",
+            "auto_populate": False,
+            "line_items": [{"description": "Livery", "quantity": "1", "unit_price": "100.00", "amount": "100.00"}]
+        }, headers=auth_headers_admin)
+        assert response.status_code == 200
+        invoice = response.json()
+
+        url = f"/api/invoices/{invoice['id']}/pdf"
+        first = client.get(url, headers=auth_headers_admin)
+        assert first.status_code == 200
+        assert first.content.startswith(b"%PDF")
+        assert f'filename="{invoice["invoice_number"]}.pdf"' in first.headers["content-disposition"]
+        assert len(os.listdir(cache.directory)) == 1
+        assert client.get(url, headers=auth_headers_admin).content == first.content
+
+        assert client.post(f"/api/invoices/{invoice['id']}/cancel", headers=auth_headers_admin).status_code == 200
+        assert not os.listdir(cache.directory)
+
+
+class TestPdfRendering:
+    def test_render_runs_in_pool_and_drains_queue(self, client, db, livery_user, auth_headers_admin):
+        _charge(client, auth_headers_admin, livery_user.id, "30.00", transaction_date="2025-01-05T10:00:00")
+        statement = load_statements(db, date(2025, 1, 1), date(2025, 1, 31))[0]
+
+        pdf = pdf_rendering.render_pdf_blocking(render_statement, statement)
+        assert pdf.startswith(b"%PDF")
+        assert pdf_rendering.pdf_render_queue_depth._value.get() == 0
+
+    def test_full_queue_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(pdf_rendering, "_slots", threading.BoundedSemaphore(1))
+        pdf_rendering._slots.acquire()
+        with pytest.raises(HTTPException) as exc:
+            pdf_rendering.render_pdf_blocking(time.sleep, 0)
+        assert exc.value.status_code == 503
+
+    def test_slow_render_times_out(self, monkeypatch):
+        monkeypatch.setattr(pdf_rendering, "PDF_RENDER_TIMEOUT", 0.05)
+        with pytest.raises(HTTPException) as exc:
+            pdf_rendering.render_pdf_blocking(time.sleep, 2)
+        assert exc.value.status_code == 504
+
+
+class TestBillingRun:
+    def _run(self, client, headers, endpoint):
+        response = client.post(f"/api/billing/{endpoint}", json={"year": 2025, "month": 2}, headers=headers)
+        assert response.status_code == 200
+        return response.json()
+
+    def test_run_bulk_inserts_charges_and_updates_projections(self, client, db, livery_user, livery_package,
+                                                              auth_headers_admin):
+        db.add_all([
+            Horse(owner_id=livery_user.id, name="Thunder", livery_package_id=livery_package.id),
+            Horse(owner_id=livery_user.id, name="Lightning", livery_package_id=livery_package.id,
+                  livery_start_date=date(2025, 2, 15)),
+        ])
+        db.commit()
+
+        preview = self._run(client, auth_headers_admin, "preview")
+        assert preview["total_horses"] == 2
+        assert preview["ledger_entries_created"] == 0
+        assert set(preview["timings"]) == {"load", "calculate", "total"}
+
+        result = self._run(client, auth_headers_admin, "run")
+        assert result["ledger_entries_created"] == 2
+        assert Decimal(result["total_amount"]) == Decimal("715.00") + Decimal("357.50")
+        assert "write" in result["timings"]
+
+        # The bulk insert bypasses the flush hooks, so the projections are maintained explicitly
+        db.expire_all()
+        balance = db.get(UserAccountBalance, livery_user.id)
+        assert balance.balance == Decimal("1072.50")
+        assert balance.entry_count == 2
+        rollup = db.query(MonthlyIncomeRollup).filter_by(transaction_type=TransactionType.PACKAGE_CHARGE).one()
+        assert (rollup.amount, rollup.entry_count) == (Decimal("1072.50"), 2)
+        assert reconcile_account_balances(db) == []
+
+        # A second run finds both horses already billed
+        assert self._run(client, auth_headers_admin, "run")["ledger_entries_created"] == 0
+        assert db.query(LedgerEntry).count() == 2
@@ -2,6 +2,9 @@
 import pytest
 import json
 import os
+import zipfile
+from contextlib import nullcontext
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 from io import BytesIO
 
@@ -9,6 +12,23 @@ from app.models.backup import Backup, BackupSchedule
 from app.models.user import User, UserRole
 from app.models.arena import Arena
 from app.utils.auth import get_password_hash
+from app.models.livery_package import LiveryPackage
+from app.utils.backup import (
+    differential_base, export_database, iter_model_rows, list_backup_files, load_backup_chain,
+    load_backup_file, write_backup_archive
+)
+from app.utils.backup_archive import (
+    MANIFEST_NAME, BackupArchiveError, read_manifest, verify_archive, write_archive
+)
+from app.utils.snapshot_export import parallel_tables
+
+
+@pytest.fixture(autouse=True)
+def backup_dir(tmp_path):
+    """Keep exports written through the API out of the real backups directory."""
+    with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)), \
+            patch('app.routers.backup.BACKUP_DIR', str(tmp_path)):
+        yield tmp_path
 
 
 class TestDataExport:
@@ -42,7 +62,7 @@ class TestDataExport:
         data = response.json()
         assert "filename" in data
         assert data["filename"].startswith("backup_")
-        assert data["filename"].endswith(".json")
+        assert data["filename"].endswith(".zip")
         assert "file_size" in data
         assert data["file_size"] > 0
         assert "entity_counts" in data
@@ -59,6 +79,15 @@ class TestDataExport:
         data = response.json()
         assert data["notes"] == "Pre-update backup"
 
+    def test_iter_model_rows_fetches_in_batches(self, db):
+        """Test rows stream in primary key order across yield_per batches."""
+        db.add_all([Arena(name=f"Arena {i}", is_active=True) for i in range(7)])
+        db.commit()
+
+        rows = list(iter_model_rows(db, Arena, yield_per=3))
+        assert [row["name"] for row in rows] == [f"Arena {i}" for i in range(7)]
+        assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
 
 class TestDataExportList:
     """Tests for listing data exports - GET /api/backup/list."""
@@ -88,6 +117,207 @@ class TestDataExportList:
         assert len(data["backups"]) >= 1
 
 
+class TestBackupArchive:
+    """Tests for the compressed, checksummed backup archive format."""
+
+    def _archive(self, db, tmp_path):
+        db.add_all([Arena(name=f"Arena {i}", is_active=True, price_per_hour=20 + i) for i in range(3)])
+        db.commit()
+        with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)):
+            return write_backup_archive(db, "backup.zip", metadata={"exported_by": "Admin"})
+
+    def test_archive_round_trips_export(self, db, admin_user, tmp_path):
+        """Test an archive loads back to the same data as export_database."""
+        filepath, entity_counts = self._archive(db, tmp_path)
+        data, expected_counts = export_database(db)
+        assert entity_counts == expected_counts
+
+        with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)):
+            loaded = load_backup_file("backup.zip")
+        assert loaded.pop("_metadata")["exported_by"] == "Admin"
+        assert loaded == json.loads(json.dumps(data))
+        assert all("password_hash" not in user for user in loaded["users"])
+        assert verify_archive(filepath) == []
+
+    def test_unreadable_archive_still_listed(self, db, admin_user, tmp_path):
+        """Test listing backups reports an unreadable archive instead of failing."""
+        self._archive(db, tmp_path)
+        (tmp_path / "broken.zip").write_bytes(b"not a zip")
+
+        files = {entry["filename"]: entry for entry in list_backup_files()}
+        assert files["backup.zip"]["entity_counts"]["arenas"] == 3
+        assert "error" not in files["backup.zip"]
+        assert "Not a backup archive" in files["broken.zip"]["error"]
+
+    def test_manifest_read_without_table_data(self, db, admin_user, tmp_path):
+        """Test the manifest is stored uncompressed and describes every table."""
+        filepath, _ = self._archive(db, tmp_path)
+        with zipfile.ZipFile(filepath) as archive:
+            assert archive.getinfo(MANIFEST_NAME).compress_type == zipfile.ZIP_STORED
+            assert archive.getinfo("tables/arenas.ndjson").compress_type == zipfile.ZIP_DEFLATED
+
+        manifest = read_manifest(filepath)
+        assert manifest["tables"]["arenas"]["rows"] == 3
+        assert len(manifest["tables"]["arenas"]["sha256"]) == 64
+        assert manifest["metadata"] == {"exported_by": "Admin"}
+
+    def test_tampered_table_fails_checksum(self, tmp_path):
+        """Test a table whose content does not match the manifest is rejected."""
+        tables = [("users", iter([{"username": "a"}])), ("arenas", iter([]))]
+        manifest = write_archive(str(tmp_path / "original.zip"), tables)
+        tampered = str(tmp_path / "tampered.zip")
+        with zipfile.ZipFile(tampered, "w") as archive:
+            archive.writestr("tables/users.ndjson", '{"username": "b"}\n')
+            archive.writestr("tables/arenas.ndjson", "")
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest))
+
+        assert verify_archive(tampered) == ["Checksum mismatch in the users table"]
+        with pytest.raises(BackupArchiveError):
+            load_backup_file(tampered)
+
+    def test_validate_and_import_archive(self, client, auth_headers_admin, db, admin_user, tmp_path):
+        """Test archives can be validated from the manifest and imported."""
+        filepath, _ = self._archive(db, tmp_path)
+        with open(filepath, "rb") as f:
+            content = f.read()
+
+        files = {"file": ("backup.zip", content, "application/zip")}
+        response = client.post("/api/backup/validate", files=files, headers=auth_headers_admin)
+        assert response.status_code == 200
+        assert response.json()["is_valid"] is True
+        assert response.json()["entity_counts"]["arenas"] == 3
+
+        files = {"file": ("backup.zip", content, "application/zip")}
+        response = client.post("/api/backup/import", files=files, headers=auth_headers_admin)
+        assert response.status_code == 200
+
+
+class TestDifferentialBackup:
+    """Tests for differential backups against a full backup's watermarks."""
+
+    def _full_backup(self, db, tmp_path):
+        # Last changed well before the full backup's watermark
+        db.add_all([
+            LiveryPackage(name=f"Package {i}", price_display="£100", updated_at=datetime.utcnow() - timedelta(hours=i + 1))
+            for i in range(3)
+        ])
+        db.commit()
+        with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)):
+            write_backup_archive(db, "full.zip")
+
+    def test_differential_replays_to_current_data(self, db, admin_user, tmp_path):
+        """Test a differential holds only changed rows and replays to the current data."""
+        self._full_backup(db, tmp_path)
+        packages = db.query(LiveryPackage).order_by(LiveryPackage.id).all()
+        packages[0].name = "Renamed"
+        db.delete(packages[2])
+        db.add(LiveryPackage(name="New", price_display="£120"))
+        db.commit()
+
+        with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)):
+            write_backup_archive(db, "diff.zip", base="full.zip")
+            loaded = load_backup_file("diff.zip")
+
+        manifest = read_manifest(str(tmp_path / "diff.zip"))
+        assert manifest["kind"] == "differential"
+        assert manifest["base"]["filename"] == "full.zip"
+        assert manifest["tables"]["livery_packages"]["rows"] == 2
+
+        data, _ = export_database(db)
+        loaded.pop("_metadata")
+        assert loaded == json.loads(json.dumps(data))
+        assert [p["name"] for p in loaded["livery_packages"]] == ["Renamed", "Package 1", "New"]
+
+    def test_differential_keeps_ledger_edits(self, db, admin_user, tmp_path):
+        """Test in-place ledger edits, which stamp no column, reach a differential."""
+        from app.models.account import LedgerEntry, TransactionType
+        entry = LedgerEntry(
+            user_id=admin_user.id, transaction_type=TransactionType.ADJUSTMENT, amount=40,
+            description="Opening balance", created_by_id=admin_user.id
+        )
+        db.add(entry)
+        db.commit()
+        self._full_backup(db, tmp_path)
+        entry.description = "Opening balance (corrected)"
+        entry.notes = "Typo"
+        db.commit()
+
+        with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)):
+            write_backup_archive(db, "diff.zip", base="full.zip")
+            loaded = load_backup_file("diff.zip")
+
+        [restored] = loaded["ledger_entries"]
+        assert restored["description"] == "Opening balance (corrected)"
+        assert restored["notes"] == "Typo"
+
+    def test_differential_base_selection(self, db, admin_user, tmp_path):
+        """Test scheduled differentials use the latest full backup and chains are checked."""
+        self._full_backup(db, tmp_path)
+        with patch('app.utils.backup.BACKUP_DIR', str(tmp_path)):
+            assert differential_base(db) == "full.zip"
+            assert differential_base(db, max_age_days=0) is None
+
+            write_backup_archive(db, "diff.zip", base="full.zip")
+            assert differential_base(db) == "full.zip"
+            with pytest.raises(BackupArchiveError):
+                write_backup_archive(db, "diff2.zip", base="diff.zip")
+
+            write_backup_archive(db, "other.zip")
+            with pytest.raises(BackupArchiveError):
+                load_backup_chain(["other.zip", "diff.zip"])
+
+
+class TestParallelExport:
+    """Tests for reading export tables on a pool of snapshot sessions."""
+
+    @staticmethod
+    def _readers(sizes):
+        def rows(key, size):
+            return lambda session: iter([{"table": key, "n": n} for n in range(size)])
+        return [(key, rows(key, size)) for key, size in sizes.items()]
+
+    def test_tables_returned_in_order(self):
+        """Test every table's rows come back whole and in order across batches."""
+        sizes = {"a": 7, "b": 0, "c": 12, "d": 1}
+        tables = parallel_tables(self._readers(sizes), 3, lambda: nullcontext(), batch_size=2, read_ahead=1)
+        result = [(key, list(records)) for key, records in tables]
+
+        assert [key for key, _ in result] == list(sizes)
+        for key, records in result:
+            assert records == [{"table": key, "n": n} for n in range(sizes[key])]
+
+    def test_reader_error_raised_on_its_table(self):
+        """Test a failing read surfaces when its table is consumed."""
+        def broken(session):
+            yield {"n": 0}
+            raise RuntimeError("connection lost")
+
+        tables = parallel_tables(
+            self._readers({"a": 3}) + [("b", broken)], 2, lambda: nullcontext(), batch_size=10
+        )
+        key, records = next(tables)
+        assert len(list(records)) == 3
+        key, records = next(tables)
+        with pytest.raises(RuntimeError, match="connection lost"):
+            list(records)
+        tables.close()
+
+    def test_closing_early_stops_workers(self):
+        """Test abandoning an export does not wait on workers blocked on a full queue."""
+        tables = parallel_tables(
+            self._readers({"a": 1000, "b": 1000}), 2, lambda: nullcontext(), batch_size=1, read_ahead=1
+        )
+        key, records = next(tables)
+        next(records)
+        tables.close()
+
+    def test_sequential_fallback_matches(self, db, admin_user):
+        """Test databases without snapshot export read every table on the caller's session."""
+        db.add_all([Arena(name=f"Arena {i}", is_active=True) for i in range(3)])
+        db.commit()
+        assert export_database(db, workers=4) == export_database(db, workers=1)
+
+
 class TestDataExportDownload:
     """Tests for downloading data exports - GET /api/backup/download/{id}."""
 
@@ -115,6 +345,23 @@ class TestDataExportDelete:
         response = client.delete("/api/backup/999", headers=auth_headers_admin)
         assert response.status_code == 404
 
+    def test_delete_full_backup_with_differential(self, client, auth_headers_admin, db, admin_user, tmp_path):
+        """Test a full backup cannot be deleted while a differential depends on it."""
+        write_backup_archive(db, "full.zip")
+        write_backup_archive(db, "diff.zip", base="full.zip")
+        full, diff = Backup(filename="full.zip"), Backup(filename="diff.zip")
+        db.add_all([full, diff])
+        db.commit()
+
+        response = client.delete(f"/api/backup/{full.id}", headers=auth_headers_admin)
+        assert response.status_code == 409
+        assert "diff.zip" in response.json()["detail"]
+        assert (tmp_path / "full.zip").exists()
+
+        assert client.delete(f"/api/backup/{diff.id}", headers=auth_headers_admin).status_code == 200
+        assert client.delete(f"/api/backup/{full.id}", headers=auth_headers_admin).status_code == 200
+        assert not (tmp_path / "full.zip").exists()
+
 
 class TestDataImportValidation:
     """Tests for validating import files - POST /api/backup/validate."""
@@ -201,6 +448,74 @@ class TestDataImport:
         assert data["entity_counts"].get("users", 0) >= 1
 
 
+class TestBulkImport:
+    """Tests for import_database resolving references from preloaded maps."""
+
+    SEED = {
+        "users": [
+            {"username": "owner1", "email": "owner1@example.com", "name": "Owner One",
+             "role": "livery", "password": "testpass123"},
+            {"username": "owner2", "email": "owner2@example.com", "name": "Owner Two",
+             "role": "livery", "password": "testpass123"},
+        ],
+        "horses": [
+            {"name": "Bramble", "owner_username": "owner1"},
+            {"name": "Bramble", "owner_username": "owner2"},
+        ],
+        "fields": [{"name": "Top Paddock"}],
+        "turnout_groups": [
+            {"field_name": "Top Paddock", "assigned_by_username": "owner1", "horses": [
+                {"horse_name": "Bramble", "owner_username": "owner2"},
+                {"horse_name": "Missing", "owner_username": "owner2"},
+            ]},
+        ],
+        "ledger_entries": [
+            {"user_username": "owner1", "transaction_type": "adjustment", "amount": 40,
+             "description": "Opening balance"},
+            {"user_username": "owner1", "transaction_type": "payment", "amount": -15,
+             "description": "Payment"},
+        ],
+    }
+
+    def _import(self, db):
+        from app.utils.backup import import_database
+        counts = import_database(db, self.SEED, validate=False, log=lambda message: None)
+        db.commit()
+        return counts
+
+    def test_references_resolved_from_maps(self, db):
+        from app.models.field import Field, TurnoutGroup, TurnoutGroupHorse
+        from app.models.horse import Horse
+        counts = self._import(db)
+
+        assert counts["horses"] == 2
+        assert counts["fields"] == 1
+        owner2 = db.query(User).filter(User.username == "owner2").one()
+        horse = db.query(Horse).filter(Horse.owner_id == owner2.id).one()
+        group = db.query(TurnoutGroup).one()
+        assert group.field_id == db.query(Field).filter(Field.name == "Top Paddock").one().id
+        assert [row.horse_id for row in db.query(TurnoutGroupHorse)] == [horse.id]
+
+    def test_reimport_skips_existing_rows(self, db):
+        from app.models.horse import Horse
+        self._import(db)
+        counts = self._import(db)
+
+        assert counts["users"] == 0
+        assert counts["horses"] == 0
+        assert counts["fields"] == 0
+        assert db.query(Horse).count() == 2
+
+    def test_ledger_projections_updated(self, db):
+        from app.models.account import UserAccountBalance
+        self._import(db)
+
+        owner1 = db.query(User).filter(User.username == "owner1").one()
+        balance = db.get(UserAccountBalance, owner1.id)
+        assert balance.balance == 25
+        assert balance.entry_count == 2
+
+
 class TestBackupSchedule:
     """Tests for backup schedule configuration."""
 
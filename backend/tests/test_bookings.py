@@ -1,6 +1,8 @@
 import pytest
-from datetime import datetime, timedelta
-from app.models.booking import BookingType, PaymentStatus
+from datetime import datetime, timedelta, date, time
+from unittest.mock import patch
+from app.models.booking import Booking, BookingType, BookingStatus, PaymentStatus
+from app.services.arena_usage import clear_usage_cache
 
 
 class TestCreateBooking:
@@ -109,6 +111,26 @@ class TestCreateBooking:
 
         assert response.status_code == 409
 
+    def test_create_booking_partial_overlap_conflict(self, client, arena, public_booking, auth_headers_public):
+        response = client.post("/api/bookings/", json={
+            "arena_id": arena.id,
+            "title": "Overlapping Booking",
+            "start_time": (public_booking.start_time + timedelta(minutes=30)).isoformat(),
+            "end_time": (public_booking.end_time + timedelta(minutes=30)).isoformat()
+        }, headers=auth_headers_public)
+
+        assert response.status_code == 409
+
+    def test_create_booking_back_to_back_allowed(self, client, arena, public_booking, auth_headers_public):
+        response = client.post("/api/bookings/", json={
+            "arena_id": arena.id,
+            "title": "Following Booking",
+            "start_time": public_booking.end_time.isoformat(),
+            "end_time": (public_booking.end_time + timedelta(hours=1)).isoformat()
+        }, headers=auth_headers_public)
+
+        assert response.status_code == 201
+
     def test_create_booking_invalid_times(self, client, arena, auth_headers_public):
         start = (datetime.utcnow() + timedelta(days=2)).isoformat()
         end = (datetime.utcnow() + timedelta(days=1)).isoformat()
@@ -151,6 +173,84 @@ class TestListBookings:
         assert len(data) == 1
 
 
+class TestBookingCalendar:
+    def _range(self):
+        start = datetime.utcnow()
+        return {"start_date": start.isoformat(), "end_date": (start + timedelta(days=7)).isoformat()}
+
+    def test_calendar_keyset_pagination(self, client, db, arena, admin_user, auth_headers_admin):
+        base = datetime.combine(date.today() + timedelta(days=3), time(9, 0))
+        for i in range(3):
+            db.add(Booking(
+                arena_id=arena.id,
+                user_id=admin_user.id,
+                title=f"Slot {i}",
+                start_time=base + timedelta(hours=i),
+                end_time=base + timedelta(hours=i, minutes=45),
+                booking_type=BookingType.MAINTENANCE,
+                payment_status=PaymentStatus.NOT_REQUIRED
+            ))
+        db.commit()
+
+        response = client.get("/api/bookings/calendar", params={**self._range(), "limit": 2}, headers=auth_headers_admin)
+        assert response.status_code == 200
+        page = response.json()
+        assert [b["title"] for b in page["items"]] == ["Slot 0", "Slot 1"]
+        assert page["next_cursor"]
+
+        response = client.get(
+            "/api/bookings/calendar",
+            params={**self._range(), "limit": 2, "cursor": page["next_cursor"]},
+            headers=auth_headers_admin
+        )
+        page = response.json()
+        assert [b["title"] for b in page["items"]] == ["Slot 2"]
+        assert page["next_cursor"] is None
+
+    def test_calendar_etag_not_modified(self, client, public_booking, auth_headers_admin):
+        params = self._range()
+        response = client.get("/api/bookings/calendar", params=params, headers=auth_headers_admin)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+
+        response = client.get(
+            "/api/bookings/calendar",
+            params=params,
+            headers={**auth_headers_admin, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+    def test_calendar_etag_changes_on_edit(self, client, public_booking, auth_headers_admin):
+        params = self._range()
+        etag = client.get("/api/bookings/calendar", params=params, headers=auth_headers_admin).headers["etag"]
+
+        client.put(f"/api/bookings/{public_booking.id}/cancel", headers=auth_headers_admin)
+
+        response = client.get(
+            "/api/bookings/calendar",
+            params=params,
+            headers={**auth_headers_admin, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
+    def test_calendar_hides_details_from_other_users(self, client, public_booking, auth_headers_livery):
+        response = client.get("/api/bookings/calendar", params=self._range(), headers=auth_headers_livery)
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert item["title"] == "Booked"
+        assert "user_name" not in item
+
+    def test_calendar_invalid_cursor(self, client, auth_headers_admin):
+        response = client.get(
+            "/api/bookings/calendar",
+            params={**self._range(), "cursor": "not-a-cursor"},
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 400
+
+
 class TestDeleteBooking:
     def test_delete_own_booking(self, client, public_booking, auth_headers_public):
         response = client.delete(f"/api/bookings/{public_booking.id}", headers=auth_headers_public)
@@ -175,3 +275,137 @@ class TestPublicBookings:
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
+
+
+class TestProcessPendingBookings:
+    def _pending(self, db, arena, user, title, start, end, created_at):
+        booking = Booking(
+            arena_id=arena.id,
+            user_id=user.id,
+            title=title,
+            start_time=start,
+            end_time=end,
+            booking_type=BookingType.LIVERY,
+            booking_status=BookingStatus.PENDING,
+            payment_status=PaymentStatus.NOT_REQUIRED,
+            created_at=created_at
+        )
+        db.add(booking)
+        db.commit()
+        db.refresh(booking)
+        return booking
+
+    def test_overlapping_pending_first_come_first_served(self, client, db, arena, livery_user, auth_headers_admin):
+        start = datetime.combine(date.today() + timedelta(days=1), time(10, 0))
+        now = datetime.utcnow()
+        first = self._pending(db, arena, livery_user, "First", start, start + timedelta(hours=1), now - timedelta(hours=2))
+        second = self._pending(db, arena, livery_user, "Second", start + timedelta(minutes=30), start + timedelta(hours=2), now - timedelta(hours=1))
+        third = self._pending(db, arena, livery_user, "Third", start + timedelta(hours=1), start + timedelta(hours=2), now)
+
+        response = client.post("/api/bookings/process-pending", headers=auth_headers_admin)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed"] == 3
+        assert data["confirmed"] == 2
+        assert data["arenas"][0]["confirmed_booking_ids"] == [first.id, third.id]
+        assert data["arenas"][0]["skipped_booking_ids"] == [second.id]
+
+        db.refresh(second)
+        assert second.booking_status == BookingStatus.PENDING
+
+    def test_pending_blocked_by_confirmed(self, client, db, arena, livery_user, auth_headers_admin):
+        start = datetime.combine(date.today() + timedelta(days=1), time(14, 0))
+        db.add(Booking(
+            arena_id=arena.id,
+            user_id=livery_user.id,
+            title="Confirmed",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            booking_type=BookingType.LIVERY,
+            booking_status=BookingStatus.CONFIRMED,
+            payment_status=PaymentStatus.NOT_REQUIRED
+        ))
+        db.commit()
+        self._pending(db, arena, livery_user, "Clash", start, start + timedelta(hours=1), datetime.utcnow())
+
+        response = client.post("/api/bookings/process-pending", headers=auth_headers_admin)
+        assert response.status_code == 200
+        assert response.json()["confirmed"] == 0
+
+    def test_process_pending_requires_admin(self, client, auth_headers_livery):
+        response = client.post("/api/bookings/process-pending", headers=auth_headers_livery)
+        assert response.status_code == 403
+
+
+class TestArenaUsageReport:
+    @pytest.fixture(autouse=True)
+    def fresh_usage_cache(self):
+        # Closed-period usage is memoised per process
+        clear_usage_cache()
+        yield
+        clear_usage_cache()
+
+    def _add_past_booking(self, db, arena, user):
+        start = datetime(date.today().year - 1, 11, 3, 10, 0)
+        booking = Booking(
+            arena_id=arena.id, user_id=user.id, title="Past Booking",
+            start_time=start, end_time=start + timedelta(hours=1),
+            booking_type=BookingType.PUBLIC, payment_status=PaymentStatus.NOT_REQUIRED
+        )
+        db.add(booking)
+        db.commit()
+        return booking
+
+    def _previous_year_hours(self, client, headers):
+        response = client.get("/api/bookings/reports/usage", headers=headers)
+        return response.json()["previous_year"]["total_hours"]
+
+    def test_usage_report_sums_hours_by_type(self, client, db, arena, admin_user, auth_headers_admin):
+        start = datetime(date.today().year - 1, 12, 15, 10, 0)
+        for hours, booking_type in [(2, BookingType.PUBLIC), (1, BookingType.PUBLIC), (3, BookingType.EVENT)]:
+            db.add(Booking(
+                arena_id=arena.id,
+                user_id=admin_user.id,
+                title="Past Booking",
+                start_time=start,
+                end_time=start + timedelta(hours=hours),
+                booking_type=booking_type,
+                payment_status=PaymentStatus.NOT_REQUIRED
+            ))
+        db.commit()
+
+        response = client.get("/api/bookings/reports/usage", headers=auth_headers_admin)
+        assert response.status_code == 200
+        year = response.json()["previous_year"]
+        assert year["total_hours"] == 6.0
+        usage = {u["booking_type"]: u for u in year["arena_summaries"][0]["usage_by_type"]}
+        assert usage["public"]["total_hours"] == 3.0
+        assert usage["public"]["booking_count"] == 2
+        assert usage["event"]["total_hours"] == 3.0
+        assert usage["livery"]["booking_count"] == 0
+
+    def test_usage_cache_expires(self, client, db, arena, admin_user, auth_headers_admin):
+        self._add_past_booking(db, arena, admin_user)
+        assert self._previous_year_hours(client, auth_headers_admin) == 1.0
+
+        # Written without invalidating: memoised until the TTL passes
+        self._add_past_booking(db, arena, admin_user)
+        assert self._previous_year_hours(client, auth_headers_admin) == 1.0
+        clear_usage_cache()
+        with patch("app.services.arena_usage.USAGE_CACHE_SECONDS", 0):
+            assert self._previous_year_hours(client, auth_headers_admin) == 2.0
+            self._add_past_booking(db, arena, admin_user)
+            assert self._previous_year_hours(client, auth_headers_admin) == 3.0
+
+    def test_cancel_unpaid_booking_updates_usage(self, client, db, arena, admin_user, auth_headers_admin):
+        self._add_past_booking(db, arena, admin_user)
+        booking = self._add_past_booking(db, arena, admin_user)
+        assert self._previous_year_hours(client, auth_headers_admin) == 2.0
+
+        response = client.delete(f"/api/payments/cancel/{booking.id}")
+        assert response.status_code == 200
+        assert self._previous_year_hours(client, auth_headers_admin) == 1.0
+
+    def test_usage_report_requires_admin(self, client, auth_headers_livery):
+        response = client.get("/api/bookings/reports/usage", headers=auth_headers_livery)
+        assert response.status_code == 403
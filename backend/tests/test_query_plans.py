@@ -0,0 +1,208 @@
+"""Query plan regression checks for hot-path queries.
+
+Each query mirrors a router or service filter that has a supporting
+composite index. The tables are seeded, analysed, and planned with
+sequential scans disabled, and each plan must read through the composite
+index added for it (the foreign key indexes alone would avoid a Seq Scan
+too), so a dropped or mismatched index fails here.
+
+Only runs against PostgreSQL (DATABASE_URL=postgresql://...).
+"""
+import os
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.account import LedgerEntry, TransactionType
+from app.models.field import Field, TurnoutGroup
+from app.models.health_record import WormingRecord
+from app.models.staff_management import (
+    Timesheet, TimesheetStatus, HolidayRequest, LeaveStatus
+)
+from app.models.task import YardTask, TaskCategory, TaskStatus, HealthTaskType
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL", "").startswith("postgresql"),
+    reason="Query plans are only checked on PostgreSQL"
+)
+
+SEED_ROWS = 2000
+START = date(2024, 1, 1)
+TODAY = date(2025, 6, 1)
+
+
+@pytest.fixture
+def seeded(db, admin_user, staff_user, livery_user, horse):
+    """Bulk-load enough rows per table for the planner to consider indexes."""
+    field = Field(name="Top Paddock")
+    db.add(field)
+    db.flush()
+
+    days = [START + timedelta(days=i % 600) for i in range(SEED_ROWS)]
+    task_statuses = list(TaskStatus)
+    db.execute(insert(LedgerEntry), [{
+        "user_id": (livery_user.id, staff_user.id)[i % 2],
+        "transaction_type": TransactionType.SERVICE_CHARGE if i % 3 else TransactionType.PAYMENT,
+        "amount": Decimal("10.00") if i % 3 else Decimal("-10.00"),
+        "description": "Seed",
+        "voided": i % 50 == 0,
+        "transaction_date": datetime.combine(day, time(9)),
+        "created_by_id": admin_user.id,
+    } for i, day in enumerate(days)])
+    db.execute(insert(YardTask), [{
+        "title": "Seed task",
+        "category": TaskCategory.MAINTENANCE,
+        "reported_by_id": admin_user.id,
+        "status": task_statuses[i % len(task_statuses)],
+        "scheduled_date": day,
+        "completed_date": datetime.combine(day, time(12)) if i % 4 == 0 else None,
+        "health_task_type": HealthTaskType.MEDICATION if i % 5 == 0 else None,
+    } for i, day in enumerate(days)])
+    db.execute(insert(Timesheet), [{
+        "staff_id": (staff_user.id, admin_user.id)[i % 2],
+        "date": day,
+        "clock_in": time(8),
+        "clock_out": time(16),
+        "status": TimesheetStatus.APPROVED if i % 2 else TimesheetStatus.SUBMITTED,
+    } for i, day in enumerate(days)])
+    db.execute(insert(HolidayRequest), [{
+        "staff_id": (staff_user.id, admin_user.id)[i % 2],
+        "start_date": day,
+        "end_date": day + timedelta(days=2),
+        "days_requested": Decimal("3"),
+        "status": LeaveStatus.APPROVED if i % 2 else LeaveStatus.PENDING,
+    } for i, day in enumerate(days)])
+    db.execute(insert(TurnoutGroup), [{
+        "turnout_date": day,
+        "field_id": field.id,
+        "assigned_by_id": admin_user.id,
+    } for day in days])
+    db.execute(insert(WormingRecord), [{
+        "horse_id": horse.id,
+        "treatment_date": day,
+        "product": "Equest",
+        "worm_count_date": day if i % 2 else None,
+    } for i, day in enumerate(days)])
+    db.commit()
+
+    for table in ("ledger_entries", "yard_tasks", "timesheets", "holiday_requests",
+                  "turnout_groups", "worming_records"):
+        db.execute(text(f"ANALYZE {table}"))
+    db.commit()
+    return {"field": field, "horse": horse, "staff": staff_user, "livery": livery_user}
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _scans(db, statement):
+    """(node type, relation, index name) for every scan in the statement's plan."""
+    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()[0]["Plan"]
+    return [
+        (node["Node Type"], node.get("Relation Name"), node.get("Index Name"))
+        for node in _plan_nodes(plan) if "Relation Name" in node or "Index Name" in node
+    ]
+
+
+# Composite index each hot query should be planned through (add_hot_path_indexes)
+EXPECTED_INDEXES = {
+    "ledger statement": "ix_ledger_entries_user_date",
+    "income summary": "ix_ledger_entries_voided_date",
+    "task rollover": "ix_yard_tasks_status_scheduled",
+    "tasks completed today": "ix_yard_tasks_status_completed",
+    "health tasks in range": "ix_yard_tasks_scheduled_health_type",
+    "staff timesheets": "ix_timesheets_staff_date",
+    "payroll timesheets": "ix_timesheets_status_date",
+    "staff leave overlap": "ix_holiday_requests_staff_dates",
+    "approved leave overlap": "ix_holiday_requests_status_dates",
+    "field usage": "ix_turnout_groups_field_date",
+    "turnout for date": "ix_turnout_groups_date",
+    "latest worming": "ix_worming_records_horse_treatment",
+    "latest worm count": "ix_worming_records_horse_count",
+}
+
+
+def _hot_queries(seeded):
+    day_start = datetime.combine(TODAY, time.min)
+    period_start = TODAY - timedelta(days=30)
+    return {
+        "ledger statement": select(LedgerEntry).where(
+            LedgerEntry.user_id == seeded["livery"].id,
+            LedgerEntry.transaction_date >= datetime.combine(period_start, time.min),
+            LedgerEntry.transaction_date < day_start,
+            LedgerEntry.voided == False
+        ),
+        "income summary": select(LedgerEntry.transaction_type, LedgerEntry.amount).where(
+            LedgerEntry.voided == False,
+            LedgerEntry.transaction_date >= datetime.combine(period_start, time.min),
+            LedgerEntry.transaction_date < day_start
+        ),
+        "task rollover": select(YardTask.id).where(
+            YardTask.status.in_([TaskStatus.OPEN, TaskStatus.IN_PROGRESS]),
+            YardTask.scheduled_date < TODAY
+        ),
+        "tasks completed today": select(YardTask.id).where(
+            YardTask.status == TaskStatus.COMPLETED,
+            YardTask.completed_date >= day_start,
+            YardTask.completed_date < day_start + timedelta(days=1)
+        ),
+        "health tasks in range": select(YardTask.id).where(
+            YardTask.scheduled_date >= TODAY,
+            YardTask.scheduled_date <= TODAY + timedelta(days=7),
+            YardTask.health_task_type.isnot(None)
+        ),
+        "staff timesheets": select(Timesheet).where(
+            Timesheet.staff_id == seeded["staff"].id,
+            Timesheet.date >= period_start,
+            Timesheet.date <= TODAY
+        ),
+        "payroll timesheets": select(Timesheet).where(
+            Timesheet.status == TimesheetStatus.APPROVED,
+            Timesheet.date >= period_start,
+            Timesheet.date <= TODAY
+        ),
+        "staff leave overlap": select(HolidayRequest).where(
+            HolidayRequest.staff_id == seeded["staff"].id,
+            HolidayRequest.start_date <= TODAY,
+            HolidayRequest.end_date >= period_start
+        ),
+        "approved leave overlap": select(HolidayRequest).where(
+            HolidayRequest.status == LeaveStatus.APPROVED,
+            HolidayRequest.start_date <= TODAY,
+            HolidayRequest.end_date >= period_start
+        ),
+        "field usage": select(TurnoutGroup.id).where(
+            TurnoutGroup.field_id == seeded["field"].id,
+            TurnoutGroup.turnout_date >= TODAY - timedelta(days=7)
+        ),
+        "turnout for date": select(TurnoutGroup).where(TurnoutGroup.turnout_date == TODAY),
+        "latest worming": select(WormingRecord).where(
+            WormingRecord.horse_id == seeded["horse"].id
+        ).order_by(WormingRecord.treatment_date.desc()).limit(1),
+        "latest worm count": select(WormingRecord).where(
+            WormingRecord.horse_id == seeded["horse"].id,
+            WormingRecord.worm_count_date.isnot(None)
+        ).order_by(WormingRecord.worm_count_date.desc()).limit(1),
+    }
+
+
+def test_hot_queries_use_indexes(db, seeded):
+    queries = _hot_queries(seeded)
+    assert queries.keys() == EXPECTED_INDEXES.keys()
+
+    regressions = {}
+    for name, statement in queries.items():
+        scans = _scans(db, statement)
+        seq_scans = [relation for node_type, relation, _ in scans if node_type == "Seq Scan"]
+        indexes = {index for _, _, index in scans if index}
+        if seq_scans or EXPECTED_INDEXES[name] not in indexes:
+            regressions[name] = {"seq_scans": seq_scans, "indexes": sorted(indexes)}
+    assert not regressions, f"Hot-path queries not using their composite indexes: {regressions}"
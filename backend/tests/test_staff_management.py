@@ -1162,6 +1162,66 @@ class TestLeaveSummary:
         assert casual_summary["annual_leave_remaining"] is None
 
 
+class TestPayrollSummary:
+    """Tests for the payroll summary."""
+
+    def test_payroll_uses_rate_effective_on_each_date(
+        self, client, db, auth_headers_admin, admin_user, staff_user, second_staff_user
+    ):
+        """Test pay uses the rate history, holiday pro-rating and adjustments."""
+        from app.models.staff_management import PayrollAdjustment, PayrollAdjustmentType
+        from app.models.staff_profile import StaffProfile, HourlyRateHistory
+
+        db.add(StaffProfile(user_id=staff_user.id, hourly_rate=12))
+        db.add_all([
+            HourlyRateHistory(staff_id=staff_user.id, hourly_rate=10, effective_date=date(2025, 1, 1),
+                              created_by_id=admin_user.id),
+            HourlyRateHistory(staff_id=staff_user.id, hourly_rate=12, effective_date=date(2025, 3, 15),
+                              created_by_id=admin_user.id),
+            Timesheet(staff_id=staff_user.id, date=date(2025, 3, 10), clock_in=time(9, 0),
+                      clock_out=time(17, 0), status=TimesheetStatus.APPROVED),
+            Timesheet(staff_id=staff_user.id, date=date(2025, 3, 20), clock_in=time(9, 0),
+                      clock_out=time(13, 0), status=TimesheetStatus.APPROVED),
+            Timesheet(staff_id=staff_user.id, date=date(2025, 3, 21), clock_in=time(9, 0),
+                      clock_out=time(17, 0), status=TimesheetStatus.DRAFT),
+            PayrollAdjustment(staff_id=staff_user.id, adjustment_type=PayrollAdjustmentType.TIP, amount=5,
+                              description="Tip", payment_date=date(2025, 3, 28), taxable=False),
+            PayrollAdjustment(staff_id=staff_user.id, adjustment_type=PayrollAdjustmentType.ONEOFF, amount=20,
+                              description="Bonus", payment_date=date(2025, 3, 28), taxable=True),
+            HolidayRequest(staff_id=staff_user.id, start_date=date(2025, 3, 30), end_date=date(2025, 4, 2),
+                           days_requested=4, leave_type=LeaveType.ANNUAL, status=LeaveStatus.APPROVED),
+        ])
+        db.commit()
+
+        response = client.get(
+            "/api/staff/payroll-summary",
+            params={"start_date": "2025-03-01", "end_date": "2025-03-31"},
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 200
+        data = response.json()
+        summaries = {s["staff_id"]: s for s in data["staff_summaries"]}
+
+        staff = summaries[staff_user.id]
+        assert staff["approved_hours"] == 12.0
+        assert staff["timesheet_count"] == 2
+        assert staff["base_pay"] == 128.0  # 8h at 10.00 + 4h at 12.00
+        assert staff["holiday_days"] == 2.0
+        assert staff["holiday_pay"] == 192.0
+        assert staff["adjustments"]["tips_total"] == 5.0
+        assert staff["total_pay"] == 345.0
+        assert staff["taxable_pay"] == 340.0
+        assert staff["non_taxable_pay"] == 5.0
+
+        assert summaries[second_staff_user.id]["total_pay"] == 0.0
+        assert data["total_pay"] == 345.0
+
+    def test_payroll_requires_admin(self, client, auth_headers_staff):
+        """Test that staff cannot view the payroll summary."""
+        response = client.get("/api/staff/payroll-summary", headers=auth_headers_staff)
+        assert response.status_code == 403
+
+
 # ============== Edge Cases and Integration Tests ==============
 
 class TestTimesheetHoursCalculation:
@@ -476,3 +476,261 @@ def test_maintenance_day_assignment_fields(client, db, admin_user, auth_headers_
     assert yard_task.assignment_type == AssignmentType.SPECIFIC
     assert yard_task.is_maintenance_day_task is True
     assert yard_task.status == TaskStatus.OPEN  # Status should remain open
+
+
+# =====================
+# Summary Tests
+# =====================
+
+def test_summary_counts(client, db, admin_user, auth_headers_admin, staff_user):
+    """Test that the summary counters are computed in one pass over open tasks."""
+    from app.routers.tasks import invalidate_summary_cache
+
+    today = date.today()
+    db.add_all([
+        YardTask(title="Urgent today", category=TaskCategory.REPAIRS, priority=TaskPriority.URGENT,
+                 reported_by_id=admin_user.id, assigned_to_id=admin_user.id,
+                 assignment_type=AssignmentType.SPECIFIC, scheduled_date=today, status=TaskStatus.OPEN),
+        YardTask(title="High overdue", category=TaskCategory.REPAIRS, priority=TaskPriority.HIGH,
+                 reported_by_id=admin_user.id, assigned_to_id=staff_user.id,
+                 assignment_type=AssignmentType.SPECIFIC, scheduled_date=today - timedelta(days=2),
+                 status=TaskStatus.IN_PROGRESS),
+        YardTask(title="Backlog", category=TaskCategory.CLEANING, priority=TaskPriority.LOW,
+                 reported_by_id=admin_user.id, assignment_type=AssignmentType.BACKLOG,
+                 status=TaskStatus.OPEN),
+        YardTask(title="Done", category=TaskCategory.CLEANING, priority=TaskPriority.URGENT,
+                 reported_by_id=admin_user.id, assignment_type=AssignmentType.BACKLOG,
+                 status=TaskStatus.COMPLETED),
+    ])
+    db.commit()
+    invalidate_summary_cache()
+
+    response = client.get("/api/tasks/summary", headers=auth_headers_admin)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "total_open": 3,
+        "urgent_count": 1,
+        "high_priority_count": 1,
+        "overdue_count": 1,
+        "my_assigned_count": 1,
+        "today_count": 1,
+    }
+
+
+def test_summary_cache_cleared_by_task_write(client, db, admin_user, auth_headers_admin):
+    """Test that creating a task is reflected immediately despite the summary cache."""
+    from app.routers.tasks import invalidate_summary_cache
+
+    invalidate_summary_cache()
+    before = client.get("/api/tasks/summary", headers=auth_headers_admin).json()
+
+    response = client.post(
+        "/api/tasks/",
+        json={"title": "Broken fence", "category": "repairs", "priority": "urgent"},
+        headers=auth_headers_admin
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    after = client.get("/api/tasks/summary", headers=auth_headers_admin).json()
+    assert after["total_open"] == before["total_open"] + 1
+    assert after["urgent_count"] == before["urgent_count"] + 1
+
+
+# =====================
+# Task Board Tests
+# =====================
+
+def test_task_board_buckets(client, db, admin_user, auth_headers_admin, staff_user):
+    """Test that the board partitions tasks into tabs and orders them by priority."""
+    today = date.today()
+    db.add_all([
+        YardTask(title="Mine low", category=TaskCategory.REPAIRS, priority=TaskPriority.LOW,
+                 reported_by_id=admin_user.id, assigned_to_id=admin_user.id,
+                 assignment_type=AssignmentType.SPECIFIC, scheduled_date=today, status=TaskStatus.OPEN),
+        YardTask(title="Mine urgent", category=TaskCategory.REPAIRS, priority=TaskPriority.URGENT,
+                 reported_by_id=admin_user.id, assigned_to_id=admin_user.id,
+                 assignment_type=AssignmentType.SPECIFIC, scheduled_date=today, status=TaskStatus.OPEN),
+        YardTask(title="Pool", category=TaskCategory.CLEANING, priority=TaskPriority.MEDIUM,
+                 reported_by_id=admin_user.id, assignment_type=AssignmentType.POOL,
+                 scheduled_date=today, status=TaskStatus.OPEN),
+        YardTask(title="Next week", category=TaskCategory.CLEANING, priority=TaskPriority.HIGH,
+                 reported_by_id=admin_user.id, assigned_to_id=staff_user.id,
+                 assignment_type=AssignmentType.SPECIFIC, scheduled_date=today + timedelta(days=7),
+                 status=TaskStatus.OPEN),
+        YardTask(title="Backlog", category=TaskCategory.OTHER, priority=TaskPriority.LOW,
+                 reported_by_id=admin_user.id, assignment_type=AssignmentType.BACKLOG,
+                 status=TaskStatus.OPEN),
+        YardTask(title="Done today", category=TaskCategory.OTHER, priority=TaskPriority.LOW,
+                 reported_by_id=admin_user.id, assignment_type=AssignmentType.BACKLOG,
+                 status=TaskStatus.COMPLETED, completed_date=datetime.utcnow()),
+        YardTask(title="Done last week", category=TaskCategory.OTHER, priority=TaskPriority.LOW,
+                 reported_by_id=admin_user.id, assignment_type=AssignmentType.BACKLOG,
+                 status=TaskStatus.COMPLETED, completed_date=datetime.utcnow() - timedelta(days=7)),
+    ])
+    db.commit()
+
+    response = client.get("/api/tasks/", headers=auth_headers_admin)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    titles = lambda bucket: [t["title"] for t in data[bucket]]
+    assert titles("open_tasks")[:2] == ["Mine urgent", "Next week"]
+    assert len(data["open_tasks"]) == 5
+    assert titles("my_tasks") == ["Mine urgent", "Mine low"]
+    assert titles("today_tasks") == ["Mine urgent", "Mine low"]
+    assert titles("pool_tasks") == ["Pool"]
+    assert titles("backlog_tasks") == ["Backlog"]
+    assert titles("scheduled_tasks") == ["Next week"]
+    assert titles("completed_tasks") == ["Done today"]
+
+
+def test_list_tasks_does_not_roll_over(client, db, admin_user, auth_headers_admin, staff_user):
+    """Test that loading the board leaves overdue tasks for the scheduler to roll over."""
+    overdue = YardTask(
+        title="Yesterday's job",
+        category=TaskCategory.REPAIRS,
+        reported_by_id=admin_user.id,
+        assigned_to_id=staff_user.id,
+        assignment_type=AssignmentType.SPECIFIC,
+        scheduled_date=date.today() - timedelta(days=1),
+        status=TaskStatus.OPEN
+    )
+    db.add(overdue)
+    db.commit()
+
+    response = client.get("/api/tasks/", headers=auth_headers_admin)
+    assert response.status_code == status.HTTP_200_OK
+
+    db.refresh(overdue)
+    assert overdue.assignment_type == AssignmentType.SPECIFIC
+    assert overdue.assigned_to_id == staff_user.id
+    assert overdue.scheduled_date == date.today() - timedelta(days=1)
+
+
+# =====================
+# Rollover Tests
+# =====================
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_rollover_moves_overdue_tasks_to_backlog(db, admin_user, staff_user, chunk_size):
+    """Test that the set-based rollover moves only past incomplete tasks."""
+    from app.services.scheduler import rollover_tasks
+
+    today = date.today()
+    overdue = [
+        YardTask(title=f"Overdue {i}", category=TaskCategory.REPAIRS, reported_by_id=admin_user.id,
+                 assigned_to_id=staff_user.id, assignment_type=AssignmentType.SPECIFIC,
+                 scheduled_date=today - timedelta(days=i + 1), is_maintenance_day_task=True,
+                 status=TaskStatus.OPEN)
+        for i in range(3)
+    ]
+    upcoming = YardTask(title="Today", category=TaskCategory.REPAIRS, reported_by_id=admin_user.id,
+                        assignment_type=AssignmentType.POOL, scheduled_date=today, status=TaskStatus.OPEN)
+    finished = YardTask(title="Finished", category=TaskCategory.REPAIRS, reported_by_id=admin_user.id,
+                        assignment_type=AssignmentType.SPECIFIC, scheduled_date=today - timedelta(days=1),
+                        status=TaskStatus.COMPLETED)
+    db.add_all(overdue + [upcoming, finished])
+    db.commit()
+
+    moved = rollover_tasks(db, today, chunk_size=chunk_size)
+    db.commit()
+
+    assert sorted(moved) == sorted(t.id for t in overdue)
+    for task in overdue:
+        db.refresh(task)
+        assert task.assignment_type == AssignmentType.BACKLOG
+        assert task.scheduled_date is None
+        assert task.assigned_to_id is None
+        assert task.is_maintenance_day_task is False
+    db.refresh(upcoming)
+    db.refresh(finished)
+    assert upcoming.assignment_type == AssignmentType.POOL
+    assert finished.scheduled_date == today - timedelta(days=1)
+
+
+# =====================
+# Health Task Generation Tests
+# =====================
+
+def test_health_task_generation_for_range(db, admin_user, livery_user, horse, livery_package):
+    """Test that a date range generates each day's health tasks once, in bulk."""
+    from app.models.feed import FeedAddition, FeedTime, AdditionStatus
+    from app.models.task import HealthTaskType
+    from app.services.health_task_generator import HealthTaskGenerator
+
+    start = date.today() + timedelta(days=1)
+    horse.livery_package_id = livery_package.id
+    db.add(FeedAddition(horse_id=horse.id, name="Bute", dosage="1 sachet", feed_time=FeedTime.BOTH,
+                        start_date=start, end_date=start + timedelta(days=1),
+                        status=AdditionStatus.APPROVED, requested_by_id=livery_user.id))
+    db.commit()
+
+    generator = HealthTaskGenerator(db, admin_user.id)
+    result = generator.generate_all_for_range(start, start + timedelta(days=2))
+
+    assert result["medication"] == 4
+    assert result["health_check"] == 3
+    assert result["total"] == 7
+    medication = db.query(YardTask).filter(YardTask.health_task_type == HealthTaskType.MEDICATION).all()
+    assert {(t.scheduled_date, t.feed_time) for t in medication} == {
+        (start + timedelta(days=d), ft) for d in range(2) for ft in ("morning", "evening")
+    }
+
+    # Completed tasks are kept and not regenerated
+    medication[0].status = TaskStatus.COMPLETED
+    db.commit()
+    assert generator.generate_medication_tasks(start, start + timedelta(days=2)) == []
+    result = generator.generate_all_for_range(start, start + timedelta(days=2))
+    assert result["total"] == 0
+    assert result["unchanged"] == 6
+    assert db.query(YardTask).filter(YardTask.health_task_type.isnot(None)).count() == 7
+
+
+def test_health_task_reconciliation(client, db, admin_user, livery_user, horse, auth_headers_admin):
+    """Test that regeneration updates and deletes open tasks in place instead of recreating them."""
+    from app.models.feed import FeedAddition, FeedTime, AdditionStatus
+    from app.models.task import HealthTaskType, TaskComment
+    from app.services.health_task_generator import HealthTaskGenerator
+
+    target = date.today() + timedelta(days=1)
+    addition = FeedAddition(horse_id=horse.id, name="Bute", dosage="1 sachet", feed_time=FeedTime.BOTH,
+                            start_date=target, status=AdditionStatus.APPROVED, requested_by_id=livery_user.id)
+    db.add(addition)
+    db.commit()
+
+    generator = HealthTaskGenerator(db, admin_user.id)
+    generator.generate_all_for_date(target)
+    morning, evening = db.query(YardTask).filter(
+        YardTask.health_task_type == HealthTaskType.MEDICATION
+    ).order_by(YardTask.feed_time.desc()).all()
+    morning.assigned_to_id = admin_user.id
+    db.add(TaskComment(task_id=morning.id, user_id=admin_user.id, content="Mix with chaff"))
+    addition.dosage = "2 sachets"
+    addition.feed_time = FeedTime.MORNING
+    db.commit()
+    morning_id, evening_id = morning.id, evening.id
+
+    response = client.get(f"/api/settings/scheduler/preview/{target.isoformat()}", headers=auth_headers_admin)
+    assert response.status_code == 200
+    preview = response.json()
+    assert preview["up_to_date"] is False
+    assert preview["changes"]["update"]["medication"] == 1
+    assert preview["changes"]["delete"]["medication"] == 1
+    assert preview["changes"]["insert"]["total"] == 0
+    assert preview["to_update"] == [{"task_id": morning_id, "title": morning.title, "fields": ["description"]}]
+    assert db.query(YardTask).filter(YardTask.id == evening_id).count() == 1
+
+    result = generator.generate_all_for_date(target)
+    assert result["updated"] == 1
+    assert result["deleted"] == 1
+
+    db.expire_all()
+    task = db.query(YardTask).filter(YardTask.health_task_type == HealthTaskType.MEDICATION).one()
+    assert task.id == morning_id
+    assert task.description == "Administer 2 sachets"
+    assert task.assigned_to_id == admin_user.id
+    assert len(task.comments) == 1
+
+    response = client.get(f"/api/settings/scheduler/preview/{target.isoformat()}", headers=auth_headers_admin)
+    assert response.json()["up_to_date"] is True
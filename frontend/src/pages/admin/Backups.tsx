@@ -151,7 +151,7 @@ export function AdminBackups() {
 
   const handleDownload = async (backup: Backup) => {
     try {
-      await backupApi.download(backup.id);
+      await backupApi.download(backup.id, backup.filename);
     } catch {
       setError('Failed to download backup');
     }
@@ -164,8 +164,10 @@ export function AdminBackups() {
       setBackups(backups.filter(b => b.id !== deleteTarget.id));
       setSuccess('Backup deleted');
       setDeleteTarget(null);
-    } catch {
-      setError('Failed to delete backup');
+    } catch (err: unknown) {
+      const error = err as { response?: { data?: { detail?: string } } };
+      setError(error.response?.data?.detail || 'Failed to delete backup');
+      setDeleteTarget(null);
     }
   };
 
@@ -381,7 +383,7 @@ export function AdminBackups() {
             Validate File
             <input
               type="file"
-              accept=".json"
+              accept=".zip,.json"
               onChange={handleValidateFile}
               ref={validateFileInputRef}
               style={{ display: 'none' }}
@@ -391,7 +393,7 @@ export function AdminBackups() {
             Import from File
             <input
               type="file"
-              accept=".json"
+              accept=".zip,.json"
               onChange={handleRestoreFileSelect}
               ref={restoreFileInputRef}
               style={{ display: 'none' }}
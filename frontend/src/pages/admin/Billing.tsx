@@ -480,6 +480,20 @@ export default function Billing() {
     }
   };
 
+  const handleDownloadAllStatements = async () => {
+    if (!statementForm.from_date || !statementForm.to_date) return;
+
+    try {
+      setDownloadingStatement(true);
+      await accountApi.downloadAllStatements(statementForm.from_date, statementForm.to_date);
+      setShowStatementModal(false);
+    } catch {
+      setError('Failed to download statements');
+    } finally {
+      setDownloadingStatement(false);
+    }
+  };
+
   const handleDownloadTransactionsCsv = async () => {
     if (!selectedUserId) return;
 
@@ -1216,6 +1230,14 @@ export default function Billing() {
             <button className="ds-btn ds-btn-secondary" onClick={() => setShowStatementModal(false)}>
               Cancel
             </button>
+            <button
+              className="ds-btn ds-btn-secondary"
+              onClick={handleDownloadAllStatements}
+              disabled={downloadingStatement || !statementForm.from_date || !statementForm.to_date}
+              title="Statements for every livery client as a zip"
+            >
+              All Clients (ZIP)
+            </button>
             <button
               className="ds-btn ds-btn-primary"
               onClick={handleDownloadStatement}
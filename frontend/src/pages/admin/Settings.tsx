@@ -829,10 +829,7 @@ export function AdminSettings() {
       try {
         const result = await settingsApi.generateHealthTasks(selectedDate);
         setSuccess(result.message);
-        setPreviewData({
-          existing_tasks: result.tasks_generated,
-          already_generated: true,
-        });
+        await handlePreviewTasks();
         if (selectedDate === new Date().toISOString().split('T')[0]) {
           await loadSchedulerStatus();
         }
@@ -220,6 +220,7 @@ import type {
   MyInvoiceSummary,
   InvoiceGenerateRequest,
   HealthTaskCompletion,
+  HealthTaskCounts,
   HealthTaskGenerationResult,
   MonthOption,
   BillingRunRequest,
@@ -346,6 +347,16 @@ export const settingsApi = {
       total: number;
     };
     already_generated: boolean;
+    up_to_date: boolean;
+    changes: {
+      insert: HealthTaskCounts;
+      update: HealthTaskCounts;
+      delete: HealthTaskCounts;
+      unchanged: number;
+    };
+    to_create: { health_task_type: string; title: string; feed_time: string | null }[];
+    to_update: { task_id: number; title: string; fields: string[] }[];
+    to_delete: { task_id: number; title: string }[];
     message: string;
   }> => {
     const response = await api.get(`/settings/scheduler/preview/${targetDate}`);
@@ -361,6 +372,9 @@ export const settingsApi = {
       health_check: number;
       rehab_exercise: number;
       total: number;
+      updated: number;
+      deleted: number;
+      unchanged: number;
     };
     message: string;
   }> => {
@@ -2343,6 +2357,22 @@ export const accountApi = {
     window.URL.revokeObjectURL(url);
   },
 
+  // Download statements for every livery client as a zip (admin)
+  downloadAllStatements: async (fromDate: string, toDate: string): Promise<void> => {
+    const response = await api.get('/account/statements/zip', {
+      params: { from_date: fromDate, to_date: toDate },
+      responseType: 'blob',
+    });
+    const url = window.URL.createObjectURL(new Blob([response.data], { type: 'application/zip' }));
+    const link = document.createElement('a');
+    link.href = url;
+    link.setAttribute('download', `statements_${fromDate}_${toDate}.zip`);
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    window.URL.revokeObjectURL(url);
+  },
+
   // Download user transactions CSV (admin)
   downloadUserTransactionsCsv: async (userId: number, fromDate?: string, toDate?: string): Promise<void> => {
     const params: Record<string, string> = {};
@@ -2363,21 +2393,24 @@ export const accountApi = {
   },
 
   // Get aged debt report (admin)
-  getAgedDebtReport: async (): Promise<AgedDebtReport> => {
-    const response = await api.get('/account/reports/aged-debt');
+  getAgedDebtReport: async (asOfDate?: string): Promise<AgedDebtReport> => {
+    const response = await api.get('/account/reports/aged-debt', {
+      params: asOfDate ? { as_of_date: asOfDate } : undefined,
+    });
     return response.data;
   },
 
   // Download aged debt CSV (admin)
-  downloadAgedDebtCsv: async (): Promise<void> => {
+  downloadAgedDebtCsv: async (asOfDate?: string): Promise<void> => {
     const response = await api.get('/account/reports/aged-debt/csv', {
+      params: asOfDate ? { as_of_date: asOfDate } : undefined,
       responseType: 'blob',
     });
     const url = window.URL.createObjectURL(new Blob([response.data], { type: 'text/csv' }));
     const link = document.createElement('a');
     link.href = url;
-    const today = new Date().toISOString().split('T')[0];
-    link.setAttribute('download', `aged_debt_${today}.csv`);
+    const reportDate = asOfDate || new Date().toISOString().split('T')[0];
+    link.setAttribute('download', `aged_debt_${reportDate}.csv`);
     document.body.appendChild(link);
     link.click();
     link.remove();
@@ -2453,7 +2486,7 @@ export const backupApi = {
   },
 
   // Download backup file
-  download: async (backupId: number): Promise<void> => {
+  download: async (backupId: number, filename?: string): Promise<void> => {
     const response = await api.get(`/backup/download/${backupId}`, {
       responseType: 'blob',
     });
@@ -2461,7 +2494,7 @@ export const backupApi = {
     const url = window.URL.createObjectURL(new Blob([response.data]));
     const link = document.createElement('a');
     link.href = url;
-    link.setAttribute('download', `backup_${backupId}.json`);
+    link.setAttribute('download', filename || `backup_${backupId}.zip`);
     document.body.appendChild(link);
     link.click();
     link.remove();
@@ -3144,8 +3144,7 @@ export interface HealthTaskCompletion {
   rehab_exercise?: RehabExerciseTaskCompletion;
 }
 
-export interface HealthTaskGenerationResult {
-  date: string;
+export interface HealthTaskCounts {
   medication: number;
   wound_care: number;
   health_check: number;
@@ -3153,6 +3152,13 @@ export interface HealthTaskGenerationResult {
   total: number;
 }
 
+export interface HealthTaskGenerationResult extends HealthTaskCounts {
+  date: string;
+  updated: number;
+  deleted: number;
+  unchanged: number;
+}
+
 // Monthly Billing Types
 export interface MonthOption {
   year: number;
@@ -3196,6 +3202,7 @@ export interface BillingRunResponse {
   total_owners: number;
   ledger_entries_created: number;
   is_preview: boolean;
+  timings: Record<string, number>;
 }
 
 export interface BillingRunRequest {